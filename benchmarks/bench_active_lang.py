@@ -0,0 +1,90 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Compare the context variable active language against a plain module global.
+
+    python -m benchmarks.bench_active_lang
+"""
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from timeit import timeit
+
+from lingua_franca.lang import active_lang, get_active_lang, \
+    set_active_lang, get_full_lang_code
+from lingua_franca.parse import extract_number
+
+_GLOBAL_LANG = "en-us"
+
+
+def global_full_lang_code(lang=None):
+    """ get_full_lang_code as implemented with a module global """
+    if not lang:
+        lang = _GLOBAL_LANG
+    return lang or "en-us"
+
+
+def lookup_throughput(func, number=1000000):
+    seconds = timeit(func, number=number)
+    return number / seconds
+
+
+def context_worker(lang, calls):
+    with active_lang(lang):
+        for _ in range(calls):
+            extract_number("twenty two")
+
+
+_lock = Lock()
+
+
+def locked_global_worker(lang, calls):
+    # what callers had to do to share the global between threads
+    for _ in range(calls):
+        with _lock:
+            old_lang = get_active_lang()
+            set_active_lang(lang)
+            extract_number("twenty two")
+            set_active_lang(old_lang)
+
+
+def threaded_throughput(worker, workers=4, calls=2000):
+    with ThreadPoolExecutor(workers) as pool:
+        seconds = timeit(
+            lambda: list(pool.map(worker, ["en-us"] * workers,
+                                  [calls] * workers)),
+            number=1)
+    return workers * calls / seconds
+
+
+def main():
+    print("default language lookup (calls/s)")
+    print("  module global:     {:,.0f}".format(
+        lookup_throughput(global_full_lang_code)))
+    print("  context variable:  {:,.0f}".format(
+        lookup_throughput(get_full_lang_code)))
+    with active_lang("en-us"):
+        print("  inside active_lang: {:,.0f}".format(
+            lookup_throughput(get_full_lang_code)))
+
+    print("extract_number with 4 threads (calls/s)")
+    print("  global and a lock: {:,.0f}".format(
+        threaded_throughput(locked_global_worker)))
+    print("  context variable:  {:,.0f}".format(
+        threaded_throughput(context_worker)))
+
+
+if __name__ == "__main__":
+    main()
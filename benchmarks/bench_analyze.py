@@ -0,0 +1,70 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+An intent pipeline running all the extractors on each utterance, on the
+texts and on the documents of lingua_franca.analyze().  The pipeline asks
+for the numbers twice, once to fill slots and once to validate them.
+
+    python -m benchmarks.bench_analyze
+"""
+from timeit import repeat
+
+from lingua_franca import analyze, load_languages
+from lingua_franca.parse import extract_number, extract_numbers, \
+    extract_duration, extract_datetime, normalize
+
+from benchmarks.bench_batch import ANCHOR, distinct_utterances
+
+
+def pipeline(text, lang):
+    normalize(text, lang=lang)
+    extract_number(text, lang=lang)
+    extract_numbers(text, lang=lang)
+    extract_duration(text, lang=lang)
+    extract_datetime(text, ANCHOR, lang=lang)
+    extract_number(text, lang=lang)
+    extract_numbers(text, lang=lang)
+
+
+def analyzed_pipeline(text, lang):
+    doc = analyze(text, lang)
+    normalize(doc)
+    extract_number(doc)
+    extract_numbers(doc)
+    extract_duration(doc)
+    extract_datetime(doc, ANCHOR)
+    extract_number(doc)
+    extract_numbers(doc)
+
+
+def best_time(func):
+    return min(repeat(func, number=1, repeat=5))
+
+
+def main(size=500, langs=("en-us", "cs-cz")):
+    load_languages(langs)
+    texts = distinct_utterances(size)
+    for lang in langs:
+        seconds = best_time(lambda: [pipeline(t, lang) for t in texts])
+        analyzed = best_time(lambda: [analyzed_pipeline(t, lang)
+                                      for t in texts])
+        print("{:<6} texts {:>7,.0f}/s   documents {:>7,.0f}/s   "
+              "x{:.2f}".format(lang, len(texts) / seconds,
+                               len(texts) / analyzed, seconds / analyzed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Compare the batch extraction functions against a loop over the scalar ones,
+on distinct utterances and on a corpus repeating a few common ones.
+
+    python -m benchmarks.bench_batch
+"""
+from datetime import datetime
+from timeit import timeit
+
+from lingua_franca.format import pronounce_number
+from lingua_franca.parse import extract_number, extract_numbers, \
+    extract_duration, extract_datetime, normalize, extract_number_batch, \
+    extract_numbers_batch, extract_duration_batch, extract_datetime_batch, \
+    normalize_batch
+
+TEMPLATES = [
+    "set a timer for {} minutes",
+    "what's the weather like in {} days",
+    "I have {} hats and three cats",
+    "remind me in {} and a half hours to call mom",
+    "add {} to the list",
+    "it's the {} time this week",
+    "wake me up at {} thirty",
+    "play {} songs",
+]
+
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+
+
+def compare(name, loop, batch, texts, repeat=5):
+    loop_seconds = timeit(lambda: loop(texts), number=repeat)
+    batch_seconds = timeit(lambda: batch(texts), number=repeat)
+    calls = len(texts) * repeat
+    print("{:<18} loop {:>9,.0f}/s   batch {:>9,.0f}/s   x{:.2f}".format(
+        name, calls / loop_seconds, calls / batch_seconds,
+        loop_seconds / batch_seconds))
+
+
+def distinct_utterances(size):
+    return [TEMPLATES[i % len(TEMPLATES)].format(pronounce_number(i))
+            for i in range(size)]
+
+
+def repeated_utterances(size, distinct=50):
+    return (distinct_utterances(distinct) * (size // distinct + 1))[:size]
+
+
+def run(texts, lang):
+    compare("extract_number",
+            lambda ts: [extract_number(t, lang=lang) for t in ts],
+            lambda ts: extract_number_batch(ts, lang=lang), texts)
+    compare("extract_numbers",
+            lambda ts: [extract_numbers(t, lang=lang) for t in ts],
+            lambda ts: extract_numbers_batch(ts, lang=lang), texts)
+    compare("extract_duration",
+            lambda ts: [extract_duration(t, lang=lang) for t in ts],
+            lambda ts: extract_duration_batch(ts, lang=lang), texts)
+    compare("extract_datetime",
+            lambda ts: [extract_datetime(t, ANCHOR, lang=lang) for t in ts],
+            lambda ts: extract_datetime_batch(ts, ANCHOR, lang=lang), texts)
+    compare("normalize",
+            lambda ts: [normalize(t, lang=lang) for t in ts],
+            lambda ts: normalize_batch(ts, lang=lang), texts)
+
+
+def main(size=2000, lang="en-us"):
+    print("{} distinct utterances, {}".format(size, lang))
+    run(distinct_utterances(size), lang)
+    print("{} utterances, 50 distinct ones, {}".format(size, lang))
+    run(repeated_utterances(size), lang)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+extract_datetime_xx of every language on the phrases of
+bench_extract_datetime, at an anchor on each day of a week, as a skill
+hearing the same commands day after day.  "parsed" drops the plans before
+each phrase, "planned" applies the plans kept from the previous runs.
+
+    python -m benchmarks.bench_datetime_plans
+"""
+from datetime import timedelta
+from importlib import import_module
+
+from benchmarks.bench_extract_datetime import ANCHOR, PHRASES, best_time
+
+ANCHORS = [ANCHOR + timedelta(days=day, hours=5 * day) for day in range(7)]
+
+
+def main(number=50):
+    for lang, phrases in sorted(PHRASES.items()):
+        module = import_module("lingua_franca.lang.parse_" + lang)
+        extract = getattr(module, "extract_datetime_" + lang)
+        plans = getattr(module, "_DATETIME_PLANS_" + lang.upper())
+
+        def parse():
+            for anchor in ANCHORS:
+                for phrase in phrases:
+                    plans.clear()
+                    extract(phrase, anchor, None)
+
+        def apply():
+            for anchor in ANCHORS:
+                for phrase in phrases:
+                    extract(phrase, anchor, None)
+
+        count = len(ANCHORS) * len(phrases)
+        parsed = best_time(parse, number) / count * 1e6
+        planned = best_time(apply, number) / count * 1e6
+        print("extract_datetime_{}  parsed {:8.2f}  planned {:8.2f} "
+              "us/phrase  x{:.1f}".format(lang, parsed, planned,
+                                          parsed / planned))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+German number words: size of the number tables, and reading rate of
+_number_de, on the words of a sentence and on compound numbers, with and
+without the words remembered from previous calls.
+
+    python -m benchmarks.bench_de_numbers
+"""
+import sys
+from timeit import repeat
+
+from lingua_franca.lang import parse_de
+
+WORDS = ("ich habe einundzwanzig katzen und dreihundertfünfundvierzig "
+         "hunde gesehen die neunzehnhundertneunundneunzig geboren sind "
+         "und zwei millionen fische").split()
+
+COMPOUNDS = ["einundzwanzig", "dreihundertfünfundvierzig",
+             "dreihundertfünfundvierzigtausend", "hunderteins",
+             "neunzehnhundertneunundneunzig", "zweitausendzwanzig"]
+
+
+def table_size(*tables):
+    size = 0
+    for table in tables:
+        size += sys.getsizeof(table)
+        for key, value in table.items():
+            size += sys.getsizeof(key) + sys.getsizeof(value)
+    return size
+
+
+def best_rate(func, number):
+    return number / min(repeat(func, number=number, repeat=5))
+
+
+def main(number=10000):
+    size = table_size(parse_de.de_numbers, parse_de._UNITS_DE,
+                      parse_de._TENS_DE, parse_de._BELOW_HUNDRED_DE,
+                      dict(parse_de._FRACTION_DE))
+    print("number tables {:>9,} bytes".format(size))
+
+    def lookup(words):
+        for word in words:
+            parse_de._number_de(word)
+
+    def decompose(words):
+        for word in words:
+            parse_de._number_de.__wrapped__(word)
+
+    for name, words in (("sentence", WORDS), ("compounds", COMPOUNDS)):
+        warm = best_rate(lambda: lookup(words), number) * len(words)
+        cold = best_rate(lambda: decompose(words), number) * len(words)
+        print("{:<10} remembered {:>11,.0f} words/s   "
+              "decomposed {:>11,.0f} words/s".format(name, warm, cold))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+extract_datetime_xx of every language on a few of its date and time
+phrases.
+
+    python -m benchmarks.bench_extract_datetime
+"""
+from datetime import datetime
+from importlib import import_module
+from timeit import repeat
+
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+
+PHRASES = {
+    "cs": ["jaký je zítra den", "nastav alarm na pondělí v 8 ráno",
+           "co je 5. června 2017", "připomeň mi za 10 minut"],
+    "da": ["hvad er vejret i morgen", "sæt alarm på mandag klokken 8",
+           "hvad skete der den 5 juni", "husk mig om 10 minutter"],
+    "de": ["wie ist das wetter morgen", "weck mich am montag um 8 uhr",
+           "was war am 5. juni", "erinnere mich in 10 minuten"],
+    "en": ["what is the weather tomorrow", "set an alarm for monday at 8 am",
+           "what happened on june 5 2017", "remind me in 10 minutes"],
+    "es": ["qué tiempo hará mañana", "despiértame el lunes a las 8",
+           "qué pasa el próximo viernes", "recuérdame en 10 minutos"],
+    "fr": ["quel temps fera-t-il demain", "réveille-moi lundi à 8 heures",
+           "que s'est-il passé le 5 juin 2017",
+           "rappelle-moi dans 10 minutes"],
+    "it": ["che tempo farà domani", "svegliami lunedi alle 8",
+           "cosa è successo il 5 giugno 2017", "ricordami tra 10 minuti"],
+    "nl": ["wat is het weer morgen", "wek me maandag om 8 uur",
+           "wat gebeurt er volgende vrijdag", "herinner me over 10 minuten"],
+    "pt": ["como estará o tempo amanhã", "acorda-me na segunda às 8",
+           "o que acontece na próxima sexta", "lembra-me em 10 minutos"],
+    "sv": ["hur blir vädret imorgon", "väck mig på måndag",
+           "vad händer nästa fredag", "påminn mig om 10 minuter"],
+}
+
+
+def best_time(func, number):
+    return min(repeat(func, number=number, repeat=5)) / number
+
+
+def main(number=200):
+    for lang, phrases in sorted(PHRASES.items()):
+        extract = getattr(import_module("lingua_franca.lang.parse_" + lang),
+                          "extract_datetime_" + lang)
+
+        def parse():
+            for phrase in phrases:
+                extract(phrase, ANCHOR, None)
+
+        print("extract_datetime_{}  {:8.2f} us/phrase".format(
+            lang, best_time(parse, number) / len(phrases) * 1e6))
+
+
+if __name__ == "__main__":
+    main()
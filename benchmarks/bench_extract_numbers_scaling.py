@@ -0,0 +1,67 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+English extract_numbers on texts from 10 to 10,000 tokens, of prose and of
+one long run of number words.  The time per token should stay flat as the
+texts grow.
+
+    python -m benchmarks.bench_extract_numbers_scaling
+"""
+from itertools import cycle, islice
+from timeit import repeat
+
+from lingua_franca.lang.parse_en import extract_numbers_en
+
+SENTENCES = [
+    "I bought two hundred and twelve apples",
+    "then three thousand pears for twenty five dollars",
+    "she gave one and a half dozen to my four sisters",
+    "who had seventy seven cats and a couple of dogs",
+    "while the other nine hundred people waited for six days",
+    "the fair lasted a week",
+    "and the temperature rose to thirty two point five degrees",
+    "one million bees ate fifteen pies",
+]
+
+RUN = ["seven", "eight", "nine"]
+
+SIZES = [10, 100, 1000, 10000]
+
+
+def text_of(size, words):
+    return " ".join(islice(cycle(words), size))
+
+
+def best_time(func, number):
+    return min(repeat(func, number=number, repeat=5)) / number
+
+
+def main():
+    prose = " ".join(SENTENCES).split()
+    for name, words in (("prose", prose), ("run", RUN)):
+        for size in SIZES:
+            text = text_of(size, words)
+            number = max(1, 2000 // size)
+            seconds = best_time(lambda: extract_numbers_en(text), number)
+            print("{:5} {:>6} tokens  {:>5} numbers  {:>10.2f} ms  "
+                  "{:>6.1f} us/token".format(name, size,
+                                             len(extract_numbers_en(text)),
+                                             seconds * 1000,
+                                             seconds * 1e6 / size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+has_datetime_xx and extract_datetime_xx of every language on a mixed
+corpus: the date and time phrases of bench_extract_datetime and as many
+utterances without any, as an intent pipeline sees them.  "both" only calls
+extract_datetime_xx on the phrases has_datetime_xx accepts.
+
+    python -m benchmarks.bench_has_datetime
+"""
+from importlib import import_module
+from timeit import repeat
+
+from benchmarks.bench_extract_datetime import ANCHOR, PHRASES
+
+UTTERANCES = {
+    "cs": ["zhasni světla v kuchyni", "pusť nějakou hudbu",
+           "jaké je hlavní město francie", "řekni mi vtip"],
+    "da": ["sluk lyset i køkkenet", "spil noget musik",
+           "hvad er hovedstaden i frankrig", "fortæl mig en vittighed"],
+    "de": ["mach das licht in der küche aus", "spiel etwas musik",
+           "was ist die hauptstadt von frankreich", "erzähl mir einen witz"],
+    "en": ["turn off the kitchen lights", "play some music",
+           "what is the capital of france", "tell me a joke"],
+    "es": ["apaga las luces de la cocina", "pon algo de música",
+           "cuál es la capital de francia", "cuéntame un chiste"],
+    "fr": ["éteins les lumières de la cuisine", "joue de la musique",
+           "quelle est la capitale de la france", "raconte-moi une blague"],
+    "it": ["spegni le luci della cucina", "metti un po' di musica",
+           "qual è la capitale della francia", "raccontami una barzelletta"],
+    "nl": ["doe het licht in de keuken uit", "speel wat muziek",
+           "wat is de hoofdstad van frankrijk", "vertel me een grap"],
+    "pt": ["apaga as luzes da cozinha", "toca alguma música",
+           "qual é a capital da frança", "conta-me uma piada"],
+    "sv": ["släck lamporna i köket", "spela lite musik",
+           "vad är huvudstaden i frankrike", "berätta ett skämt"],
+}
+
+
+def best_time(func, number):
+    return min(repeat(func, number=number, repeat=5)) / number
+
+
+def main(number=200):
+    for lang, phrases in sorted(PHRASES.items()):
+        module = import_module("lingua_franca.lang.parse_" + lang)
+        extract = getattr(module, "extract_datetime_" + lang)
+        check = getattr(module, "has_datetime_" + lang)
+        corpus = phrases + UTTERANCES[lang]
+        rejected = sum(not check(text) for text in UTTERANCES[lang])
+
+        def scan():
+            for text in corpus:
+                check(text)
+
+        def parse():
+            for text in corpus:
+                extract(text, ANCHOR, None)
+
+        def parse_checked():
+            for text in corpus:
+                if check(text):
+                    extract(text, ANCHOR, None)
+
+        print("{}  rejected {}/{}  has_datetime {:6.2f}  extract_datetime "
+              "{:7.2f}  both {:7.2f} us/phrase".format(
+                  lang, rejected, len(UTTERANCES[lang]),
+                  best_time(scan, number) / len(corpus) * 1e6,
+                  best_time(parse, number) / len(corpus) * 1e6,
+                  best_time(parse_checked, number) / len(corpus) * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+normalize_es and normalize_fr on 1,000 word paragraphs, which try the
+number grammar of the language from every word of the text.
+
+    python -m benchmarks.bench_normalize_es_fr
+"""
+from timeit import repeat
+
+from lingua_franca.lang import parse_es, parse_fr
+
+SENTENCE_ES = ("el tren de las siete sale con trescientos cuarenta y dos "
+               "pasajeros y llega a madrid después de dos mil quinientos "
+               "kilómetros con veintiún días de lluvia y ciento ocho mil "
+               "doscientas personas esperan comprar una docena de huevos")
+
+SENTENCE_FR = ("le train de sept heures part avec trois cent quarante-deux "
+               "passagers et arrive à paris après deux mille cinq cents "
+               "kilomètres avec vingt et un jours de pluie et "
+               "quatre-vingt-dix-neuf personnes attendent le vingtième jour "
+               "pour acheter une douzaine d'oeufs")
+
+
+def paragraph(sentence, words=1000):
+    sentence = sentence.split()
+    return " ".join(sentence[i % len(sentence)] for i in range(words))
+
+
+def best_time(func, number):
+    return min(repeat(func, number=number, repeat=5)) / number
+
+
+def main(number=20):
+    text_es = paragraph(SENTENCE_ES)
+    text_fr = paragraph(SENTENCE_FR)
+
+    print("normalize_es, 1000 words  {:8.2f} ms".format(
+        best_time(lambda: parse_es.normalize_es(text_es, True),
+                  number) * 1000))
+    print("normalize_fr, 1000 words  {:8.2f} ms".format(
+        best_time(lambda: parse_fr.normalize_fr(text_fr, True),
+                  number) * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+normalize_it on a 1,000 word paragraph, which reads every word with
+extractnumber_it, and extractnumber_long_it on its own.
+
+    python -m benchmarks.bench_normalize_it
+"""
+from timeit import repeat
+
+from lingua_franca.lang import parse_it
+
+SENTENCE = ("il treno delle sette e venti parte da milano con trecento "
+            "quarantadue passeggeri e arriva a roma dopo duemilacinquecento "
+            "chilometri ma ottobre e novembre sono mesi con ventuno giorni "
+            "di pioggia e centottomiladuecentotredici persone aspettano il "
+            "ventesimo giorno per comprare una dozzina di uova e mezzo chilo "
+            "di pane")
+
+
+def paragraph(words=1000):
+    sentence = SENTENCE.split()
+    return " ".join(sentence[i % len(sentence)] for i in range(words))
+
+
+def best_time(func, number):
+    return min(repeat(func, number=number, repeat=5)) / number
+
+
+def main(number=20):
+    text = paragraph()
+    words = text.split()
+
+    def normalize():
+        parse_it.normalize_it(text, True)
+
+    def first_reads():
+        # forget the words read by the previous run
+        parse_it.extractnumber_long_it.cache_clear()
+        normalize()
+
+    def long_numbers():
+        for word in words:
+            parse_it.extractnumber_long_it.__wrapped__(word)
+
+    print("normalize_it, 1000 words            {:8.2f} ms".format(
+        best_time(normalize, number) * 1000))
+    print("normalize_it, words not remembered  {:8.2f} ms".format(
+        best_time(first_reads, number) * 1000))
+    print("extractnumber_long_it, not remembered {:6.2f} us/word".format(
+        best_time(long_numbers, number) / len(words) * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+extract_numbers on a 50 word utterance, for the languages sharing the
+_initialize_number_data number tables.  The language implementations are
+called directly, parse.extract_numbers doesn't dispatch Dutch.
+
+    python -m benchmarks.bench_number_tables
+"""
+from timeit import repeat
+
+from lingua_franca.lang import parse_cs, parse_en, parse_nl
+
+UTTERANCES = {
+    "en-us": "I bought two hundred and twelve apples and three thousand "
+             "pears for twenty five dollars then gave one and a half dozen "
+             "to my four sisters who had seventy seven cats, one million "
+             "bees and a couple of dogs while the other nine hundred "
+             "people waited for six days and ate fifteen pies at the "
+             "fair",
+    "cs-cz": "koupil jsem dvě stě dvanáct jablek a tři tisíce hrušek za "
+             "dvacet pět korun pak jsem dal jeden a půl tuctu mým čtyřem "
+             "sestrám které měly sedmdesát sedm koček jeden milion včel "
+             "a dva psy zatímco dalších devět set lidí čekalo šest dní a "
+             "snědlo patnáct koláčů na pouti a pak ještě osm",
+    "nl-nl": "ik kocht tweehonderd twaalf appels en drie duizend peren "
+             "voor vijfentwintig euro en gaf er anderhalf dozijn aan mijn "
+             "vier zussen die zevenenzeventig katten een miljoen bijen en "
+             "twee honden hadden terwijl de andere negenhonderd mensen zes "
+             "dagen wachtten en vijftien taarten aten op de kermis met acht "
+             "vrienden en nog twee",
+}
+
+MODULES = {"en-us": parse_en, "cs-cz": parse_cs, "nl-nl": parse_nl}
+
+
+def best_rate(func, number):
+    return number / min(repeat(func, number=number, repeat=5))
+
+
+def main(number=100):
+    for lang, text in UTTERANCES.items():
+        module = MODULES[lang]
+        init = module._initialize_number_data
+        extract_numbers = getattr(module,
+                                  "extract_numbers_" + lang.split("-")[0])
+        tables = best_rate(lambda: init(True), number * 100)
+        extraction = best_rate(lambda: extract_numbers(text), number)
+        print("{}  {} words  extract_numbers {:>7,.0f}/s   "
+              "_initialize_number_data {:>11,.0f}/s".format(
+                  lang, len(text.split()), extraction, tables))
+
+
+if __name__ == "__main__":
+    main()
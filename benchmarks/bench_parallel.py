@@ -0,0 +1,77 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Scaling of lingua_franca.parallel from 1 process to the cores available,
+against the single process batch functions.
+
+    python -m benchmarks.bench_parallel [size] [chunksize] [processes]
+
+processes is the largest pool measured, the number of cores this process
+may run on by default.  Run it on the machine the corpus jobs run on: the
+scaling depends on its cores, and a pool larger than them only adds
+overhead.
+"""
+import os
+import sys
+from datetime import datetime
+from timeit import timeit
+
+import lingua_franca.parallel as parallel
+from benchmarks.bench_batch import distinct_utterances
+from lingua_franca.parse import extract_numbers_batch, \
+    extract_datetime_batch, normalize_batch
+
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+
+JOBS = [
+    ("extract_numbers", extract_numbers_batch,
+     lambda texts, **kwargs: parallel.extract_numbers(texts, **kwargs)),
+    ("extract_datetime",
+     lambda texts: extract_datetime_batch(texts, ANCHOR),
+     lambda texts, **kwargs: parallel.extract_datetime(texts, ANCHOR,
+                                                       **kwargs)),
+    ("normalize", normalize_batch,
+     lambda texts, **kwargs: parallel.normalize(texts, **kwargs)),
+]
+
+
+def available_cores():
+    """ Number of cores this process may run on """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not on linux
+        return os.cpu_count() or 1
+
+
+def main(size=4000, chunksize=parallel.DEFAULT_CHUNKSIZE, processes=None):
+    texts = distinct_utterances(size)
+    cores = available_cores()
+    processes = processes or cores
+    print("{} distinct utterances, chunks of {}, {} cores".format(
+        size, chunksize, cores))
+    for name, batch, run in JOBS:
+        serial = size / timeit(lambda: batch(texts), number=1)
+        print("{:<17} in process {:>9,.0f}/s".format(name, serial))
+        for pool_size in range(1, processes + 1):
+            rate = size / timeit(
+                lambda: list(run(texts, processes=pool_size,
+                                 chunksize=chunksize)), number=1)
+            print("{:<17} {:>2} processes {:>9,.0f}/s  x{:.2f}".format(
+                "", pool_size, rate, rate / serial))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,62 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+parse_month_day against the datetime.strptime calls it replaces, on the
+dates extract_datetime_xx builds with and without a year.
+
+    python -m benchmarks.bench_parse_month_day
+"""
+from datetime import datetime
+
+from benchmarks.bench_extract_datetime import best_time
+from lingua_franca.lang.parse_common import parse_month_day
+
+MONTHS = ("january", "february", "march", "april", "may", "june", "july",
+          "august", "september", "october", "november", "december")
+DATES = {
+    "day": ["june 5", "december 31", "march 03", "february 28"],
+    "year": ["june 5 2018", "december 31 1999", "march 03 2020",
+             "february 29 2020"],
+}
+
+
+def strptime(date_str):
+    try:
+        return datetime.strptime(date_str, "%B %d")
+    except ValueError:
+        return datetime.strptime(date_str, "%B %d %Y")
+
+
+def main(number=2000):
+    for name, dates in sorted(DATES.items()):
+        assert all(strptime(d) == parse_month_day(d, MONTHS) for d in dates)
+
+        def run_strptime():
+            for date_str in dates:
+                strptime(date_str)
+
+        def run_table():
+            for date_str in dates:
+                parse_month_day(date_str, MONTHS)
+
+        old = best_time(run_strptime, number) / len(dates) * 1e6
+        new = best_time(run_table, number) / len(dates) * 1e6
+        print("{:4}  strptime {:6.2f} us  parse_month_day {:6.2f} us  "
+              "x{:.1f}".format(name, old, new, old / new))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+shift_datetime against the relativedelta additions it replaces, on the
+offsets extract_datetime_xx reads from the phrases of
+bench_extract_datetime, and on a text using every offset.  "peak" is the
+most memory the temporaries of one move hold at once.
+
+    python -m benchmarks.bench_shift_datetime
+"""
+import tracemalloc
+from importlib import import_module
+
+from dateutil.relativedelta import relativedelta
+
+from benchmarks.bench_extract_datetime import ANCHOR, PHRASES, best_time
+from lingua_franca.lang.parse_common import shift_datetime
+
+
+def add_relativedeltas(date, years=0, months=0, days=0, time=None, hours=0,
+                       minutes=0, seconds=0, not_before=None):
+    if years != 0:
+        date = date + relativedelta(years=years)
+    if months != 0:
+        date = date + relativedelta(months=months)
+    if days != 0:
+        date = date + relativedelta(days=days)
+    if time is not None:
+        date = date + relativedelta(hours=time[0], minutes=time[1])
+        if not_before is not None and not_before > date:
+            date = date + relativedelta(days=1)
+    if hours != 0:
+        date = date + relativedelta(hours=hours)
+    if minutes != 0:
+        date = date + relativedelta(minutes=minutes)
+    if seconds != 0:
+        date = date + relativedelta(seconds=seconds)
+    return date
+
+
+def moves(lang):
+    """ The arguments of the move of each phrase of lang """
+    module = import_module("lingua_franca.lang.parse_" + lang)
+    plans = getattr(module, "_DATETIME_PLANS_" + lang.upper())
+    for phrase in PHRASES[lang]:
+        plan = plans.get(phrase, ANCHOR)
+        if plan is None or plan.now:
+            continue
+        time = None
+        if plan.hour != -1 and plan.minute != -1:
+            time = (plan.hour or 0, plan.minute or 0)
+        yield (ANCHOR, plan.year_offset, plan.month_offset, plan.day_offset,
+               time, plan.hour_offset, plan.minute_offset,
+               plan.second_offset, ANCHOR)
+
+
+def peak(move, args):
+    move(*args)
+    tracemalloc.start()
+    try:
+        move(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def report(name, cases, number):
+    for move in (add_relativedeltas, shift_datetime):
+        assert all(move(*args) == add_relativedeltas(*args)
+                   for args in cases)
+
+    def run(move):
+        def apply():
+            for args in cases:
+                move(*args)
+        return best_time(apply, number) / len(cases) * 1e6
+
+    print("{:4}  relativedelta {:6.2f} us {:5.0f} B peak  shift_datetime "
+          "{:6.2f} us {:5.0f} B peak".format(
+              name, run(add_relativedeltas),
+              max(peak(add_relativedeltas, args) for args in cases),
+              run(shift_datetime),
+              max(peak(shift_datetime, args) for args in cases)))
+
+
+def main(number=2000):
+    for lang in sorted(PHRASES):
+        report(lang, list(moves(lang)), number)
+    report("all", [(ANCHOR, 1, 2, 3, (8, 30), 1, 15, 30, ANCHOR)], number)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import os
-from os.path import join, expanduser
+from os.path import join, expanduser, dirname
+from time import monotonic
 
 
 def _log_unsupported_language(language, supported_languages):
@@ -37,30 +38,176 @@ def resolve_resource_file(res_name, data_dir=None):
     where the '...' is replaced by the path where the package has
     been installed.
 
+    Results, including unresolved resources, are cached by resource_cache.
+
     Args:
         res_name (str): a resource path/name
+        data_dir (str, optional): replaces /opt/mycroft/res/
     Returns:
         str: path to resource or None if no resource found
     """
+    return resource_cache.resolve(res_name, data_dir)
+
+
+def _resolve_resource_file(res_name, data_dir=None):
+    """ Uncached implementation of resolve_resource_file """
     # First look for fully qualified file (e.g. a user setting)
     if os.path.isfile(res_name):
         return res_name
 
-    # Now look for ~/.mycroft/res_name (in user folder)
-    filename = os.path.expanduser("~/.mycroft/" + res_name)
-    if os.path.isfile(filename):
-        return filename
+    # Now look for ~/.mycroft/res_name (in user folder), next look for
+    # /opt/mycroft/res/res_name and finally look for it in the source package
+    for res_dir in resource_dirs(data_dir):
+        filename = os.path.abspath(os.path.normpath(join(res_dir, res_name)))
+        if os.path.isfile(filename):
+            return filename
+
+    return None  # Resource cannot be resolved
+
+
+def resource_dirs(data_dir=None):
+    """ Get the directories searched for resources, in order of precedence
+
+    Args:
+        data_dir (str, optional): replaces /opt/mycroft/res/
+    Returns:
+        [str]: the user, system and package resource directories
+    """
+    return [expanduser("~/.mycroft/"),
+            expanduser(data_dir or "/opt/mycroft/res/"),
+            join(os.path.dirname(__file__), 'res')]
+
+
+def _candidate_files(res_name, data_dir=None):
+    """ All the files resolve_resource_file may return, by precedence """
+    return [res_name] + [
+        os.path.abspath(os.path.normpath(join(res_dir, res_name)))
+        for res_dir in resource_dirs(data_dir)]
 
-    # Next look for /opt/mycroft/res/res_name
-    data_dir = data_dir or expanduser("/opt/mycroft/res/")
-    filename = os.path.expanduser(join(data_dir, res_name))
-    if os.path.isfile(filename):
-        return filename
 
-    # Finally look for it in the source package
-    filename = os.path.join(os.path.dirname(__file__), 'res', res_name)
-    filename = os.path.abspath(os.path.normpath(filename))
-    if os.path.isfile(filename):
+class ResourceCache:
+    """
+    Cache of resolve_resource_file results, keyed by (res_name, data_dir).
+
+    Resolving a resource stats up to four files, which adds up on hot paths
+    and on network mounted home directories.  The winning path, or None,
+    is kept according to the cache mode:
+
+        PERMANENT: until clear() is called (the default)
+        TTL: for ``ttl`` seconds
+        STAT: while the directories of the resolved file, and of the
+              candidates taking precedence over it, keep the same mtime.
+              This costs a stat per directory but notices new overrides.
+        DISABLED: no caching at all
+
+    Args:
+        mode (str): one of the modes above
+        ttl (float): lifetime of the entries in TTL mode, in seconds
+    """
+    PERMANENT = "permanent"
+    TTL = "ttl"
+    STAT = "stat"
+    DISABLED = "disabled"
+
+    def __init__(self, mode=PERMANENT, ttl=60.0):
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.configure(mode, ttl)
+
+    def configure(self, mode=PERMANENT, ttl=60.0):
+        """ Change the cache mode, dropping the cached entries """
+        if mode not in (self.PERMANENT, self.TTL, self.STAT, self.DISABLED):
+            raise ValueError("Unknown resource cache mode: " + str(mode))
+        self.mode = mode
+        self.ttl = ttl
+        self.clear()
+
+    def clear(self):
+        """ Drop all cached entries and reset the statistics """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def discard(self, prefix):
+        """ Drop the entries of the resources starting with prefix """
+        for key in [key for key in self._entries if key[0].startswith(prefix)]:
+            del self._entries[key]
+
+    @property
+    def stats(self):
+        """ dict: hits, misses, number of cached entries and mode """
+        return {"hits": self.hits, "misses": self.misses,
+                "entries": len(self._entries), "mode": self.mode}
+
+    @staticmethod
+    def _dir_mtimes(res_name, data_dir, filename):
+        mtimes = []
+        for candidate in _candidate_files(res_name, data_dir):
+            directory = dirname(os.path.abspath(candidate))
+            try:
+                mtimes.append((directory, os.stat(directory).st_mtime))
+            except OSError:
+                mtimes.append((directory, None))
+            if candidate == filename:
+                break
+        return mtimes
+
+    def _is_valid(self, entry):
+        if self.mode == self.PERMANENT:
+            return True
+        if self.mode == self.TTL:
+            return monotonic() < entry[1]
+        for directory, mtime in entry[1]:
+            try:
+                if os.stat(directory).st_mtime != mtime:
+                    return False
+            except OSError:
+                if mtime is not None:
+                    return False
+        return True
+
+    def resolve(self, res_name, data_dir=None):
+        """ Cached resolve_resource_file """
+        if self.mode == self.DISABLED:
+            return _resolve_resource_file(res_name, data_dir)
+
+        key = (res_name, data_dir)
+        entry = self._entries.get(key)
+        if entry is not None and self._is_valid(entry):
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        filename = _resolve_resource_file(res_name, data_dir)
+        if self.mode == self.TTL:
+            validity = monotonic() + self.ttl
+        elif self.mode == self.STAT:
+            validity = self._dir_mtimes(res_name, data_dir, filename)
+        else:
+            validity = None
+        self._entries[key] = (filename, validity)
         return filename
 
-    return None  # Resource cannot be resolved
+
+resource_cache = ResourceCache()
+
+
+def reload_resources():
+    """ Forget the resources read so far, so they are read again from disk
+
+    Call this after changing the resource files, e.g. the overrides in
+    ~/.mycroft.  Alternatively, use resource_cache.configure(ResourceCache.STAT)
+    and set lingua_franca.format.word_translations.check_mtime to True, to
+    have changed files picked up automatically.
+    """
+    from lingua_franca.format import word_translations
+    from lingua_franca.pack import unload_packs
+    resource_cache.clear()
+    unload_packs()
+    word_translations.reload()
+
+
+# imported last, the language modules depend on the helpers above
+from lingua_franca.language import Language, analyze, get_language, \
+    load_languages, unload_language  # noqa: E402
@@ -0,0 +1,216 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Texts analyzed once and shared between the extractors.
+
+An intent pipeline typically calls several extractors on the same
+utterance, and each of them lowercases and tokenizes it again.  A Document,
+created by lingua_franca.analyze(), keeps the results of that preprocessing
+and of the extractors themselves, and is accepted in place of the text by
+the lingua_franca.parse functions and the Language methods:
+
+    from lingua_franca import analyze
+    from lingua_franca.parse import extract_number, extract_datetime
+
+    doc = analyze("wake me up in two and a half hours", "en-us")
+    extract_number(doc)
+    extract_datetime(doc, anchor)
+"""
+from lingua_franca.lang.parse_common import Token, is_numeric, tokenize
+from lingua_franca.time import now_local
+
+# token classes
+NUMERIC = "numeric"
+NUMBER_WORD = "number word"
+ORDINAL = "ordinal"
+FRACTION = "fraction"
+MARKER = "marker"
+
+
+def _is_number(value):
+    return value is not None and value is not False
+
+
+class Document:
+    """
+    A text analyzed for a language.
+
+    The lowercased text, the tokens, their classes and the results of the
+    extractors are computed on first use and kept, so each of them is only
+    computed once however many extractors use them.  The lists returned are
+    copies, changing them doesn't change the document.
+
+    Use lingua_franca.analyze() rather than creating these directly.
+
+    Args:
+        text (str): the text to analyze
+        language (Language): the language of the text
+    """
+
+    def __init__(self, text, language):
+        self.text = text
+        self.language = language
+        self._cache = {}
+
+    def __repr__(self):
+        return "{n}({t!r}, {l})".format(n=self.__class__.__name__,
+                                        t=self.text,
+                                        l=self.language.full_code)
+
+    def _cached(self, key, compute, *args):
+        try:
+            return self._cache[key]
+        except KeyError:
+            result = self._cache[key] = compute(*args)
+            return result
+
+    # preprocessing
+
+    @property
+    def lower(self):
+        """ str: the lowercased text """
+        return self._cached("lower", self.text.lower)
+
+    @property
+    def words(self):
+        """ [str]: the words of the text, as split by tokenize() """
+        return [token.word for token in self._tokens]
+
+    @property
+    def tokens(self):
+        """ [Token]: the tokens of the text, as made by tokenize() """
+        return list(self._tokens)
+
+    @property
+    def _tokens(self):
+        return self._cached("tokens", lambda: tuple(tokenize(self.text)))
+
+    @property
+    def _lower_tokens(self):
+        return self._cached("lower tokens", lambda: tuple(
+            Token(token.word.lower(), token.index, token.start, token.end)
+            for token in self._tokens))
+
+    @property
+    def token_spans(self):
+        """ [(int, int)]: the start and end character of each token """
+        return [(token.start, token.end) for token in self._tokens]
+
+    @property
+    def classes(self):
+        """ [frozenset]: the classes of each token, among NUMERIC,
+        NUMBER_WORD, ORDINAL, FRACTION and MARKER """
+        return list(self._cached("classes", self._classes))
+
+    def _classes(self):
+        classes = {}  # by lowercased word
+        for token in self._lower_tokens:
+            if token.word not in classes:
+                classes[token.word] = self._classify(token.word)
+        return tuple(classes[token.word] for token in self._lower_tokens)
+
+    def _classify(self, word):
+        language = self.language
+        classes = set()
+        if word in language._number_markers:
+            classes.add(MARKER)
+        if is_numeric(word):
+            classes.add(NUMERIC)
+        elif language._extract_number:
+            value = language.extract_number(word)
+            ordinal = language.extract_number(word, ordinals=True)
+            if _is_number(value) or _is_number(ordinal):
+                classes.add(NUMBER_WORD)
+            if _is_number(ordinal) and ordinal != value:
+                classes.add(ORDINAL)
+            if _is_number(value) and 0 < value < 1:
+                classes.add(FRACTION)
+        return frozenset(classes)
+
+    # extractors
+
+    def number_spans(self, short_scale=True, ordinals=False):
+        """ The numbers of the text, with the characters they were read from
+
+        Args:
+            short_scale (bool): see lingua_franca.parse.extract_numbers
+            ordinals (bool): see lingua_franca.parse.extract_numbers
+        Returns:
+            list: (number, start, end) for each number, with text[start:end]
+                  the words it was read from, or None if the language can't
+                  locate its numbers
+        """
+        spans = self._cached(("number spans", short_scale, ordinals),
+                             self._number_spans, short_scale, ordinals)
+        return None if spans is None else list(spans)
+
+    def _number_spans(self, short_scale, ordinals):
+        language = self.language
+        if language._extract_numbers_tokens:
+            numbers = language._extract_numbers_tokens(
+                list(self._tokens), short_scale, ordinals)
+            return tuple((float(number.value), number.start, number.end)
+                         for number in numbers)
+        if language._extract_numbers_with_spans:
+            return tuple(language._extract_numbers_with_spans(
+                self.text, short_scale, ordinals))
+        return None
+
+    def extract_number(self, short_scale=True, ordinals=False):
+        """ See lingua_franca.parse.extract_number """
+        return self._cached(("extract_number", short_scale, ordinals),
+                            self._extract_number, short_scale, ordinals)
+
+    def _extract_number(self, short_scale, ordinals):
+        language = self.language
+        if language._extract_number_tokens:
+            return language._extract_number_tokens(
+                list(self._lower_tokens), short_scale, ordinals).value
+        return language.extract_number(self.text, short_scale, ordinals)
+
+    def extract_numbers(self, short_scale=True, ordinals=False):
+        """ See lingua_franca.parse.extract_numbers """
+        spans = self._cached(("number spans", short_scale, ordinals),
+                             self._number_spans, short_scale, ordinals)
+        if spans is not None:
+            return [number for number, _, _ in spans]
+        return list(self._cached(
+            ("extract_numbers", short_scale, ordinals),
+            self.language.extract_numbers, self.text, short_scale, ordinals))
+
+    def extract_duration(self):
+        """ See lingua_franca.parse.extract_duration """
+        return self._cached("extract_duration",
+                            self.language.extract_duration, self.text)
+
+    def extract_datetime(self, anchorDate=None, default_time=None):
+        """ See lingua_franca.parse.extract_datetime """
+        anchorDate = anchorDate or now_local()
+        result = self._cached(("extract_datetime", anchorDate, default_time),
+                              self.language.extract_datetime, self.text,
+                              anchorDate, default_time)
+        return result and list(result)
+
+    def has_datetime(self):
+        """ See lingua_franca.parse.has_datetime """
+        return self._cached("has_datetime", self.language.has_datetime,
+                            self.text)
+
+    def normalize(self, remove_articles=True):
+        """ See lingua_franca.parse.normalize """
+        return self._cached(("normalize", remove_articles),
+                            self.language.normalize, self.text,
+                            remove_articles)
@@ -17,40 +17,125 @@ from os.path import join
 
 from lingua_franca.lang import get_full_lang_code, get_primary_lang_code
 
-from lingua_franca.lang.format_en import *
-from lingua_franca.lang.format_pt import *
-from lingua_franca.lang.format_it import *
-from lingua_franca.lang.format_sv import *
-from lingua_franca.lang.format_hu import *
-from lingua_franca.lang.format_cs import *
-
-from lingua_franca.lang.format_es import nice_number_es
-from lingua_franca.lang.format_es import nice_time_es
-from lingua_franca.lang.format_es import pronounce_number_es
-from lingua_franca.lang.format_de import nice_number_de
-from lingua_franca.lang.format_de import nice_time_de
-from lingua_franca.lang.format_de import pronounce_number_de
-from lingua_franca.lang.format_fr import nice_number_fr
-from lingua_franca.lang.format_fr import nice_time_fr
-from lingua_franca.lang.format_fr import pronounce_number_fr
-from lingua_franca.lang.format_nl import nice_time_nl
-from lingua_franca.lang.format_nl import pronounce_number_nl
-from lingua_franca.lang.format_nl import nice_number_nl
-from lingua_franca.lang.format_da import nice_number_da
-from lingua_franca.lang.format_da import nice_time_da
-from lingua_franca.lang.format_da import pronounce_number_da
-from lingua_franca.lang.format_cs import nice_number_cs
-from lingua_franca.lang.format_cs import nice_time_cs
-from lingua_franca.lang.format_cs import pronounce_number_cs
+from lingua_franca.lang.registry import get_function, get_provider, \
+    supported_languages
 
 from lingua_franca.bracket_expansion import SentenceTreeParser
+from lingua_franca.pack import TEXT_DIR, load_pack, packed_file, \
+    read_word_file
 from lingua_franca import _log_unsupported_language
+# used to come with the star imports of format_xx
+from lingua_franca.lang.format_common import convert_to_mixed_fraction
 
 from collections import namedtuple
+from importlib import import_module
 import json
 import os
 import datetime
 import re
+import sys
+from types import ModuleType
+
+# the language specific names this module used to have that aren't found
+# in format_xx from their "_xx" suffix
+_LEGACY_NAMES = {"months": "format_hu", "EXTRA_SPACE": "format_hu",
+                 "NUM_POWERS_OF_TEN": "format_hu"}
+
+
+class WordTranslations:
+    """
+    In-memory index of the text/<lang>/*.word resources.
+
+    The index of a language is built the first time one of its words is
+    requested, by scanning the resource directories in reverse order of
+    precedence (see lingua_franca.resource_dirs), so user overrides in
+    ~/.mycroft win over /opt/mycroft and over the packaged resources.  The
+    packaged words come from the language pack when one was built.
+
+    Args:
+        check_mtime (bool): if True, the directories and the .word file are
+            stat'ed on every lookup and the index is refreshed when they
+            changed, for deployments that hot-patch their overrides.
+            Otherwise the index is only refreshed by reload().
+    """
+
+    def __init__(self, check_mtime=False):
+        self.check_mtime = check_mtime
+        self.lang_words = {}
+        self._dirs = {}
+        self._files = {}
+
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    def cache(self, lang):
+        if lang in self.lang_words:
+            return
+        from lingua_franca import resource_dirs
+
+        words = {}
+        files = {}
+        dirs = {}
+        *override_dirs, package_dir = resource_dirs()
+        pack = load_pack(lang)
+        if pack:
+            for filename, word in pack["files"].items():
+                if filename.endswith(".word"):
+                    words[filename[:-len(".word")]] = word
+        else:
+            override_dirs.append(package_dir)
+        for res_dir in reversed(override_dirs):
+            lang_dir = os.path.abspath(join(res_dir, "text", lang))
+            dirs[lang_dir] = self._mtime(lang_dir)
+            if dirs[lang_dir] is None:
+                continue
+            for filename in os.listdir(lang_dir):
+                path = join(lang_dir, filename)
+                if filename.endswith(".word") and os.path.isfile(path):
+                    name = filename[:-len(".word")]
+                    words[name] = read_word_file(path)
+                    files[name] = (path, self._mtime(path))
+        self.lang_words[lang] = words
+        self._files[lang] = files
+        self._dirs[lang] = dirs
+
+    def _is_stale(self, name, lang):
+        for lang_dir, mtime in self._dirs[lang].items():
+            if self._mtime(lang_dir) != mtime:
+                return True
+        path, mtime = self._files[lang].get(name, (None, None))
+        return path is not None and self._mtime(path) != mtime
+
+    def translate(self, name, lang):
+        """ Get the translation of a .word resource
+
+        Args:
+            name (str): Word name. Returned if not translated.
+            lang (str): full language code, e.g. "en-us"
+
+        Returns:
+            str: translated version of resource name
+        """
+        if self.check_mtime and lang in self.lang_words and \
+                self._is_stale(name, lang):
+            self.reload(lang)
+        self.cache(lang)
+        word = self.lang_words[lang].get(name)
+        return name if word is None else word
+
+    def reload(self, lang=None):
+        """ Drop the index of a language, or of all languages if None """
+        if lang is None:
+            self.lang_words.clear()
+        else:
+            self.lang_words.pop(lang, None)
+
+
+word_translations = WordTranslations()
 
 
 def _translate_word(name, lang):
@@ -63,23 +148,15 @@ def _translate_word(name, lang):
     Returns:
         str: translated version of resource name
     """
-    from lingua_franca import resolve_resource_file
+    return word_translations.translate(name, get_full_lang_code(lang))
 
-    lang_code = get_full_lang_code(lang)
 
-    filename = resolve_resource_file(join("text", lang_code, name+".word"))
-    if filename:
-        # open the file
-        try:
-            with open(filename, 'r', encoding='utf8') as f:
-                for line in f:
-                    word = line.strip()
-                    if word.startswith("#"):
-                        continue  # skip comment lines
-                    return word
-        except Exception:
-            pass
-    return name  # use resource name as the word
+# Optional arguments understood by each pronounce_number_xx, besides places
+_PRONOUNCE_NUMBER_OPTIONS = {
+    "en": ("short_scale", "scientific", "ordinals"),
+    "cs": ("short_scale", "scientific", "ordinals"),
+    "it": ("short_scale", "scientific"),
+}
 
 
 NUMBER_TUPLE = namedtuple(
@@ -93,29 +170,37 @@ class DateTimeFormat:
         self.lang_config = {}
         self.config_path = config_path
 
+    def _load_config(self, lang):
+        if os.path.normpath(self.config_path) == os.path.normpath(TEXT_DIR):
+            config = packed_file(lang, 'date_time.json')
+            if config is not None:
+                return config
+        with open(self.config_path + '/' + lang + '/date_time.json',
+                  'r', encoding='utf8') as lang_config_file:
+            return json.loads(lang_config_file.read())
+
     def cache(self, lang):
         if lang not in self.lang_config:
             try:
                 # Attempt to load the language-specific formatting data
-                with open(self.config_path + '/' + lang + '/date_time.json',
-                          'r', encoding='utf8') as lang_config_file:
-                    self.lang_config[lang] = json.loads(
-                        lang_config_file.read())
+                config = self._load_config(lang)
             except FileNotFoundError:
                 # Fallback to English formatting
-                with open(self.config_path + '/en-us/date_time.json',
-                          'r') as lang_config_file:
-                    self.lang_config[lang] = json.loads(
-                        lang_config_file.read())
+                config = self._load_config('en-us')
 
+            # the packed config is shared, copy what the compiled regexes
+            # are added to instead of modifying it
+            config = dict(config)
             for x in ['decade_format', 'hundreds_format', 'thousand_format',
                       'year_format']:
+                config[x] = dict(config[x])
                 i = 1
-                while self.lang_config[lang][x].get(str(i)):
-                    self.lang_config[lang][x][str(i)]['re'] = (
-                        re.compile(self.lang_config[lang][x][str(i)]['match']
-                                   ))
+                while config[x].get(str(i)):
+                    config[x][str(i)] = dict(config[x][str(i)])
+                    config[x][str(i)]['re'] = re.compile(
+                        config[x][str(i)]['match'])
                     i = i + 1
+            self.lang_config[lang] = config
 
     def _number_strings(self, number, lang):
         x = (self.lang_config[lang]['number'].get(str(number % 10)) or
@@ -264,34 +349,14 @@ def nice_number(number, lang=None, speech=True, denominators=None):
     """
     # Convert to spoken representation in appropriate language
     lang_code = get_primary_lang_code(lang)
-    if lang_code == "en":
-        return nice_number_en(number, speech, denominators)
-    elif lang_code == "es":
-        return nice_number_es(number, speech, denominators)
-    elif lang_code == "pt":
-        return nice_number_pt(number, speech, denominators)
-    elif lang_code == "it":
-        return nice_number_it(number, speech, denominators)
-    elif lang_code == "fr":
-        return nice_number_fr(number, speech, denominators)
-    elif lang_code == "sv":
-        return nice_number_sv(number, speech, denominators)
-    elif lang_code == "de":
-        return nice_number_de(number, speech, denominators)
-    elif lang_code == "hu":
-        return nice_number_hu(number, speech, denominators)
-    elif lang_code == "nl":
-        return nice_number_nl(number, speech, denominators)
-    elif lang_code == "da":
-        return nice_number_da(number, speech, denominators)
-    elif lang_code == "cs":
-        return nice_number_cs(number, speech, denominators)
+    nice = get_function("nice_number", lang_code)
+    if nice:
+        return nice(number, speech, denominators)
 
     # Default to the raw number for unsupported languages,
     # hopefully the STT engine will pronounce understandably.
     # TODO: nice_number_XX for other languages
-    _log_unsupported_language(lang_code, ['en', 'es', 'pt', 'it', 'fr',
-                                          'sv', 'de', 'hu', 'nl', 'da', 'cs'])
+    _log_unsupported_language(lang_code, supported_languages("nice_number"))
     return str(number)
 
 
@@ -313,31 +378,11 @@ def nice_time(dt, lang=None, speech=True, use_24hour=False,
         (str): The formatted time string
     """
     lang_code = get_primary_lang_code(lang)
-    if lang_code == "en":
-        return nice_time_en(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "es":
-        return nice_time_es(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "it":
-        return nice_time_it(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "fr":
-        return nice_time_fr(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "de":
-        return nice_time_de(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "hu":
-        return nice_time_hu(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "nl":
-        return nice_time_nl(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "da":
-        return nice_time_da(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "pt":
-        return nice_time_pt(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "sv":
-        return nice_time_sv(dt, speech, use_24hour, use_ampm)
-    elif lang_code == "cs":
-        return nice_time_cs(dt, speech, use_24hour, use_ampm)
+    nice = get_function("nice_time", lang_code)
+    if nice:
+        return nice(dt, speech, use_24hour, use_ampm)
     # TODO: Other languages
-    _log_unsupported_language(lang_code, ['en', 'es', 'pt', 'it', 'fr',
-                                          'sv', 'de', 'hu', 'nl', 'da','cs'])
+    _log_unsupported_language(lang_code, supported_languages("nice_time"))
     return str(dt)
 
 
@@ -358,41 +403,18 @@ def pronounce_number(number, lang=None, places=2, short_scale=True,
         (str): The pronounced number
     """
     lang_code = get_primary_lang_code(lang)
-    if lang_code == "en":
-        return pronounce_number_en(number, places=places,
-                                   short_scale=short_scale,
-                                   scientific=scientific,
-                                   ordinals=ordinals)
-    elif lang_code == "it":
-        return pronounce_number_it(number, places=places,
-                                   short_scale=short_scale,
-                                   scientific=scientific)
-    elif lang_code == "es":
-        return pronounce_number_es(number, places=places)
-    elif lang_code == "fr":
-        return pronounce_number_fr(number, places=places)
-    elif lang_code == "de":
-        return pronounce_number_de(number, places=places)
-    elif lang_code == "hu":
-        return pronounce_number_hu(number, places=places)
-    elif lang_code == "nl":
-        return pronounce_number_nl(number, places=places)
-    elif lang_code == "da":
-        return pronounce_number_da(number, places=places)
-    elif lang_code == "pt":
-        return pronounce_number_pt(number, places=places)
-    elif lang_code == "sv":
-        return pronounce_number_sv(number, places=places)
-    elif lang_code == "cs":
-        return pronounce_number_cs(number, places=places,
-                                   short_scale=short_scale,
-                                   scientific=scientific,
-                                   ordinals=ordinals)
+    pronounce = get_function("pronounce_number", lang_code)
+    if pronounce:
+        options = {"short_scale": short_scale, "scientific": scientific,
+                   "ordinals": ordinals}
+        kwargs = {option: options[option] for option in
+                  _PRONOUNCE_NUMBER_OPTIONS.get(lang_code, ())}
+        return pronounce(number, places=places, **kwargs)
 
     # Default to just returning the numeric value
     # TODO: Other languages
-    _log_unsupported_language(lang_code, ['en', 'es', 'pt', 'it', 'fr',
-                                          'sv', 'de', 'hu', 'nl', 'da','cs'])
+    _log_unsupported_language(lang_code,
+                              supported_languages("pronounce_number"))
     return str(number)
 
 
@@ -483,6 +505,22 @@ def nice_duration(duration, lang=None, speech=True):
     Returns:
         str: timespan as a string
     """
+    return _nice_duration(duration, speech,
+                          lambda number: pronounce_number(number, lang),
+                          lambda word: _translate_word(word, lang))
+
+
+def _nice_duration(duration, speech, pronounce, translate):
+    """ Implementation of nice_duration
+
+    Args:
+        duration: time, in seconds
+        speech (bool): format for speech (True) or display (False)
+        pronounce (callable): pronounces a number in the target language
+        translate (callable): translates a .word resource name
+    Returns:
+        str: timespan as a string
+    """
     if type(duration) is datetime.timedelta:
         duration = duration.total_seconds()
 
@@ -499,36 +537,36 @@ def nice_duration(duration, lang=None, speech=True):
     if speech:
         out = ""
         if days > 0:
-            out += pronounce_number(days, lang) + " "
+            out += pronounce(days) + " "
             if days == 1:
-                out += _translate_word("day", lang)
+                out += translate("day")
             else:
-                out += _translate_word("days", lang)
+                out += translate("days")
             out += " "
         if hours > 0:
             if out:
                 out += " "
-            out += pronounce_number(hours, lang) + " "
+            out += pronounce(hours) + " "
             if hours == 1:
-                out += _translate_word("hour", lang)
+                out += translate("hour")
             else:
-                out += _translate_word("hours", lang)
+                out += translate("hours")
         if minutes > 0:
             if out:
                 out += " "
-            out += pronounce_number(minutes, lang) + " "
+            out += pronounce(minutes) + " "
             if minutes == 1:
-                out += _translate_word("minute", lang)
+                out += translate("minute")
             else:
-                out += _translate_word("minutes", lang)
+                out += translate("minutes")
         if seconds > 0:
             if out:
                 out += " "
-            out += pronounce_number(seconds, lang) + " "
+            out += pronounce(seconds) + " "
             if seconds == 1:
-                out += _translate_word("second", lang)
+                out += translate("second")
             else:
-                out += _translate_word("seconds", lang)
+                out += translate("seconds")
     else:
         # M:SS, MM:SS, H:MM:SS, Dd H:MM:SS format
         out = ""
@@ -561,6 +599,14 @@ def join_list(items, connector, sep=None, lang=None):
         str: the connected list phrase
     """
 
+    return _join_list(items, connector, sep,
+                      lambda word: _translate_word(word, lang))
+
+
+def _join_list(items, connector, sep, translate):
+    """ Implementation of join_list, translate being a callable that
+    translates the connector resource name
+    """
     if not items:
         return ""
     if len(items) == 1:
@@ -571,7 +617,7 @@ def join_list(items, connector, sep=None, lang=None):
     else:
         sep += " "
     return (sep.join(str(item) for item in items[:-1]) +
-            " " + _translate_word(connector, lang) +
+            " " + translate(connector) +
             " " + items[-1])
 
 
@@ -606,3 +652,30 @@ def expand_options(parentheses_line: str) -> list:
     # 'a(this|that)b' -> [['a', 'this', 'b'], ['a', 'that', 'b']]
     options = expand_parentheses(re.split(r'([(|)])', parentheses_line))
     return [re.sub(r'\s+', ' ', ' '.join(i)).strip() for i in options]
+
+
+def __getattr__(name):
+    """ Backwards compatibility for the language specific functions, which
+    used to be imported into this module, e.g. format.nice_number_en
+    """
+    module = _LEGACY_NAMES.get(name)
+    if module is None:
+        provider = get_provider(name.rsplit("_", 1)[-1].lower())
+        module = provider and "format_" + provider.code
+    if module:
+        try:
+            return getattr(import_module("lingua_franca.lang." + module),
+                           name)
+        except (ImportError, AttributeError):
+            pass
+    raise AttributeError("module {} has no attribute {}".format(__name__,
+                                                                name))
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ (PEP 562) is new in Python 3.7
+    class _Module(ModuleType):
+        def __getattr__(self, name):
+            return __getattr__(name)
+
+    sys.modules[__name__].__class__ = _Module
@@ -12,10 +12,36 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import threading
+from contextlib import contextmanager
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # Python < 3.7
+    class ContextVar(threading.local):
+        """ The part of contextvars.ContextVar used here, per thread only """
+
+        def __init__(self, name, default=None):
+            self.value = default
+
+        def get(self):
+            return self.value
+
+        def set(self, value):
+            token, self.value = self.value, value
+            return token
+
+        def reset(self, token):
+            self.value = token
+
 
 __active_lang = "en-us"  # English is the default active language
 # TODO: Should this really be stored in the user config file?
 
+# Language set by active_lang() for the current thread / asyncio task,
+# None meaning the process wide default set by set_active_lang()
+_context_lang = ContextVar("lingua_franca_active_lang", default=None)
+
 
 def get_active_lang():
     """ Get the active full language code (BCP-47)
@@ -23,12 +49,15 @@ def get_active_lang():
     Returns:
         str: A BCP-47 language code, e.g. ("en-us", or "pt-pt")
     """
-    return __active_lang
+    return _context_lang.get() or __active_lang
 
 
 def set_active_lang(lang_code):
     """ Set the active BCP-47 language code to be used in formatting/parsing
 
+    This is the process wide default, used by every thread and task that
+    isn't inside an active_lang() block.
+
     Args:
         lang (str): BCP-47 language code, e.g. "en-us" or "es-mx"
     """
@@ -38,6 +67,30 @@ def set_active_lang(lang_code):
         __active_lang = lang_code
 
 
+@contextmanager
+def active_lang(lang_code):
+    """ Set the active language for the current context only
+
+    The language is stored in a context variable, so concurrent threads and
+    asyncio tasks each keep their own active language without locking, and
+    the previous one is restored when the block exits.  Before Python 3.7,
+    which has no contextvars, it is stored per thread: the asyncio tasks
+    of a thread share it.
+
+    Example:
+        with active_lang("de-de"):
+            extract_number("zwei")
+
+    Args:
+        lang_code (str): BCP-47 language code, e.g. "en-us" or "es-mx"
+    """
+    token = _context_lang.set(lang_code)
+    try:
+        yield lang_code
+    finally:
+        _context_lang.reset(token)
+
+
 def get_primary_lang_code(lang=None):
     """ Get the primary language code
 
@@ -65,6 +118,6 @@ def get_full_lang_code(lang=None):
         str: A full language code, such as "en-us" or "de-de"
     """
     if not lang:
-        lang = __active_lang
+        lang = _context_lang.get() or __active_lang
 
     return lang or "en-us"
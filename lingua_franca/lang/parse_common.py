@@ -13,7 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from collections import namedtuple
+from calendar import monthrange
+from collections import OrderedDict
+from datetime import datetime, timedelta, MINYEAR, MAXYEAR
+from functools import lru_cache, wraps
+from threading import Lock
+from types import MappingProxyType
+from unicodedata import normalize
 import re
 
 
@@ -189,11 +195,49 @@ class Normalizer:
         return utterance
 
 
-# Token is intended to be used in the number processing functions in
-# this module. The parsing requires slicing and dividing of the original
-# text. To ensure things parse correctly, we need to know where text came
-# from in the original input, hence this nametuple.
-Token = namedtuple('Token', 'word index')
+class Token:
+    """
+    A word of a text, as used in the number processing functions.
+
+    The parsing requires slicing and dividing of the original text.  To
+    ensure things parse correctly, we need to know where each word came
+    from in the original input: its index in the list of words, and its
+    start and end characters, so text[start:end] is the word as written.
+
+    Tokens compare and unpack like the (word, index) tuples they replace.
+
+    Args:
+        word (str): the word
+        index (int): the position of the word in the list of words
+        start (int): offset of its first character, None if unknown
+        end (int): offset after its last character, None if unknown
+    """
+    __slots__ = ("word", "index", "start", "end")
+
+    def __init__(self, word, index, start=None, end=None):
+        self.word = word
+        self.index = index
+        self.start = start
+        self.end = end
+
+    def __eq__(self, other):
+        if isinstance(other, Token):
+            return self.word == other.word and self.index == other.index
+        if isinstance(other, tuple):
+            return (self.word, self.index) == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.word, self.index))
+
+    def __iter__(self):
+        yield self.word
+        yield self.index
+
+    def __repr__(self):
+        return "{n}(word={w!r}, index={i}, start={s}, end={e})".format(
+            n=self.__class__.__name__, w=self.word, i=self.index,
+            s=self.start, e=self.end)
 
 
 class ReplaceableNumber:
@@ -203,12 +247,13 @@ class ReplaceableNumber:
     Once we've found a number in a string, this class contains all
     the info about the value, and where it came from in the original text.
     In other words, it is the text, and the number that can replace it in
-    the string.
+    the string.  text[number.start:number.end] is the number as written.
     """
+    __slots__ = ("value", "tokens")
 
     def __init__(self, value, tokens: [Token]):
-        self.value = value
-        self.tokens = tokens
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "tokens", tokens)
 
     def __bool__(self):
         return bool(self.value is not None and self.value is not False)
@@ -221,17 +266,22 @@ class ReplaceableNumber:
     def end_index(self):
         return self.tokens[-1].index
 
+    @property
+    def start(self):
+        """ int: offset of the first character of the number in the text """
+        return self.tokens[0].start
+
+    @property
+    def end(self):
+        """ int: offset after the last character of the number """
+        return self.tokens[-1].end
+
     @property
     def text(self):
         return ' '.join([t.word for t in self.tokens])
 
     def __setattr__(self, key, value):
-        try:
-            getattr(self, key)
-        except AttributeError:
-            super().__setattr__(key, value)
-        else:
-            raise Exception("Immutable!")
+        raise Exception("Immutable!")
 
     def __str__(self):
         return "({v}, {t})".format(v=self.value, t=self.tokens)
@@ -251,8 +301,20 @@ def tokenize(text):
         [Token]
 
     """
-    return [Token(word, index)
-            for index, word in enumerate(Normalizer.tokenize(text))]
+    tokens = []
+    for match in re.finditer(r"\S+", text):
+        word = match.group()
+        if "%" in word or "#" in word:
+            # Normalizer.tokenize splits "12%" and "#1" further
+            end = match.start()
+            for part in Normalizer.tokenize(word):
+                start = text.index(part, end)
+                end = start + len(part)
+                tokens.append(Token(part, len(tokens), start, end))
+        else:
+            tokens.append(Token(word, len(tokens), match.start(),
+                                match.end()))
+    return tokens
 
 
 def partition_list(items, split_on):
@@ -300,6 +362,28 @@ def invert_dict(original):
     return {value: key for key, value in original.items()}
 
 
+def fraction_table(denominators, values=None):
+    """
+    Build the read-only lookup table of the fraction words of a language.
+
+    The isFractional_xx helpers build their tables once, at import, and
+    answer with a single lookup.
+
+    Args:
+        denominators dict: fraction word to its denominator, e.g. "fifth": 5
+        values dict: fraction word to its value, for the fractions that
+                     aren't 1/n, e.g. "three quarters": 0.75
+
+    Returns:
+        MappingProxyType: fraction word to value, e.g. "fifth": 0.2
+
+    """
+    table = {word: 1.0 / denominator
+             for word, denominator in denominators.items()}
+    table.update(values or {})
+    return MappingProxyType(table)
+
+
 def is_numeric(input_str):
     """
     Takes in a string and tests to see if it is a number.
@@ -335,6 +419,625 @@ def look_for_fractions(split_list):
     return False
 
 
+def grammar_rule(rule):
+    """
+    Memoize a rule of a recursive-descent number grammar.
+
+    A rule is called as rule(words, i, memo) and returns the
+    (value, index of the next word) of the match starting at words[i], or
+    None.  Its result is kept in memo under (rule, i), so a scan sharing
+    one memo across all its start indices parses each suffix only once.
+    The memo must be discarded whenever words changes.
+
+    Args:
+        rule function: rule(words, i, memo) -> (value, next index) or None
+
+    Returns:
+        function: the memoized rule, with the same signature
+
+    """
+    @wraps(rule)
+    def memoized(words, i, memo):
+        key = (rule, i)
+        if key in memo:
+            return memo[key]
+        result = memo[key] = rule(words, i, memo)
+        return result
+    return memoized
+
+
+_NO_KINDS = MappingProxyType({})
+
+
+def _numeral_kinds(word):
+    """ The kinds of a number written in digits, "12", "0.5" or "1/2" """
+    if is_numeric(word):
+        return {"numeral": float(word)}
+    parts = word.split("/")
+    if look_for_fractions(parts):
+        denominator = float(parts[1])
+        return {"numeral": float(parts[0]) / denominator
+                if denominator else None}
+    return _NO_KINDS
+
+
+class NumberLexicon:
+    """
+    The number vocabulary of a language, in a table of words.
+
+    Each language builds its lexicons once, when its module is loaded,
+    from the same tables its extractors use.  A single lookup then tells
+    everything a word can be in a number, instead of testing it against
+    each table in turn.
+
+    Each word is stored with its kinds, a dict of kind to value, True
+    for the kinds the language doesn't give a value:
+        "number": a number, "two": 2, "half": 0.5
+        "sum": a number summed with the next one, "twenty"
+        "multiplier": a number multiplying the previous one, "hundred": 100
+        "ordinal": "third": 3
+        "fraction": "third": 1/3
+        "marker": a word joining the parts of a number, "and", "point"
+        "negative": a word negating the next number, "minus"
+        "article": a word that can precede a number, "a"
+    Words written in digits, "12", "0.5" or "1/2", are of kind "numeral",
+    without being stored.  The kinds returned are shared by all the
+    lookups: don't modify them.
+
+    Args:
+        entries (dict): kind to its words, a dict of word to value or a
+                        collection of words
+    """
+    __slots__ = ("_words",)
+
+    def __init__(self, entries=None):
+        self._words = {}
+        for kind, words in (entries or {}).items():
+            self.update(kind, words)
+
+    def add(self, word, kind, value=True):
+        """
+        Add a word.
+
+        Args:
+            word (str): the word, as written
+            kind (str): what the word is in a number, e.g. "number"
+            value: the value of the word as this kind
+        """
+        if not word or len(word.split()) != 1:
+            raise ValueError("Not a single word: {!r}".format(word))
+        self._words.setdefault(word, {})[kind] = value
+
+    def update(self, kind, words):
+        """
+        Add words of the same kind.
+
+        Args:
+            kind (str): what the words are in a number, e.g. "number"
+            words (dict or collection): word to value, or words
+        """
+        if isinstance(words, dict):
+            for word, value in words.items():
+                self.add(word, kind, value)
+        else:
+            for word in words:
+                self.add(word, kind)
+
+    def kinds(self, word):
+        """
+        Get what a word can be in a number.
+
+        Args:
+            word (str): the word, as written
+
+        Returns:
+            dict: kind to value, empty if the word isn't a number word
+        """
+        kinds = self._words.get(word)
+        if kinds is not None:
+            return kinds
+        return _numeral_kinds(word)
+
+
+def _positions(words):
+    """ word -> position of its first occurrence, as list.index() finds """
+    positions = {}
+    for position, word in enumerate(words):
+        positions.setdefault(word, position)
+    return positions
+
+
+_DIGIT = re.compile(r"\d")
+
+# ASCII punctuation and whitespace
+_NOT_ALPHANUMERIC = "".join(chr(c) for c in range(128)
+                            if not chr(c).isalnum()).encode("ascii")
+
+
+def _fold_datetime_text(text):
+    """ text lowercased, without accents, punctuation and whitespace """
+    return normalize("NFKD", text.lower()).encode("ascii", "ignore") \
+        .translate(None, _NOT_ALPHANUMERIC).decode("ascii")
+
+
+def _trie_pattern(words):
+    """
+    Regular expression matching any of the words, factored as a trie so
+    the regex engine never tries the same prefix twice.
+
+    A word starting with another one is left out, as anything it matches
+    the shorter one matches as well.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = None
+
+    def branches(node):
+        if "" in node:
+            return ""
+        alternatives = [re.escape(char) + branches(child)
+                        for char, child in sorted(node.items())]
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return "(?:" + "|".join(alternatives) + ")"
+
+    return branches(trie) if trie else "(?!)"
+
+
+class DatetimeLexicon:
+    """
+    The date and time vocabulary of a language.
+
+    Each extract_datetime_xx used to rebuild its word lists on every call,
+    and to look the position of a day or a month up with list.index().
+    The lists are now built once, when the language module is loaded, and
+    the positions are dict lookups.
+
+    The days, months and months_short lists keep their order, and their
+    word -> position tables are day_index, month_index and
+    month_short_index.  Every other list is kept in the attribute named
+    after its keyword argument, as a tuple, or a frozenset if it was given
+    as a set.  A dict is kept as a read-only mapping: the parsers look the
+    current word up in these tables, e.g. relative_days={"today": 0}, where
+    they used to compare it with each keyword in turn.
+
+    The triggers are the words extract_datetime_xx can't find anything
+    without, besides the days, the months and the digits: has_datetime()
+    looks for them with a single regular expression before the parser
+    runs.  A word the parser only uses next to another trigger, like
+    "at" in "at 5", doesn't need to be one.
+
+    Args:
+        days (list): weekday names, monday first
+        months (list): month names, january first
+        months_short (list): abbreviated month names, january first
+        triggers (list): the other words a date or time needs
+        trigger_phrases (list): the triggers made of several words, each
+            a tuple of word lists: one word of each list, in that order,
+            anywhere in the text, e.g. (["from"], ["next", "last"])
+        **tables: the other word lists, e.g. markers=["at", "on"], and
+            word tables, e.g. relative_days={"today": 0, "tomorrow": 1}
+    """
+
+    def __init__(self, days, months, months_short=(), triggers=(),
+                 trigger_phrases=(), **tables):
+        self.days = tuple(days)
+        self.months = tuple(months)
+        self.months_short = tuple(months_short)
+        self.day_index = _positions(self.days)
+        self.month_index = _positions(self.months)
+        self.month_short_index = _positions(self.months_short)
+        for name, words in tables.items():
+            if isinstance(words, dict):
+                words = MappingProxyType(dict(words))
+            elif isinstance(words, (set, frozenset)):
+                words = frozenset(words)
+            else:
+                words = tuple(words)
+            setattr(self, name, words)
+        words = self.days + self.months + self.months_short + tuple(triggers)
+        patterns = [_trie_pattern(_fold_datetime_text(word) for word in words)]
+        for phrase in trigger_phrases:
+            patterns.append(".*".join(
+                _trie_pattern(_fold_datetime_text(word) for word in choices)
+                for choices in phrase))
+        self._find_trigger = re.compile("|".join(patterns)).search
+
+    def has_datetime(self, text):
+        """
+        Check if text may contain a date or a time.
+
+        The text is lowercased and stripped of its accents, punctuation and
+        spaces, as no clean_string of the parsers keeps more of it, and
+        searched for a digit or a trigger.  A trigger inside a longer word
+        counts too, so "mondays" or "week-end" are found whatever the
+        parser does with them.
+
+        Args:
+            text (str): the text to check
+
+        Returns:
+            bool: False if extract_datetime_xx would find nothing in text
+        """
+        return _DIGIT.search(text) is not None or \
+            self._find_trigger(_fold_datetime_text(text)) is not None
+
+    def month(self, word):
+        """
+        Get the position of a month, from its name or abbreviation.
+
+        Args:
+            word (str): the month, lowercase
+
+        Returns:
+            int: 0 for january, None if the word isn't a month
+        """
+        position = self.month_index.get(word)
+        if position is None:
+            position = self.month_short_index.get(word)
+        return position
+
+
+class DatetimePlan:
+    """
+    What extract_datetime_xx found in a text, before it is applied to an
+    anchor date: the explicit date, the offsets and the time of day it
+    read, and the words it left.
+
+    A plan is shared by every anchor it holds for, it is never modified.
+
+    Args:
+        leftover (str): the text without the date and time words
+        date_str (str): the explicit date, "month day [year]", or ""
+        has_year (bool): True if date_str has a year
+        year_offset, month_offset, day_offset (int): offsets of the date
+        hour, minute (int): time of day, None if not given, -1 if the
+            time is relative to the anchor
+        hour_offset, minute_offset, second_offset (int): offsets of the
+            time
+        day_specified (bool): True if the text set the day, so a time of
+            day already past isn't moved to the next day
+        time_str (str): the time of day the parser spelled out, or ""
+        now (bool): True if the text is "now", the anchor itself
+    """
+    __slots__ = ("leftover", "date_str", "has_year", "year_offset",
+                 "month_offset", "day_offset", "hour", "minute",
+                 "hour_offset", "minute_offset", "second_offset",
+                 "day_specified", "time_str", "now")
+
+    def __init__(self, leftover, date_str="", has_year=False, year_offset=0,
+                 month_offset=0, day_offset=0, hour=None, minute=None,
+                 hour_offset=0, minute_offset=0, second_offset=0,
+                 day_specified=False, time_str="", now=False):
+        self.leftover = leftover
+        self.date_str = date_str
+        self.has_year = has_year
+        self.year_offset = year_offset
+        self.month_offset = month_offset
+        self.day_offset = day_offset
+        self.hour = hour
+        self.minute = minute
+        self.hour_offset = hour_offset
+        self.minute_offset = minute_offset
+        self.second_offset = second_offset
+        self.day_specified = day_specified
+        self.time_str = time_str
+        self.now = now
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        if isinstance(other, DatetimePlan):
+            return self._values() == other._values()
+        return NotImplemented
+
+    def __repr__(self):
+        return "{n}({a})".format(
+            n=self.__class__.__name__,
+            a=", ".join("{}={!r}".format(name, value) for name, value
+                        in zip(self.__slots__, self._values())))
+
+
+def _day_of_week(anchor):
+    return anchor.isoweekday() % 7
+
+
+def _is_before(anchor, hour, minute):
+    return anchor.hour < hour or (anchor.hour == hour and
+                                  anchor.minute < minute)
+
+
+class AnchorFacts:
+    """
+    The anchor date as a parse sees it: each fact read from it is
+    recorded, as the resulting plan only holds for the anchors sharing
+    them.
+
+    Args:
+        anchor (datetime): the anchor date
+    """
+    __slots__ = ("_anchor", "read")
+
+    def __init__(self, anchor):
+        self._anchor = anchor
+        self.read = []
+
+    def _ask(self, question, *args):
+        answer = question(self._anchor, *args)
+        self.read.append((question, args, answer))
+        return answer
+
+    def day_of_week(self):
+        """
+        Returns:
+            int: the day of the anchor, 0 for sunday, as strftime("%w")
+        """
+        return self._ask(_day_of_week)
+
+    def is_before(self, hour, minute=0):
+        """
+        Returns:
+            bool: True if the time of the anchor is before hour:minute
+        """
+        return self._ask(_is_before, hour, minute)
+
+
+class _Question:
+    """ A fact a parse read from the anchor, and the plans of each answer """
+    __slots__ = ("question", "args", "answers")
+
+    def __init__(self, question, args):
+        self.question = question
+        self.args = args
+        self.answers = {}
+
+
+_MISSING = object()
+
+
+class DatetimePlans:
+    """
+    The DatetimePlan of each text extract_datetime_xx was given, so a text
+    seen before is applied to a new anchor without being parsed again.
+
+    The parse of a text only reads a few facts of the anchor, through
+    AnchorFacts: nothing for "tomorrow at 5 pm", the day of the week for
+    "next tuesday", whether a time of day has passed for "at 5".  The plans
+    of a text are kept in a tree of the facts read, and an anchor reuses
+    the plan whose facts it shares, the text being parsed again otherwise.
+
+    Args:
+        plan (callable): plan(text, anchor) -> DatetimePlan, or None if the
+            text has no date, anchor being an AnchorFacts
+        size (int): number of texts kept, the least recently used is
+            dropped first, 0 disables the cache
+    """
+
+    def __init__(self, plan, size=1000):
+        self._plan = plan
+        self.size = size
+        self._texts = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """ Drop all the plans and reset the statistics """
+        with self._lock:
+            self._texts.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def stats(self):
+        """ dict: hits, misses and number of texts kept """
+        return {"hits": self.hits, "misses": self.misses,
+                "entries": len(self._texts)}
+
+    def get(self, text, anchor):
+        """
+        Get the plan of a text, parsing it if no plan of it holds at anchor.
+
+        Args:
+            text (str): the text, as given to extract_datetime_xx
+            anchor (datetime): the anchor date
+
+        Returns:
+            DatetimePlan: the plan, None if the text has no date
+        """
+        with self._lock:
+            node = self._texts.get(text, _MISSING)
+            if node is not _MISSING:
+                self._texts.move_to_end(text)
+        while isinstance(node, _Question):
+            node = node.answers.get(node.question(anchor, *node.args),
+                                    _MISSING)
+        if node is not _MISSING:
+            self.hits += 1
+            return node
+
+        self.misses += 1
+        facts = AnchorFacts(anchor)
+        plan = self._plan(text, facts)
+        if self.size > 0:
+            self._add(text, facts.read, plan)
+        return plan
+
+    def _add(self, text, read, plan):
+        with self._lock:
+            if not read:
+                self._texts[text] = plan
+            else:
+                node = self._texts.get(text)
+                if not isinstance(node, _Question):
+                    node = self._texts[text] = _Question(*read[0][:2])
+                # the parse only depends on the text and the answers, so
+                # the same answers lead to the same next question
+                for (_, _, answer), following in zip(read, read[1:]):
+                    child = node.answers.get(answer)
+                    if not isinstance(child, _Question):
+                        child = node.answers[answer] = \
+                            _Question(*following[:2])
+                    node = child
+                node.answers[read[-1][2]] = plan
+            while len(self._texts) > self.size:
+                self._texts.popitem(last=False)
+
+
+# the day and the year as datetime.strptime reads "%d" and "%Y"
+_DAY = re.compile(r"\s*(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])", re.IGNORECASE)
+_DAY_YEAR = re.compile(r"\s*(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])\s+(\d\d\d\d)",
+                       re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _month_numbers(months):
+    return {name: number for number, name in enumerate(months, 1)}
+
+
+def parse_month_day(date_str, months):
+    """
+    Read the date extract_datetime_xx built, "<month> <day>" or
+    "<month> <day> <year>", the month being one of months.
+
+    This is datetime.strptime(date_str, "%B %d"), then "%B %d %Y", in the
+    language of months: the month is looked up in months rather than in
+    the month names of the C locale, with no lock and no exception when
+    the date has a year.
+
+    Args:
+        date_str (str): the month, a space and the day, and maybe the year
+        months (tuple): the month names, january first
+
+    Returns:
+        datetime: the date, in 1900 if date_str has no year
+
+    Raises:
+        ValueError: if date_str is no such date
+    """
+    month, _, rest = date_str.partition(" ")
+    number = _month_numbers(months).get(month)
+    if number is not None:
+        match = _DAY.match(rest)
+        if match is not None and match.end() == len(rest):
+            return datetime(1900, number, int(match.group(1)))
+        match = _DAY_YEAR.match(rest)
+        if match is not None and match.end() == len(rest):
+            return datetime(int(match.group(2)), number,
+                            int(match.group(1)))
+    raise ValueError("{!r} is not a date of the form '<month> <day> "
+                     "[<year>]'".format(date_str))
+
+
+def _relative_timedelta(days=0, hours=0, minutes=0, seconds=0):
+    """
+    The timedelta a relativedelta of days, hours, minutes and seconds adds
+    to a datetime, carried over as relativedelta does so float values are
+    rounded to the same microsecond.
+    """
+    if abs(seconds) > 59:
+        sign = 1 if seconds > 0 else -1
+        div, seconds = divmod(seconds * sign, 60)
+        seconds *= sign
+        minutes += div * sign
+    if abs(minutes) > 59:
+        sign = 1 if minutes > 0 else -1
+        div, minutes = divmod(minutes * sign, 60)
+        minutes *= sign
+        hours += div * sign
+    if abs(hours) > 23:
+        sign = 1 if hours > 0 else -1
+        div, hours = divmod(hours * sign, 24)
+        hours *= sign
+        days += div * sign
+    return timedelta(days=days, hours=hours, minutes=minutes,
+                     seconds=seconds)
+
+
+_MIN_ORDINAL = datetime.min.toordinal()
+_MAX_ORDINAL = datetime.max.toordinal()
+
+
+def _shift_month(year, month, day, months):
+    """ (year, month, day) moved by months, the day clamped to the month """
+    year, month = divmod(year * 12 + month - 1 + months, 12)
+    month += 1
+    return year, month, min(monthrange(year, month)[1], day)
+
+
+def shift_datetime(date, years=0, months=0, days=0, time=None, hours=0,
+                   minutes=0, seconds=0, not_before=None):
+    """
+    Move a date the way extract_datetime_xx does: by years, then months,
+    then days, then by the time of day, then by hours, minutes and seconds.
+
+    The result is the same as adding a relativedelta for each step, a day
+    past the end of the month is clamped after the years and again after
+    the months, the tzinfo of date is kept.  The years and months are
+    applied with a single replace and the rest as a single timedelta.
+
+    Args:
+        date (datetime): the date to move
+        years (int): years to add
+        months (int): months to add
+        days (float): days to add
+        time (tuple): (hour, minute) to add after the days, or None
+        hours (float): hours to add after the time of day
+        minutes (float): minutes to add after the hours
+        seconds (float): seconds to add after the minutes
+        not_before (datetime): if date moved by the days and the time of
+            day is before not_before, it is moved a day further
+
+    Returns:
+        datetime: the moved date
+    """
+    if years or months:
+        if years != int(years) or months != int(months):
+            raise ValueError("Non-integer years and months are ambiguous "
+                             "and not currently supported.")
+        year, month, day = date.year, date.month, date.day
+        if years:
+            year, month, day = _shift_month(year, month, day,
+                                            int(years) * 12)
+            if months and not MINYEAR <= year <= MAXYEAR:
+                raise ValueError("year {} is out of range".format(year))
+        if months:
+            year, month, day = _shift_month(year, month, day, int(months))
+        date = date.replace(year=year, month=month, day=day)
+
+    steps = [timedelta(days=days)]
+    if time is not None:
+        steps.append(_relative_timedelta(hours=time[0], minutes=time[1]))
+    if not_before is not None and not_before > _add_steps(date, steps):
+        steps.append(timedelta(days=1))
+    if hours:
+        steps.append(_relative_timedelta(hours=hours))
+    if minutes:
+        steps.append(_relative_timedelta(minutes=minutes))
+    if seconds:
+        steps.append(_relative_timedelta(seconds=seconds))
+    return _add_steps(date, steps)
+
+
+def _add_steps(date, steps):
+    """
+    date + each timedelta of steps in turn, added as their sum unless date
+    is close enough to the ends of the calendar for a step to overflow
+    """
+    reach = 0
+    for step in steps:
+        reach += abs(step.days) + 1
+    if _MIN_ORDINAL + reach < date.toordinal() < _MAX_ORDINAL - reach:
+        return date + sum(steps, timedelta())
+    for step in steps:
+        date = date + step
+    return date
+
+
 def extract_numbers_generic(text, pronounce_handler, extract_handler,
                             short_scale=True, ordinals=False):
     """
@@ -385,3 +1088,165 @@ def extract_numbers_generic(text, pronounce_handler, extract_handler,
             extract = extract_handler(to_parse, short_scale, ordinals)
     numbers.reverse()
     return numbers
+
+
+def _place(value):
+    """ The largest power of ten dividing the whole number value, else 0 """
+    if value != int(value) or value == 0:
+        return 0
+    value = int(value)
+    place = 1
+    while value % (place * 10) == 0:
+        place *= 10
+    return place
+
+
+def is_compound_number(value, part, combined):
+    """
+    Whether combined, read from the words of value followed by the words
+    of part, is one number rather than two numbers next to each other.
+
+    Number words compose in three ways: a smaller part is added to the
+    round number before it, "twenty two" or "two thousand and twenty", a
+    larger power of ten or a fraction multiplies it, "two thousand" or
+    "two thirds", or decimals follow it, "two point five".  "one two" is
+    none of these, even for a handler reading it as 2.
+
+    Args:
+        value (int or float): the number read so far
+        part (int or float): the number read from the following words alone
+        combined (int or float): the number read from all the words
+    Returns:
+        bool: True if combined is value continued by part
+    """
+    if combined == value * part and \
+            (0 < part < 1 or part > value and part == _place(part)):
+        return True
+    if combined == value + part:
+        return part < _place(value)
+    return value == int(value) and value < combined < value + 1
+
+
+def extract_numbers_with_spans_generic(text, extract_handler,
+                                       short_scale=True, ordinals=False,
+                                       connectors=(), fraction_handler=None,
+                                       prefixes=(), compound_handler=None,
+                                       zeros=()):
+    """
+        Takes in a string and extracts a list of numbers, with the
+        characters each of them was read from.
+        Language agnostic, per language parsers need to be provided
+
+    The text is scanned once, from left to right.  A number starts at a
+    word that extract_handler reads as a number, and goes on with the
+    following number words, or a connector and a number word, as long as
+    extract_handler reads them together as a new value: "twenty two" is
+    one number, "one two" are two.  After a connector, the words leaving
+    the value unchanged are read on, until the value changes or the words
+    stop reading as one number: "two point zero two" is one number.
+    Words extract_handler fails to read together are read apart.
+
+    Args:
+        text (str): the string to extract numbers from
+        extract_handler (function): function that extracts a number from a
+            string, extractnumber_xx
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        connectors (collection): words joining two parts of a number, e.g.
+            "and" in "two and a half" or "point" in "two point five"
+        fraction_handler (function): isFractional_xx, fractions are always
+            read with the number before them, "one third" = 1/3
+        prefixes (collection): words read with the number after them, e.g.
+            "minus"
+        compound_handler (function): is_compound_number or the like, for
+            an extract_handler adding up whatever numbers it reads, telling
+            whether the value it reads for a run of words is one number
+        zeros (collection): words for zero that extract_handler reads as no
+            number, read on after them within a number, "dos punto cero dos"
+    Returns:
+        list: (number, start, end) for each number, in the order of the
+              text, with text[start:end] the words it was read from
+    """
+    words = [match.span() for match in re.finditer(r"\S+", text)]
+    values = {}  # by phrase
+
+    def value_of(first, last):
+        phrase = text[words[first][0]:words[last][1]]
+        if phrase not in values:
+            try:
+                values[phrase] = extract_handler(phrase, short_scale,
+                                                 ordinals)
+            except ValueError:
+                # e.g. two decimal markers, "veintiuno coma medio"
+                values[phrase] = None
+        return values[phrase]
+
+    def is_number(value):
+        return value is not None and value is not False
+
+    numbers = []
+    first = 0
+    while first < len(words):
+        value = value_of(first, first)
+        if not is_number(value):
+            first += 1
+            continue
+        last = first
+        # "minus two", unless the prefix ended the previous number
+        previous = first - 1
+        if previous >= 0 and (not numbers or
+                              numbers[-1][2] < words[previous][0]) and \
+                text[slice(*words[previous])].lower() in prefixes:
+            prefixed = value_of(previous, first)
+            if is_number(prefixed) and prefixed != value:
+                first, value = previous, prefixed
+
+        # the last word read, past last while the value is unchanged
+        tail = last
+        while True:
+            following = tail + 1
+            joined = following < len(words) and \
+                text[slice(*words[following])].lower() in connectors
+            if joined:
+                following += 1
+            if following >= len(words):
+                break
+            end = following
+            if compound_handler:
+                # "20 2" are two numbers, "2 point 0 2" one
+                if not joined and tail == last and \
+                        is_numeric(text[slice(*words[end])]):
+                    break
+                # "one and a half", the part is the number and its fraction
+                if end + 1 < len(words) and fraction_handler and \
+                        fraction_handler(text[slice(*words[end + 1])]) and \
+                        (joined or is_number(value_of(end, end))):
+                    end += 1
+            alone = value_of(following, end)
+            if not is_number(alone) and \
+                    text[slice(*words[end])].lower() not in zeros:
+                break
+            combined = value_of(first, end)
+            if not is_number(combined):
+                break
+            if combined == value:
+                # "two point zero two", read on until the value changes
+                if not joined and tail == last:
+                    break
+                tail = end
+                continue
+            if compound_handler and \
+                    not compound_handler(value, alone, combined):
+                break
+            # the value of the last word only, not a combination
+            if combined == alone and not (
+                    fraction_handler and
+                    fraction_handler(text[slice(*words[end])])):
+                break
+            value, last = combined, end
+            tail = end
+
+        numbers.append((value, words[first][0], words[last][1]))
+        first = last + 1
+    return numbers
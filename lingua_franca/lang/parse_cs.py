@@ -13,20 +13,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from datetime import datetime, timedelta
+from datetime import timedelta
 
-from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, \
+    Normalizer, fraction_table, NumberLexicon, DatetimeLexicon, \
+    DatetimePlan, DatetimePlans, shift_datetime, parse_month_day
 from lingua_franca.lang.common_data_cs import _NUM_STRING_CS, \
     _LONG_ORDINAL_CS, _LONG_SCALE_CS, _SHORT_SCALE_CS, _SHORT_ORDINAL_CS, \
     _FRACTION_STRING_CS, _MONTHS_CONVERSION, _MONTHS_CZECH, _TIME_UNITS_CONVERSION, \
     _ORDINAL_BASE_CS  #_ARTICLES_CS
 
 import re
-import json
-from lingua_franca import resolve_resource_file
+from lingua_franca.pack import read_json_resource
 from lingua_franca.time import now_local
 
 
@@ -67,6 +67,9 @@ _FRACTION_MARKER = {"a"}
 # decimal marker ( 1 point 5 = 1 + 0.5)
 _DECIMAL_MARKER = {"bod", "tečka", "čárka", "celá"}
 
+# all the words joining the parts of a number
+_NUMBER_MARKERS_CS = frozenset(_FRACTION_MARKER | _DECIMAL_MARKER)
+
 _STRING_NUM_CS = invert_dict(_NUM_STRING_CS)
 _STRING_NUM_CS.update(generate_plurals_cs(_STRING_NUM_CS))
 _STRING_NUM_CS.update({
@@ -81,6 +84,45 @@ _STRING_NUM_CS.update({
 _STRING_SHORT_ORDINAL_CS = invert_dict(_SHORT_ORDINAL_CS)
 _STRING_LONG_ORDINAL_CS = invert_dict(_LONG_ORDINAL_CS)
 
+_STRING_SHORT_SCALE_CS = invert_dict(_SHORT_SCALE_CS)
+_STRING_SHORT_SCALE_CS.update(generate_plurals_cs(_STRING_SHORT_SCALE_CS))
+_STRING_LONG_SCALE_CS = invert_dict(_LONG_SCALE_CS)
+_STRING_LONG_SCALE_CS.update(generate_plurals_cs(_STRING_LONG_SCALE_CS))
+
+# first four numbers have little different format
+_FRACTION_DENOMINATORS_CS = {"celá": 1}
+# numbers from 2 to 1 hundred, more is not usually used in common speech
+_FRACTION_DENOMINATORS_CS.update({word: num for num, word in
+                                  _FRACTION_STRING_CS.items() if num > 1})
+_FRACTION_CS = fraction_table(_FRACTION_DENOMINATORS_CS)
+
+# the kinds of NumberLexicon words that are part of whole numbers
+_WHOLE_NUMBER_KINDS = frozenset({"number", "sum", "multiplier", "fraction",
+                                 "numeral"})
+
+
+def _build_number_lexicon_cs(string_num_scale, string_num_ordinal):
+    # isFractional_cs reads the plurals, "dvě třetiny"
+    fractions = {word: value for word, value in _FRACTION_CS.items()
+                 if not word.endswith("iny")}
+    fractions.update({word[:-1] + "y": value
+                      for word, value in _FRACTION_CS.items()
+                      if word.endswith("ina")})
+    return NumberLexicon({
+        "number": _STRING_NUM_CS,
+        "sum": _SUMS,
+        "multiplier": string_num_scale,
+        "ordinal": string_num_ordinal,
+        "fraction": fractions,
+        "marker": _NUMBER_MARKERS_CS,
+        "negative": _NEGATIVES})
+
+
+_LEXICON_SHORT_SCALE_CS = _build_number_lexicon_cs(
+    _STRING_SHORT_SCALE_CS, _STRING_SHORT_ORDINAL_CS)
+_LEXICON_LONG_SCALE_CS = _build_number_lexicon_cs(
+    _STRING_LONG_SCALE_CS, _STRING_LONG_ORDINAL_CS)
+
 
 def _convert_words_to_numbers_cs(text, short_scale=True, ordinals=False):
     """
@@ -154,7 +196,7 @@ def _extract_numbers_with_text_cs(tokens, short_scale=True,
             t if not
             to_replace.start_index <= t.index <= to_replace.end_index
             else
-            Token(placeholder, t.index) for t in tokens
+            Token(placeholder, t.index, t.start, t.end) for t in tokens
         ]
     results.sort(key=lambda n: n.start_index)
     return results
@@ -365,14 +407,7 @@ def _extract_whole_number_with_text_cs(tokens, short_scale, ordinals):
         if not ordinals:
             word = _text_cs_inflection_normalize(word, 1)
 
-        if word not in string_num_scale and \
-                word not in _STRING_NUM_CS and \
-                word not in _SUMS and \
-                word not in multiplies and \
-                not (ordinals and word in string_num_ordinal) and \
-                not is_numeric(word) and \
-                not isFractional_cs(word, short_scale=short_scale) and \
-                not look_for_fractions(word.split('/')):
+        if not _is_number_word_cs(word, short_scale, ordinals):
             words_only = [token.word for token in number_words]
             #if number_words and not all([w in _ARTICLES_CS |
             #                             _NEGATIVES for w in words_only]):
@@ -555,11 +590,52 @@ def _extract_whole_number_with_text_cs(tokens, short_scale, ordinals):
     return val, number_words
 
 
+def _is_number_word_cs(word, short_scale, ordinals):
+    """
+    Check if a word can be part of a whole number.
+
+    Args:
+        word str: the word, with its inflection normalized
+        short_scale boolean:
+        ordinals boolean:
+
+    Returns:
+        bool
+
+    """
+    kinds = _get_number_lexicon_cs(short_scale).kinds(word)
+    if not kinds:
+        # the fractions are read whatever their case
+        return word != word.lower() and \
+            bool(isFractional_cs(word, short_scale=short_scale))
+    return not _WHOLE_NUMBER_KINDS.isdisjoint(kinds) or \
+        (ordinals and "ordinal" in kinds)
+
+
+def _get_number_lexicon_cs(short_scale):
+    """
+    Get the NumberLexicon of the czech number words, based on scale.
+
+    Like the dictionaries of _initialize_number_data, the lexicons are
+    built once, when the module is loaded.
+
+    Args:
+        short_scale boolean:
+
+    Returns:
+        NumberLexicon
+
+    """
+    return _LEXICON_SHORT_SCALE_CS if short_scale else _LEXICON_LONG_SCALE_CS
+
+
 def _initialize_number_data(short_scale):
     """
-    Generate dictionaries of words to numbers, based on scale.
+    Get the dictionaries of words to numbers, based on scale.
 
-    This is a helper function for _extract_whole_number.
+    This is a helper function for _extract_whole_number.  The dictionaries
+    are built once, when the module is loaded, and shared by all the calls:
+    don't modify them.
 
     Args:
         short_scale boolean:
@@ -569,16 +645,11 @@ def _initialize_number_data(short_scale):
         multiplies, string_num_ordinal, string_num_scale
 
     """
-    multiplies = _MULTIPLIES_SHORT_SCALE_CS if short_scale \
-        else _MULTIPLIES_LONG_SCALE_CS
-
-    string_num_ordinal_cs = _STRING_SHORT_ORDINAL_CS if short_scale \
-        else _STRING_LONG_ORDINAL_CS
-
-    string_num_scale_cs = _SHORT_SCALE_CS if short_scale else _LONG_SCALE_CS
-    string_num_scale_cs = invert_dict(string_num_scale_cs)
-    string_num_scale_cs.update(generate_plurals_cs(string_num_scale_cs))
-    return multiplies, string_num_ordinal_cs, string_num_scale_cs
+    if short_scale:
+        return _MULTIPLIES_SHORT_SCALE_CS, _STRING_SHORT_ORDINAL_CS, \
+            _STRING_SHORT_SCALE_CS
+    return _MULTIPLIES_LONG_SCALE_CS, _STRING_LONG_ORDINAL_CS, \
+        _STRING_LONG_SCALE_CS
 
 
 def extractnumber_cs(text, short_scale=True, ordinals=False):
@@ -662,6 +733,95 @@ def extract_duration_cs(text):
     return (duration, text)
 
 
+def _build_inflections_datetime_cs():
+    # the "-nu" and "-na" forms of the months in "-en", "v dubnu"
+    inflections = {name[:-2] + suffix: name for name in _MONTHS_CZECH
+                   if name.endswith("en") for suffix in ("nu", "na")}
+    inflections.update({
+        "únoru": "únor", "červenci": "červenec", "července": "červenec",
+        "listopadu": "listopad", "prosinci": "prosinec"})
+    for base, forms in (
+            ("hodin", ("hodina", "hodiny", "hodinu")),
+            ("minut", ("minuta", "minuty", "minutu")),
+            ("sekund", ("sekunda", "sekundy", "sekundu")),
+            ("den", ("dní", "dnů", "dny")),
+            ("týden", ("týdny", "týdnů")),
+            ("měsíc", ("měsíců", "měsíce", "měsíci")),
+            ("rok", ("roky", "roků", "let")),
+            ("včera", ("včerejšku",)),
+            ("zítra", ("zítřku", "zítřejší")),
+            ("ráno", ("ranní",)),
+            ("dopoledne", ("dopolední",)),
+            ("poledne", ("polední",)),
+            ("odpoledne", ("odpolední",)),
+            ("večer", ("večerní",)),
+            ("noc", ("noční",)),
+            ("víkend", ("víkendech", "víkendu")),
+            ("všední", ("všedních", "všedním"))):
+        inflections.update(dict.fromkeys(forms, base))
+    return inflections
+
+
+# inflected word -> the form extract_datetime_cs knows
+_INFLECTIONS_DATETIME_CS = _build_inflections_datetime_cs()
+
+
+def _build_datetime_lexicon_cs():
+    days = ['pondělí', 'úterý', 'středa',
+            'čtvrtek', 'pátek', 'sobota', 'neděle']
+    months = _MONTHS_CZECH
+    monthsShort = ['led', 'úno', 'bře', 'dub', 'kvě', 'čvn', 'čvc', 'srp',
+                   'zář', 'říj', 'lis', 'pro']
+    timeQualifiersAM = ['ráno', 'dopoledne']
+    timeQualifiersPM = ['odpoledne', 'večer', 'noc', 'noci']
+    return DatetimeLexicon(
+        days, months, monthsShort,
+        # word -> day offset
+        relative_days={"dnes": 0, "zítra": 1, "včera": -1},
+        time_qualifiers_am=timeQualifiersAM,
+        time_qualifiers_pm=timeQualifiersPM,
+        time_qualifiers=set(timeQualifiersAM + timeQualifiersPM),
+        markers=['na', 'v', 'do', 'na', 'tento', 'okolo', 'toto', 'během',
+                 'za', 'této'],
+        recur_markers=days + [d + 'ho' for d in days] +
+        ['víkend', 'všední'],  # Check this
+        year_multiples=["desetiletí", "století", "tisíciletí"],
+        day_multiples=["týden", "měsíc", "rok"],
+        # the month names of the dates the parser builds
+        months_en=[_MONTHS_CONVERSION[m] for m in range(12)],
+        valid_followups=set(days + months + monthsShort +
+                            ["dnes", "zítra", "včera", "další", "příští",
+                             "poslední", "teď", "toto", "této", "tento"]),
+        triggers=timeQualifiersAM + timeQualifiersPM +
+        ["nyní", "dnes", "zítra", "včera", "týden", "měsíc", "rok",
+         "desetiletí", "století", "tisíciletí", "poledne", "půlnoc", "hodin",
+         "minut", "sekund", "dvoje", "dvojice", "prvního", "třetího"] +
+        # the day ordinals clean_string turns into digits
+        [name[:-1] + "ého" for name in _ORDINAL_BASE_CS.values()
+         if name.endswith("ý")] +
+        list(_INFLECTIONS_DATETIME_CS),
+        trigger_phrases=[(["od", "po", "do"],
+                          ["další", "příští", "poslední", "teď", "toto",
+                           "této", "tento"])])
+
+
+_DATETIME_CS = _build_datetime_lexicon_cs()
+
+
+def has_datetime_cs(text):
+    """ Check if text may contain a date or a time
+
+    A cheap scan for the words extract_datetime_cs needs, text without any
+    of them has no date or time.
+
+    Args:
+        text (str): the text to check
+    Returns:
+        bool: False if extract_datetime_cs would find nothing in text
+    """
+    return _DATETIME_CS.has_datetime(text)
+
+
 def extract_datetime_cs(string, dateNow, default_time):
     """ Convert a human date reference into an exact datetime
 
@@ -693,6 +853,18 @@ def extract_datetime_cs(string, dateNow, default_time):
                          date or time related text was found.
     """
 
+    if string == "" or not dateNow or not _DATETIME_CS.has_datetime(string):
+        return None
+
+    plan = _DATETIME_PLANS_CS.get(string, dateNow)
+    if plan is None:
+        return None
+    return _resolve_datetime_cs(plan, dateNow, default_time)
+
+
+def _plan_datetime_cs(string, anchor):
+    """ DatetimePlan of string, None if it has no date or time """
+
     def clean_string(s):
         # clean unneeded punctuation and capitalization among other things.
         # Normalize czech inflection
@@ -756,33 +928,29 @@ def extract_datetime_cs(string, dateNow, default_time):
                 minAbs or secOffset != 0
             )
 
-    if string == "" or not dateNow:
-        return None
-
     found = False
     daySpecified = False
     dayOffset = False
     monthOffset = 0
     yearOffset = 0
-    today = dateNow.strftime("%w")
-    currentYear = dateNow.strftime("%Y")
     fromFlag = False
     datestr = ""
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersAM = ['ráno', 'dopoledne']
-    timeQualifiersPM = ['odpoledne', 'večer', 'noc', 'noci']
-    timeQualifiersList = set(timeQualifiersAM + timeQualifiersPM)
-    markers = ['na', 'v', 'do', 'na', 'tento', 'okolo', 'toto', 'během', 'za', 'této']
-    days = ['pondělí', 'úterý', 'středa',
-            'čtvrtek', 'pátek', 'sobota', 'neděle']
-    months =_MONTHS_CZECH
-    recur_markers = days + [d + 'ho' for d in days] + ['víkend', 'všední'] #Check this
-    monthsShort = ['led', 'úno', 'bře', 'dub', 'kvě', 'čvn', 'čvc', 'srp',
-                   'zář', 'říj', 'lis', 'pro']
-    year_multiples = ["desetiletí", "století", "tisíciletí"]
-    day_multiples = ["týden", "měsíc", "rok"]
+    lexicon = _DATETIME_CS
+    timeQualifiersAM = lexicon.time_qualifiers_am
+    timeQualifiersPM = lexicon.time_qualifiers_pm
+    timeQualifiersList = lexicon.time_qualifiers
+    markers = lexicon.markers
+    days = lexicon.days
+    months = lexicon.months
+    recur_markers = lexicon.recur_markers
+    monthsShort = lexicon.months_short
+    year_multiples = lexicon.year_multiples
+    day_multiples = lexicon.day_multiples
+    validFollowups = lexicon.valid_followups
+    relative_days = lexicon.relative_days
 
     words = clean_string(string)
 
@@ -807,8 +975,7 @@ def extract_datetime_cs(string, dateNow, default_time):
         if word == "nyní" and not datestr:
             resultStr = " ".join(words[idx + 1:])
             resultStr = ' '.join(resultStr.split())
-            extractedDate = dateNow.replace(microsecond=0)
-            return [extractedDate, resultStr]
+            return DatetimePlan(resultStr, now=True)
         elif wordNext in year_multiples:
             multiplier = None
             if is_numeric(word):
@@ -846,11 +1013,8 @@ def extract_datetime_cs(string, dateNow, default_time):
         elif word in timeQualifiersList:
             timeQualifier = word
         # parse today, tomorrow, day after tomorrow
-        elif word == "dnes" and not fromFlag:
-            dayOffset = 0
-            used += 1
-        elif word == "zítra" and not fromFlag:
-            dayOffset = 1
+        elif word in relative_days and not fromFlag:
+            dayOffset = relative_days[word]
             used += 1
         elif word == "den" and wordNext == "před" and wordNextNext == "včera" and not fromFlag:
             dayOffset = -2
@@ -858,9 +1022,6 @@ def extract_datetime_cs(string, dateNow, default_time):
         elif word == "před" and wordNext == "včera" and not fromFlag:
             dayOffset = -2
             used += 2
-        elif word == "včera" and not fromFlag:
-            dayOffset = -1
-            used += 1
         elif (word == "den" and
               wordNext == "po" and
               wordNextNext == "zítra" and
@@ -926,8 +1087,8 @@ def extract_datetime_cs(string, dateNow, default_time):
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
         elif word in days and not fromFlag:
-            d = days.index(word)
-            dayOffset = (d + 1) - int(today)
+            d = lexicon.day_index[word]
+            dayOffset = (d + 1) - anchor.day_of_week()
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
@@ -942,10 +1103,7 @@ def extract_datetime_cs(string, dateNow, default_time):
                 start -= 1
                 # parse 15 of July, June 20th, Feb 18, 19 of February
         elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+            m = lexicon.month(word)
             used += 1
             datestr = _MONTHS_CONVERSION.get(m)  # Convert czech months to english
             if wordPrev and (wordPrev[0].isdigit() or
@@ -983,17 +1141,6 @@ def extract_datetime_cs(string, dateNow, default_time):
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("dnes")
-        validFollowups.append("zítra")
-        validFollowups.append("včera")
-        validFollowups.append("další")
-        validFollowups.append("příští")
-        validFollowups.append("poslední")
-        validFollowups.append("teď")
-        validFollowups.append("toto")
-        validFollowups.append("této")
-        validFollowups.append("tento")
         if (word == "od" or word == "po" or word == "do") and wordNext in validFollowups:
             used = 2
             fromFlag = True
@@ -1002,15 +1149,15 @@ def extract_datetime_cs(string, dateNow, default_time):
             elif wordNext == "včera":
                 dayOffset -= 1
             elif wordNext in days:
-                d = days.index(wordNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
             elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNextNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 3
                 if wordNext == "další" or wordPrev == "příští":
                     if dayOffset <= 2:
@@ -1387,10 +1534,9 @@ def extract_datetime_cs(string, dateNow, default_time):
 
                 # ambiguous time, detect whether they mean this evening or
                 # the next morning based on whether it has already passed
-                if dateNow.hour < HH or (dateNow.hour == HH and
-                                         dateNow.minute < MM):
+                if anchor.is_before(HH, MM):
                     pass  # No modification needed
-                elif dateNow.hour < HH + 12:
+                elif anchor.is_before(HH + 12):
                     HH += 12
                 else:
                     # has passed, assume the next morning
@@ -1442,49 +1588,84 @@ def extract_datetime_cs(string, dateNow, default_time):
     if dayOffset is False:
         dayOffset = 0
 
+    for idx, word in enumerate(words):
+        if words[idx] == "a" and \
+                words[idx - 1] == "" and words[idx + 1] == "":
+            words[idx] = ""
+
+    resultStr = " ".join(words)
+    resultStr = ' '.join(resultStr.split())
+
+    return DatetimePlan(
+        resultStr,
+        date_str=datestr,
+        has_year=hasYear,
+        year_offset=yearOffset,
+        month_offset=monthOffset,
+        day_offset=dayOffset,
+        hour=hrAbs,
+        minute=minAbs,
+        hour_offset=hrOffset,
+        minute_offset=minOffset,
+        second_offset=secOffset,
+        day_specified=daySpecified)
+
+
+_DATETIME_PLANS_CS = DatetimePlans(_plan_datetime_cs)
+
+
+def _resolve_datetime_cs(plan, dateNow, default_time):
+    """ extract_datetime_cs result of plan at the anchor dateNow """
+    if plan.now:
+        return [dateNow.replace(microsecond=0), plan.leftover]
+    datestr = plan.date_str
+    hasYear = plan.has_year
+    yearOffset = plan.year_offset
+    monthOffset = plan.month_offset
+    dayOffset = plan.day_offset
+    hrAbs = plan.hour
+    minAbs = plan.minute
+    hrOffset = plan.hour_offset
+    minOffset = plan.minute_offset
+    secOffset = plan.second_offset
+    daySpecified = plan.day_specified
+    currentYear = dateNow.year
+
     # perform date manipulation
 
     extractedDate = dateNow.replace(microsecond=0)
     if datestr != "":
         # date included an explicit date, e.g. "june 5" or "june 2, 2017"
-        try:
-            temp = datetime.strptime(datestr, "%B %d")
-        except ValueError:
-            # Try again, allowing the year
-            temp = datetime.strptime(datestr, "%B %d %Y")
+        temp = parse_month_day(datestr, _DATETIME_CS.months_en)
         extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
         if not hasYear:
             temp = temp.replace(year=extractedDate.year,
                                 tzinfo=extractedDate.tzinfo)
             if extractedDate < temp:
                 extractedDate = extractedDate.replace(
-                    year=int(currentYear),
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
+                    year=currentYear,
+                    month=temp.month,
+                    day=temp.day,
                     tzinfo=extractedDate.tzinfo)
             else:
                 extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
+                    year=currentYear + 1,
+                    month=temp.month,
+                    day=temp.day,
                     tzinfo=extractedDate.tzinfo)
         else:
             extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")),
+                year=temp.year,
+                month=temp.month,
+                day=temp.day,
                 tzinfo=extractedDate.tzinfo)
     else:
         # ignore the current HH:MM:SS if relative using days or greater
         if hrOffset == 0 and minOffset == 0 and secOffset == 0:
             extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
 
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
+    timeOfDay = None
+    notBefore = None
     if hrAbs != -1 and minAbs != -1:
         # If no time was supplied in the string set the time to default
         # time if it's available
@@ -1494,25 +1675,14 @@ def extract_datetime_cs(string, dateNow, default_time):
             hrAbs = hrAbs or 0
             minAbs = minAbs or 0
 
-        extractedDate = extractedDate + relativedelta(hours=hrAbs,
-                                                      minutes=minAbs)
+        timeOfDay = (hrAbs, minAbs)
         if (hrAbs != 0 or minAbs != 0) and datestr == "":
-            if not daySpecified and dateNow > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-    for idx, word in enumerate(words):
-        if words[idx] == "a" and \
-                words[idx - 1] == "" and words[idx + 1] == "":
-            words[idx] = ""
-
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    return [extractedDate, resultStr]
+            if not daySpecified:
+                notBefore = dateNow
+    extractedDate = shift_datetime(extractedDate, yearOffset, monthOffset,
+                                   dayOffset, timeOfDay, hrOffset, minOffset,
+                                   secOffset, notBefore)
+    return [extractedDate, plan.leftover]
 
 def isFractional_cs(input_str, short_scale=True):
     """
@@ -1528,16 +1698,29 @@ def isFractional_cs(input_str, short_scale=True):
     if input_str.endswith('iny', -3):  #leading number is bigger than one ( one třetina, two třetiny)
         input_str = input_str[:len(input_str) - 1] + "a"  # Normalize to format of one (třetiny > třetina)
 
-    fracts = {"celá": 1 }  #first four numbers have little different format
-    
-    for num in _FRACTION_STRING_CS:  #Numbers from 2 to 1 hundret, more is not usualy used in common speech
-        if num > 1:
-            fracts[_FRACTION_STRING_CS[num]] = num
+    return _FRACTION_CS.get(input_str.lower(), False)
 
-    if input_str.lower() in fracts:
-        return 1.0 / fracts[input_str.lower()]
-    return False
 
+def extract_numbers_with_spans_cs(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers, with the
+        characters each of them was read from.
+
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: (number, start, end) for each number, with text[start:end]
+              the words it was read from
+    """
+    results = _extract_numbers_with_text_cs(tokenize(text),
+                                            short_scale, ordinals)
+    return [(float(result.value), result.start, result.end)
+            for result in results]
 
 def extract_numbers_cs(text, short_scale=True, ordinals=False):
     """
@@ -1559,8 +1742,7 @@ def extract_numbers_cs(text, short_scale=True, ordinals=False):
 
 
 class CzechNormalizer(Normalizer):
-    with open(resolve_resource_file("text/cs-cz/normalize.json"),encoding='utf8') as f:
-        _default_config = json.load(f)
+    _default_config = read_json_resource("text/cs-cz/normalize.json")
 
 
 def normalize_cs(text, remove_articles):
@@ -1593,55 +1775,7 @@ def _text_cs_inflection_normalize(word, arg):
         elif word == "dvě":
             word = "dva"
 
-    elif arg == 2: # extract_datetime_cs  TODO: This is ugly
-        if word == "hodina": word = "hodin"
-        if word == "hodiny": word = "hodin"
-        if word == "hodinu": word = "hodin"
-        if word == "minuta": word = "minut"
-        if word == "minuty": word = "minut"
-        if word == "minutu": word = "minut"
-        if word == "minutu": word = "minut"
-        if word == "sekunda": word = "sekund"
-        if word == "sekundy": word = "sekund"
-        if word == "sekundu": word = "sekund"  
-        if word == "dní": word = "den" 
-        if word == "dnů": word = "den" 
-        if word == "dny": word = "den"
-        if word == "týdny": word = "týden"
-        if word == "týdnů": word = "týden"
-        if word == "měsíců": word = "měsíc"
-        if word == "měsíce": word = "měsíc"
-        if word == "měsíci": word = "měsíc"
-        if word == "roky": word = "rok"
-        if word == "roků": word = "rok"
-        if word == "let": word = "rok"
-        if word == "včerejšku": word = "včera"
-        if word == "zítřku": word = "zítra"
-        if word == "zítřejší": word = "zítra"
-        if word == "ranní": word = "ráno"
-        if word == "dopolední": word ="dopoledne"
-        if word == "polední": word ="poledne"
-        if word == "odpolední": word = "odpoledne"
-        if word == "večerní": word = "večer"
-        if word == "noční": word = "noc"
-        if word == "víkendech": word = "víkend"
-        if word == "víkendu": word = "víkend"
-        if word == "všedních": word = "všední"
-        if word == "všedním": word = "všední"
-
-        #Months
-        if word == "únoru": word = "únor"
-        elif word == "červenci": word = "červenec"
-        elif word == "července": word = "červenec"
-        elif word == "listopadu": word = "listopad"
-        elif word == "prosinci": word = "prosinec"
-
-        elif word.endswith("nu") or word.endswith("na"):
-                    tmp = word[:-2] 
-                    tmp +=("en")
-                    for name in _MONTHS_CZECH:
-                        if name == tmp:
-                            word=name
-                            
+    elif arg == 2: # extract_datetime_cs
+        word = _INFLECTIONS_DATETIME_CS.get(word, word)
 
     return word
\ No newline at end of file
@@ -14,10 +14,9 @@
 # limitations under the License.
 #
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic
-from lingua_franca.lang.format_da import pronounce_number_da
+    extract_numbers_with_spans_generic, DatetimeLexicon, DatetimePlan, \
+    DatetimePlans, shift_datetime, parse_month_day
 
 da_numbers = {
     'nul': 0,
@@ -72,6 +71,9 @@ da_numbers = {
     'million': 1000000
 }
 
+# words joining the parts of a number, "to og tyve"
+_NUMBER_MARKERS_DA = ("og",)
+
 # TODO: short_scale and ordinals don't do anything here.
 # The parameters are present in the function signature for API compatibility
 # reasons.
@@ -159,7 +161,64 @@ def extractnumber_da(text, short_scale=True, ordinals=False):
     return val or False
 
 
+def _build_datetime_lexicon_da():
+    days = ['mandag', 'tirsdag', 'onsdag',
+            'torsdag', 'fredag', 'lørdag', 'søndag']
+    months = ['januar', 'februar', 'marts', 'april', 'maj', 'juni',
+              'juli', 'august', 'september', 'oktober', 'november',
+              'desember']
+    monthsShort = ['jan', 'feb', 'mar', 'apr', 'maj', 'juni', 'juli', 'aug',
+                   'sep', 'okt', 'nov', 'des']
+    timeQualifiers = {'tidlig', 'morgen', 'morgenen', 'formidag',
+                      'formiddagen', 'eftermiddag', 'eftermiddagen',
+                      'aften', 'aftenen', 'nat', 'natten'}
+    return DatetimeLexicon(
+        days, months, monthsShort,
+        # word -> day offset
+        relative_days={"dag": 0, "overmorgen": 2},
+        time_qualifiers=timeQualifiers,
+        markers=['i', 'om', 'på', 'klokken', 'ved'],
+        valid_followups=set(days + months + monthsShort +
+                            ["i dag", "morgen", "næste", "forige", "nu"]),
+        triggers=list(timeQualifiers) +
+        ["dag", "middag", "midnat", "time", "første", "anden", "tredie",
+         "fjerde", "femte", "sjette", "elfte", "tolvfte"] +
+        # the ordinals clean_string turns into digits
+        [number + suffix for number in da_numbers
+         for suffix in ("nde", "ende", "te")],
+        trigger_phrases=[(["næste", "forige"], ["uge", "måned", "år"]),
+                         (["fra", "til", "om"], ["næste", "forige", "nu"])])
+
+
+_DATETIME_DA = _build_datetime_lexicon_da()
+
+
+def has_datetime_da(text):
+    """ Check if text may contain a date or a time
+
+    A cheap scan for the words extract_datetime_da needs, text without any
+    of them has no date or time.
+
+    Args:
+        text (str): the text to check
+    Returns:
+        bool: False if extract_datetime_da would find nothing in text
+    """
+    return _DATETIME_DA.has_datetime(text)
+
+
 def extract_datetime_da(string, currentDate, default_time):
+    if string == "" or not currentDate:
+        return None
+
+    plan = _DATETIME_PLANS_DA.get(string, currentDate)
+    if plan is None:
+        return None
+    return _resolve_datetime_da(plan, currentDate, default_time)
+
+
+def _plan_datetime_da(string, anchor):
+    """ DatetimePlan of string, None if it has no date or time """
     def clean_string(s):
         """
             cleans the input string of unneeded punctuation
@@ -193,52 +252,31 @@ def extract_datetime_da(string, currentDate, default_time):
                 minAbs or secOffset != 0
             )
 
-    if string == "" or not currentDate:
-        return None
-
     found = False
     daySpecified = False
     dayOffset = False
     monthOffset = 0
     yearOffset = 0
-    dateNow = currentDate
-    today = dateNow.strftime("%w")
-    currentYear = dateNow.strftime("%Y")
     fromFlag = False
     datestr = ""
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersList = ['tidlig',
-                          'morgen',
-                          'morgenen',
-                          'formidag',
-                          'formiddagen',
-                          'eftermiddag',
-                          'eftermiddagen',
-                          'aften',
-                          'aftenen',
-                          'nat',
-                          'natten']
-    markers = ['i', 'om', 'på', 'klokken', 'ved']
-    days = ['mandag', 'tirsdag', 'onsdag',
-            'torsdag', 'fredag', 'lørdag', 'søndag']
-    months = ['januar', 'februar', 'marts', 'april', 'maj', 'juni',
-              'juli', 'august', 'september', 'oktober', 'november',
-              'desember']
-    monthsShort = ['jan', 'feb', 'mar', 'apr', 'maj', 'juni', 'juli', 'aug',
-                   'sep', 'okt', 'nov', 'des']
-
-    validFollowups = days + months + monthsShort
-    validFollowups.append("i dag")
-    validFollowups.append("morgen")
-    validFollowups.append("næste")
-    validFollowups.append("forige")
-    validFollowups.append("nu")
+    lexicon = _DATETIME_DA
+    timeQualifiersList = lexicon.time_qualifiers
+    markers = lexicon.markers
+    days = lexicon.days
+    months = lexicon.months
+    monthsShort = lexicon.months_short
+    validFollowups = lexicon.valid_followups
+    relative_days = lexicon.relative_days
 
     words = clean_string(string)
+    # without a trigger no word can start a date or a time, the scans
+    # below would only go through the words
+    scanned = words if lexicon.has_datetime(string) else []
 
-    for idx, word in enumerate(words):
+    for idx, word in enumerate(scanned):
         if word == "":
             continue
         wordPrevPrev = words[idx - 2] if idx > 1 else ""
@@ -252,17 +290,14 @@ def extract_datetime_da(string, currentDate, default_time):
         if word in timeQualifiersList:
             timeQualifier = word
             # parse today, tomorrow, day after tomorrow
-        elif word == "dag" and not fromFlag:
-            dayOffset = 0
+        elif word in relative_days and not fromFlag:
+            dayOffset = relative_days[word]
             used += 1
         elif word == "morgen" and not fromFlag and wordPrev != "om" and \
                 wordPrev not in days:  # morgen means tomorrow if not "am
             # Morgen" and not [day of the week] morgen
             dayOffset = 1
             used += 1
-        elif word == "overmorgen" and not fromFlag:
-            dayOffset = 2
-            used += 1
             # parse 5 days, 10 weeks, last week, next week
         elif word == "dag" or word == "dage":
             if wordPrev[0].isdigit():
@@ -313,8 +348,8 @@ def extract_datetime_da(string, currentDate, default_time):
                 # parse Monday, Tuesday, etc., and next Monday,
                 # last Tuesday, etc.
         elif word in days and not fromFlag:
-            d = days.index(word)
-            dayOffset = (d + 1) - int(today)
+            d = lexicon.day_index[word]
+            dayOffset = (d + 1) - anchor.day_of_week()
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
@@ -332,10 +367,7 @@ def extract_datetime_da(string, currentDate, default_time):
                 start -= 1
                 # parse 15 of July, June 20th, Feb 18, 19 of February
         elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+            m = lexicon.month(word)
             used += 1
             datestr = months[m]
             if wordPrev and (wordPrev[0].isdigit() or
@@ -379,15 +411,15 @@ def extract_datetime_da(string, currentDate, default_time):
                 # [day of the week] morgen:
                 dayOffset += 1
             elif wordNext in days:
-                d = days.index(wordNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
             elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNextNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 3
                 if wordNext[:6] == "næste":
                     tmpOffset += 7
@@ -419,7 +451,7 @@ def extract_datetime_da(string, currentDate, default_time):
     hrAbs = None
     minAbs = None
 
-    for idx, word in enumerate(words):
+    for idx, word in enumerate(scanned):
         if word == "":
             continue
 
@@ -739,6 +771,52 @@ def extract_datetime_da(string, currentDate, default_time):
     if dayOffset is False:
         dayOffset = 0
 
+    for idx, word in enumerate(words):
+        if words[idx] == "og" and words[idx - 1] == "" \
+                and words[idx + 1] == "":
+            words[idx] = ""
+
+    resultStr = " ".join(words)
+    resultStr = ' '.join(resultStr.split())
+
+    return DatetimePlan(
+        resultStr,
+        date_str=datestr,
+        has_year=hasYear,
+        year_offset=yearOffset,
+        month_offset=monthOffset,
+        day_offset=dayOffset,
+        hour=hrAbs,
+        minute=minAbs,
+        hour_offset=hrOffset,
+        minute_offset=minOffset,
+        second_offset=secOffset,
+        day_specified=daySpecified,
+        time_str=timeStr)
+
+
+_DATETIME_PLANS_DA = DatetimePlans(_plan_datetime_da)
+
+
+def _resolve_datetime_da(plan, dateNow, default_time):
+    """ extract_datetime_da result of plan at the anchor dateNow """
+    if plan.now:
+        return [dateNow.replace(microsecond=0), plan.leftover]
+    datestr = plan.date_str
+    hasYear = plan.has_year
+    yearOffset = plan.year_offset
+    monthOffset = plan.month_offset
+    dayOffset = plan.day_offset
+    hrAbs = plan.hour
+    minAbs = plan.minute
+    hrOffset = plan.hour_offset
+    minOffset = plan.minute_offset
+    secOffset = plan.second_offset
+    daySpecified = plan.day_specified
+    timeStr = plan.time_str
+    months = _DATETIME_DA.months
+    currentYear = dateNow.year
+
     # perform date manipulation
 
     extractedDate = dateNow
@@ -747,37 +825,23 @@ def extract_datetime_da(string, currentDate, default_time):
                                           minute=0,
                                           hour=0)
     if datestr != "":
-        en_months = ['january', 'february', 'march', 'april', 'may', 'june',
-                     'july', 'august', 'september', 'october', 'november',
-                     'december']
-        en_monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july',
-                          'aug',
-                          'sept', 'oct', 'nov', 'dec']
-        for idx, en_month in enumerate(en_months):
-            datestr = datestr.replace(months[idx], en_month)
-        for idx, en_month in enumerate(en_monthsShort):
-            datestr = datestr.replace(monthsShort[idx], en_month)
-
-        temp = datetime.strptime(datestr, "%B %d")
+        temp = parse_month_day(datestr, months)
         if not hasYear:
             temp = temp.replace(year=extractedDate.year)
             if extractedDate < temp:
-                extractedDate = extractedDate.replace(year=int(currentYear),
-                                                      month=int(
-                                                          temp.strftime(
-                                                              "%m")),
-                                                      day=int(temp.strftime(
-                                                          "%d")))
+                extractedDate = extractedDate.replace(year=currentYear,
+                                                      month=temp.month,
+                                                      day=temp.day)
             else:
                 extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")))
+                    year=currentYear + 1,
+                    month=temp.month,
+                    day=temp.day)
         else:
             extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")))
+                year=temp.year,
+                month=temp.month,
+                day=temp.day)
 
     if timeStr != "":
         temp = datetime(timeStr)
@@ -785,39 +849,23 @@ def extract_datetime_da(string, currentDate, default_time):
                                               minute=temp.strftime("%M"),
                                               second=temp.strftime("%S"))
 
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
 
     if hrAbs is None and minAbs is None and default_time:
         hrAbs = default_time.hour
         minAbs = default_time.minute
 
+    timeOfDay = None
+    notBefore = None
     if hrAbs != -1 and minAbs != -1:
 
-        extractedDate = extractedDate + relativedelta(hours=hrAbs or 0,
-                                                      minutes=minAbs or 0)
+        timeOfDay = (hrAbs or 0, minAbs or 0)
         if (hrAbs or minAbs) and datestr == "":
-            if not daySpecified and dateNow > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-    for idx, word in enumerate(words):
-        if words[idx] == "og" and words[idx - 1] == "" \
-                and words[idx + 1] == "":
-            words[idx] = ""
-
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-
-    return [extractedDate, resultStr]
+            if not daySpecified:
+                notBefore = dateNow
+    extractedDate = shift_datetime(extractedDate, yearOffset, monthOffset,
+                                   dayOffset, timeOfDay, hrOffset, minOffset,
+                                   secOffset, notBefore)
+    return [extractedDate, plan.leftover]
 
 
 def isFractional_da(input_str):
@@ -916,6 +964,27 @@ def normalize_da(text, remove_articles):
     return normalized[1:]  # strip the initial space
 
 
+def extract_numbers_with_spans_da(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers, with the
+        characters each of them was read from.
+
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: (number, start, end) for each number, with text[start:end]
+              the words it was read from
+    """
+    return extract_numbers_with_spans_generic(
+        text, extractnumber_da, short_scale, ordinals,
+        connectors=_NUMBER_MARKERS_DA, fraction_handler=isFractional_da)
+
+
 def extract_numbers_da(text, short_scale=True, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -930,5 +999,5 @@ def extract_numbers_da(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    return extract_numbers_generic(text, pronounce_number_da, extractnumber_da,
-                                   short_scale=short_scale, ordinals=ordinals)
+    return [number for number, _, _ in
+            extract_numbers_with_spans_da(text, short_scale, ordinals)]
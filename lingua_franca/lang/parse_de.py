@@ -14,68 +14,121 @@
 # limitations under the License.
 #
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
+from functools import lru_cache
+from lingua_franca.lang.format_de import NUM_STRING_DE, FRACTION_STRING_DE
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic
-from lingua_franca.lang.format_de import pronounce_number_de
+    extract_numbers_with_spans_generic, fraction_table, DatetimeLexicon, \
+    DatetimePlan, DatetimePlans, shift_datetime, parse_month_day
 
-de_numbers = {
-    'null': 0,
-    'ein': 1,
+# the numbers written in a single word, the compounds of these are read by
+# _number_de
+de_numbers = {word: number for number, word in NUM_STRING_DE.items()}
+de_numbers.update({
     'eins': 1,
     'eine': 1,
     'einer': 1,
     'einem': 1,
     'einen': 1,
     'eines': 1,
-    'zwei': 2,
-    'drei': 3,
-    'vier': 4,
-    'fünf': 5,
-    'sechs': 6,
-    'sieben': 7,
-    'acht': 8,
-    'neun': 9,
-    'zehn': 10,
-    'elf': 11,
-    'zwölf': 12,
-    'dreizehn': 13,
-    'vierzehn': 14,
-    'fünfzehn': 15,
-    'sechzehn': 16,
-    'siebzehn': 17,
-    'achtzehn': 18,
-    'neunzehn': 19,
-    'zwanzig': 20,
-    'einundzwanzig': 21,
-    'zweiundzwanzig': 22,
-    'dreiundzwanzig': 23,
-    'vierundzwanzig': 24,
-    'fünfundzwanzig': 25,
-    'sechsundzwanzig': 26,
-    'siebenundzwanzig': 27,
-    'achtundzwanzig': 28,
-    'neunundzwanzig': 29,
-    'dreißig': 30,
-    'einunddreißig': 31,
-    'vierzig': 40,
-    'fünfzig': 50,
-    'sechzig': 60,
-    'siebzig': 70,
-    'achtzig': 80,
-    'neunzig': 90,
-    'hundert': 100,
-    'zweihundert': 200,
-    'dreihundert': 300,
-    'vierhundert': 400,
-    'fünfhundert': 500,
-    'sechshundert': 600,
-    'siebenhundert': 700,
-    'achthundert': 800,
-    'neunhundert': 900,
     'tausend': 1000,
     'million': 1000000
-}
+})
+
+# the parts of the compound numbers, "dreihundertfünfundvierzigtausend"
+_UNITS_DE = {word: number for number, word in NUM_STRING_DE.items()
+             if 0 < number < 10}
+_TENS_DE = {word: number for number, word in NUM_STRING_DE.items()
+            if 20 <= number < 100}
+_BELOW_HUNDRED_DE = {word: number for number, word in NUM_STRING_DE.items()
+                     if 0 < number < 100}
+_BELOW_HUNDRED_DE["eins"] = 1  # "hunderteins"
+
+# the scales, largest first, with the ending of their plural
+_SCALES_DE = ((1000000000, "milliarde", "n"), (1000000, "million", "en"),
+              (1000, "tausend", ""), (100, "hundert", ""))
+
+_FRACTION_DE = fraction_table({word: number for number, word
+                               in FRACTION_STRING_DE.items() if number > 2})
+
+
+def _decompose_number_de(word, limit):
+    """
+    Read a compound number, e.g. "dreihundertfünfundvierzigtausend".
+
+    The word is split on its largest scale, "tausend", and the number
+    before the scale, its multiplier, and the one after it are read the
+    same way.
+
+    Args:
+        word (str): the lowercase word
+        limit (int): the number has to be below limit
+
+    Returns:
+        (int) or None: the number, None if the word isn't a number below
+                       limit
+    """
+    if word in _BELOW_HUNDRED_DE:
+        number = _BELOW_HUNDRED_DE[word]
+        return number if number < limit else None
+
+    unit, _, tens = word.partition("und")
+    if unit in _UNITS_DE and tens in _TENS_DE:
+        # "fünfundvierzig"
+        number = _UNITS_DE[unit] + _TENS_DE[tens]
+        return number if number < limit else None
+
+    for scale, name, plural in _SCALES_DE:
+        if scale >= limit:
+            continue
+        before, found, after = word.partition(name)
+        if not found:
+            continue
+        if before in ("", "ein"):
+            multiplier = 1
+        else:
+            # "neunzehnhundert", "dreihundertfünfundvierzigtausend"
+            multiplier = _decompose_number_de(
+                before, 100 if scale == 100 else 1000)
+            if not multiplier:
+                return None
+        rests = [after]
+        if plural and multiplier > 1 and after.startswith(plural):
+            # "zweimillionen"
+            rests.insert(0, after[len(plural):])
+        for rest in rests:
+            if rest.startswith("und") and len(rest) > 3:
+                # "hundertundeins"
+                rest = rest[3:]
+            if not rest:
+                return multiplier * scale
+            number = _decompose_number_de(rest, scale)
+            if number:
+                return multiplier * scale + number
+        return None
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _number_de(word):
+    """
+    Get the number written in a word.
+
+    The compound numbers aren't enumerated in de_numbers, they are
+    decomposed, and the words already seen are remembered.
+
+    Args:
+        word (str): the lowercase word
+
+    Returns:
+        (int) or None: the number, None if the word isn't a number
+    """
+    if word in de_numbers:
+        return de_numbers[word]
+    return _decompose_number_de(word, 1000 * _SCALES_DE[0][0])
+
+
+# words joining the parts of a number, "zwei und zwanzig"
+_NUMBER_MARKERS_DE = ("und",)
 
 # TODO: short_scale and ordinals don't do anything here.
 # The parameters are present in the function signature for API compatibility
@@ -114,8 +167,9 @@ def extractnumber_de(text, short_scale=True, ordinals=False):
         elif isOrdinal_de(word):
             val = isOrdinal_de(word)
         else:
-            if word in de_numbers:
-                val = de_numbers[word]
+            number = _number_de(word)
+            if number is not None:
+                val = number
                 if count < (len(aWords) - 1):
                     wordNext = aWords[count + 1]
                 else:
@@ -164,7 +218,70 @@ def extractnumber_de(text, short_scale=True, ordinals=False):
     return val or False
 
 
+def _build_datetime_lexicon_de():
+    days = ['montag', 'dienstag', 'mittwoch',
+            'donnerstag', 'freitag', 'samstag', 'sonntag']
+    months = ['januar', 'februar', 'märz', 'april', 'mai', 'juni',
+              'juli', 'august', 'september', 'october', 'november',
+              'dezember']
+    monthsShort = ['jan', 'feb', 'mär', 'apr', 'mai', 'juni', 'juli', 'aug',
+                   'sept', 'oct', 'nov', 'dez']
+    timeQualifiers = {'früh', 'morgens', 'vormittag', 'vormittags',
+                      'nachmittag', 'nachmittags', 'abend', 'abends',
+                      'nachts'}
+    # the ordinals clean_string turns into digits are numbers followed by
+    # "te", "ste", "ter", "sten"...
+    ordinals = ["erste", "dritte", "siebte", "achte"] + \
+        [number + suffix for number in set(de_numbers) | set(
+            _BELOW_HUNDRED_DE) for suffix in ("te", "ste")] + \
+        [name for _, name, _ in _SCALES_DE]
+    return DatetimeLexicon(
+        days, months, monthsShort,
+        # word -> day offset
+        relative_days={"heute": 0, "übermorgen": 2},
+        time_qualifiers=timeQualifiers,
+        markers=['in', 'am', 'gegen', 'bis', 'für'],
+        valid_followups=set(days + months + monthsShort +
+                            ["heute", "morgen", "nächste", "nächster",
+                             "nächstes", "nächsten", "nächstem", "letzte",
+                             "letzter", "letztes", "letzten", "letztem",
+                             "jetzt"]),
+        triggers=list(timeQualifiers) + ordinals +
+        ["heute", "morgen", "mittag", "mitternacht", "stunde"],
+        trigger_phrases=[(["nächst", "letzt"], ["woch", "monat", "jahr"]),
+                         (["von", "nach", "ab"],
+                          ["nächst", "letzt", "jetzt"])])
+
+
+_DATETIME_DE = _build_datetime_lexicon_de()
+
+
+def has_datetime_de(text):
+    """ Check if text may contain a date or a time
+
+    A cheap scan for the words extract_datetime_de needs, text without any
+    of them has no date or time.
+
+    Args:
+        text (str): the text to check
+    Returns:
+        bool: False if extract_datetime_de would find nothing in text
+    """
+    return _DATETIME_DE.has_datetime(text)
+
+
 def extract_datetime_de(string, currentDate, default_time):
+    if string == "" or not currentDate:
+        return None
+
+    plan = _DATETIME_PLANS_DE.get(string, currentDate)
+    if plan is None:
+        return None
+    return _resolve_datetime_de(plan, currentDate, default_time)
+
+
+def _plan_datetime_de(string, anchor):
+    """ DatetimePlan of string, None if it has no date or time """
     def clean_string(s):
         """
             cleans the input string of unneeded punctuation
@@ -198,52 +315,31 @@ def extract_datetime_de(string, currentDate, default_time):
                 minAbs or secOffset != 0
             )
 
-    if string == "" or not currentDate:
-        return None
-
     found = False
     daySpecified = False
     dayOffset = False
     monthOffset = 0
     yearOffset = 0
-    dateNow = currentDate
-    today = dateNow.strftime("%w")
-    currentYear = dateNow.strftime("%Y")
     fromFlag = False
     datestr = ""
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersList = ['früh', 'morgens', 'vormittag', 'vormittags',
-                          'nachmittag', 'nachmittags', 'abend', 'abends',
-                          'nachts']
-    markers = ['in', 'am', 'gegen', 'bis', 'für']
-    days = ['montag', 'dienstag', 'mittwoch',
-            'donnerstag', 'freitag', 'samstag', 'sonntag']
-    months = ['januar', 'februar', 'märz', 'april', 'mai', 'juni',
-              'juli', 'august', 'september', 'october', 'november',
-              'dezember']
-    monthsShort = ['jan', 'feb', 'mär', 'apr', 'mai', 'juni', 'juli', 'aug',
-                   'sept', 'oct', 'nov', 'dez']
-
-    validFollowups = days + months + monthsShort
-    validFollowups.append("heute")
-    validFollowups.append("morgen")
-    validFollowups.append("nächste")
-    validFollowups.append("nächster")
-    validFollowups.append("nächstes")
-    validFollowups.append("nächsten")
-    validFollowups.append("nächstem")
-    validFollowups.append("letzte")
-    validFollowups.append("letzter")
-    validFollowups.append("letztes")
-    validFollowups.append("letzten")
-    validFollowups.append("letztem")
-    validFollowups.append("jetzt")
+    lexicon = _DATETIME_DE
+    timeQualifiersList = lexicon.time_qualifiers
+    markers = lexicon.markers
+    days = lexicon.days
+    months = lexicon.months
+    monthsShort = lexicon.months_short
+    validFollowups = lexicon.valid_followups
+    relative_days = lexicon.relative_days
 
     words = clean_string(string)
+    # without a trigger no word can start a date or a time, the scans
+    # below would only go through the words
+    scanned = words if lexicon.has_datetime(string) else []
 
-    for idx, word in enumerate(words):
+    for idx, word in enumerate(scanned):
         if word == "":
             continue
         wordPrevPrev = words[idx - 2] if idx > 1 else ""
@@ -266,17 +362,14 @@ def extract_datetime_de(string, currentDate, default_time):
         if word in timeQualifiersList:
             timeQualifier = word
             # parse today, tomorrow, day after tomorrow
-        elif word == "heute" and not fromFlag:
-            dayOffset = 0
+        elif word in relative_days and not fromFlag:
+            dayOffset = relative_days[word]
             used += 1
         elif word == "morgen" and not fromFlag and wordPrev != "am" and \
                 wordPrev not in days:  # morgen means tomorrow if not "am
             # Morgen" and not [day of the week] morgen
             dayOffset = 1
             used += 1
-        elif word == "übermorgen" and not fromFlag:
-            dayOffset = 2
-            used += 1
             # parse 5 days, 10 weeks, last week, next week
         elif word == "tag" or word == "tage":
             if wordPrev[0].isdigit():
@@ -327,8 +420,8 @@ def extract_datetime_de(string, currentDate, default_time):
                 # parse Monday, Tuesday, etc., and next Monday,
                 # last Tuesday, etc.
         elif word in days and not fromFlag:
-            d = days.index(word)
-            dayOffset = (d + 1) - int(today)
+            d = lexicon.day_index[word]
+            dayOffset = (d + 1) - anchor.day_of_week()
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
@@ -345,10 +438,7 @@ def extract_datetime_de(string, currentDate, default_time):
                 start -= 1
                 # parse 15 of July, June 20th, Feb 18, 19 of February
         elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+            m = lexicon.month(word)
             used += 1
             datestr = months[m]
             if wordPrev and (wordPrev[0].isdigit() or
@@ -390,15 +480,15 @@ def extract_datetime_de(string, currentDate, default_time):
                 #  Morgen" and not [day of the week] morgen:
                 dayOffset += 1
             elif wordNext in days:
-                d = days.index(wordNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
             elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNextNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 3
                 if wordNext[:6] == "nächst":
                     tmpOffset += 7
@@ -430,7 +520,7 @@ def extract_datetime_de(string, currentDate, default_time):
     hrAbs = None
     minAbs = None
 
-    for idx, word in enumerate(words):
+    for idx, word in enumerate(scanned):
         if word == "":
             continue
 
@@ -751,6 +841,52 @@ def extract_datetime_de(string, currentDate, default_time):
     if dayOffset is False:
         dayOffset = 0
 
+    for idx, word in enumerate(words):
+        if words[idx] == "und" and words[idx - 1] == "" \
+                and words[idx + 1] == "":
+            words[idx] = ""
+
+    resultStr = " ".join(words)
+    resultStr = ' '.join(resultStr.split())
+
+    return DatetimePlan(
+        resultStr,
+        date_str=datestr,
+        has_year=hasYear,
+        year_offset=yearOffset,
+        month_offset=monthOffset,
+        day_offset=dayOffset,
+        hour=hrAbs,
+        minute=minAbs,
+        hour_offset=hrOffset,
+        minute_offset=minOffset,
+        second_offset=secOffset,
+        day_specified=daySpecified,
+        time_str=timeStr)
+
+
+_DATETIME_PLANS_DE = DatetimePlans(_plan_datetime_de)
+
+
+def _resolve_datetime_de(plan, dateNow, default_time):
+    """ extract_datetime_de result of plan at the anchor dateNow """
+    if plan.now:
+        return [dateNow.replace(microsecond=0), plan.leftover]
+    datestr = plan.date_str
+    hasYear = plan.has_year
+    yearOffset = plan.year_offset
+    monthOffset = plan.month_offset
+    dayOffset = plan.day_offset
+    hrAbs = plan.hour
+    minAbs = plan.minute
+    hrOffset = plan.hour_offset
+    minOffset = plan.minute_offset
+    secOffset = plan.second_offset
+    daySpecified = plan.day_specified
+    timeStr = plan.time_str
+    months = _DATETIME_DE.months
+    currentYear = dateNow.year
+
     # perform date manipulation
 
     extractedDate = dateNow
@@ -759,37 +895,23 @@ def extract_datetime_de(string, currentDate, default_time):
                                           minute=0,
                                           hour=0)
     if datestr != "":
-        en_months = ['january', 'february', 'march', 'april', 'may', 'june',
-                     'july', 'august', 'september', 'october', 'november',
-                     'december']
-        en_monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july',
-                          'aug',
-                          'sept', 'oct', 'nov', 'dec']
-        for idx, en_month in enumerate(en_months):
-            datestr = datestr.replace(months[idx], en_month)
-        for idx, en_month in enumerate(en_monthsShort):
-            datestr = datestr.replace(monthsShort[idx], en_month)
-
-        temp = datetime.strptime(datestr, "%B %d")
+        temp = parse_month_day(datestr, months)
         if not hasYear:
             temp = temp.replace(year=extractedDate.year)
             if extractedDate < temp:
-                extractedDate = extractedDate.replace(year=int(currentYear),
-                                                      month=int(
-                                                          temp.strftime(
-                                                              "%m")),
-                                                      day=int(temp.strftime(
-                                                          "%d")))
+                extractedDate = extractedDate.replace(year=currentYear,
+                                                      month=temp.month,
+                                                      day=temp.day)
             else:
                 extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")))
+                    year=currentYear + 1,
+                    month=temp.month,
+                    day=temp.day)
         else:
             extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")))
+                year=temp.year,
+                month=temp.month,
+                day=temp.day)
 
     if timeStr != "":
         temp = datetime(timeStr)
@@ -797,39 +919,23 @@ def extract_datetime_de(string, currentDate, default_time):
                                               minute=temp.strftime("%M"),
                                               second=temp.strftime("%S"))
 
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
 
     if hrAbs is None and minAbs is None and default_time:
         hrAbs = default_time.hour
         minAbs = default_time.minute
 
+    timeOfDay = None
+    notBefore = None
     if hrAbs != -1 and minAbs != -1:
 
-        extractedDate = extractedDate + relativedelta(hours=hrAbs or 0,
-                                                      minutes=minAbs or 0)
+        timeOfDay = (hrAbs or 0, minAbs or 0)
         if (hrAbs or minAbs) and datestr == "":
-            if not daySpecified and dateNow > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-    for idx, word in enumerate(words):
-        if words[idx] == "und" and words[idx - 1] == "" \
-                and words[idx + 1] == "":
-            words[idx] = ""
-
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-
-    return [extractedDate, resultStr]
+            if not daySpecified:
+                notBefore = dateNow
+    extractedDate = shift_datetime(extractedDate, yearOffset, monthOffset,
+                                   dayOffset, timeOfDay, hrOffset, minOffset,
+                                   secOffset, notBefore)
+    return [extractedDate, plan.leftover]
 
 
 def isFractional_de(input_str):
@@ -842,18 +948,21 @@ def isFractional_de(input_str):
         (bool) or (float): False if not a fraction, otherwise the fraction
 
     """
-    if input_str.lower().startswith("halb"):
+    lower_str = input_str.lower()
+    if lower_str.startswith("halb"):
         return 0.5
 
-    if input_str.lower() == "drittel":
-        return 1.0 / 3
-    elif input_str.endswith('tel'):
-        if input_str.endswith('stel'):
-            input_str = input_str[:len(input_str) - 4]  # e.g. "hundertstel"
-        else:
-            input_str = input_str[:len(input_str) - 3]  # e.g. "fünftel"
-        if input_str.lower() in de_numbers:
-            return 1.0 / (de_numbers[input_str.lower()])
+    if lower_str == "drittel" or input_str.endswith('tel'):
+        if lower_str in _FRACTION_DE:
+            return _FRACTION_DE[lower_str]
+        # "hundertstel", "einundzwanzigstel", "zwölftel"
+        stems = [lower_str[:-3]]
+        if lower_str.endswith("stel"):
+            stems.insert(0, lower_str[:-4])
+        for stem in stems:
+            number = _number_de(stem)
+            if number:
+                return 1.0 / number
 
     return False
 
@@ -870,7 +979,7 @@ def isOrdinal_de(input_str):
 
     ordinals for 1, 3, 7 and 8 are irregular
 
-    only works for ordinals corresponding to the numbers in de_numbers
+    only works for ordinals corresponding to the numbers read by _number_de
 
     """
 
@@ -887,23 +996,27 @@ def isOrdinal_de(input_str):
 
     if lowerstr[-3:] == "ste":  # from 20 suffix is -ste*
         lowerstr = lowerstr[:-3]
-        if lowerstr in de_numbers:
-            return de_numbers[lowerstr]
+        number = _number_de(lowerstr)
+        if number is not None:
+            return number
 
     if lowerstr[-4:] in ["ster", "stes", "sten", "stem"]:
         lowerstr = lowerstr[:-4]
-        if lowerstr in de_numbers:
-            return de_numbers[lowerstr]
+        number = _number_de(lowerstr)
+        if number is not None:
+            return number
 
     if lowerstr[-2:] == "te":  # below 20 suffix is -te*
         lowerstr = lowerstr[:-2]
-        if lowerstr in de_numbers:
-            return de_numbers[lowerstr]
+        number = _number_de(lowerstr)
+        if number is not None:
+            return number
 
     if lowerstr[-3:] in ["ter", "tes", "ten", "tem"]:
         lowerstr = lowerstr[:-3]
-        if lowerstr in de_numbers:
-            return de_numbers[lowerstr]
+        number = _number_de(lowerstr)
+        if number is not None:
+            return number
 
     return False
 
@@ -926,14 +1039,36 @@ def normalize_de(text, remove_articles):
 
         # Convert numbers into digits, e.g. "two" -> "2"
 
-        if word in de_numbers:
-            word = str(de_numbers[word])
+        number = _number_de(word)
+        if number is not None:
+            word = str(number)
 
         normalized += " " + word
 
     return normalized[1:]  # strip the initial space
 
 
+def extract_numbers_with_spans_de(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers, with the
+        characters each of them was read from.
+
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: (number, start, end) for each number, with text[start:end]
+              the words it was read from
+    """
+    return extract_numbers_with_spans_generic(
+        text, extractnumber_de, short_scale, ordinals,
+        connectors=_NUMBER_MARKERS_DE, fraction_handler=isFractional_de)
+
+
 def extract_numbers_de(text, short_scale=True, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -948,5 +1083,5 @@ def extract_numbers_de(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    return extract_numbers_generic(text, pronounce_number_de, extractnumber_de,
-                                   short_scale=short_scale, ordinals=ordinals)
+    return [number for number, _, _ in
+            extract_numbers_with_spans_de(text, short_scale, ordinals)]
@@ -13,18 +13,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from itertools import chain
+from datetime import timedelta
 
-from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, \
+    Normalizer, fraction_table, NumberLexicon, DatetimeLexicon, \
+    DatetimePlan, DatetimePlans, shift_datetime, parse_month_day
 from lingua_franca.lang.common_data_en import _ARTICLES_EN, _NUM_STRING_EN, \
     _LONG_ORDINAL_EN, _LONG_SCALE_EN, _SHORT_SCALE_EN, _SHORT_ORDINAL_EN
 
 import re
-import json
-from lingua_franca import resolve_resource_file
+from lingua_franca.pack import read_json_resource
 from lingua_franca.time import now_local
 
 
@@ -65,6 +67,9 @@ _FRACTION_MARKER = {"and"}
 # decimal marker ( 1 point 5 = 1 + 0.5)
 _DECIMAL_MARKER = {"point", "dot"}
 
+# all the words joining the parts of a number
+_NUMBER_MARKERS_EN = frozenset(_FRACTION_MARKER | _DECIMAL_MARKER)
+
 _STRING_NUM_EN = invert_dict(_NUM_STRING_EN)
 _STRING_NUM_EN.update(generate_plurals_en(_STRING_NUM_EN))
 _STRING_NUM_EN.update({
@@ -76,6 +81,49 @@ _STRING_NUM_EN.update({
 _STRING_SHORT_ORDINAL_EN = invert_dict(_SHORT_ORDINAL_EN)
 _STRING_LONG_ORDINAL_EN = invert_dict(_LONG_ORDINAL_EN)
 
+_STRING_SHORT_SCALE_EN = invert_dict(_SHORT_SCALE_EN)
+_STRING_SHORT_SCALE_EN.update(generate_plurals_en(_STRING_SHORT_SCALE_EN))
+_STRING_LONG_SCALE_EN = invert_dict(_LONG_SCALE_EN)
+_STRING_LONG_SCALE_EN.update(generate_plurals_en(_STRING_LONG_SCALE_EN))
+
+
+def _fraction_denominators_en(ordinals):
+    denominators = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
+    denominators.update({word: num for num, word in ordinals.items()
+                         if num > 2})
+    return denominators
+
+
+_FRACTION_SHORT_SCALE_EN = fraction_table(
+    _fraction_denominators_en(_SHORT_ORDINAL_EN))
+_FRACTION_LONG_SCALE_EN = fraction_table(
+    _fraction_denominators_en(_LONG_ORDINAL_EN))
+
+# the kinds of NumberLexicon words that are part of whole numbers
+_WHOLE_NUMBER_KINDS = frozenset({"number", "sum", "multiplier", "fraction",
+                                 "numeral"})
+
+
+def _build_number_lexicon_en(string_num_scale, string_num_ordinal,
+                             fractions):
+    return NumberLexicon({
+        "number": _STRING_NUM_EN,
+        "sum": _SUMS,
+        "multiplier": string_num_scale,
+        "ordinal": string_num_ordinal,
+        # isFractional_en reads plurals, "two fifths"
+        "fraction": {form: value for word, value in fractions.items()
+                     for form in (word, word + "s")},
+        "marker": _NUMBER_MARKERS_EN,
+        "negative": _NEGATIVES,
+        "article": _ARTICLES_EN})
+
+
+_LEXICON_SHORT_SCALE_EN = _build_number_lexicon_en(
+    _STRING_SHORT_SCALE_EN, _STRING_SHORT_ORDINAL_EN, _FRACTION_SHORT_SCALE_EN)
+_LEXICON_LONG_SCALE_EN = _build_number_lexicon_en(
+    _STRING_LONG_SCALE_EN, _STRING_LONG_ORDINAL_EN, _FRACTION_LONG_SCALE_EN)
+
 
 def _convert_words_to_numbers_en(text, short_scale=True, ordinals=False):
     """
@@ -119,6 +167,13 @@ def _extract_numbers_with_text_en(tokens, short_scale=True,
     Extract all numbers from a list of Tokens, with the words that
     represent them.
 
+    The numbers are found in a single pass over the tokens, with the same
+    results as extracting them one at a time from the start of the text:
+    each search for a whole number resumes after the words that can't be
+    part of a number anymore, the numbers of a run of number words are
+    read in one pass over the run, and the numbers around the fraction and
+    decimal markers are only looked for again when they were replaced.
+
     Args:
         [Token]: The tokens to parse.
         short_scale bool: True if short scale numbers should be used, False for
@@ -134,27 +189,260 @@ def _extract_numbers_with_text_en(tokens, short_scale=True,
 
     """
     placeholder = "<placeholder>"  # inserted to maintain correct indices
+    positions = {token.index: position
+                 for position, token in enumerate(tokens) if token.word}
+    # positions of the fraction and decimal markers, and the numbers around
+    # those that occur only once, as _extract_fraction_with_text_en and
+    # _extract_decimal_with_text_en only split the text on these
+    markers = {}
+    if fractional_numbers:
+        for position, token in enumerate(tokens):
+            if token.word in _FRACTION_MARKER or \
+                    token.word in _DECIMAL_MARKER:
+                markers.setdefault(token.word, []).append(position)
+    around = {word: _NumbersAroundEN(found[0])
+              for word, found in markers.items() if len(found) == 1}
+
     results = []
+    start = 0
+    copied = False
+    # the numbers of the run of number words scanned last, not replaced yet
+    pending = []
     while True:
-        to_replace = \
-            _extract_number_with_text_en(tokens, short_scale,
-                                         ordinals, fractional_numbers)
+        number = None
+        if fractional_numbers:
+            number, number_tokens = _extract_split_number_with_text_en(
+                tokens, markers, around, start, short_scale, ordinals)
+        if number:
+            # the tokens of the pending numbers may be replaced
+            pending = []
+        else:
+            if not pending:
+                pending, start = _scan_whole_numbers_with_text_en(
+                    tokens, short_scale, ordinals, start)
+            number, number_tokens = pending.pop()
+        while number_tokens and number_tokens[0].word in _ARTICLES_EN:
+            number_tokens.pop(0)
+        to_replace = ReplaceableNumber(number, number_tokens)
 
         if not to_replace:
             break
 
         results.append(to_replace)
 
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
+        if not copied:
+            # the scans may have changed the tokens, but only the ones
+            # given by the caller and only until the first number
+            tokens = list(tokens)
+            copied = True
+        first = positions[to_replace.start_index]
+        last = positions[to_replace.end_index]
+        for position in range(first, last + 1):
+            token = tokens[position]
+            tokens[position] = Token(placeholder, token.index, token.start,
+                                     token.end)
+        if markers:
+            _replace_markers_en(markers, around, first, last)
     results.sort(key=lambda n: n.start_index)
     return results
 
 
+class _NumbersAroundEN:
+    """
+    The numbers around a fraction or decimal marker that occurs once in
+    the tokens given to _extract_numbers_with_text_en.
+
+    They are kept from one number to the next, and forgotten when one of
+    the numbers on their side of the marker is replaced.
+
+    Args:
+        position (int): position of the marker in the tokens
+    """
+
+    def __init__(self, position):
+        self.position = position
+        # number before the marker, False if there is none, and the position
+        # of the words it was found in
+        self.last = None
+        self.last_start = None
+        # number after the marker, False if there is none, by value of
+        # fractional_numbers
+        self.first = {}
+
+    def numbers(self, tokens, start, short_scale, ordinals,
+                fractional_numbers):
+        """
+        Get the last number before the marker, and the first after it.
+
+        Args:
+            tokens [Token]: the tokens, with the numbers found so far replaced
+            start (int): position before which there is no number left
+            short_scale boolean:
+            ordinals boolean:
+            fractional_numbers boolean: look for fractions and decimals after
+                                        the marker
+
+        Returns:
+            (ReplaceableNumber, ReplaceableNumber)
+            (None, None) if there is no number on one of the sides.
+
+        """
+        if self.last is None:
+            self.last, self.last_start = _extract_last_number_with_text_en(
+                tokens, start, self.position, short_scale, ordinals)
+        if not self.last:
+            return None, None
+        first = self.first.get(fractional_numbers)
+        if first is None:
+            numbers = _extract_numbers_with_text_en(
+                tokens[self.position + 1:], short_scale, ordinals,
+                fractional_numbers)
+            first = numbers[0] if numbers else False
+            self.first[fractional_numbers] = first
+        if not first:
+            return None, None
+        return self.last, first
+
+    def replaced(self, first, last):
+        """ Forget the numbers on the side of the tokens replaced """
+        if last < self.position:
+            if self.last and last >= self.last_start:
+                self.last = None
+        elif first > self.position:
+            self.first.clear()
+
+
+def _replace_markers_en(markers, around, first, last):
+    """
+    Update the markers of _extract_numbers_with_text_en once the tokens
+    between positions first and last are replaced.
+    """
+    for word, found in markers.items():
+        lo = bisect_left(found, first)
+        hi = bisect_right(found, last)
+        if lo < hi:
+            del found[lo:hi]
+            if len(found) == 1:
+                around[word] = _NumbersAroundEN(found[0])
+            else:
+                around.pop(word, None)
+        elif word in around:
+            around[word].replaced(first, last)
+
+
+def _extract_split_number_with_text_en(tokens, markers, around, start,
+                                       short_scale, ordinals):
+    """
+    Find the fraction or decimal that _extract_fraction_with_text_en or
+    _extract_decimal_with_text_en would find in the tokens.
+
+    Args:
+        tokens [Token]: the tokens, with the numbers found so far replaced
+        markers dict(str, [int]): positions of each marker in the tokens
+        around dict(str, _NumbersAroundEN): numbers around the markers that
+                                            occur once
+        start (int): position before which there is no number left
+        short_scale boolean:
+        ordinals boolean:
+
+    Returns:
+        (int or float, [Token])
+        The value found, and the list of relevant tokens.
+        (None, None) if no fraction or decimal value is found.
+
+    """
+    for c in _FRACTION_MARKER:
+        # any other number of markers leaves a side without numbers
+        if c not in around or \
+                _count_partitions(markers[c], len(tokens)) != 3:
+            continue
+        position = around[c].position
+        num1, num2 = around[c].numbers(tokens, start, short_scale, ordinals,
+                                       fractional_numbers=True)
+        if num1 is None:
+            break
+        if num1.value >= 1 and 0 < num2.value < 1:
+            return num1.value + num2.value, \
+                num1.tokens + [tokens[position]] + num2.tokens
+        break
+
+    for c in _DECIMAL_MARKER:
+        found = markers.get(c)
+        if not found or len(found) > 3 or \
+                _count_partitions(found, len(tokens)) != 3:
+            continue
+        if c not in around:
+            # markers next to each other or at the ends of the text
+            break
+        position = around[c].position
+        number, decimal = around[c].numbers(tokens, start, short_scale,
+                                            ordinals, fractional_numbers=False)
+        if number is None:
+            break
+        if "." not in str(decimal.text):
+            value = number.value + float('0.' + str(decimal.value))
+            if value:
+                return value, \
+                    number.tokens + [tokens[position]] + decimal.tokens
+            break
+
+    return None, None
+
+
+def _count_partitions(positions, length):
+    """
+    Count the partitions that partition_list makes of a list of length
+    items, splitting on the items at positions.
+    """
+    count = len(positions) + (positions[0] > 0) + \
+        (positions[-1] < length - 1)
+    for previous, position in zip(positions, positions[1:]):
+        count += position - previous > 1
+    return count
+
+
+def _extract_last_number_with_text_en(tokens, start, stop, short_scale,
+                                      ordinals):
+    """
+    Extract the last number of tokens[:stop], without fractions and decimals.
+
+    Only the words that can make up this number are parsed: the run of
+    number words closest to stop.
+
+    Args:
+        tokens [Token]:
+        start (int): position before which there is no number
+        stop (int): position after the last token to consider
+        short_scale boolean:
+        ordinals boolean:
+
+    Returns:
+        (ReplaceableNumber, int)
+        The number, and the position of the words it was found in.
+        (False, None) if there is no number.
+
+    """
+    position = stop - 1
+    while position >= start and \
+            not _is_number_token_en(tokens[position].word, short_scale,
+                                    ordinals):
+        position -= 1
+    if position < start:
+        return False, None
+    while position > start and \
+            (tokens[position - 1].word in _ARTICLES_EN or
+             tokens[position - 1].word in _NEGATIVES or
+             _is_number_token_en(tokens[position - 1].word, short_scale,
+                                 ordinals)):
+        position -= 1
+    numbers = _extract_numbers_with_text_en(tokens[position:stop],
+                                            short_scale, ordinals,
+                                            fractional_numbers=False)
+    if not numbers:
+        return False, None
+    return numbers[-1], position
+
+
 def _extract_number_with_text_en(tokens, short_scale=True,
                                  ordinals=False, fractional_numbers=True):
     """
@@ -318,6 +606,79 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
         int or float, [Tokens]
         The value parsed, and tokens that it corresponds to.
 
+    """
+    val, number_words, _ = \
+        _scan_whole_number_with_text_en(tokens, short_scale, ordinals)
+    return val, number_words
+
+
+def _is_number_token_en(word, short_scale, ordinals):
+    """
+    Check if a word can be part of a whole number.
+
+    Articles and negatives are not, they are only kept in front of numbers.
+
+    Args:
+        word str:
+        short_scale boolean:
+        ordinals boolean:
+
+    Returns:
+        bool
+
+    """
+    if is_numeric(word[:-2]) and word.endswith(("st", "nd", "rd", "th")):
+        word = word[:-2]
+    return _is_number_word_en(word, short_scale, ordinals)
+
+
+def _is_number_word_en(word, short_scale, ordinals):
+    """ _is_number_token_en, once the suffix of 1st, 2nd... is removed """
+    kinds = _get_number_lexicon_en(short_scale).kinds(word)
+    if not kinds:
+        # the fractions are read whatever their case
+        return word != word.lower() and \
+            bool(isFractional_en(word, short_scale=short_scale))
+    return not _WHOLE_NUMBER_KINDS.isdisjoint(kinds) or \
+        (ordinals and "ordinal" in kinds)
+
+
+def _scan_whole_number_with_text_en(tokens, short_scale, ordinals, start=0,
+                                    stop=None, rest=None, bounds=None):
+    """
+    Scan the tokens for a whole number, see
+    _extract_whole_number_with_text_en.
+
+    Scanning from start gives the same number as scanning from the first
+    token when there is no number before start, and start is a position
+    returned by a previous scan of the same tokens.
+
+    A run of number words can hold several numbers in a row, "one two
+    three", of which the scan returns the last.  Scanning from the start
+    of one of the others to the start of the next, with the tokens up to
+    the end of the run left out as if they were replaced, gives that
+    number, see _scan_whole_numbers_with_text_en.
+
+    Args:
+        tokens [Token]:
+        short_scale boolean:
+        ordinals boolean:
+        start (int): position of the first token to scan
+        stop (int): position after the last token to scan, the end of the
+                    tokens by default
+        rest (int): position of the first token after stop that the
+                    lookahead of "hundred", "thousand"... reads, stop by
+                    default
+        bounds (list): if given, the positions at which a number follows
+                       another in the run are appended to it, then the
+                       position at which the scan stopped
+
+    Returns:
+        int or float, [Tokens], int
+        The value parsed, the tokens that it corresponds to, and the
+        position from which the next number can be scanned once these
+        tokens are replaced.
+
     """
     multiplies, string_num_ordinal, string_num_scale = \
         _initialize_number_data(short_scale)
@@ -327,7 +688,13 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
     prev_val = None
     next_val = None
     to_sum = []
-    for idx, token in enumerate(tokens):
+    resume = start
+    if stop is None:
+        stop = len(tokens)
+    if rest is None:
+        rest = stop
+    for idx in range(start, stop):
+        token = tokens[idx]
         current_val = None
         if next_val:
             next_val = None
@@ -339,7 +706,7 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
             continue
 
         prev_word = tokens[idx - 1].word if idx > 0 else ""
-        next_word = tokens[idx + 1].word if idx + 1 < len(tokens) else ""
+        next_word = tokens[idx + 1].word if idx + 1 < stop else ""
 
         if is_numeric(word[:-2]) and \
                 (word.endswith("st") or word.endswith("nd") or word.endswith("rd") or word.endswith("th")):
@@ -350,23 +717,18 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
             # handle nth one
             if next_word == "one":
                 # would return 1 instead otherwise
-                tokens[idx + 1] = Token("", idx)
+                tokens[idx + 1] = Token("", idx, tokens[idx + 1].start,
+                                        tokens[idx + 1].end)
                 next_word = ""
 
-        if word not in string_num_scale and \
-                word not in _STRING_NUM_EN and \
-                word not in _SUMS and \
-                word not in multiplies and \
-                not (ordinals and word in string_num_ordinal) and \
-                not is_numeric(word) and \
-                not isFractional_en(word, short_scale=short_scale) and \
-                not look_for_fractions(word.split('/')):
+        if not _is_number_word_en(word, short_scale, ordinals):
             words_only = [token.word for token in number_words]
             if number_words and not all([w in _ARTICLES_EN |
                                          _NEGATIVES for w in words_only]):
                 break
             else:
                 number_words = []
+                resume = idx + 1
                 continue
         elif word not in multiplies \
                 and prev_word not in multiplies \
@@ -375,8 +737,12 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
                 and prev_word not in _NEGATIVES \
                 and prev_word not in _ARTICLES_EN:
             number_words = [token]
+            if bounds is not None:
+                bounds.append(idx)
         elif prev_word in _SUMS and word in _SUMS:
             number_words = [token]
+            if bounds is not None:
+                bounds.append(idx)
         else:
             number_words.append(token)
 
@@ -515,7 +881,9 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
                 # 9907657
 
                 time_to_sum = True
-                for other_token in tokens[idx+1:]:
+                for other_idx in chain(range(idx + 1, stop),
+                                       range(rest, len(tokens))):
+                    other_token = tokens[other_idx]
                     if other_token.word in multiplies:
                         if string_num_scale[other_token.word] >= current_val:
                             time_to_sum = False
@@ -528,17 +896,69 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
                     val = 0
                     prev_val = 0
 
+    else:
+        idx = stop
+
+    if bounds is not None:
+        bounds.append(idx)
     if val is not None and to_sum:
         val += sum(to_sum)
 
-    return val, number_words
+    return val, number_words, resume
+
+
+def _scan_whole_numbers_with_text_en(tokens, short_scale, ordinals, start):
+    """
+    Scan the tokens for the numbers of the next run of number words, in
+    one pass over the run.
+
+    _scan_whole_number_with_text_en returns the last number of the run,
+    and would have to scan the run again for each of the others once the
+    ones after them are replaced.  The run is scanned once to find where
+    its numbers start, then each number is scanned on its own, from its
+    start to the start of the next, reading the rest of the run as
+    replaced.
+
+    Args:
+        tokens [Token]:
+        short_scale boolean:
+        ordinals boolean:
+        start (int): position of the first token to scan, as for
+                     _scan_whole_number_with_text_en
+
+    Returns:
+        [(int or float, [Token])], int
+        The numbers of the run, in the order of the text, with the tokens
+        they correspond to, and the position from which the next numbers
+        can be scanned once all of these are replaced.
+
+    """
+    bounds = []
+    val, number_words, resume = _scan_whole_number_with_text_en(
+        tokens, short_scale, ordinals, start, bounds=bounds)
+    end = bounds.pop()
+    # the first number starts at resume, unless a number follows nothing
+    starts = bounds if bounds and bounds[0] == resume else [resume] + bounds
+    if len(starts) == 1:
+        return [(val, number_words)], resume
+    numbers = []
+    for first, following in zip(starts, starts[1:]):
+        val, number_words, _ = _scan_whole_number_with_text_en(
+            tokens, short_scale, ordinals, first, stop=following, rest=end)
+        numbers.append((val, number_words))
+    val, number_words, _ = _scan_whole_number_with_text_en(
+        tokens, short_scale, ordinals, starts[-1])
+    numbers.append((val, number_words))
+    return numbers, resume
 
 
 def _initialize_number_data(short_scale):
     """
-    Generate dictionaries of words to numbers, based on scale.
+    Get the dictionaries of words to numbers, based on scale.
 
-    This is a helper function for _extract_whole_number.
+    This is a helper function for _extract_whole_number.  The dictionaries
+    are built once, when the module is loaded, and shared by all the calls:
+    don't modify them.
 
     Args:
         short_scale boolean:
@@ -548,16 +968,28 @@ def _initialize_number_data(short_scale):
         multiplies, string_num_ordinal, string_num_scale
 
     """
-    multiplies = _MULTIPLIES_SHORT_SCALE_EN if short_scale \
-        else _MULTIPLIES_LONG_SCALE_EN
+    if short_scale:
+        return _MULTIPLIES_SHORT_SCALE_EN, _STRING_SHORT_ORDINAL_EN, \
+            _STRING_SHORT_SCALE_EN
+    return _MULTIPLIES_LONG_SCALE_EN, _STRING_LONG_ORDINAL_EN, \
+        _STRING_LONG_SCALE_EN
+
+
+def _get_number_lexicon_en(short_scale):
+    """
+    Get the NumberLexicon of the english number words, based on scale.
+
+    Like the dictionaries of _initialize_number_data, the lexicons are
+    built once, when the module is loaded.
+
+    Args:
+        short_scale boolean:
 
-    string_num_ordinal_en = _STRING_SHORT_ORDINAL_EN if short_scale \
-        else _STRING_LONG_ORDINAL_EN
+    Returns:
+        NumberLexicon
 
-    string_num_scale_en = _SHORT_SCALE_EN if short_scale else _LONG_SCALE_EN
-    string_num_scale_en = invert_dict(string_num_scale_en)
-    string_num_scale_en.update(generate_plurals_en(string_num_scale_en))
-    return multiplies, string_num_ordinal_en, string_num_scale_en
+    """
+    return _LEXICON_SHORT_SCALE_EN if short_scale else _LEXICON_LONG_SCALE_EN
 
 
 def extractnumber_en(text, short_scale=True, ordinals=False):
@@ -635,6 +1067,61 @@ def extract_duration_en(text):
     return (duration, text)
 
 
+def _build_datetime_lexicon_en():
+    days = ['monday', 'tuesday', 'wednesday',
+            'thursday', 'friday', 'saturday', 'sunday']
+    months = ['january', 'february', 'march', 'april', 'may', 'june',
+              'july', 'august', 'september', 'october', 'november',
+              'december']
+    monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
+                   'sept', 'oct', 'nov', 'dec']
+    timeQualifiersAM = ['morning']
+    timeQualifiersPM = ['afternoon', 'evening', 'night', 'tonight']
+    return DatetimeLexicon(
+        days, months, monthsShort,
+        time_qualifiers_am=timeQualifiersAM,
+        time_qualifiers_pm=timeQualifiersPM,
+        time_qualifiers=set(timeQualifiersAM + timeQualifiersPM),
+        markers=['at', 'in', 'on', 'by', 'this', 'around', 'for', 'of',
+                 "within"],
+        recur_markers=days + [d + 's' for d in days] +
+        ['weekend', 'weekday', 'weekends', 'weekdays'],
+        # word -> years
+        year_multiples={"decade": 10, "century": 100, "millennium": 1000},
+        # word -> day offset
+        relative_days={"today": 0, "tomorrow": 1, "yesterday": -1},
+        # word -> hour, set whatever hour was read before
+        hour_words={"noon": 12, "midnight": 0},
+        # word -> hour, unless an hour was read before
+        day_part_hours={"morning": 8, "afternoon": 15, "evening": 19},
+        day_multiples=["weeks", "months", "years"],
+        valid_followups=set(days + months + monthsShort +
+                            ["today", "tomorrow", "yesterday", "next",
+                             "last", "now", "this"]),
+        triggers=timeQualifiersAM + timeQualifiersPM +
+        ["now", "today", "tomorrow", "yesterday", "week", "month", "year",
+         "decade", "century", "centuries", "millennium", "couple", "noon",
+         "midnight", "hour", "minute", "second"],
+        trigger_phrases=[(["from", "after"], ["this", "next", "last"])])
+
+
+_DATETIME_EN = _build_datetime_lexicon_en()
+
+
+def has_datetime_en(text):
+    """ Check if text may contain a date or a time
+
+    A cheap scan for the words extract_datetime_en needs, text without any
+    of them has no date or time.
+
+    Args:
+        text (str): the text to check
+    Returns:
+        bool: False if extract_datetime_en would find nothing in text
+    """
+    return _DATETIME_EN.has_datetime(text)
+
+
 def extract_datetime_en(string, dateNow, default_time):
     """ Convert a human date reference into an exact datetime
 
@@ -666,6 +1153,18 @@ def extract_datetime_en(string, dateNow, default_time):
                          date or time related text was found.
     """
 
+    if string == "" or not dateNow or not _DATETIME_EN.has_datetime(string):
+        return None
+
+    plan = _DATETIME_PLANS_EN.get(string, dateNow)
+    if plan is None:
+        return None
+    return _resolve_datetime_en(plan, dateNow, default_time)
+
+
+def _plan_datetime_en(string, anchor):
+    """ DatetimePlan of string, None if it has no date or time """
+
     def clean_string(s):
         # clean unneeded punctuation and capitalization among other things.
         s = s.lower().replace('?', '').replace('.', '').replace(',', '') \
@@ -680,9 +1179,8 @@ def extract_datetime_en(string, dateNow, default_time):
         for idx, word in enumerate(wordList):
             word = word.replace("'s", "")
 
-            ordinals = ["rd", "st", "nd", "th"]
             if word[0].isdigit():
-                for ordinal in ordinals:
+                for ordinal in ("rd", "st", "nd", "th"):
                     # "second" is the only case we should not do this
                     if ordinal in word and "second" not in word:
                         word = word.replace(ordinal, "")
@@ -700,36 +1198,31 @@ def extract_datetime_en(string, dateNow, default_time):
                 minAbs or secOffset != 0
             )
 
-    if string == "" or not dateNow:
-        return None
-
     found = False
     daySpecified = False
     dayOffset = False
     monthOffset = 0
     yearOffset = 0
-    today = dateNow.strftime("%w")
-    currentYear = dateNow.strftime("%Y")
     fromFlag = False
     datestr = ""
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersAM = ['morning']
-    timeQualifiersPM = ['afternoon', 'evening', 'night', 'tonight']
-    timeQualifiersList = set(timeQualifiersAM + timeQualifiersPM)
-    markers = ['at', 'in', 'on', 'by', 'this', 'around', 'for', 'of', "within"]
-    days = ['monday', 'tuesday', 'wednesday',
-            'thursday', 'friday', 'saturday', 'sunday']
-    months = ['january', 'february', 'march', 'april', 'may', 'june',
-              'july', 'august', 'september', 'october', 'november',
-              'december']
-    recur_markers = days + [d + 's' for d in days] + ['weekend', 'weekday',
-                                                      'weekends', 'weekdays']
-    monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
-                   'sept', 'oct', 'nov', 'dec']
-    year_multiples = ["decade", "century", "millennium"]
-    day_multiples = ["weeks", "months", "years"]
+    lexicon = _DATETIME_EN
+    timeQualifiersAM = lexicon.time_qualifiers_am
+    timeQualifiersPM = lexicon.time_qualifiers_pm
+    timeQualifiersList = lexicon.time_qualifiers
+    markers = lexicon.markers
+    days = lexicon.days
+    months = lexicon.months
+    recur_markers = lexicon.recur_markers
+    monthsShort = lexicon.months_short
+    year_multiples = lexicon.year_multiples
+    relative_days = lexicon.relative_days
+    hour_words = lexicon.hour_words
+    day_part_hours = lexicon.day_part_hours
+    day_multiples = lexicon.day_multiples
+    validFollowups = lexicon.valid_followups
 
     words = clean_string(string)
 
@@ -752,8 +1245,7 @@ def extract_datetime_en(string, dateNow, default_time):
         if word == "now" and not datestr:
             resultStr = " ".join(words[idx + 1:])
             resultStr = ' '.join(resultStr.split())
-            extractedDate = dateNow.replace(microsecond=0)
-            return [extractedDate, resultStr]
+            return DatetimePlan(resultStr, now=True)
         elif wordNext in year_multiples:
             multiplier = None
             if is_numeric(word):
@@ -761,23 +1253,13 @@ def extract_datetime_en(string, dateNow, default_time):
             multiplier = multiplier or 1
             multiplier = int(multiplier)
             used += 2
-            if wordNext == "decade":
-                yearOffset = multiplier * 10
-            elif wordNext == "century":
-                yearOffset = multiplier * 100
-            elif wordNext == "millennium":
-                yearOffset = multiplier * 1000
+            yearOffset = multiplier * year_multiples[wordNext]
         # couple of
         elif word == "2" and wordNext == "of" and \
                 wordNextNext in year_multiples:
             multiplier = 2
             used += 3
-            if wordNextNext == "decade":
-                yearOffset = multiplier * 10
-            elif wordNextNext == "century":
-                yearOffset = multiplier * 100
-            elif wordNextNext == "millennium":
-                yearOffset = multiplier * 1000
+            yearOffset = multiplier * year_multiples[wordNextNext]
         elif word == "2" and wordNext == "of" and \
                 wordNextNext in day_multiples:
             multiplier = 2
@@ -790,22 +1272,17 @@ def extract_datetime_en(string, dateNow, default_time):
                 dayOffset = multiplier * 7
         elif word in timeQualifiersList:
             timeQualifier = word
-        # parse today, tomorrow, day after tomorrow
-        elif word == "today" and not fromFlag:
-            dayOffset = 0
-            used += 1
-        elif word == "tomorrow" and not fromFlag:
-            dayOffset = 1
+        # parse today, tomorrow, yesterday
+        elif word in relative_days and not fromFlag:
+            dayOffset = relative_days[word]
             used += 1
+        # day before yesterday
         elif word == "day" and wordNext == "before" and wordNextNext == "yesterday" and not fromFlag:
             dayOffset = -2
             used += 3
         elif word == "before" and wordNext == "yesterday" and not fromFlag:
             dayOffset = -2
             used += 2
-        elif word == "yesterday" and not fromFlag:
-            dayOffset = -1
-            used += 1
         elif (word == "day" and
               wordNext == "after" and
               wordNextNext == "tomorrow" and
@@ -866,8 +1343,8 @@ def extract_datetime_en(string, dateNow, default_time):
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
         elif word in days and not fromFlag:
-            d = days.index(word)
-            dayOffset = (d + 1) - int(today)
+            d = lexicon.day_index[word]
+            dayOffset = (d + 1) - anchor.day_of_week()
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
@@ -882,10 +1359,7 @@ def extract_datetime_en(string, dateNow, default_time):
                 start -= 1
                 # parse 15 of July, June 20th, Feb 18, 19 of February
         elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+            m = lexicon.month(word)
             used += 1
             datestr = months[m]
             if wordPrev and (wordPrev[0].isdigit() or
@@ -923,14 +1397,6 @@ def extract_datetime_en(string, dateNow, default_time):
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("today")
-        validFollowups.append("tomorrow")
-        validFollowups.append("yesterday")
-        validFollowups.append("next")
-        validFollowups.append("last")
-        validFollowups.append("now")
-        validFollowups.append("this")
         if (word == "from" or word == "after") and wordNext in validFollowups:
             used = 2
             fromFlag = True
@@ -939,15 +1405,15 @@ def extract_datetime_en(string, dateNow, default_time):
             elif wordNext == "yesterday":
                 dayOffset -= 1
             elif wordNext in days:
-                d = days.index(wordNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
             elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNextNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 3
                 if wordNext == "next":
                     if dayOffset <= 2:
@@ -990,23 +1456,12 @@ def extract_datetime_en(string, dateNow, default_time):
         wordNextNext = words[idx + 2] if idx + 2 < len(words) else ""
         # parse noon, midnight, morning, afternoon, evening
         used = 0
-        if word == "noon":
-            hrAbs = 12
-            used += 1
-        elif word == "midnight":
-            hrAbs = 0
+        if word in hour_words:
+            hrAbs = hour_words[word]
             used += 1
-        elif word == "morning":
+        elif word in day_part_hours:
             if hrAbs is None:
-                hrAbs = 8
-            used += 1
-        elif word == "afternoon":
-            if hrAbs is None:
-                hrAbs = 15
-            used += 1
-        elif word == "evening":
-            if hrAbs is None:
-                hrAbs = 19
+                hrAbs = day_part_hours[word]
             used += 1
         elif word == "tonight" or word == "night":
             if hrAbs is None:
@@ -1317,10 +1772,9 @@ def extract_datetime_en(string, dateNow, default_time):
 
                 # ambiguous time, detect whether they mean this evening or
                 # the next morning based on whether it has already passed
-                if dateNow.hour < HH or (dateNow.hour == HH and
-                                         dateNow.minute < MM):
+                if anchor.is_before(HH, MM):
                     pass  # No modification needed
-                elif dateNow.hour < HH + 12:
+                elif anchor.is_before(HH + 12):
                     HH += 12
                 else:
                     # has passed, assume the next morning
@@ -1373,50 +1827,85 @@ def extract_datetime_en(string, dateNow, default_time):
     if dayOffset is False:
         dayOffset = 0
 
+    for idx, word in enumerate(words):
+        if words[idx] == "and" and \
+                words[idx - 1] == "" and words[idx + 1] == "":
+            words[idx] = ""
+
+    resultStr = " ".join(words)
+    resultStr = ' '.join(resultStr.split())
+
+    return DatetimePlan(
+        resultStr,
+        date_str=datestr,
+        has_year=hasYear,
+        year_offset=yearOffset,
+        month_offset=monthOffset,
+        day_offset=dayOffset,
+        hour=hrAbs,
+        minute=minAbs,
+        hour_offset=hrOffset,
+        minute_offset=minOffset,
+        second_offset=secOffset,
+        day_specified=daySpecified)
+
+
+_DATETIME_PLANS_EN = DatetimePlans(_plan_datetime_en)
+
+
+def _resolve_datetime_en(plan, dateNow, default_time):
+    """ extract_datetime_en result of plan at the anchor dateNow """
+    if plan.now:
+        return [dateNow.replace(microsecond=0), plan.leftover]
+    datestr = plan.date_str
+    hasYear = plan.has_year
+    yearOffset = plan.year_offset
+    monthOffset = plan.month_offset
+    dayOffset = plan.day_offset
+    hrAbs = plan.hour
+    minAbs = plan.minute
+    hrOffset = plan.hour_offset
+    minOffset = plan.minute_offset
+    secOffset = plan.second_offset
+    daySpecified = plan.day_specified
+    currentYear = dateNow.year
+
     # perform date manipulation
 
     extractedDate = dateNow.replace(microsecond=0)
 
     if datestr != "":
         # date included an explicit date, e.g. "june 5" or "june 2, 2017"
-        try:
-            temp = datetime.strptime(datestr, "%B %d")
-        except ValueError:
-            # Try again, allowing the year
-            temp = datetime.strptime(datestr, "%B %d %Y")
+        temp = parse_month_day(datestr, _DATETIME_EN.months)
         extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
         if not hasYear:
             temp = temp.replace(year=extractedDate.year,
                                 tzinfo=extractedDate.tzinfo)
             if extractedDate < temp:
                 extractedDate = extractedDate.replace(
-                    year=int(currentYear),
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
+                    year=currentYear,
+                    month=temp.month,
+                    day=temp.day,
                     tzinfo=extractedDate.tzinfo)
             else:
                 extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
+                    year=currentYear + 1,
+                    month=temp.month,
+                    day=temp.day,
                     tzinfo=extractedDate.tzinfo)
         else:
             extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")),
+                year=temp.year,
+                month=temp.month,
+                day=temp.day,
                 tzinfo=extractedDate.tzinfo)
     else:
         # ignore the current HH:MM:SS if relative using days or greater
         if hrOffset == 0 and minOffset == 0 and secOffset == 0:
             extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
 
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
+    timeOfDay = None
+    notBefore = None
     if hrAbs != -1 and minAbs != -1:
         # If no time was supplied in the string set the time to default
         # time if it's available
@@ -1426,25 +1915,14 @@ def extract_datetime_en(string, dateNow, default_time):
             hrAbs = hrAbs or 0
             minAbs = minAbs or 0
 
-        extractedDate = extractedDate + relativedelta(hours=hrAbs,
-                                                      minutes=minAbs)
+        timeOfDay = (hrAbs, minAbs)
         if (hrAbs != 0 or minAbs != 0) and datestr == "":
-            if not daySpecified and dateNow > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-    for idx, word in enumerate(words):
-        if words[idx] == "and" and \
-                words[idx - 1] == "" and words[idx + 1] == "":
-            words[idx] = ""
-
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    return [extractedDate, resultStr]
+            if not daySpecified:
+                notBefore = dateNow
+    extractedDate = shift_datetime(extractedDate, yearOffset, monthOffset,
+                                   dayOffset, timeOfDay, hrOffset, minOffset,
+                                   secOffset, notBefore)
+    return [extractedDate, plan.leftover]
 
 
 def isFractional_en(input_str, short_scale=True):
@@ -1461,19 +1939,31 @@ def isFractional_en(input_str, short_scale=True):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
 
-    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
-    if short_scale:
-        for num in _SHORT_ORDINAL_EN:
-            if num > 2:
-                fracts[_SHORT_ORDINAL_EN[num]] = num
-    else:
-        for num in _LONG_ORDINAL_EN:
-            if num > 2:
-                fracts[_LONG_ORDINAL_EN[num]] = num
+    fractions = _FRACTION_SHORT_SCALE_EN if short_scale \
+        else _FRACTION_LONG_SCALE_EN
+    return fractions.get(input_str.lower(), False)
+
+
+def extract_numbers_with_spans_en(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers, with the
+        characters each of them was read from.
 
-    if input_str.lower() in fracts:
-        return 1.0 / fracts[input_str.lower()]
-    return False
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: (number, start, end) for each number, with text[start:end]
+              the words it was read from
+    """
+    results = _extract_numbers_with_text_en(tokenize(text),
+                                            short_scale, ordinals)
+    return [(float(result.value), result.start, result.end)
+            for result in results]
 
 
 def extract_numbers_en(text, short_scale=True, ordinals=False):
@@ -1496,8 +1986,7 @@ def extract_numbers_en(text, short_scale=True, ordinals=False):
 
 
 class EnglishNormalizer(Normalizer):
-    with open(resolve_resource_file("text/en-us/normalize.json")) as f:
-        _default_config = json.load(f)
+    _default_config = read_json_resource("text/en-us/normalize.json")
 
 
 def normalize_en(text, remove_articles):
@@ -18,12 +18,22 @@
     TODO: numbers greater than 999999
 """
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
 from dateutil.tz import gettz
-from lingua_franca.lang.format_es import pronounce_number_es
 from lingua_franca.lang.parse_common import *
 from lingua_franca.lang.common_data_es import _ARTICLES_ES, _NUM_STRING_ES
 
+_FRACTION_ES = fraction_table({
+    "medio": 2, "media": 2, "tercio": 3, "cuarto": 4, "cuarta": 4,
+    "quinto": 5, "quinta": 5, "sexto": 6, "sexta": 6, "séptimo": 7,
+    "séptima": 7, "octavo": 8, "octava": 8, "noveno": 9, "novena": 9,
+    "décimo": 10, "décima": 10, "onceavo": 11, "onceava": 11, "doceavo": 12,
+    "doceava": 12, "vigésimo": 20, "vigésima": 20, "trigésimo": 30,
+    "trigésima": 30, "centésimo": 100, "centésima": 100, "milésimo": 1000,
+    "milésima": 1000})
+
+# words joining the parts of a number, "dos y medio"
+_NUMBER_MARKERS_ES = ("y", "punto", "coma")
+
 
 def isFractional_es(input_str):
     """
@@ -38,23 +48,7 @@ def isFractional_es(input_str):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
 
-    aFrac = {"medio": 2, "media": 2, "tercio": 3, "cuarto": 4,
-             "cuarta": 4, "quinto": 5, "quinta": 5, "sexto": 6, "sexta": 6,
-             "séptimo": 7, "séptima": 7, "octavo": 8, "octava": 8,
-             "noveno": 9, "novena": 9, "décimo": 10, "décima": 10,
-             "onceavo": 11, "onceava": 11, "doceavo": 12, "doceava": 12}
-
-    if input_str.lower() in aFrac:
-        return 1.0 / aFrac[input_str]
-    if (input_str == "vigésimo" or input_str == "vigésima"):
-        return 1.0 / 20
-    if (input_str == "trigésimo" or input_str == "trigésima"):
-        return 1.0 / 30
-    if (input_str == "centésimo" or input_str == "centésima"):
-        return 1.0 / 100
-    if (input_str == "milésimo" or input_str == "milésima"):
-        return 1.0 / 1000
-    return False
+    return _FRACTION_ES.get(input_str.lower(), False)
 
 
 # TODO: short_scale and ordinals don't do anything here.
@@ -89,6 +83,18 @@ def extractnumber_es(text, short_scale=True, ordinals=False):
         # is current word a number?
         if word in _NUM_STRING_ES:
             val = _NUM_STRING_ES[word]
+            # "dos mil trescientos"
+            parsed = es_number_parse(aWords, count)
+            if parsed and parsed[1] > count + 1:
+                val, end = parsed
+                count = end - 1
+                next_next_word = None
+                if end < len(aWords):
+                    next_word = aWords[end]
+                    if end + 1 < len(aWords):
+                        next_next_word = aWords[end + 1]
+                else:
+                    next_word = None
         elif word.isdigit():  # doesn't work with decimals
             val = int(word)
         elif is_numeric(word):
@@ -171,7 +177,8 @@ def extractnumber_es(text, short_scale=True, ordinals=False):
                     zeros += 1
                 else:
                     break
-            afterDotVal = str(extractnumber_es(newText[:-1]))
+            # "dos punto cero", only zeros after the marker
+            afterDotVal = str(extractnumber_es(newText[:-1]) or 0)
             afterDotVal = zeros * "0" + afterDotVal
             result = float(str(result) + "." + afterDotVal)
             break
@@ -190,81 +197,114 @@ def extractnumber_es(text, short_scale=True, ordinals=False):
     return result or False
 
 
-# TODO Not parsing 'cero'
-def es_number_parse(words, i):
-    def es_cte(i, s):
-        if i < len(words) and s == words[i]:
-            return s, i + 1
-        return None
-
-    def es_number_word(i, mi, ma):
-        if i < len(words):
-            v = _NUM_STRING_ES.get(words[i])
-            if v and v >= mi and v <= ma:
-                return v, i + 1
-        return None
-
-    def es_number_1_99(i):
-        r1 = es_number_word(i, 1, 29)
-        if r1:
+def _es_number_word(words, i, mi, ma):
+    if i < len(words):
+        v = _NUM_STRING_ES.get(words[i])
+        if v and v >= mi and v <= ma:
+            return v, i + 1
+    return None
+
+
+@grammar_rule
+def _es_number_1_99(words, i, memo):
+    r1 = _es_number_word(words, i, 1, 29)
+    if r1:
+        return r1
+
+    r1 = _es_number_word(words, i, 30, 90)
+    if r1:
+        v1, i1 = r1
+        if i1 < len(words) and words[i1] == "y":
+            r3 = _es_number_word(words, i1 + 1, 1, 9)
+            if r3:
+                v3, i3 = r3
+                return v1 + v3, i3
+        return r1
+    return None
+
+
+@grammar_rule
+def _es_number_1_999(words, i, memo):
+    # [2-9]cientos [1-99]?
+    r1 = _es_number_word(words, i, 100, 900)
+    if r1:
+        v1, i1 = r1
+        r2 = _es_number_1_99(words, i1, memo)
+        if r2:
+            v2, i2 = r2
+            return v1 + v2, i2
+        else:
             return r1
 
-        r1 = es_number_word(i, 30, 90)
-        if r1:
-            v1, i1 = r1
-            r2 = es_cte(i1, "y")
-            if r2:
-                i2 = r2[1]
-                r3 = es_number_word(i2, 1, 9)
-                if r3:
-                    v3, i3 = r3
-                    return v1 + v3, i3
+    # [1-99]
+    return _es_number_1_99(words, i, memo)
+
+
+@grammar_rule
+def _es_number(words, i, memo):
+    # check for cero
+    r1 = _es_number_word(words, i, 0, 0)
+    if r1:
+        return r1
+
+    # check for [1-999] (mil [0-999])?
+    r1 = _es_number_1_999(words, i, memo)
+    if r1:
+        v1, i1 = r1
+        if i1 < len(words) and words[i1] == "mil":
+            i2 = i1 + 1
+            r3 = _es_number_1_999(words, i2, memo)
+            if r3:
+                v3, i3 = r3
+                return v1 * 1000 + v3, i3
+            else:
+                return v1 * 1000, i2
+        else:
             return r1
-        return None
+    return None
 
-    def es_number_1_999(i):
-        # [2-9]cientos [1-99]?
-        r1 = es_number_word(i, 100, 900)
-        if r1:
-            v1, i1 = r1
-            r2 = es_number_1_99(i1)
-            if r2:
-                v2, i2 = r2
-                return v1 + v2, i2
-            else:
-                return r1
 
-        # [1-99]
-        r1 = es_number_1_99(i)
-        if r1:
-            return r1
+# TODO Not parsing 'cero'
+def es_number_parse(words, i, memo=None):
+    """ Parses a list of words to find a number
+    Takes in a list of words (strings without whitespace) and
+    extracts a number that starts at the given index.
+    Args:
+        words (array): the list to extract a number from
+        i (int): the index in words where to look for the number
+        memo (dict): partial parses of words, share it between the calls
+                     scanning the same list so each suffix is parsed once
+    Returns:
+        tuple with number, index of next word after the number.
 
+        Returns None if no number was found.
+    """
+    # every number starts with a number word
+    if i >= len(words) or not _NUM_STRING_ES.get(words[i]):
         return None
+    return _es_number(words, i, {} if memo is None else memo)
 
-    def es_number(i):
-        # check for cero
-        r1 = es_number_word(i, 0, 0)
-        if r1:
-            return r1
 
-        # check for [1-999] (mil [0-999])?
-        r1 = es_number_1_999(i)
-        if r1:
-            v1, i1 = r1
-            r2 = es_cte(i1, "mil")
-            if r2:
-                i2 = r2[1]
-                r3 = es_number_1_999(i2)
-                if r3:
-                    v3, i3 = r3
-                    return v1 * 1000 + v3, i3
-                else:
-                    return v1 * 1000, i2
-            else:
-                return r1
-        return None
+def extract_numbers_with_spans_es(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers, with the
+        characters each of them was read from.
 
-    return es_number(i)
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: (number, start, end) for each number, with text[start:end]
+              the words it was read from
+    """
+    return extract_numbers_with_spans_generic(
+        text, extractnumber_es, short_scale, ordinals,
+        connectors=_NUMBER_MARKERS_ES, fraction_handler=isFractional_es,
+        compound_handler=is_compound_number, zeros=("cero", "0"))
 
 
 def extract_numbers_es(text, short_scale=True, ordinals=False):
@@ -281,8 +321,8 @@ def extract_numbers_es(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    return extract_numbers_generic(text, pronounce_number_es, extractnumber_es,
-                                   short_scale=short_scale, ordinals=ordinals)
+    return [number for number, _, _ in
+            extract_numbers_with_spans_es(text, short_scale, ordinals)]
 
 
 def normalize_es(text, remove_articles):
@@ -291,6 +331,7 @@ def normalize_es(text, remove_articles):
     words = text.split()  # this also removed extra spaces
 
     normalized = ""
+    memo = {}
     i = 0
     while i < len(words):
         word = words[i]
@@ -300,7 +341,7 @@ def normalize_es(text, remove_articles):
             continue
 
         # Convert numbers into digits
-        r = es_number_parse(words, i)
+        r = es_number_parse(words, i, memo)
         if r:
             v, i = r
             normalized += " " + str(v)
@@ -312,8 +353,88 @@ def normalize_es(text, remove_articles):
     return normalized[1:]  # strip the initial space
 
 
+def _build_datetime_lexicon_es():
+    time_indicators = ["en", "la", "al", "por", "pasados",
+                       "pasadas", "día", "hora"]
+    days = ['lunes', 'martes', 'miércoles',
+            'jueves', 'viernes', 'sábado', 'domingo']
+    months = ['enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio',
+              'julio', 'agosto', 'septiembre', 'octubre', 'noviembre',
+              'diciembre']
+    monthsShort = ['ene', 'feb', 'mar', 'abr', 'may', 'jun', 'jul', 'ago',
+                   'sep', 'oct', 'nov', 'dic']
+    nxts = ["después", "siguiente", "próximo", "próxima"]
+    prevs = ["antes", "previa", "previo", "anterior"]
+    froms = ["desde", "en", "para", "después de", "por", "próximo",
+             "próxima", "de"]
+    thises = ["este", "esta"]
+    froms += thises
+    nexts = ["siguiente", "próximo", "próxima"]
+    suffix_nexts = ["siguientes", "subsecuentes"]
+    lasts = ["último", "última"]
+    suffix_lasts = ["pasada", "pasado", "anterior", "antes"]
+    return DatetimeLexicon(
+        days, months, monthsShort,
+        # word -> day offset
+        relative_days={"hoy": 0, "mañana": 1},
+        time_qualifiers={'mañana', 'tarde', 'noche'},
+        nexts=nexts,
+        suffix_nexts=suffix_nexts,
+        lasts=lasts,
+        suffix_lasts=suffix_lasts,
+        time_indicators=time_indicators,
+        nxts=nxts,
+        prevs=prevs,
+        froms=froms,
+        thises=thises,
+        lists=set(nxts + prevs + froms + time_indicators),
+        valid_followups=set(days + months + monthsShort +
+                            ["hoy", "mañana", "ayer", "anteayer", "ahora",
+                             "ya", "ante"]),
+        # with the synonyms clean_string replaces by a time qualifier
+        triggers=["mañana", "tarde", "noche", "amanecer", "temprano",
+                  "atardecer", "anochecer", "hoy", "ayer", "madrugada",
+                  "hora"],
+        trigger_phrases=[(["día"], ["pasado", "ante"]),
+                         (["medio"], ["día"]),
+                         (nexts + lasts, ["semana", "mes", "año"]),
+                         (["semana", "mes", "año"],
+                          suffix_nexts + suffix_lasts),
+                         (froms, ["ahora", "ya", "ante"])])
+
+
+_DATETIME_ES = _build_datetime_lexicon_es()
+
+
+def has_datetime_es(text):
+    """ Check if text may contain a date or a time
+
+    A cheap scan for the words extract_datetime_es needs, text without any
+    of them has no date or time.
+
+    Args:
+        text (str): the text to check
+    Returns:
+        bool: False if extract_datetime_es would find nothing in text
+    """
+    return _DATETIME_ES.has_datetime(text)
+
+
 # TODO MycroftAI/mycroft-core#2348
 def extract_datetime_es(input_str, currentDate=None, default_time=None):
+    if input_str == "":
+        return None
+    if currentDate is None:
+        currentDate = datetime.now()
+
+    plan = _DATETIME_PLANS_ES.get(input_str, currentDate)
+    if plan is None:
+        return None
+    return _resolve_datetime_es(plan, currentDate, default_time)
+
+
+def _plan_datetime_es(input_str, anchor):
+    """ DatetimePlan of input_str, None if it has no date or time """
     def clean_string(s):
         # cleans the input string of unneeded punctuation and capitalization
         # among other things
@@ -363,47 +484,39 @@ def extract_datetime_es(input_str, currentDate=None, default_time=None):
                 minAbs or secOffset != 0
             )
 
-    if input_str == "":
-        return None
-    if currentDate is None:
-        currentDate = datetime.now()
-
     found = False
     daySpecified = False
     dayOffset = False
     monthOffset = 0
     yearOffset = 0
-    dateNow = currentDate
-    today = dateNow.strftime("%w")
-    currentYear = dateNow.strftime("%Y")
     fromFlag = False
     datestr = ""
     hasYear = False
     timeQualifier = ""
 
     words = clean_string(input_str).split(" ")
-    timeQualifiersList = ['mañana', 'tarde', 'noche']
-    time_indicators = ["en", "la", "al", "por", "pasados",
-                       "pasadas", "día", "hora"]
-    days = ['lunes', 'martes', 'miércoles',
-            'jueves', 'viernes', 'sábado', 'domingo']
-    months = ['enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio',
-              'julio', 'agosto', 'septiembre', 'octubre', 'noviembre',
-              'diciembre']
-    monthsShort = ['ene', 'feb', 'mar', 'abr', 'may', 'jun', 'jul', 'ago',
-                   'sep', 'oct', 'nov', 'dic']
-    nexts = ["siguiente", "próximo", "próxima"]
-    suffix_nexts = ["siguientes", "subsecuentes"]
-    lasts = ["último", "última"]
-    suffix_lasts = ["pasada", "pasado", "anterior", "antes"]
-    nxts = ["después", "siguiente", "próximo", "próxima"]
-    prevs = ["antes", "previa", "previo", "anterior"]
-    froms = ["desde", "en", "para", "después de", "por", "próximo",
-             "próxima", "de"]
-    thises = ["este", "esta"]
-    froms += thises
-    lists = nxts + prevs + froms + time_indicators
-    for idx, word in enumerate(words):
+    lexicon = _DATETIME_ES
+    timeQualifiersList = lexicon.time_qualifiers
+    days = lexicon.days
+    months = lexicon.months
+    monthsShort = lexicon.months_short
+    nexts = lexicon.nexts
+    suffix_nexts = lexicon.suffix_nexts
+    lasts = lexicon.lasts
+    suffix_lasts = lexicon.suffix_lasts
+    time_indicators = lexicon.time_indicators
+    nxts = lexicon.nxts
+    prevs = lexicon.prevs
+    froms = lexicon.froms
+    thises = lexicon.thises
+    lists = lexicon.lists
+    validFollowups = lexicon.valid_followups
+    relative_days = lexicon.relative_days
+
+    # without a trigger no word can start a date or a time, the scans
+    # below would only go through the words
+    scanned = words if lexicon.has_datetime(input_str) else []
+    for idx, word in enumerate(scanned):
         if word == "":
             continue
         wordPrevPrev = words[idx - 2] if idx > 1 else ""
@@ -419,11 +532,8 @@ def extract_datetime_es(input_str, currentDate=None, default_time=None):
             timeQualifier = word
 
         # parse today, tomorrow, yesterday
-        elif word == "hoy" and not fromFlag:
-            dayOffset = 0
-            used += 1
-        elif word == "mañana" and not fromFlag:
-            dayOffset = 1
+        elif word in relative_days and not fromFlag:
+            dayOffset = relative_days[word]
             used += 1
         elif word == "ayer" and not fromFlag:
             dayOffset -= 1
@@ -550,8 +660,8 @@ def extract_datetime_es(input_str, currentDate=None, default_time=None):
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
         elif word in days and not fromFlag:
-            d = days.index(word)
-            dayOffset = (d + 1) - int(today)
+            d = lexicon.day_index[word]
+            dayOffset = (d + 1) - anchor.day_of_week()
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
@@ -571,10 +681,7 @@ def extract_datetime_es(input_str, currentDate=None, default_time=None):
                 used += 1
         # parse 15 of July, June 20th, Feb 18, 19 of February
         elif word in months or word in monthsShort:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+            m = lexicon.month(word)
             used += 1
             datestr = months[m]
             if wordPrev and wordPrev[0].isdigit():
@@ -629,14 +736,6 @@ def extract_datetime_es(input_str, currentDate=None, default_time=None):
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("hoy")
-        validFollowups.append("mañana")
-        validFollowups.append("ayer")
-        validFollowups.append("anteayer")
-        validFollowups.append("ahora")
-        validFollowups.append("ya")
-        validFollowups.append("ante")
 
         # TODO debug word "depois" that one is failing for some reason
         if word in froms and wordNext in validFollowups:
@@ -657,8 +756,8 @@ def extract_datetime_es(input_str, currentDate=None, default_time=None):
                   wordNextNextNext == "ayer"):
                 dayOffset -= 3
             elif wordNext in days:
-                d = days.index(wordNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 2
                 # if wordNextNext == "feira":
                 #     used += 1
@@ -673,8 +772,8 @@ def extract_datetime_es(input_str, currentDate=None, default_time=None):
                         used += 1
                 dayOffset += tmpOffset
             elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNextNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 3
                 if wordNextNextNext:
                     if wordNextNextNext in nxts:
@@ -708,7 +807,7 @@ def extract_datetime_es(input_str, currentDate=None, default_time=None):
     hrAbs = None
     minAbs = None
 
-    for idx, word in enumerate(words):
+    for idx, word in enumerate(scanned):
         if word == "":
             continue
 
@@ -999,6 +1098,46 @@ def extract_datetime_es(input_str, currentDate=None, default_time=None):
     if dayOffset is False:
         dayOffset = 0
 
+    resultStr = " ".join(words)
+    resultStr = ' '.join(resultStr.split())
+    # resultStr = pt_pruning(resultStr)
+
+    return DatetimePlan(
+        resultStr,
+        date_str=datestr,
+        has_year=hasYear,
+        year_offset=yearOffset,
+        month_offset=monthOffset,
+        day_offset=dayOffset,
+        hour=hrAbs,
+        minute=minAbs,
+        hour_offset=hrOffset,
+        minute_offset=minOffset,
+        second_offset=secOffset,
+        day_specified=daySpecified)
+
+
+_DATETIME_PLANS_ES = DatetimePlans(_plan_datetime_es)
+
+
+def _resolve_datetime_es(plan, dateNow, default_time):
+    """ extract_datetime_es result of plan at the anchor dateNow """
+    if plan.now:
+        return [dateNow.replace(microsecond=0), plan.leftover]
+    datestr = plan.date_str
+    hasYear = plan.has_year
+    yearOffset = plan.year_offset
+    monthOffset = plan.month_offset
+    dayOffset = plan.day_offset
+    hrAbs = plan.hour
+    minAbs = plan.minute
+    hrOffset = plan.hour_offset
+    minOffset = plan.minute_offset
+    secOffset = plan.second_offset
+    daySpecified = plan.day_specified
+    months = _DATETIME_ES.months
+    currentYear = dateNow.year
+
     # perform date manipulation
 
     extractedDate = dateNow
@@ -1007,69 +1146,43 @@ def extract_datetime_es(input_str, currentDate=None, default_time=None):
                                           minute=0,
                                           hour=0)
     if datestr != "":
-        en_months = ['january', 'february', 'march', 'april', 'may', 'june',
-                     'july', 'august', 'september', 'october', 'november',
-                     'december']
-        en_monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july',
-                          'aug',
-                          'sept', 'oct', 'nov', 'dec']
-        for idx, en_month in enumerate(en_months):
-            datestr = datestr.replace(months[idx], en_month)
-        for idx, en_month in enumerate(en_monthsShort):
-            datestr = datestr.replace(monthsShort[idx], en_month)
-
-        temp = datetime.strptime(datestr, "%B %d")
+        temp = parse_month_day(datestr, months)
         temp = temp.replace(tzinfo=None)
         if not hasYear:
             temp = temp.replace(year=extractedDate.year)
             print(gettz(temp.tzname()))
             print(extractedDate.tzname(), temp.tzname())
             if extractedDate < temp:
-                extractedDate = extractedDate.replace(year=int(currentYear),
-                                                      month=int(
-                                                          temp.strftime(
-                                                              "%m")),
-                                                      day=int(temp.strftime(
-                                                          "%d")))
+                extractedDate = extractedDate.replace(year=currentYear,
+                                                      month=temp.month,
+                                                      day=temp.day)
             else:
                 extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")))
+                    year=currentYear + 1,
+                    month=temp.month,
+                    day=temp.day)
         else:
             extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")))
+                year=temp.year,
+                month=temp.month,
+                day=temp.day)
 
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
 
     if hrAbs is None and minAbs is None and default_time:
         hrAbs = default_time.hour
         minAbs = default_time.minute
 
+    timeOfDay = None
+    notBefore = None
     if hrAbs != -1 and minAbs != -1:
-        extractedDate = extractedDate + relativedelta(hours=hrAbs or 0,
-                                                      minutes=minAbs or 0)
+        timeOfDay = (hrAbs or 0, minAbs or 0)
         if (hrAbs or minAbs) and datestr == "":
-            if not daySpecified and dateNow > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    # resultStr = pt_pruning(resultStr)
-    return [extractedDate, resultStr]
+            if not daySpecified:
+                notBefore = dateNow
+    extractedDate = shift_datetime(extractedDate, yearOffset, monthOffset,
+                                   dayOffset, timeOfDay, hrOffset, minOffset,
+                                   secOffset, notBefore)
+    return [extractedDate, plan.leftover]
 
 
 def get_gender_es(word, raw_string=""):
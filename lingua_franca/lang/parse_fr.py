@@ -22,11 +22,11 @@
         * get_gender_fr
 """
 
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
+from functools import lru_cache
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic
-from lingua_franca.lang.format_fr import pronounce_number_fr
+    extract_numbers_with_spans_generic, fraction_table, grammar_rule, \
+    DatetimeLexicon, DatetimePlan, DatetimePlans, shift_datetime, \
+    parse_month_day
 
 # Undefined articles ["un", "une"] cannot be supressed,
 # in French, "un cheval" means "a horse" or "one horse".
@@ -77,203 +77,213 @@ numbers_fr = {
 
 ordinals_fr = ("er", "re", "ère", "nd", "nde" "ième", "ème", "e")
 
+fractions_fr = fraction_table({
+    "entier": 1, "demi": 2, "tiers": 3, "quart": 4, "cinquième": 5,
+    "sixième": 6, "septième": 7, "huitième": 8, "neuvième": 9,
+    "dixième": 10, "onzième": 11, "douzième": 12, "treizième": 13,
+    "quatorzième": 14, "quinzième": 15, "seizième": 16, "dix-septième": 17,
+    "dix-huitième": 18, "dix-neuvième": 19, "vingtième": 20,
+    "trentième": 30, "centième": 100, "millième": 1000})
+
+# words joining the parts of a number, "deux virgule cinq"
+_NUMBER_MARKERS_FR = ("et", "plus", "+", "virgule")
+
+
+@lru_cache(maxsize=4096)
+def _number_word_value_fr(word):
+    """ The value of a number word, hyphenated ones included, or None """
+    # Numbers [0-16,20,30,40,50,60,70,80,90,100,1000]
+    val = numbers_fr.get(word)
+    if val is not None:
+        return val
+    # The number may be hyphenated (numbers [17-999])
+    splitWord = word.split('-')
+    if len(splitWord) > 1:
+        val1 = numbers_fr.get(splitWord[0])
+        if val1:
+            i1 = 0
+            val2 = 0
+            val3 = 0
+            if val1 < 10 and splitWord[1] == "cents":
+                val1 = val1 * 100
+                i1 = 2
+
+            # For [81-99], e.g. "quatre-vingt-deux"
+            if len(splitWord) > i1 and splitWord[0] == "quatre" and \
+                    splitWord[1] == "vingt":
+                val1 = 80
+                i1 += 2
+
+            # We still found a number
+            if i1 == 0:
+                i1 = 1
+
+            if len(splitWord) > i1:
+                # For [21,31,41,51,61,71]
+                if len(splitWord) > i1 + 1 and splitWord[i1] == "et":
+                    val2 = numbers_fr.get(splitWord[i1 + 1])
+                    if val2 is not None:
+                        i1 += 2
+                # For [77-79],[97-99] e.g. "soixante-dix-sept"
+                elif splitWord[i1] == "dix" and \
+                        len(splitWord) > i1 + 1:
+                    val2 = numbers_fr.get(splitWord[i1 + 1])
+                    if val2 is not None:
+                        val2 += 10
+                        i1 += 2
+                else:
+                    val2 = numbers_fr.get(splitWord[i1])
+                    if val2 is not None:
+                        i1 += 1
+                        if len(splitWord) > i1:
+                            val3 = numbers_fr.get(splitWord[i1])
+                            if val3 is not None:
+                                i1 += 1
 
-def number_parse_fr(words, i):
-    """ Parses a list of words to find a number
-    Takes in a list of words (strings without whitespace) and
-    extracts a number that starts at the given index.
-    Args:
-        words (array): the list to extract a number from
-        i (int): the index in words where to look for the number
-    Returns:
-        tuple with number, index of next word after the number.
+                if val2:
+                    if val3:
+                        val = val1 + val2 + val3
+                    else:
+                        val = val1 + val2
+                else:
+                    return None
+            if i1 == len(splitWord) and val:
+                return val
 
-        Returns None if no number was found.
-    """
+    return None
 
-    def cte_fr(i, s):
-        # Check if string s is equal to words[i].
-        # If it is return tuple with s, index of next word.
-        # If it is not return None.
-        if i < len(words) and s == words[i]:
-            return s, i + 1
-        return None
 
-    def number_word_fr(i, mi, ma):
-        # Check if words[i] is a number in numbers_fr between mi and ma.
-        # If it is return tuple with number, index of next word.
-        # If it is not return None.
-        if i < len(words):
-            val = numbers_fr.get(words[i])
-            # Numbers [1-16,20,30,40,50,60,70,80,90,100,1000]
-            if val is not None:
-                if val >= mi and val <= ma:
-                    return val, i + 1
-                else:
-                    return None
-            # The number may be hyphenated (numbers [17-999])
-            splitWord = words[i].split('-')
-            if len(splitWord) > 1:
-                val1 = numbers_fr.get(splitWord[0])
-                if val1:
-                    i1 = 0
-                    val2 = 0
-                    val3 = 0
-                    if val1 < 10 and splitWord[1] == "cents":
-                        val1 = val1 * 100
-                        i1 = 2
-
-                    # For [81-99], e.g. "quatre-vingt-deux"
-                    if len(splitWord) > i1 and splitWord[0] == "quatre" and \
-                            splitWord[1] == "vingt":
-                        val1 = 80
-                        i1 += 2
+def _number_word_fr(words, i, mi, ma):
+    # Check if words[i] is a number in numbers_fr between mi and ma.
+    # If it is return tuple with number, index of next word.
+    # If it is not return None.
+    if i < len(words):
+        val = _number_word_value_fr(words[i])
+        if val is not None and ma >= val >= mi:
+            return val, i + 1
+    return None
 
-                    # We still found a number
-                    if i1 == 0:
-                        i1 = 1
-
-                    if len(splitWord) > i1:
-                        # For [21,31,41,51,61,71]
-                        if len(splitWord) > i1 + 1 and splitWord[i1] == "et":
-                            val2 = numbers_fr.get(splitWord[i1 + 1])
-                            if val2 is not None:
-                                i1 += 2
-                        # For [77-79],[97-99] e.g. "soixante-dix-sept"
-                        elif splitWord[i1] == "dix" and \
-                                len(splitWord) > i1 + 1:
-                            val2 = numbers_fr.get(splitWord[i1 + 1])
-                            if val2 is not None:
-                                val2 += 10
-                                i1 += 2
-                        else:
-                            val2 = numbers_fr.get(splitWord[i1])
-                            if val2 is not None:
-                                i1 += 1
-                                if len(splitWord) > i1:
-                                    val3 = numbers_fr.get(splitWord[i1])
-                                    if val3 is not None:
-                                        i1 += 1
-
-                        if val2:
-                            if val3:
-                                val = val1 + val2 + val3
-                            else:
-                                val = val1 + val2
-                        else:
-                            return None
-                    if i1 == len(splitWord) and val and ma >= val >= mi:
-                        return val, i + 1
 
-        return None
+@grammar_rule
+def _number_1_99_fr(words, i, memo):
+    # Check if words[i] is a number between 1 and 99.
+    # If it is return tuple with number, index of next word.
+    # If it is not return None.
+
+    # Is it a number between 1 and 16?
+    result1 = _number_word_fr(words, i, 1, 16)
+    if result1:
+        return result1
+
+    # Is it a number between 10 and 99?
+    result1 = _number_word_fr(words, i, 10, 99)
+    if result1:
+        val1, i1 = result1
+        # If the number is not hyphenated [21,31,41,51,61,71]
+        if i1 < len(words) and words[i1] == "et":
+            result3 = _number_word_fr(words, i1 + 1, 1, 11)
+            if result3:
+                val3, i3 = result3
+                return val1 + val3, i3
+        return result1
 
-    def number_1_99_fr(i):
-        # Check if words[i] is a number between 1 and 99.
-        # If it is return tuple with number, index of next word.
-        # If it is not return None.
-
-        # Is it a number between 1 and 16?
-        result1 = number_word_fr(i, 1, 16)
-        if result1:
-            return result1
-
-        # Is it a number between 10 and 99?
-        result1 = number_word_fr(i, 10, 99)
-        if result1:
-            val1, i1 = result1
-            result2 = cte_fr(i1, "et")
-            # If the number is not hyphenated [21,31,41,51,61,71]
-            if result2:
-                i2 = result2[1]
-                result3 = number_word_fr(i2, 1, 11)
-                if result3:
-                    val3, i3 = result3
-                    return val1 + val3, i3
-            return result1
-
-        # It is not a number
-        return None
+    # It is not a number
+    return None
 
-    def number_1_999_fr(i):
-        # Check if words[i] is a number between 1 and 999.
-        # If it is return tuple with number, index of next word.
-        # If it is not return None.
-
-        # Is it 100 ?
-        result = number_word_fr(i, 100, 100)
-
-        # Is it [200,300,400,500,600,700,800,900]?
-        if not result:
-            resultH1 = number_word_fr(i, 2, 9)
-            if resultH1:
-                valH1, iH1 = resultH1
-                resultH2 = number_word_fr(iH1, 100, 100)
-                if resultH2:
-                    iH2 = resultH2[1]
-                    result = valH1 * 100, iH2
-
-        if result:
-            val1, i1 = result
-            result2 = number_1_99_fr(i1)
-            if result2:
-                val2, i2 = result2
-                return val1 + val2, i2
-            else:
-                return result
 
-        # Is it hyphenated? [101-999]
-        result = number_word_fr(i, 101, 999)
-        if result:
-            return result
+@grammar_rule
+def _number_1_999_fr(words, i, memo):
+    # Check if words[i] is a number between 1 and 999.
+    # If it is return tuple with number, index of next word.
+    # If it is not return None.
 
-        # [1-99]
-        result = number_1_99_fr(i)
-        if result:
+    # Is it 100 ?
+    result = _number_word_fr(words, i, 100, 100)
+
+    # Is it [200,300,400,500,600,700,800,900]?
+    if not result:
+        resultH1 = _number_word_fr(words, i, 2, 9)
+        if resultH1:
+            valH1, iH1 = resultH1
+            resultH2 = _number_word_fr(words, iH1, 100, 100)
+            if resultH2:
+                iH2 = resultH2[1]
+                result = valH1 * 100, iH2
+
+    if result:
+        val1, i1 = result
+        result2 = _number_1_99_fr(words, i1, memo)
+        if result2:
+            val2, i2 = result2
+            return val1 + val2, i2
+        else:
             return result
 
-        return None
+    # Is it hyphenated? [101-999]
+    result = _number_word_fr(words, i, 101, 999)
+    if result:
+        return result
 
-    def number_1_999999_fr(i):
-        """ Find a number in a list of words
-        Checks if words[i] is a number between 1 and 999,999.
+    # [1-99]
+    return _number_1_99_fr(words, i, memo)
 
-        Args:
-            i (int): the index in words where to look for the number
-        Returns:
-            tuple with number, index of next word after the number.
 
-            Returns None if no number was found.
-        """
+@grammar_rule
+def _number_1_999999_fr(words, i, memo):
+    # Check if words[i] is a number between 1 and 999,999.
+    # If it is return tuple with number, index of next word.
+    # If it is not return None.
 
-        # check for zero
-        result1 = number_word_fr(i, 0, 0)
-        if result1:
-            return result1
+    # check for zero
+    result1 = _number_word_fr(words, i, 0, 0)
+    if result1:
+        return result1
 
-        # check for [1-999]
-        result1 = number_1_999_fr(i)
-        if result1:
-            val1, i1 = result1
+    # check for [1-999]
+    result1 = _number_1_999_fr(words, i, memo)
+    if result1:
+        val1, i1 = result1
+    else:
+        val1 = 1
+        i1 = i
+    # check for 1000
+    result2 = _number_word_fr(words, i1, 1000, 1000)
+    if result2:
+        # it's [1000-999000]
+        i2 = result2[1]
+        # check again for [1-999]
+        result3 = _number_1_999_fr(words, i2, memo)
+        if result3:
+            val3, i3 = result3
+            return val1 * 1000 + val3, i3
         else:
-            val1 = 1
-            i1 = i
-        # check for 1000
-        result2 = number_word_fr(i1, 1000, 1000)
-        if result2:
-            # it's [1000-999000]
-            i2 = result2[1]
-            # check again for [1-999]
-            result3 = number_1_999_fr(i2)
-            if result3:
-                val3, i3 = result3
-                return val1 * 1000 + val3, i3
-            else:
-                return val1 * 1000, i2
-        elif result1:
-            return result1
-        return None
+            return val1 * 1000, i2
+    elif result1:
+        return result1
+    return None
 
-    return number_1_999999_fr(i)
+
+def number_parse_fr(words, i, memo=None):
+    """ Parses a list of words to find a number
+    Takes in a list of words (strings without whitespace) and
+    extracts a number that starts at the given index.
+    Args:
+        words (array): the list to extract a number from
+        i (int): the index in words where to look for the number
+        memo (dict): partial parses of words, share it between the calls
+                     scanning the same list so each suffix is parsed once
+    Returns:
+        tuple with number, index of next word after the number.
+
+        Returns None if no number was found.
+    """
+    # every number starts with a number word up to "mille"
+    if i >= len(words):
+        return None
+    val = _number_word_value_fr(words[i])
+    if val is None or val > 1000:
+        return None
+    return _number_1_999999_fr(words, i, {} if memo is None else memo)
 
 
 def getOrdinal_fr(word):
@@ -297,13 +307,14 @@ def getOrdinal_fr(word):
     return None
 
 
-def number_ordinal_fr(words, i):
+def number_ordinal_fr(words, i, memo=None):
     """ Find an ordinal number in a list of words
     Takes in a list of words (strings without whitespace) and
     extracts an ordinal number that starts at the given index.
     Args:
         words (array): the list to extract a number from
         i (int): the index in words where to look for the ordinal number
+        memo (dict): partial parses of words, see number_parse_fr
     Returns:
         tuple with ordinal number (str),
         index of next word after the number (int).
@@ -322,7 +333,7 @@ def number_ordinal_fr(words, i):
         return strOrd, i + 1
 
     # if it's a big number the beginning should be detected as a number
-    result = number_parse_fr(words, i)
+    result = number_parse_fr(words, i, memo)
     if result:
         val1, i = result
     else:
@@ -362,7 +373,7 @@ def number_ordinal_fr(words, i):
                     word = word + "e"
                     result = number_parse_fr([word], 0)
                 if result:
-                    val2, i = result
+                    val2 = result[0]
                 if val2 is not None:
                     strOrd = str(val1 + val2) + "e"
         if strOrd:
@@ -448,7 +459,7 @@ def extractnumber_fr(text, short_scale=True, ordinals=False):
                     break
             afterDotVal = None
             # extract the number after the zeros
-            if newWords[zeros].isdigit():
+            if zeros < len(newWords) and newWords[zeros].isdigit():
                 afterDotVal = newWords[zeros]
                 countDot = count + zeros + 2
             # if a number was extracted (since comma is also a
@@ -470,7 +481,75 @@ def extractnumber_fr(text, short_scale=True, ordinals=False):
     return result or False
 
 
+def _build_datetime_lexicon_fr():
+    words_in = ["dans", "après"]
+    days = ["lundi", "mardi", "mercredi",
+            "jeudi", "vendredi", "samedi", "dimanche"]
+    months = ["janvier", "février", "mars", "avril", "mai", "juin",
+              "juillet", "août", "septembre", "octobre", "novembre",
+              "décembre"]
+    monthsShort = ["jan", "fév", "mar", "avr", "mai", "juin", "juil", "aoû",
+                   "sept", "oct", "nov", "déc"]
+    return DatetimeLexicon(
+        days, months, monthsShort,
+        # word -> day offset
+        relative_days={"aujourd'hui": 0, "demain": 1, "après-demain": 2},
+        time_qualifiers={"matin", "après-midi", "soir", "nuit"},
+        words_in=words_in,
+        markers=["à", "dès", "autour", "vers", "environs", "ce",
+                 "cette"] + words_in,
+        # needed for format functions
+        months_en=['january', 'february', 'march', 'april', 'may', 'june',
+                   'july', 'august', 'september', 'october', 'november',
+                   'december'],
+        valid_followups=set(days + months + monthsShort +
+                            ["aujourd'hui", "demain", "prochain",
+                             "prochaine", "suivant", "suivante", "dernier",
+                             "dernière", "précédent", "précédente",
+                             "maintenant"]),
+        # clean_string writes the numbers in digits, the ones above 100
+        # are read as times
+        triggers=["matin", "après-midi", "soir", "nuit", "aujourd'hui",
+                  "demain", "jour", "semaine", "mois", "midi", "minuit",
+                  "heure", "minute", "seconde", "cent", "mil"],
+        trigger_phrases=[(list(numbers_fr), ["an", "année"]),
+                         (["an", "année"], ["prochain", "suivant", "dernier",
+                                            "dernière", "précédent"]),
+                         (["après", "depuis"],
+                          ["prochain", "suivant", "dernier", "dernière",
+                           "précédent", "maintenant"])])
+
+
+_DATETIME_FR = _build_datetime_lexicon_fr()
+
+
+def has_datetime_fr(text):
+    """ Check if text may contain a date or a time
+
+    A cheap scan for the words extract_datetime_fr needs, text without any
+    of them has no date or time.
+
+    Args:
+        text (str): the text to check
+    Returns:
+        bool: False if extract_datetime_fr would find nothing in text
+    """
+    return _DATETIME_FR.has_datetime(text)
+
+
 def extract_datetime_fr(string, currentDate, default_time):
+    if string == "" or not currentDate or \
+            not _DATETIME_FR.has_datetime(string):
+        return None
+
+    plan = _DATETIME_PLANS_FR.get(string, currentDate)
+    if plan is None:
+        return None
+    return _resolve_datetime_fr(plan, currentDate, default_time)
+
+
+def _plan_datetime_fr(string, anchor):
+    """ DatetimePlan of string, None if it has no date or time """
     def clean_string(s):
         """
             cleans the input string of unneeded punctuation and capitalization
@@ -495,37 +574,26 @@ def extract_datetime_fr(string, currentDate, default_time):
                        hrOffset != 0 or minOffset != 0 or secOffset != 0
                )
 
-    if string == "" or not currentDate:
-        return None
-
     found = False
     daySpecified = False
     dayOffset = False
     monthOffset = 0
     yearOffset = 0
-    dateNow = currentDate
-    today = dateNow.strftime("%w")
-    currentYear = dateNow.strftime("%Y")
     fromFlag = False
     datestr = ""
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersList = ["matin", "après-midi", "soir", "nuit"]
-    words_in = ["dans", "après"]
-    markers = ["à", "dès", "autour", "vers", "environs", "ce",
-               "cette"] + words_in
-    days = ["lundi", "mardi", "mercredi",
-            "jeudi", "vendredi", "samedi", "dimanche"]
-    months = ["janvier", "février", "mars", "avril", "mai", "juin",
-              "juillet", "août", "septembre", "octobre", "novembre",
-              "décembre"]
-    monthsShort = ["jan", "fév", "mar", "avr", "mai", "juin", "juil", "aoû",
-                   "sept", "oct", "nov", "déc"]
-    # needed for format functions
-    months_en = ['january', 'february', 'march', 'april', 'may', 'june',
-                 'july', 'august', 'september', 'october', 'november',
-                 'december']
+    lexicon = _DATETIME_FR
+    timeQualifiersList = lexicon.time_qualifiers
+    words_in = lexicon.words_in
+    markers = lexicon.markers
+    days = lexicon.days
+    months = lexicon.months
+    monthsShort = lexicon.months_short
+    months_en = lexicon.months_en
+    validFollowups = lexicon.valid_followups
+    relative_days = lexicon.relative_days
 
     words = clean_string(string)
 
@@ -548,14 +616,8 @@ def extract_datetime_fr(string, currentDate, default_time):
                 used = 2
                 start -= 1
         # parse aujourd'hui, demain, après-demain
-        elif word == "aujourd'hui" and not fromFlag:
-            dayOffset = 0
-            used += 1
-        elif word == "demain" and not fromFlag:
-            dayOffset = 1
-            used += 1
-        elif word == "après-demain" and not fromFlag:
-            dayOffset = 2
+        elif word in relative_days and not fromFlag:
+            dayOffset = relative_days[word]
             used += 1
         # parse 5 jours, 10 semaines, semaine dernière, semaine prochaine
         elif word in ["jour", "jours"]:
@@ -606,8 +668,8 @@ def extract_datetime_fr(string, currentDate, default_time):
                 used = 2
         # parse lundi, mardi etc., and lundi prochain, mardi dernier, etc.
         elif word in days and not fromFlag:
-            d = days.index(word)
-            dayOffset = (d + 1) - int(today)
+            d = lexicon.day_index[word]
+            dayOffset = (d + 1) - anchor.day_of_week()
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
@@ -619,10 +681,7 @@ def extract_datetime_fr(string, currentDate, default_time):
                 used += 1
         # parse 15 juillet, 15 juil
         elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+            m = lexicon.month(word)
             used += 1
             datestr = months_en[m]
             if wordPrev and (wordPrev[0].isdigit()):
@@ -639,26 +698,14 @@ def extract_datetime_fr(string, currentDate, default_time):
                 hasYear = False
         # parse 5 jours après demain, 10 semaines après jeudi prochain,
         # 2 mois après juillet
-        validFollowups = days + months + monthsShort
-        validFollowups.append("aujourd'hui")
-        validFollowups.append("demain")
-        validFollowups.append("prochain")
-        validFollowups.append("prochaine")
-        validFollowups.append("suivant")
-        validFollowups.append("suivante")
-        validFollowups.append("dernier")
-        validFollowups.append("dernière")
-        validFollowups.append("précédent")
-        validFollowups.append("précédente")
-        validFollowups.append("maintenant")
         if word in ["après", "depuis"] and wordNext in validFollowups:
             used = 2
             fromFlag = True
             if wordNext == "demain":
                 dayOffset += 1
             elif wordNext in days:
-                d = days.index(wordNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 2
                 if wordNextNext == "prochain":
                     tmpOffset += 7
@@ -934,6 +981,49 @@ def extract_datetime_fr(string, currentDate, default_time):
     if dayOffset is False:
         dayOffset = 0
 
+    for idx, word in enumerate(words):
+        if words[idx] == "et" and words[idx - 1] == "" and \
+                words[idx + 1] == "":
+            words[idx] = ""
+
+    resultStr = " ".join(words)
+    resultStr = ' '.join(resultStr.split())
+
+    return DatetimePlan(
+        resultStr,
+        date_str=datestr,
+        has_year=hasYear,
+        year_offset=yearOffset,
+        month_offset=monthOffset,
+        day_offset=dayOffset,
+        hour=hrAbs,
+        minute=minAbs,
+        hour_offset=hrOffset,
+        minute_offset=minOffset,
+        second_offset=secOffset,
+        day_specified=daySpecified)
+
+
+_DATETIME_PLANS_FR = DatetimePlans(_plan_datetime_fr)
+
+
+def _resolve_datetime_fr(plan, dateNow, default_time):
+    """ extract_datetime_fr result of plan at the anchor dateNow """
+    if plan.now:
+        return [dateNow.replace(microsecond=0), plan.leftover]
+    datestr = plan.date_str
+    hasYear = plan.has_year
+    yearOffset = plan.year_offset
+    monthOffset = plan.month_offset
+    dayOffset = plan.day_offset
+    hrAbs = plan.hour
+    minAbs = plan.minute
+    hrOffset = plan.hour_offset
+    minOffset = plan.minute_offset
+    secOffset = plan.second_offset
+    daySpecified = plan.day_specified
+    currentYear = dateNow.year
+
     # perform date manipulation
     extractedDate = dateNow
     extractedDate = extractedDate.replace(microsecond=0,
@@ -941,58 +1031,39 @@ def extract_datetime_fr(string, currentDate, default_time):
                                           minute=0,
                                           hour=0)
     if datestr != "":
+        temp = parse_month_day(datestr, _DATETIME_FR.months_en)
         if not hasYear:
-            temp = datetime.strptime(datestr, "%B %d")
             temp = temp.replace(year=extractedDate.year)
             if extractedDate < temp:
-                extractedDate = extractedDate.replace(year=int(currentYear),
-                                                      month=int(
-                                                          temp.strftime(
-                                                              "%m")),
-                                                      day=int(temp.strftime(
-                                                          "%d")))
+                extractedDate = extractedDate.replace(year=currentYear,
+                                                      month=temp.month,
+                                                      day=temp.day)
             else:
                 extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")))
+                    year=currentYear + 1,
+                    month=temp.month,
+                    day=temp.day)
         else:
-            temp = datetime.strptime(datestr, "%B %d %Y")
             extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")))
+                year=temp.year,
+                month=temp.month,
+                day=temp.day)
 
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
 
     if hrAbs is None and minAbs is None and default_time:
         hrAbs = default_time.hour
         minAbs = default_time.minute
+    timeOfDay = None
+    notBefore = None
     if hrAbs != -1 and minAbs != -1:
-        extractedDate = extractedDate + relativedelta(hours=hrAbs or 0,
-                                                      minutes=minAbs or 0)
+        timeOfDay = (hrAbs or 0, minAbs or 0)
         if (hrAbs or minAbs) and datestr == "":
-            if not daySpecified and dateNow > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-    for idx, word in enumerate(words):
-        if words[idx] == "et" and words[idx - 1] == "" and \
-                words[idx + 1] == "":
-            words[idx] = ""
-
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    return [extractedDate, resultStr]
+            if not daySpecified:
+                notBefore = dateNow
+    extractedDate = shift_datetime(extractedDate, yearOffset, monthOffset,
+                                   dayOffset, timeOfDay, hrOffset, minOffset,
+                                   secOffset, notBefore)
+    return [extractedDate, plan.leftover]
 
 
 def isFractional_fr(input_str):
@@ -1008,21 +1079,12 @@ def isFractional_fr(input_str):
     if input_str != "tiers" and input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "quarts"
 
-    aFrac = ["entier", "demi", "tiers", "quart", "cinquième", "sixième",
-             "septième", "huitième", "neuvième", "dixième", "onzième",
-             "douzième", "treizième", "quatorzième", "quinzième", "seizième",
-             "dix-septième", "dix-huitième", "dix-neuvième", "vingtième"]
-
-    if input_str in aFrac:
-        return 1.0 / (aFrac.index(input_str) + 1)
-    if getOrdinal_fr(input_str):
-        return 1.0 / getOrdinal_fr(input_str)
-    if input_str == "trentième":
-        return 1.0 / 30
-    if input_str == "centième":
-        return 1.0 / 100
-    if input_str == "millième":
-        return 1.0 / 1000
+    fraction = fractions_fr.get(input_str)
+    if fraction:
+        return fraction
+    ordinal = getOrdinal_fr(input_str)
+    if ordinal:
+        return 1.0 / ordinal
 
     return False
 
@@ -1032,6 +1094,7 @@ def normalize_fr(text, remove_articles):
     text = text.lower()
     words = text.split()  # this also removed extra spaces
     normalized = ""
+    memo = {}
     i = 0
     while i < len(words):
         # remove articles
@@ -1040,19 +1103,20 @@ def normalize_fr(text, remove_articles):
             continue
         if remove_articles and words[i][:2] in ["l'", "d'"]:
             words[i] = words[i][2:]
+            memo.clear()
         # remove useless punctuation signs
         if words[i] in ["?", "!", ";", "…"]:
             i += 1
             continue
         # Normalize ordinal numbers
         if i > 0 and words[i - 1] in articles_fr:
-            result = number_ordinal_fr(words, i)
+            result = number_ordinal_fr(words, i, memo)
             if result is not None:
                 val, i = result
                 normalized += " " + str(val)
                 continue
         # Convert numbers into digits
-        result = number_parse_fr(words, i)
+        result = number_parse_fr(words, i, memo)
         if result is not None:
             val, i = result
             normalized += " " + str(val)
@@ -1064,6 +1128,28 @@ def normalize_fr(text, remove_articles):
     return normalized[1:]  # strip the initial space
 
 
+def extract_numbers_with_spans_fr(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers, with the
+        characters each of them was read from.
+
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: (number, start, end) for each number, with text[start:end]
+              the words it was read from
+    """
+    return extract_numbers_with_spans_generic(
+        text, extractnumber_fr, short_scale, ordinals,
+        connectors=_NUMBER_MARKERS_FR, fraction_handler=isFractional_fr,
+        zeros=("zéro", "0"))
+
+
 def extract_numbers_fr(text, short_scale=True, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -1078,5 +1164,5 @@ def extract_numbers_fr(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    return extract_numbers_generic(text, pronounce_number_fr, extractnumber_fr,
-                                   short_scale=short_scale, ordinals=ordinals)
+    return [number for number, _, _ in
+            extract_numbers_with_spans_fr(text, short_scale, ordinals)]
@@ -19,12 +19,12 @@
 """
 
 import collections
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
+import re
+from functools import lru_cache
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic
-from lingua_franca.lang.format_it import LONG_SCALE_IT, SHORT_SCALE_IT, \
-    pronounce_number_it
+    extract_numbers_with_spans_generic, fraction_table, DatetimeLexicon, \
+    DatetimePlan, DatetimePlans, shift_datetime, parse_month_day
+from lingua_franca.lang.format_it import LONG_SCALE_IT, SHORT_SCALE_IT
 
 SHORT_ORDINAL_STRING_IT = {
     1: 'primo',
@@ -187,6 +187,23 @@ STRING_NUM_ITA = {
 }
 
 
+
+def _fraction_denominators_it(ordinals):
+    denominators = {"intero": 1, "mezza": 2, "mezzo": 2}
+    denominators.update({word: num for num, word in ordinals.items()
+                         if num > 2})
+    return denominators
+
+
+FRACTION_SHORT_SCALE_IT = fraction_table(
+    _fraction_denominators_it(SHORT_ORDINAL_STRING_IT))
+FRACTION_LONG_SCALE_IT = fraction_table(
+    _fraction_denominators_it(LONG_ORDINAL_STRING_IT))
+
+# words joining the parts of a number, "due virgola cinque"
+_NUMBER_MARKERS_IT = ("e", "punto", "virgola")
+
+
 def isFractional_it(input_str, short_scale=False):
     """
     This function takes the given text and checks if it is a fraction.
@@ -203,22 +220,90 @@ def isFractional_it(input_str, short_scale=False):
     if input_str.endswith('i', -1) and len(input_str) > 2:
         input_str = input_str[:-1] + "o"  # normalizza plurali
 
-    fracts_it = {"intero": 1, "mezza": 2, "mezzo": 2}
+    fractions = FRACTION_SHORT_SCALE_IT if short_scale \
+        else FRACTION_LONG_SCALE_IT
+    return fractions.get(input_str, False)
 
-    if short_scale:
-        for num in SHORT_ORDINAL_STRING_IT:
-            if num > 2:
-                fracts_it[SHORT_ORDINAL_STRING_IT[num]] = num
-    else:
-        for num in LONG_ORDINAL_STRING_IT:
-            if num > 2:
-                fracts_it[LONG_ORDINAL_STRING_IT[num]] = num
 
-    if input_str in fracts_it:
-        return 1.0 / fracts_it[input_str]
-    return False
+# the parts of the agglutinated numbers read by extractnumber_long_it
+_UNITS_IT = {'zero': 0, 'uno': 1, 'due': 2, 'tre': 3, 'quattro': 4,
+             'cinque': 5, 'sei': 6, 'sette': 7, 'otto': 8, 'nove': 9}
+
+_TENS_IT = {'dieci': 10, 'venti': 20, 'trenta': 30, 'quaranta': 40,
+            'cinquanta': 50, 'sessanta': 60, 'settanta': 70, 'ottanta': 80,
+            'novanta': 90}
+
+_TENS_SHORT_IT = {'vent': 20, 'trent': 30, 'quarant': 40, 'cinquant': 50,
+                  'sessant': 60, 'settant': 70, 'ottant': 80, 'novant': 90}
+
+_NUMS_LONG_IT = {'undici': 11, 'dodici': 12, 'tredici': 13,
+                 'quattordici': 14, 'quindici': 15, 'sedici': 16,
+                 'diciassette': 17, 'diciotto': 18, 'diciannove': 19}
+
+_MULTIPLI_IT = collections.OrderedDict([
+    # (1e63, 'deciliardi'),
+    # (1e60, 'decilioni'),
+    # (1e57, 'noviliardi'),
+    # (1e54, 'novilioni'),
+    # (1e51, 'ottiliardi'),
+    # (1e48, 'ottilioni'),
+    # (1e45, 'settiliardi'),
+    # (1e42, 'settilioni'),
+    # (1e39, 'sestiliardi'),
+    # (1e36, 'sestilioni'),
+    # (1e33, 'quintiliardi'),
+    # (1e30, 'quintilioni'),
+    # (1e27, 'quadriliardi'),
+    # (1e24, 'quadrilioni'),    # yotta
+    (1e21, 'triliardi'),      # zetta
+    (1e18, 'trilioni'),       # exa
+    (1e15, 'biliardi'),       # peta
+    (1e12, 'bilioni'),        # tera
+    (1e9, 'miliardi'),        # giga
+    (1e6, 'milioni')          # mega
+])
+
+
+def _multipliers_it():
+    multiplier = {}
+    un_multiplier = {}
+    for num in _MULTIPLI_IT:
+        if num > 1000 and num <= 1e21:
+            # plurali
+            multiplier[_MULTIPLI_IT[num]] = int(num)
+            # singolari - modificare per eccezioni *liardo
+            if _MULTIPLI_IT[num][-5:-1] == 'iard':
+                un_multiplier['un' + _MULTIPLI_IT[num][:-1] + 'o'] = int(num)
+            else:
+                un_multiplier['un' + _MULTIPLI_IT[num][:-1] + 'e'] = int(num)
+    return multiplier, un_multiplier
+
+
+_MULTIPLIER_IT, _UN_MULTIPLIER_IT = _multipliers_it()
 
+# normalizza ordinali singoli o plurali -esimo -esimi
+_ORDINAL_ENDINGS3_IT = {'tre': '', 'ttr': 'o', 'sei': '', 'ott': 'o'}
+_ORDINAL_ENDINGS2_IT = {'un': 'o', 'du': 'e', 'qu': 'e', 'tt': 'e',
+                        'ov': 'e'}
 
+# the rewriting of the number words into sums and products, in order
+_REPLACEMENTS_IT = tuple(
+    [(item, '+' + str(value)) for table in
+     (_TENS_IT, _TENS_SHORT_IT, _NUMS_LONG_IT) for item, value in
+     table.items()] +
+    [('cento', '+1xx'), ('cent', '+1xx'),
+     ('mille', '+1000'),   # unmilionemille
+     ('mila', '*1000')] +  # unmilioneduemila
+    [(item, '+' + str(value)) for item, value in _UNITS_IT.items()])
+
+# a word with none of these can't be a number
+_NUMBER_PART_IT = re.compile("|".join(
+    [r"\d"] + [re.escape(item) for item in
+                list(_MULTIPLIER_IT) + list(_UN_MULTIPLIER_IT) +
+                [item for item, _ in _REPLACEMENTS_IT]]))
+
+
+@lru_cache(maxsize=4096)
 def extractnumber_long_it(word):
     """
      This function converts a long textual number like
@@ -229,120 +314,58 @@ def extractnumber_long_it(word):
         milleventisette -> 1027
         diecimilaquarantuno-> 10041
         centottomiladuecentotredici -> 108213
+
+     The tables of the grammar are built once, with the module, and the
+     words already converted are remembered.
     Args:
          word (str): the word to convert in number
     Returns:
          (bool) or (int): The extracted number or False if no number
                                    was found
     """
-
-    units = {'zero': 0, 'uno': 1, 'due': 2, 'tre': 3, 'quattro': 4,
-             'cinque': 5, 'sei': 6, 'sette': 7, 'otto': 8, 'nove': 9}
-
-    tens = {'dieci': 10, 'venti': 20, 'trenta': 30, 'quaranta': 40,
-            'cinquanta': 50, 'sessanta': 60, 'settanta': 70, 'ottanta': 80,
-            'novanta': 90}
-
-    tens_short = {'vent': 20, 'trent': 30, 'quarant': 40, 'cinquant': 50,
-                  'sessant': 60, 'settant': 70, 'ottant': 80, 'novant': 90}
-
-    nums_long = {'undici': 11, 'dodici': 12, 'tredici': 13, 'quattordici': 14,
-                 'quindici': 15, 'sedici': 16, 'diciassette': 17,
-                 'diciotto': 18, 'diciannove': 19}
-
-    multipli_it = collections.OrderedDict([
-        # (1e63, 'deciliardi'),
-        # (1e60, 'decilioni'),
-        # (1e57, 'noviliardi'),
-        # (1e54, 'novilioni'),
-        # (1e51, 'ottiliardi'),
-        # (1e48, 'ottilioni'),
-        # (1e45, 'settiliardi'),
-        # (1e42, 'settilioni'),
-        # (1e39, 'sestiliardi'),
-        # (1e36, 'sestilioni'),
-        # (1e33, 'quintiliardi'),
-        # (1e30, 'quintilioni'),
-        # (1e27, 'quadriliardi'),
-        # (1e24, 'quadrilioni'),    # yotta
-        (1e21, 'triliardi'),      # zetta
-        (1e18, 'trilioni'),       # exa
-        (1e15, 'biliardi'),       # peta
-        (1e12, 'bilioni'),        # tera
-        (1e9, 'miliardi'),        # giga
-        (1e6, 'milioni')          # mega
-    ])
-
-    multiplier = {}
-    un_multiplier = {}
-
-    for num in multipli_it:
-        if num > 1000 and num <= 1e21:
-            # plurali
-            multiplier[multipli_it[num]] = int(num)
-            # singolari - modificare per eccezioni *liardo
-            if multipli_it[num][-5:-1] == 'iard':
-                un_multiplier['un' + multipli_it[num][:-1] + 'o'] = int(num)
-            else:
-                un_multiplier['un' + multipli_it[num][:-1] + 'e'] = int(num)
-
     value = False
 
     # normalizza ordinali singoli o plurali -esimo -esimi
     if word[-5:-1] == 'esim':
         base = word[:-5]
-        normalize_ita3 = {'tre': '', 'ttr': 'o', 'sei': '', 'ott': 'o'}
-        normalize_ita2 = {'un': 'o', 'du': 'e', 'qu': 'e', 'tt': 'e',
-                          'ov': 'e'}
 
-        if base[-3:] in normalize_ita3:
-            base += normalize_ita3[base[-3:]]
-        elif base[-2:] in normalize_ita2:
-            base += normalize_ita2[base[-2:]]
+        if base[-3:] in _ORDINAL_ENDINGS3_IT:
+            base += _ORDINAL_ENDINGS3_IT[base[-3:]]
+        elif base[-2:] in _ORDINAL_ENDINGS2_IT:
+            base += _ORDINAL_ENDINGS2_IT[base[-2:]]
 
         word = base
 
-    for item in un_multiplier:
+    if not _NUMBER_PART_IT.search(word):
+        return value
+
+    for item in _UN_MULTIPLIER_IT:
         components = word.split(item, 1)
         if len(components) == 2:
             if not components[0]:  # inizia con un1^x
                 if not components[1]:  # unmilione
-                    word = str(int(un_multiplier[item]))
+                    word = str(int(_UN_MULTIPLIER_IT[item]))
                 else:                  # unmilione + x
-                    word = str(int(un_multiplier[item]) +
+                    word = str(int(_UN_MULTIPLIER_IT[item]) +
                                extractnumber_long_it(components[1]))
 
-    for item in multiplier:
+    for item in _MULTIPLIER_IT:
         components = word.split(item, 1)
         if len(components) == 2:
             if not components[0]:  # inizia con un1^x
-                word = str(int(multiplier[item]) +
+                word = str(int(_MULTIPLIER_IT[item]) +
                            extractnumber_long_it(components[1]))
             else:
                 if not components[1]:
                     word = str(extractnumber_long_it(components[0])) + '*' \
-                        + str(int(multiplier[item]))
+                        + str(int(_MULTIPLIER_IT[item]))
                 else:
                     word = str(extractnumber_long_it(components[0])) + '*' \
-                        + str(int(multiplier[item])) + '+' \
+                        + str(int(_MULTIPLIER_IT[item])) + '+' \
                         + str(extractnumber_long_it(components[1]))
 
-    for item in tens:
-        word = word.replace(item, '+' + str(tens[item]))
-
-    for item in tens_short:
-        word = word.replace(item, '+' + str(tens_short[item]))
-
-    for item in nums_long:
-        word = word.replace(item, '+' + str(nums_long[item]))
-
-    word = word.replace('cento', '+1xx')
-    word = word.replace('cent', '+1xx')
-    word = word.replace('mille', '+1000')   # unmilionemille
-    word = word.replace('mila', '*1000')   # unmilioneduemila
-
-    for item in units:
-        word = word.replace(item, '+' + str(units[item]))
+    for item, replacement in _REPLACEMENTS_IT:
+        word = word.replace(item, replacement)
 
     # normalizzo i cento
     occorrenze = word.count('+1xx')
@@ -368,6 +391,9 @@ def extractnumber_long_it(word):
     for c, _ in enumerate(addends):
         if '*' in addends[c]:
             factors = addends[c].split('*')
+            if not all(factor.isdecimal() for factor in factors[:3]):
+                # "milano"
+                return False
             result = int(factors[0]) * int(factors[1])
             if len(factors) == 3:
                 result *= int(factors[2])
@@ -381,6 +407,33 @@ def extractnumber_long_it(word):
     return value
 
 
+# the tables of extractnumber_it, which adds the ordinals and the scale
+# words it reads to STRING_NUM_ITA
+_STRING_SHORT_ORDINAL_IT = {word: num for num, word
+                            in SHORT_ORDINAL_STRING_IT.items()}
+_STRING_LONG_ORDINAL_IT = {word: num for num, word
+                           in LONG_ORDINAL_STRING_IT.items()}
+_STRING_SHORT_SCALE_IT = {word: num for num, word in SHORT_SCALE_IT.items()}
+_STRING_LONG_SCALE_IT = {word: num for num, word in LONG_SCALE_IT.items()}
+
+# negate next number (-2 = 0 - 2)
+_NEGATIVES_IT = ['meno']  # 'negativo' non è usuale in italiano
+
+# multiply the previous number (one hundred = 1 * 100)
+_MULTIPLIES_IT = ['decina', 'decine', 'dozzina', 'dozzine',
+                  'centinaia', 'centinaio', 'migliaia', 'migliaio', 'mila']
+_MULTIPLIES_SHORT_SCALE_IT = frozenset(_MULTIPLIES_IT +
+                                       list(SHORT_SCALE_IT.values()))
+_MULTIPLIES_LONG_SCALE_IT = frozenset(_MULTIPLIES_IT +
+                                      list(LONG_SCALE_IT.values()))
+
+# split sentence parse separately and sum ( 2 and a half = 2 + 0.5 )
+_FRACTION_MARKER_IT = [' e ']
+
+# decimal marker ( 1 point 5 = 1 + 0.5)
+_DECIMAL_MARKER_IT = [' punto ', ' virgola ']
+
+
 def extractnumber_it(text, short_scale=False, ordinals=False):
     """
     This function extracts a number from a text string,
@@ -399,46 +452,20 @@ def extractnumber_it(text, short_scale=False, ordinals=False):
     """
 
     text = text.lower()
-    string_num_ordinal_it = {}
     # first, second...
     if ordinals:
-        if short_scale:
-            for num in SHORT_ORDINAL_STRING_IT:
-                num_string = SHORT_ORDINAL_STRING_IT[num]
-                string_num_ordinal_it[num_string] = num
-                STRING_NUM_ITA[num_string] = num
-        else:
-            for num in LONG_ORDINAL_STRING_IT:
-                num_string = LONG_ORDINAL_STRING_IT[num]
-                string_num_ordinal_it[num_string] = num
-                STRING_NUM_ITA[num_string] = num
-
-    # negate next number (-2 = 0 - 2)
-    negatives = ['meno']  # 'negativo' non è usuale in italiano
-
-    # multiply the previous number (one hundred = 1 * 100)
-    multiplies = ['decina', 'decine', 'dozzina', 'dozzine',
-                  'centinaia', 'centinaio', 'migliaia', 'migliaio', 'mila']
-
-    # split sentence parse separately and sum ( 2 and a half = 2 + 0.5 )
-    fraction_marker = [' e ']
-
-    # decimal marker ( 1 point 5 = 1 + 0.5)
-    decimal_marker = [' punto ', ' virgola ']
+        STRING_NUM_ITA.update(_STRING_SHORT_ORDINAL_IT if short_scale
+                              else _STRING_LONG_ORDINAL_IT)
 
     if short_scale:
-        for num in SHORT_SCALE_IT:
-            num_string = SHORT_SCALE_IT[num]
-            STRING_NUM_ITA[num_string] = num
-            multiplies.append(num_string)
+        STRING_NUM_ITA.update(_STRING_SHORT_SCALE_IT)
+        multiplies = _MULTIPLIES_SHORT_SCALE_IT
     else:
-        for num in LONG_SCALE_IT:
-            num_string = LONG_SCALE_IT[num]
-            STRING_NUM_ITA[num_string] = num
-            multiplies.append(num_string)
+        STRING_NUM_ITA.update(_STRING_LONG_SCALE_IT)
+        multiplies = _MULTIPLIES_LONG_SCALE_IT
 
     # 2 e 3/4 ed altri casi
-    for separator in fraction_marker:
+    for separator in _FRACTION_MARKER_IT:
         components = text.split(separator)
         zeros = 0
 
@@ -462,7 +489,7 @@ def extractnumber_it(text, short_scale=False, ordinals=False):
                 return num1 + num2 / pow(10, len(str(num2)) + zeros)
 
     # 2 punto 5
-    for separator in decimal_marker:
+    for separator in _DECIMAL_MARKER_IT:
         zeros = 0
         # count zeros in fraction part
         components = text.split(separator)
@@ -529,7 +556,7 @@ def extractnumber_it(text, short_scale=False, ordinals=False):
                 val = val * next_value
 
         # is this a negative number?
-        if val and prev_word and prev_word in negatives:
+        if val and prev_word and prev_word in _NEGATIVES_IT:
             val = 0 - val
 
         if not val:
@@ -597,7 +624,71 @@ def normalize_it(text, remove_articles):
     return normalized[1:]
 
 
+def _build_datetime_lexicon_it():
+    time_qualifiers_am = ['mattina', 'stamani', 'stamane']
+    time_qualifiers_pm = ['pomeriggio', 'sera', 'stasera', 'stanotte']
+    days = ['lunedi', 'martedi', 'mercoledi',
+            'giovedi', 'venerdi', 'sabato', 'domenica']
+    months = ['gennaio', 'febbraio', 'marzo', 'aprile', 'maggio', 'giugno',
+              'luglio', 'agosto', 'settembre', 'ottobre', 'novembre',
+              'dicembre']
+    months_short = ['gen', 'feb', 'mar', 'apr', 'mag', 'giu', 'lug', 'ago',
+                    'set', 'ott', 'nov', 'dic']
+    return DatetimeLexicon(
+        days, months, months_short,
+        # word -> day offset
+        relative_days={'oggi': 0, 'domani': 1},
+        time_qualifiers_pm=time_qualifiers_pm,
+        time_qualifiers=set(time_qualifiers_am + time_qualifiers_pm),
+        markers=['alle', 'in', 'questo', 'per', 'di', 'tra', 'fra', 'entro'],
+        # decennio <- decenni
+        year_multiples=['decenni', 'secolo', 'millenni'],
+        time_multiples=['ora', 'minuto', 'secondo'],
+        day_multiples=['settimana', 'mese', 'anno'],
+        noise_words_2={'tra', 'di', 'per', 'fra', 'un ', 'uno', 'lo', 'del',
+                       'l', 'in_punto', ' ', 'nella', 'dell'},
+        valid_followups=set(days + months + months_short +
+                            ['oggi', 'domani', 'prossimo', 'passato',
+                             'adesso']),
+        # with the plurals clean_string turns into these
+        triggers=time_qualifiers_am + time_qualifiers_pm +
+        ['mattino', 'adesso', 'oggi', 'domani', 'ieri', 'settimana',
+         'settimane', 'mese', 'mesi', 'anno', 'anni', 'decenni', 'secolo',
+         'secoli', 'millenni', 'mezzora', 'ora', 'ore', 'minuto', 'minuti',
+         'secondo', 'secondi'],
+        trigger_phrases=[(['mezzo'], ['giorno', 'giorni']),
+                         (['mezza'], ['notte'])])
+
+
+_DATETIME_IT = _build_datetime_lexicon_it()
+
+
+def has_datetime_it(text):
+    """ Check if text may contain a date or a time
+
+    A cheap scan for the words extract_datetime_it needs, text without any
+    of them has no date or time.
+
+    Args:
+        text (str): the text to check
+    Returns:
+        bool: False if extract_datetime_it would find nothing in text
+    """
+    return _DATETIME_IT.has_datetime(text)
+
+
 def extract_datetime_it(string, dateNow, default_time):
+    if string == '' or not dateNow:
+        return None
+
+    plan = _DATETIME_PLANS_IT.get(string, dateNow)
+    if plan is None:
+        return None
+    return _resolve_datetime_it(plan, dateNow, default_time)
+
+
+def _plan_datetime_it(string, anchor):
+    """ DatetimePlan of string, None if it has no date or time """
     def clean_string(s):
         """
             cleans the input string of unneeded punctuation and capitalization
@@ -651,40 +742,35 @@ def extract_datetime_it(string, dateNow, default_time):
              month_offset != 0 or day_offset is True or hr_offset != 0 or
              hr_abs or min_offset != 0 or min_abs or sec_offset != 0)
 
-    if string == '' or not dateNow:
-        return None
-
     found = False
     day_specified = False
     day_offset = False
     month_offset = 0
     year_offset = 0
-    today = dateNow.strftime('%w')
-    current_year = dateNow.strftime('%Y')
     from_flag = False
     datestr = ''
     has_year = False
     time_qualifier = ''
-    time_qualifiers_am = ['mattina', 'stamani', 'stamane']
-    time_qualifiers_pm = ['pomeriggio', 'sera', 'stasera', 'stanotte']
-    time_qualifiers_list = set(time_qualifiers_am + time_qualifiers_pm)
-    markers = ['alle', 'in', 'questo', 'per', 'di', 'tra', 'fra', 'entro']
-    days = ['lunedi', 'martedi', 'mercoledi',
-            'giovedi', 'venerdi', 'sabato', 'domenica']
-    months = ['gennaio', 'febbraio', 'marzo', 'aprile', 'maggio', 'giugno',
-              'luglio', 'agosto', 'settembre', 'ottobre', 'novembre',
-              'dicembre']
-    months_short = ['gen', 'feb', 'mar', 'apr', 'mag', 'giu', 'lug', 'ago',
-                    'set', 'ott', 'nov', 'dic']
-    year_multiples = ['decenni', 'secolo', 'millenni']  # decennio <- decenni
-    time_multiples = ['ora', 'minuto', 'secondo']
-    day_multiples = ['settimana', 'mese', 'anno']
-    noise_words_2 = ['tra', 'di', 'per', 'fra', 'un ', 'uno', 'lo', 'del',
-                     'l', 'in_punto', ' ', 'nella', 'dell']
+    lexicon = _DATETIME_IT
+    time_qualifiers_pm = lexicon.time_qualifiers_pm
+    time_qualifiers_list = lexicon.time_qualifiers
+    markers = lexicon.markers
+    days = lexicon.days
+    months = lexicon.months
+    months_short = lexicon.months_short
+    year_multiples = lexicon.year_multiples
+    time_multiples = lexicon.time_multiples
+    day_multiples = lexicon.day_multiples
+    noise_words_2 = lexicon.noise_words_2
+    valid_followups = lexicon.valid_followups
+    relative_days = lexicon.relative_days
 
     words = clean_string(string)
+    # without a trigger no word can start a date or a time, the scans
+    # below would only go through the words
+    scanned = words if lexicon.has_datetime(string) else []
 
-    for idx, word in enumerate(words):
+    for idx, word in enumerate(scanned):
         if word == '':
             continue
         word_prev_prev = words[idx - 2] if idx > 1 else ''
@@ -699,8 +785,7 @@ def extract_datetime_it(string, dateNow, default_time):
             words = [x for x in words if x != 'adesso']
             words = [x for x in words if x]
             result_str = ' '.join(words)
-            extracted_date = dateNow.replace(microsecond=0)
-            return [extracted_date, result_str]
+            return DatetimePlan(result_str, now=True)
 
         # un paio di  o  tra tre settimane --> secoli
         elif extractnumber_it(word) and (word_next in year_multiples or
@@ -722,11 +807,8 @@ def extract_datetime_it(string, dateNow, default_time):
         elif word in time_qualifiers_list:
             time_qualifier = word
         # parse today, tomorrow, day after tomorrow
-        elif word == 'oggi' and not from_flag:
-            day_offset = 0
-            used += 1
-        elif word == 'domani' and not from_flag:
-            day_offset = 1
+        elif word in relative_days and not from_flag:
+            day_offset = relative_days[word]
             used += 1
         elif word == 'ieri' and not from_flag:
             day_offset -= 1
@@ -810,8 +892,8 @@ def extract_datetime_it(string, dateNow, default_time):
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
         elif word in days and not from_flag:
-            ddd = days.index(word)
-            day_offset = (ddd + 1) - int(today)
+            ddd = lexicon.day_index[word]
+            day_offset = (ddd + 1) - anchor.day_of_week()
             used = 1
             if day_offset < 0:
                 day_offset += 7
@@ -831,10 +913,7 @@ def extract_datetime_it(string, dateNow, default_time):
                 used += 1
         # parse 15 of July, June 20th, Feb 18, 19 of February
         elif word in months or word in months_short and not from_flag:
-            try:
-                mmm = months.index(word)
-            except ValueError:
-                mmm = months_short.index(word)
+            mmm = lexicon.month(word)
             used += 1
             datestr = months[mmm]
             if word_prev and extractnumber_it(word_prev):
@@ -858,14 +937,8 @@ def extract_datetime_it(string, dateNow, default_time):
                     has_year = False
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + months_short
-        validFollowups.append('oggi')
-        validFollowups.append('domani')
-        validFollowups.append('prossimo')
-        validFollowups.append('passato')
-        validFollowups.append('adesso')
-
-        if (word == 'da' or word == 'dopo') and word_next in validFollowups:
+
+        if (word == 'da' or word == 'dopo') and word_next in valid_followups:
             used = 0
             from_flag = True
             if word_next == 'domani':
@@ -874,8 +947,8 @@ def extract_datetime_it(string, dateNow, default_time):
             elif word_next == 'oggi' or word_next == 'adesso':
                 used += 2
             elif word_next in days:
-                ddd = days.index(word_next)
-                tmp_offset = (ddd + 1) - int(today)
+                ddd = lexicon.day_index[word_next]
+                tmp_offset = (ddd + 1) - anchor.day_of_week()
                 used += 2
                 if tmp_offset < 0:
                     tmp_offset += 7
@@ -883,12 +956,12 @@ def extract_datetime_it(string, dateNow, default_time):
                     tmp_offset += 7
                     used += 1
                 elif word_next_next == 'passato' or word_next_next == 'scorso':
-                    tmp_offset = (ddd + 1) - int(today)
+                    tmp_offset = (ddd + 1) - anchor.day_of_week()
                     used += 1
                 day_offset += tmp_offset
             elif word_next_next and word_next_next in days:
-                ddd = days.index(word_next_next)
-                tmp_offset = (ddd + 1) - int(today)
+                ddd = lexicon.day_index[word_next_next]
+                tmp_offset = (ddd + 1) - anchor.day_of_week()
                 if word_next == 'prossimo':
                     tmp_offset += 7
                 # elif word_next == 'passato' or word_next == 'scorso':
@@ -918,7 +991,7 @@ def extract_datetime_it(string, dateNow, default_time):
     min_abs = None
     military = False
 
-    for idx, word in enumerate(words):
+    for idx, word in enumerate(scanned):
         if word == '':
             continue
         word_prev_prev = words[idx - 2] if idx > 1 else ''
@@ -1150,9 +1223,9 @@ def extract_datetime_it(string, dateNow, default_time):
                 # ambiguous time, detect whether they mean this evening or
                 # the next morning based on whether it has already passed
                 hr_abs = str_hh
-                if dateNow.hour < str_hh:
+                if anchor.is_before(str_hh):
                     pass  # No modification needed
-                elif dateNow.hour < str_hh + 12:
+                elif anchor.is_before(str_hh + 12):
                     str_hh += 12
                     hr_abs = str_hh
                 else:
@@ -1197,61 +1270,80 @@ def extract_datetime_it(string, dateNow, default_time):
     if day_offset is False:
         day_offset = 0
 
+    words = [x for x in words if x not in noise_words_2]
+    words = [x for x in words if x]
+    result_str = ' '.join(words)
+    return DatetimePlan(
+        result_str,
+        date_str=datestr,
+        has_year=has_year,
+        year_offset=year_offset,
+        month_offset=month_offset,
+        day_offset=day_offset,
+        hour=hr_abs,
+        minute=min_abs,
+        hour_offset=hr_offset,
+        minute_offset=min_offset,
+        second_offset=sec_offset,
+        day_specified=day_specified)
+
+
+_DATETIME_PLANS_IT = DatetimePlans(_plan_datetime_it)
+
+
+def _resolve_datetime_it(plan, dateNow, default_time):
+    """ extract_datetime_it result of plan at the anchor dateNow """
+    if plan.now:
+        return [dateNow.replace(microsecond=0), plan.leftover]
+    datestr = plan.date_str
+    has_year = plan.has_year
+    year_offset = plan.year_offset
+    month_offset = plan.month_offset
+    day_offset = plan.day_offset
+    hr_abs = plan.hour
+    min_abs = plan.minute
+    hr_offset = plan.hour_offset
+    min_offset = plan.minute_offset
+    sec_offset = plan.second_offset
+    day_specified = plan.day_specified
+    months = _DATETIME_IT.months
+    current_year = dateNow.year
+
     # perform date manipulation
 
     extracted_date = dateNow.replace(microsecond=0)
 
     if datestr != '':
-        en_months = ['january', 'february', 'march', 'april', 'may', 'june',
-                     'july', 'august', 'september', 'october', 'november',
-                     'december']
-        en_months_short = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july',
-                           'aug', 'sept', 'oct', 'nov', 'dec']
-
-        for idx, en_month in enumerate(en_months):
-            datestr = datestr.replace(months[idx], en_month)
-
-        for idx, en_month in enumerate(en_months_short):
-            datestr = datestr.replace(months_short[idx], en_month)
-
-        try:
-            temp = datetime.strptime(datestr, '%B %d')
-        except ValueError:
-            # Try again, allowing the year
-            temp = datetime.strptime(datestr, '%B %d %Y')
+        temp = parse_month_day(datestr, months)
         extracted_date = extracted_date.replace(hour=0, minute=0, second=0)
         if not has_year:
             temp = temp.replace(year=extracted_date.year,
                                 tzinfo=extracted_date.tzinfo)
             if extracted_date < temp:
                 extracted_date = extracted_date.replace(
-                    year=int(current_year),
-                    month=int(temp.strftime('%m')),
-                    day=int(temp.strftime('%d')),
+                    year=current_year,
+                    month=temp.month,
+                    day=temp.day,
                     tzinfo=extracted_date.tzinfo)
             else:
                 extracted_date = extracted_date.replace(
-                    year=int(current_year) + 1,
-                    month=int(temp.strftime('%m')),
-                    day=int(temp.strftime('%d')),
+                    year=current_year + 1,
+                    month=temp.month,
+                    day=temp.day,
                     tzinfo=extracted_date.tzinfo)
         else:
             extracted_date = extracted_date.replace(
-                year=int(temp.strftime('%Y')),
-                month=int(temp.strftime('%m')),
-                day=int(temp.strftime('%d')),
+                year=temp.year,
+                month=temp.month,
+                day=temp.day,
                 tzinfo=extracted_date.tzinfo)
     else:
         # ignore the current HH:MM:SS if relative using days or greater
         if hr_offset == 0 and min_offset == 0 and sec_offset == 0:
             extracted_date = extracted_date.replace(hour=0, minute=0, second=0)
 
-    if year_offset != 0:
-        extracted_date = extracted_date + relativedelta(years=year_offset)
-    if month_offset != 0:
-        extracted_date = extracted_date + relativedelta(months=month_offset)
-    if day_offset != 0:
-        extracted_date = extracted_date + relativedelta(days=day_offset)
+    time_of_day = None
+    not_before = None
     if hr_abs != -1 and min_abs != -1:
         # If no time was supplied in the string set the time to default
         # time if it's available
@@ -1261,23 +1353,15 @@ def extract_datetime_it(string, dateNow, default_time):
             hr_abs = hr_abs or 0
             min_abs = min_abs or 0
 
-        extracted_date = extracted_date + relativedelta(hours=hr_abs,
-                                                        minutes=min_abs)
+        time_of_day = (hr_abs, min_abs)
         if (hr_abs != 0 or min_abs != 0) and datestr == '':
-            if not day_specified and dateNow > extracted_date:
-                extracted_date = extracted_date + relativedelta(days=1)
-    if hr_offset != 0:
-        extracted_date = extracted_date + relativedelta(hours=hr_offset)
-    if min_offset != 0:
-        extracted_date = extracted_date + relativedelta(minutes=min_offset)
-    if sec_offset != 0:
-        extracted_date = extracted_date + relativedelta(seconds=sec_offset)
-
-    words = [x for x in words if x not in noise_words_2]
-    words = [x for x in words if x]
-    result_str = ' '.join(words)
+            if not day_specified:
+                not_before = dateNow
+    extracted_date = shift_datetime(extracted_date, year_offset, month_offset,
+                                    day_offset, time_of_day, hr_offset,
+                                    min_offset, sec_offset, not_before)
 
-    return [extracted_date, result_str]
+    return [extracted_date, plan.leftover]
 
 
 def get_gender_it(word, raw_string=""):
@@ -1307,6 +1391,33 @@ def get_gender_it(word, raw_string=""):
     return gender
 
 
+def _is_read_with_number_before_it(word):
+    """ Fractions, and "paio" as in "un paio", 2 """
+    return word.lower() == "paio" or isFractional_it(word)
+
+
+def extract_numbers_with_spans_it(text, short_scale=False, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers, with the
+        characters each of them was read from.
+
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: (number, start, end) for each number, with text[start:end]
+              the words it was read from
+    """
+    return extract_numbers_with_spans_generic(
+        text, extractnumber_it, short_scale, ordinals,
+        connectors=_NUMBER_MARKERS_IT,
+        fraction_handler=_is_read_with_number_before_it, prefixes=("meno",))
+
+
 def extract_numbers_it(text, short_scale=False, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -1321,5 +1432,5 @@ def extract_numbers_it(text, short_scale=False, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    return extract_numbers_generic(text, pronounce_number_it, extractnumber_it,
-                                   short_scale=short_scale, ordinals=ordinals)
+    return [number for number, _, _ in
+            extract_numbers_with_spans_it(text, short_scale, ordinals)]
@@ -13,12 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from collections import namedtuple
-from datetime import datetime, timedelta
+from datetime import timedelta
 
-from dateutil.relativedelta import relativedelta
 
-from .parse_common import is_numeric, look_for_fractions
+from .parse_common import is_numeric, look_for_fractions, fraction_table, \
+    ReplaceableNumber, Token, NumberLexicon, DatetimeLexicon, DatetimePlan, \
+    DatetimePlans, shift_datetime, parse_month_day
 from .common_data_nl import _ARTICLES, _NUM_STRING_NL, \
     _LONG_ORDINAL_STRING_NL, _LONG_SCALE_NL, \
     _SHORT_SCALE_NL, _SHORT_ORDINAL_STRING_NL
@@ -55,6 +55,9 @@ _FRACTION_MARKER = {"en"}
 # decimal marker ( 1 point 5 = 1 + 0.5)
 _DECIMAL_MARKER = {"komma", "punt"}
 
+# all the words joining the parts of a number
+_NUMBER_MARKERS_NL = frozenset(_FRACTION_MARKER | _DECIMAL_MARKER)
+
 _STRING_NUM_NL = _invert_dict(_NUM_STRING_NL)
 _STRING_NUM_NL.update({
     "half": 0.5,
@@ -66,56 +69,44 @@ _STRING_NUM_NL.update({
 _STRING_SHORT_ORDINAL_NL = _invert_dict(_SHORT_ORDINAL_STRING_NL)
 _STRING_LONG_ORDINAL_NL = _invert_dict(_LONG_ORDINAL_STRING_NL)
 
-
-# _Token is intended to be used in the number processing functions in
-# this module. The parsing requires slicing and dividing of the original
-# text. To ensure things parse correctly, we need to know where text came
-# from in the original input, hence this nametuple.
-_Token = namedtuple('_Token', 'word index')
+_STRING_SHORT_SCALE_NL = _invert_dict(_SHORT_SCALE_NL)
+_STRING_LONG_SCALE_NL = _invert_dict(_LONG_SCALE_NL)
 
 
-class _ReplaceableNumber():
-    """Similar to _Token, this class is used in number parsing.
+def _fraction_denominators_nl(ordinals):
+    denominators = {"heel": 1, "half": 2, "halve": 2, "kwart": 4}
+    denominators.update({word: num for num, word in ordinals.items()
+                         if num > 2})
+    return denominators
 
-    Once we've found a number in a string, this class contains all
-    the info about the value, and where it came from in the original text.
-    In other words, it is the text, and the number that can replace it in
-    the string.
-    """
 
-    def __init__(self, value, tokens: [_Token]):
-        self.value = value
-        self.tokens = tokens
+_FRACTION_SHORT_SCALE_NL = fraction_table(
+    _fraction_denominators_nl(_SHORT_ORDINAL_STRING_NL))
+_FRACTION_LONG_SCALE_NL = fraction_table(
+    _fraction_denominators_nl(_LONG_ORDINAL_STRING_NL))
 
-    def __bool__(self):
-        return bool(self.value is not None and self.value is not False)
+# the kinds of NumberLexicon words that are part of whole numbers
+_WHOLE_NUMBER_KINDS = frozenset({"number", "sum", "multiplier", "fraction",
+                                 "numeral"})
 
-    @property
-    def start_index(self):
-        return self.tokens[0].index
 
-    @property
-    def end_index(self):
-        return self.tokens[-1].index
+def _build_number_lexicon_nl(string_num_scale, string_num_ordinal,
+                             fractions):
+    return NumberLexicon({
+        "number": _STRING_NUM_NL,
+        "sum": _SUMS,
+        "multiplier": string_num_scale,
+        "ordinal": string_num_ordinal,
+        "fraction": dict(fractions),
+        "marker": _NUMBER_MARKERS_NL,
+        "negative": _NEGATIVES,
+        "article": _ARTICLES})
 
-    @property
-    def text(self):
-        return ' '.join([t.word for t in self.tokens])
 
-    def __setattr__(self, key, value):
-        try:
-            getattr(self, key)
-        except AttributeError:
-            super().__setattr__(key, value)
-        else:
-            raise Exception("Immutable!")
-
-    def __str__(self):
-        return "({v}, {t})".format(v=self.value, t=self.tokens)
-
-    def __repr__(self):
-        return "{n}({v}, {t})".format(n=self.__class__.__name__, v=self.value,
-                                      t=self.tokens)
+_LEXICON_SHORT_SCALE_NL = _build_number_lexicon_nl(
+    _STRING_SHORT_SCALE_NL, _STRING_SHORT_ORDINAL_NL, _FRACTION_SHORT_SCALE_NL)
+_LEXICON_LONG_SCALE_NL = _build_number_lexicon_nl(
+    _STRING_LONG_SCALE_NL, _STRING_LONG_ORDINAL_NL, _FRACTION_LONG_SCALE_NL)
 
 
 def _tokenize(text):
@@ -124,9 +115,10 @@ def _tokenize(text):
         text str: Text to tokenize.
 
     Returns:
-        [_Token]
+        [Token]
     """
-    return [_Token(word, index) for index, word in enumerate(text.split())]
+    return [Token(match.group(), index, match.start(), match.end())
+            for index, match in enumerate(re.finditer(r"\S+", text))]
 
 
 def _partition_list(items, split_on):
@@ -193,10 +185,10 @@ def _convert_words_to_numbers(text, short_scale=True, ordinals=False):
 
 def _extract_numbers_with_text(tokens, short_scale=True,
                                ordinals=False, fractional_numbers=True):
-    """Extract all numbers from a list of _Tokens, with the representing words.
+    """Extract all numbers from a list of Tokens, with the representing words.
 
     Args:
-        [_Token]: The tokens to parse.
+        [Token]: The tokens to parse.
         short_scale bool: True if short scale numbers should be used, False for
                           long scale. True by default.
         ordinals bool: True if ordinal words (first, second, third, etc) should
@@ -205,7 +197,7 @@ def _extract_numbers_with_text(tokens, short_scale=True,
                                  decimals.
 
     Returns:
-        [_ReplaceableNumber]: A list of tuples, each containing a number and a
+        [ReplaceableNumber]: A list of tuples, each containing a number and a
                          string.
     """
     placeholder = "<placeholder>"  # inserted to maintain correct indices
@@ -224,7 +216,7 @@ def _extract_numbers_with_text(tokens, short_scale=True,
             t if not
             to_replace.start_index <= t.index <= to_replace.end_index
             else
-            _Token(placeholder, t.index) for t in tokens
+            Token(placeholder, t.index, t.start, t.end) for t in tokens
         ]
     results.sort(key=lambda n: n.start_index)
     return results
@@ -232,7 +224,7 @@ def _extract_numbers_with_text(tokens, short_scale=True,
 
 def _extract_number_with_text_nl(tokens, short_scale=True,
                                  ordinals=False, fractional_numbers=True):
-    """This function extracts a number from a list of _Tokens.
+    """This function extracts a number from a list of Tokens.
 
     Args:
         tokens str: the string to normalize
@@ -241,14 +233,14 @@ def _extract_number_with_text_nl(tokens, short_scale=True,
         fractional_numbers (bool): True if we should look for fractions and
                                    decimals.
     Returns:
-        _ReplaceableNumber
+        ReplaceableNumber
     """
     number, tokens = \
         _extract_number_with_text_nl_helper(tokens, short_scale,
                                             ordinals, fractional_numbers)
     while tokens and tokens[0].word in _ARTICLES:
         tokens.pop(0)
-    return _ReplaceableNumber(number, tokens)
+    return ReplaceableNumber(number, tokens)
 
 
 def _extract_number_with_text_nl_helper(tokens,
@@ -261,13 +253,13 @@ def _extract_number_with_text_nl_helper(tokens,
     contain leading articles that can be trimmed off).
 
     Args:
-        tokens [_Token]:
+        tokens [Token]:
         short_scale boolean:
         ordinals boolean:
         fractional_numbers boolean:
 
     Returns:
-        int or float, [_Tokens]
+        int or float, [Tokens]
     """
     if fractional_numbers:
         fraction, fraction_text = \
@@ -290,12 +282,12 @@ def _extract_fraction_with_text_nl(tokens, short_scale, ordinals):
     similar will be parsed by the whole number function.
 
     Args:
-        tokens [_Token]: words and their indexes in the original string.
+        tokens [Token]: words and their indexes in the original string.
         short_scale boolean:
         ordinals boolean:
 
     Returns:
-        (int or float, [_Token])
+        (int or float, [Token])
         The value found, and the list of relevant tokens.
         (None, None) if no fraction value is found.
     """
@@ -336,12 +328,12 @@ def _extract_decimal_with_text_nl(tokens, short_scale, ordinals):
             number dot number number number
 
     Args:
-        tokens [_Token]: The text to parse.
+        tokens [Token]: The text to parse.
         short_scale boolean:
         ordinals boolean:
 
     Returns:
-        (float, [_Token])
+        (float, [Token])
         The value found and relevant tokens.
         (None, None) if no decimal value is found.
     """
@@ -377,18 +369,18 @@ def _extract_whole_number_with_text_nl(tokens, short_scale, ordinals):
     fraction function.
 
     Args:
-        tokens [_Token]:
+        tokens [Token]:
         short_scale boolean:
         ordinals boolean:
 
     Returns:
-        int or float, [_Tokens]
+        int or float, [Tokens]
         The value parsed, and tokens that it corresponds to.
     """
     multiplies, string_num_ordinal, string_num_scale = \
         _initialize_number_data(short_scale)
 
-    number_words = []  # type: [_Token]
+    number_words = []  # type: [Token]
     val = False
     prev_val = None
     next_val = None
@@ -407,14 +399,7 @@ def _extract_whole_number_with_text_nl(tokens, short_scale, ordinals):
         prev_word = tokens[idx - 1].word if idx > 0 else ""
         next_word = tokens[idx + 1].word if idx + 1 < len(tokens) else ""
 
-        if word not in string_num_scale and \
-                word not in _STRING_NUM_NL and \
-                word not in _SUMS and \
-                word not in multiplies and \
-                not (ordinals and word in string_num_ordinal) and \
-                not is_numeric(word) and \
-                not isFractional_nl(word, short_scale=short_scale) and \
-                not look_for_fractions(word.split('/')):
+        if not _is_number_word_nl(word, short_scale, ordinals):
             words_only = [token.word for token in number_words]
             if number_words and not all([w in _ARTICLES |
                                          _NEGATIVES for w in words_only]):
@@ -519,28 +504,60 @@ def _extract_whole_number_with_text_nl(tokens, short_scale, ordinals):
     return val, number_words
 
 
-def _initialize_number_data(short_scale):
-    """Generate dictionaries of words to numbers, based on scale.
+def _is_number_word_nl(word, short_scale, ordinals):
+    """Check if a word can be part of a whole number.
 
-    This is a helper function for _extract_whole_number.
+    Args:
+        word str:
+        short_scale boolean:
+        ordinals boolean:
+
+    Returns:
+        bool
+    """
+    kinds = _get_number_lexicon_nl(short_scale).kinds(word)
+    if not kinds:
+        # the fractions are read whatever their case
+        return word != word.lower() and \
+            bool(isFractional_nl(word, short_scale=short_scale))
+    return not _WHOLE_NUMBER_KINDS.isdisjoint(kinds) or \
+        (ordinals and "ordinal" in kinds)
+
+
+def _get_number_lexicon_nl(short_scale):
+    """Get the NumberLexicon of the dutch number words, based on scale.
+
+    Like the dictionaries of _initialize_number_data, the lexicons are
+    built once, when the module is loaded.
 
     Args:
         short_scale boolean:
 
     Returns:
-        (set(str), dict(str, number), dict(str, number))
-        multiplies, string_num_ordinal, string_num_scale
+        NumberLexicon
     """
-    multiplies = _MULTIPLIES_SHORT_SCALE_NL if short_scale \
-        else _MULTIPLIES_LONG_SCALE_NL
+    return _LEXICON_SHORT_SCALE_NL if short_scale else _LEXICON_LONG_SCALE_NL
+
 
-    string_num_ordinal_nl = _STRING_SHORT_ORDINAL_NL if short_scale \
-        else _STRING_LONG_ORDINAL_NL
+def _initialize_number_data(short_scale):
+    """Get the dictionaries of words to numbers, based on scale.
+
+    This is a helper function for _extract_whole_number.  The dictionaries
+    are built once, when the module is loaded, and shared by all the calls:
+    don't modify them.
 
-    string_num_scale_nl = _SHORT_SCALE_NL if short_scale else _LONG_SCALE_NL
-    string_num_scale_nl = _invert_dict(string_num_scale_nl)
+    Args:
+        short_scale boolean:
 
-    return multiplies, string_num_ordinal_nl, string_num_scale_nl
+    Returns:
+        (set(str), dict(str, number), dict(str, number))
+        multiplies, string_num_ordinal, string_num_scale
+    """
+    if short_scale:
+        return _MULTIPLIES_SHORT_SCALE_NL, _STRING_SHORT_ORDINAL_NL, \
+            _STRING_SHORT_SCALE_NL
+    return _MULTIPLIES_LONG_SCALE_NL, _STRING_LONG_ORDINAL_NL, \
+        _STRING_LONG_SCALE_NL
 
 
 def extractnumber_nl(text, short_scale=True, ordinals=False):
@@ -616,6 +633,59 @@ def extract_duration_nl(text):
     return (duration, text)
 
 
+def _build_datetime_lexicon_nl():
+    timeQualifiersAM = ['ochtend']
+    timeQualifiersPM = ['middag', 'avond', 'nacht']
+    timeQualifiersList = timeQualifiersAM + timeQualifiersPM
+    days = ["maandag", "dinsdag", "woensdag", "donderdag", "vrijdag",
+            "zaterdag", "zondag"]
+    months = ['januari', 'februari', 'maart', 'april', 'mei', 'juni',
+              'juli', 'augustus', 'september', 'oktober', 'november',
+              'december']
+    months_short = ['jan', 'feb', 'mar', 'apr', 'mei', 'jun', 'jul', 'aug',
+                    'sep', 'okt', 'nov', 'dec']
+    return DatetimeLexicon(
+        days, months, months_short,
+        # word -> day offset
+        relative_days={"vandaag": 0, "morgen": 1, "overmorgen": 2},
+        time_qualifiers_am=timeQualifiersAM,
+        time_qualifiers_pm=timeQualifiersPM,
+        time_qualifiers=timeQualifiersList,
+        markers=['op', 'in', 'om', 'tegen', 'over',
+                 'deze', 'rond', 'voor', 'van', "binnen"],
+        day_parts=[a + b for a in days for b in timeQualifiersList],
+        recur_markers=days + [d + 'en' for d in days] +
+        ['weekeinde', 'werkdag', 'weekeinden', 'werkdagen'],
+        year_multiples=["decennium", "eeuw", "millennium"],
+        day_multiples=["dagen", "weken", "maanden", "jaren"],
+        valid_followups=set(days + months + months_short +
+                            ["vandaag", "morgen", "volgende", "vorige",
+                             "nu"]),
+        # "paar" is read as 2
+        triggers=timeQualifiersList + ["nu", "paar", "decenni", "eeuw",
+                                       "millenni", "vandaag", "morgen",
+                                       "gister", "uur", "minuut", "seconde"],
+        trigger_phrases=[(["volgend", "vorig"], ["week", "maand", "jaar"]),
+                         (["van", "na"], ["volgend", "vorig"])])
+
+
+_DATETIME_NL = _build_datetime_lexicon_nl()
+
+
+def has_datetime_nl(text):
+    """ Check if text may contain a date or a time
+
+    A cheap scan for the words extract_datetime_nl needs, text without any
+    of them has no date or time.
+
+    Args:
+        text (str): the text to check
+    Returns:
+        bool: False if extract_datetime_nl would find nothing in text
+    """
+    return _DATETIME_NL.has_datetime(text)
+
+
 def extract_datetime_nl(string, dateNow, default_time):
     """Convert a human date reference into an exact datetime
 
@@ -647,6 +717,18 @@ def extract_datetime_nl(string, dateNow, default_time):
                          date or time related text was found.
     """
 
+    if string == "" or not dateNow:
+        return None
+
+    plan = _DATETIME_PLANS_NL.get(string, dateNow)
+    if plan is None:
+        return None
+    return _resolve_datetime_nl(plan, dateNow, default_time)
+
+
+def _plan_datetime_nl(string, anchor):
+    """ DatetimePlan of string, None if it has no date or time """
+
     def clean_string(s):
         # clean unneeded punctuation and capitalization among other things.
         s = s.lower().replace('?', '').replace('.', '').replace(',', '') \
@@ -677,43 +759,37 @@ def extract_datetime_nl(string, dateNow, default_time):
                 minAbs or secOffset != 0
             )
 
-    if string == "" or not dateNow:
-        return None
-
     found = False
     daySpecified = False
     dayOffset = False
     monthOffset = 0
     yearOffset = 0
-    today = dateNow.strftime("%w")
-    currentYear = dateNow.strftime("%Y")
     fromFlag = False
     datestr = ""
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersAM = ['ochtend']
-    timeQualifiersPM = ['middag', 'avond', 'nacht']
-    timeQualifiersList = timeQualifiersAM + timeQualifiersPM
-    timeQualifierOffsets = [8, 15, 19, 0]
-    markers = ['op', 'in', 'om', 'tegen', 'over',
-               'deze', 'rond', 'voor', 'van', "binnen"]
-    days = ["maandag", "dinsdag", "woensdag", "donderdag", "vrijdag",
-            "zaterdag", "zondag"]
-    day_parts = [a + b for a in days for b in timeQualifiersList]
-    months = ['januari', 'februari', 'maart', 'april', 'mei', 'juni',
-              'juli', 'augustus', 'september', 'oktober', 'november',
-              'december']
-    recur_markers = days + [d+'en' for d in days] + ['weekeinde', 'werkdag',
-                                                     'weekeinden', 'werkdagen']
-    months_short = ['jan', 'feb', 'mar', 'apr', 'mei', 'jun', 'jul', 'aug',
-                    'sep', 'okt', 'nov', 'dec']
-    year_multiples = ["decennium", "eeuw", "millennium"]
-    day_multiples = ["dagen", "weken", "maanden", "jaren"]
+    lexicon = _DATETIME_NL
+    timeQualifiersAM = lexicon.time_qualifiers_am
+    timeQualifiersPM = lexicon.time_qualifiers_pm
+    timeQualifiersList = lexicon.time_qualifiers
+    markers = lexicon.markers
+    days = lexicon.days
+    day_parts = lexicon.day_parts
+    months = lexicon.months
+    recur_markers = lexicon.recur_markers
+    months_short = lexicon.months_short
+    year_multiples = lexicon.year_multiples
+    day_multiples = lexicon.day_multiples
+    validFollowups = lexicon.valid_followups
+    relative_days = lexicon.relative_days
 
     words = clean_string(string)
+    # without a trigger no word can start a date or a time, the scans
+    # below would only go through the words
+    scanned = words if lexicon.has_datetime(string) else []
 
-    for idx, word in enumerate(words):
+    for idx, word in enumerate(scanned):
         if word == "":
             continue
         wordPrevPrev = words[idx - 2] if idx > 1 else ""
@@ -728,8 +804,7 @@ def extract_datetime_nl(string, dateNow, default_time):
         if word == "nu" and not datestr:
             resultStr = " ".join(words[idx + 1:])
             resultStr = ' '.join(resultStr.split())
-            extractedDate = dateNow.replace(microsecond=0)
-            return [extractedDate, resultStr]
+            return DatetimePlan(resultStr, now=True)
         elif wordNext in year_multiples:
             multiplier = None
             if is_numeric(word):
@@ -767,14 +842,8 @@ def extract_datetime_nl(string, dateNow, default_time):
         elif word in timeQualifiersList:
             timeQualifier = word
         # parse today, tomorrow, day after tomorrow
-        elif word == "vandaag" and not fromFlag:
-            dayOffset = 0
-            used += 1
-        elif word == "morgen" and not fromFlag:
-            dayOffset = 1
-            used += 1
-        elif word == "overmorgen" and not fromFlag:
-            dayOffset = 2
+        elif word in relative_days and not fromFlag:
+            dayOffset = relative_days[word]
             used += 1
             # parse 5 days, 10 weeks, last week, next week
         elif word == "dag" or word == "dagen":
@@ -826,8 +895,8 @@ def extract_datetime_nl(string, dateNow, default_time):
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
         elif word in days and not fromFlag:
-            d = days.index(word)
-            dayOffset = (d + 1) - int(today)
+            d = lexicon.day_index[word]
+            dayOffset = (d + 1) - anchor.day_of_week()
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
@@ -842,15 +911,12 @@ def extract_datetime_nl(string, dateNow, default_time):
                 start -= 1
         elif word in day_parts and not fromFlag:
             d = day_parts.index(word) / len(timeQualifiersList)
-            dayOffset = (d + 1) - int(today)
+            dayOffset = (d + 1) - anchor.day_of_week()
             if dayOffset < 0:
                 dayOffset += 7
                 # parse 15 of July, June 20th, Feb 18, 19 of February
         elif word in months or word in months_short and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = months_short.index(word)
+            m = lexicon.month(word)
             used += 1
             datestr = months[m]
             if wordPrev and \
@@ -883,12 +949,6 @@ def extract_datetime_nl(string, dateNow, default_time):
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + months_short
-        validFollowups.append("vandaag")
-        validFollowups.append("morgen")
-        validFollowups.append("volgende")
-        validFollowups.append("vorige")
-        validFollowups.append("nu")
         if (word == "van" or word == "na") and wordNext in validFollowups:
             used = 2
             fromFlag = True
@@ -897,15 +957,15 @@ def extract_datetime_nl(string, dateNow, default_time):
             elif wordNext == "overmorgen":
                 dayOffset += 2
             elif wordNext in days:
-                d = days.index(wordNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
             elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNextNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 3
                 if wordNext == "volgende":
                     if dayOffset <= 2:
@@ -938,7 +998,7 @@ def extract_datetime_nl(string, dateNow, default_time):
     minAbs = None
     military = False
 
-    for idx, word in enumerate(words):
+    for idx, word in enumerate(scanned):
         if word == "":
             continue
 
@@ -1258,10 +1318,9 @@ def extract_datetime_nl(string, dateNow, default_time):
                     ((not daySpecified) or dayOffset < 1)):
                 # ambiguous time, detect whether they mean this evening or
                 # the next morning based on whether it has already passed
-                if dateNow.hour < HH or (dateNow.hour == HH and
-                                         dateNow.minute < MM):
+                if anchor.is_before(HH, MM):
                     pass  # No modification needed
-                elif dateNow.hour < HH + 12:
+                elif anchor.is_before(HH + 12):
                     HH += 12
                 else:
                     # has passed, assume the next morning
@@ -1311,50 +1370,86 @@ def extract_datetime_nl(string, dateNow, default_time):
     if dayOffset is False:
         dayOffset = 0
 
+    for idx, word in enumerate(words):
+        if words[idx] == "en" and \
+                words[idx - 1] == "" and words[idx + 1] == "":
+            words[idx] = ""
+
+    resultStr = " ".join(words)
+    resultStr = ' '.join(resultStr.split())
+
+    return DatetimePlan(
+        resultStr,
+        date_str=datestr,
+        has_year=hasYear,
+        year_offset=yearOffset,
+        month_offset=monthOffset,
+        day_offset=dayOffset,
+        hour=hrAbs,
+        minute=minAbs,
+        hour_offset=hrOffset,
+        minute_offset=minOffset,
+        second_offset=secOffset,
+        day_specified=daySpecified)
+
+
+_DATETIME_PLANS_NL = DatetimePlans(_plan_datetime_nl)
+
+
+def _resolve_datetime_nl(plan, dateNow, default_time):
+    """ extract_datetime_nl result of plan at the anchor dateNow """
+    if plan.now:
+        return [dateNow.replace(microsecond=0), plan.leftover]
+    datestr = plan.date_str
+    hasYear = plan.has_year
+    yearOffset = plan.year_offset
+    monthOffset = plan.month_offset
+    dayOffset = plan.day_offset
+    hrAbs = plan.hour
+    minAbs = plan.minute
+    hrOffset = plan.hour_offset
+    minOffset = plan.minute_offset
+    secOffset = plan.second_offset
+    daySpecified = plan.day_specified
+    currentYear = dateNow.year
+
     # perform date manipulation
 
     extractedDate = dateNow.replace(microsecond=0)
 
     if datestr != "":
         # date included an explicit date, e.g. "june 5" or "june 2, 2017"
-        try:
-            temp = datetime.strptime(datestr, "%B %d")
-        except ValueError:
-            # Try again, allowing the year
-            temp = datetime.strptime(datestr, "%B %d %Y")
+        temp = parse_month_day(datestr, _DATETIME_NL.months)
         extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
         if not hasYear:
             temp = temp.replace(year=extractedDate.year,
                                 tzinfo=extractedDate.tzinfo)
             if extractedDate < temp:
                 extractedDate = extractedDate.replace(
-                    year=int(currentYear),
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
+                    year=currentYear,
+                    month=temp.month,
+                    day=temp.day,
                     tzinfo=extractedDate.tzinfo)
             else:
                 extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
+                    year=currentYear + 1,
+                    month=temp.month,
+                    day=temp.day,
                     tzinfo=extractedDate.tzinfo)
         else:
             extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")),
+                year=temp.year,
+                month=temp.month,
+                day=temp.day,
                 tzinfo=extractedDate.tzinfo)
     else:
         # ignore the current HH:MM:SS if relative using days or greater
         if hrOffset == 0 and minOffset == 0 and secOffset == 0:
             extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
 
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
+    extractedDate = shift_datetime(extractedDate, yearOffset, monthOffset,
+                                   dayOffset)
+    notBefore = None
     if hrAbs != -1 and minAbs != -1:
         # If no time was supplied in the string set the time to default
         # time if it's available
@@ -1367,22 +1462,13 @@ def extract_datetime_nl(string, dateNow, default_time):
         extractedDate = extractedDate.replace(hour=hrAbs,
                                               minute=minAbs)
         if (hrAbs != 0 or minAbs != 0) and datestr == "":
-            if not daySpecified and dateNow > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-    for idx, word in enumerate(words):
-        if words[idx] == "en" and \
-                words[idx - 1] == "" and words[idx + 1] == "":
-            words[idx] = ""
-
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    return [extractedDate, resultStr]
+            if not daySpecified:
+                notBefore = dateNow
+    # the time of day was set, not added, the rest is added to it
+    extractedDate = shift_datetime(extractedDate, hours=hrOffset,
+                                   minutes=minOffset, seconds=secOffset,
+                                   not_before=notBefore)
+    return [extractedDate, plan.leftover]
 
 
 def isFractional_nl(input_str, short_scale=True):
@@ -1394,20 +1480,31 @@ def isFractional_nl(input_str, short_scale=True):
     Returns:
         (bool) or (float): False if not a fraction, otherwise the fraction
     """
-    fracts = {"heel": 1, "half": 2, "halve": 2, "kwart": 4}
-    if short_scale:
-        for num in _SHORT_ORDINAL_STRING_NL:
-            if num > 2:
-                fracts[_SHORT_ORDINAL_STRING_NL[num]] = num
-    else:
-        for num in _LONG_ORDINAL_STRING_NL:
-            if num > 2:
-                fracts[_LONG_ORDINAL_STRING_NL[num]] = num
+    fractions = _FRACTION_SHORT_SCALE_NL if short_scale \
+        else _FRACTION_LONG_SCALE_NL
+    return fractions.get(input_str.lower(), False)
 
-    if input_str.lower() in fracts:
-        return 1.0 / fracts[input_str.lower()]
-    return False
 
+def extract_numbers_with_spans_nl(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers, with the
+        characters each of them was read from.
+
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: (number, start, end) for each number, with text[start:end]
+              the words it was read from
+    """
+    results = _extract_numbers_with_text(_tokenize(text),
+                                         short_scale, ordinals)
+    return [(float(result.value), result.start, result.end)
+            for result in results]
 
 def extract_numbers_nl(text, short_scale=True, ordinals=False):
     """Takes in a string and extracts a list of numbers.
@@ -21,15 +21,28 @@
 """
 
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
-from lingua_franca.lang.parse_common import is_numeric, look_for_fractions
+from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
+    fraction_table, extract_numbers_with_spans_generic, is_compound_number, \
+    DatetimeLexicon, DatetimePlan, DatetimePlans, shift_datetime, \
+    parse_month_day
 from lingua_franca.lang.common_data_pt import _NUMBERS_PT, _FEMALE_DETERMINANTS_PT, _FEMALE_ENDINGS_PT, \
     _MALE_DETERMINANTS_PT, _MALE_ENDINGS_PT, _GENDERS_PT
-from lingua_franca import resolve_resource_file
+from lingua_franca.pack import read_json_resource
 from lingua_franca.lang.parse_common import Normalizer
-import json
 import re
 
+_FRACTION_PT = fraction_table({
+    "meio": 2, "terço": 3, "quarto": 4, "quinto": 5, "sexto": 6,
+    "setimo": 7, "sétimo": 7, "septimo": 7, "séptimo": 7, "oitavo": 8,
+    "nono": 9, "décimo": 10, "vigésimo": 20, "trigésimo": 30,
+    "centésimo": 100, "milésimo": 1000})
+
+# words joining the parts of a number, "dois e meio"
+_NUMBER_MARKERS_PT = ("e", "vírgula", "ponto")
+
+# words multiplying the number before them, "dois mil"
+_MULTIPLIERS_PT = ("mil",)
+
 
 def isFractional_pt(input_str):
     """
@@ -44,24 +57,7 @@ def isFractional_pt(input_str):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
 
-    aFrac = ["meio", "terço", "quarto", "quinto", "sexto",
-             "setimo", "oitavo", "nono", "décimo"]
-
-    if input_str.lower() in aFrac:
-        return 1.0 / (aFrac.index(input_str) + 2)
-    if input_str == "vigésimo":
-        return 1.0 / 20
-    if input_str == "trigésimo":
-        return 1.0 / 30
-    if input_str == "centésimo":
-        return 1.0 / 100
-    if input_str == "milésimo":
-        return 1.0 / 1000
-    if (input_str == "sétimo" or input_str == "septimo" or
-            input_str == "séptimo"):
-        return 1.0 / 7
-
-    return False
+    return _FRACTION_PT.get(input_str.lower(), False)
 
 # TODO: short_scale and ordinals don't do anything here.
 # The parameters are present in the function signature for API compatibility
@@ -119,10 +115,15 @@ def extractnumber_pt(text, short_scale=True, ordinals=False):
             if result is None:
                 result = 0
             # handle fractions
-            if next_word != "avos":
-                result += val
-            else:
+            if next_word == "avos":
                 result = float(result) / float(val)
+            elif word in _MULTIPLIERS_PT and 0 < result < val and \
+                    (aWords[count - 1] in _NUMBERS_PT or
+                     is_numeric(aWords[count - 1])):
+                # "dois mil", not "dois gatos custam mil"
+                result *= val
+            else:
+                result += val
 
         if next_word is None:
             break
@@ -153,7 +154,8 @@ def extractnumber_pt(text, short_scale=True, ordinals=False):
                     afterAndVal = afterAndVal / 10.0
                 result += afterAndVal
                 break
-        elif next_next_word is not None:
+        elif next_next_word is not None and next_word not in _NUMBERS_PT:
+            # "um cafe e meio"
             if next_next_word in ands:
                 newWords = aWords[count + 3:]
                 newText = ""
@@ -178,7 +180,8 @@ def extractnumber_pt(text, short_scale=True, ordinals=False):
                     zeros += 1
                 else:
                     break
-            afterDotVal = str(extractnumber_pt(newText[:-1]))
+            # "dois vírgula zero", only zeros after the marker
+            afterDotVal = str(extractnumber_pt(newText[:-1]) or 0)
             afterDotVal = zeros * "0" + afterDotVal
             result = float(str(result) + "." + afterDotVal)
             break
@@ -198,8 +201,7 @@ def extractnumber_pt(text, short_scale=True, ordinals=False):
 
 
 class PortugueseNormalizer(Normalizer):
-    with open(resolve_resource_file("text/pt-pt/normalize.json")) as f:
-        _default_config = json.load(f)
+    _default_config = read_json_resource("text/pt-pt/normalize.json")
 
     @staticmethod
     def tokenize(utterance):
@@ -217,12 +219,130 @@ class PortugueseNormalizer(Normalizer):
         return tokens
 
 
+def extract_numbers_with_spans_pt(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers, with the
+        characters each of them was read from.
+
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: (number, start, end) for each number, with text[start:end]
+              the words it was read from
+    """
+    return extract_numbers_with_spans_generic(
+        text, extractnumber_pt, short_scale, ordinals,
+        connectors=_NUMBER_MARKERS_PT, fraction_handler=isFractional_pt,
+        compound_handler=is_compound_number, zeros=("zero", "0"))
+
+
+def extract_numbers_pt(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers.
+
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: list of extracted numbers as floats
+    """
+    return [number for number, _, _ in
+            extract_numbers_with_spans_pt(text, short_scale, ordinals)]
+
+
 def normalize_pt(text, remove_articles):
     """ PT string normalization """
     return PortugueseNormalizer().normalize(text, remove_articles)
 
 
+def _build_datetime_lexicon_pt():
+    time_indicators = ["em", "as", "nas", "pelas", "volta", "depois", "estas",
+                       "no", "dia", "hora"]
+    days = ['segunda', 'terca', 'quarta',
+            'quinta', 'sexta', 'sabado', 'domingo']
+    months = ['janeiro', 'febreiro', 'marco', 'abril', 'maio', 'junho',
+              'julho', 'agosto', 'setembro', 'outubro', 'novembro',
+              'dezembro']
+    monthsShort = ['jan', 'feb', 'mar', 'abr', 'mai', 'jun', 'jul', 'ag',
+                   'set', 'out', 'nov', 'dec']
+    nxts = ["depois", "seguir", "seguida", "seguinte", "proxima", "proximo"]
+    prevs = ["antes", "ante", "previa", "previamente", "anterior"]
+    froms = ["partir", "em", "para", "na", "no", "daqui", "seguir",
+             "depois", "por", "proxima", "proximo", "da", "do", "de"]
+    thises = ["este", "esta", "deste", "desta", "neste", "nesta", "nesse",
+              "nessa"]
+    froms += thises
+    nexts = ["proximo", "proxima"]
+    suffix_nexts = ["seguinte", "subsequente", "seguir"]
+    lasts = ["ultimo", "ultima"]
+    suffix_lasts = ["passada", "passado", "anterior", "antes"]
+    return DatetimeLexicon(
+        days, months, monthsShort,
+        # word -> day offset
+        relative_days={"hoje": 0, "amanha": 1},
+        time_qualifiers={'manha', 'tarde', 'noite'},
+        time_indicators=time_indicators,
+        nexts=nexts,
+        suffix_nexts=suffix_nexts,
+        lasts=lasts,
+        suffix_lasts=suffix_lasts,
+        nxts=nxts,
+        prevs=prevs,
+        froms=froms,
+        thises=thises,
+        lists=set(nxts + prevs + froms + time_indicators),
+        valid_followups=set(days + months + monthsShort +
+                            ["hoje", "amanha", "ontem", "anteontem", "agora",
+                             "ja", "ante"]),
+        # with the synonyms clean_string replaces by a time qualifier
+        triggers=["manha", "tarde", "tardinha", "noite", "noitinha", "cedo",
+                  "cedinho", "anoitecer", "hoje", "ontem", "hora"],
+        trigger_phrases=[(["dia"], ["depois", "antes"]),
+                         (["meio"], ["dia"]),
+                         (nexts + lasts, ["semana", "mes", "ano"]),
+                         (["semana", "mes", "ano"],
+                          suffix_nexts + suffix_lasts),
+                         (froms, ["agora", "ja", "ante"])])
+
+
+_DATETIME_PT = _build_datetime_lexicon_pt()
+
+
+def has_datetime_pt(text):
+    """ Check if text may contain a date or a time
+
+    A cheap scan for the words extract_datetime_pt needs, text without any
+    of them has no date or time.
+
+    Args:
+        text (str): the text to check
+    Returns:
+        bool: False if extract_datetime_pt would find nothing in text
+    """
+    return _DATETIME_PT.has_datetime(text)
+
+
 def extract_datetime_pt(input_str, currentDate, default_time):
+    if input_str == "" or not currentDate:
+        return None
+
+    plan = _DATETIME_PLANS_PT.get(input_str, currentDate)
+    if plan is None:
+        return None
+    return _resolve_datetime_pt(plan, currentDate, default_time)
+
+
+def _plan_datetime_pt(input_str, anchor):
+    """ DatetimePlan of input_str, None if it has no date or time """
     def clean_string(s):
         # cleans the input string of unneeded punctuation and capitalization
         # among other things
@@ -285,46 +405,39 @@ def extract_datetime_pt(input_str, currentDate, default_time):
                 minAbs or secOffset != 0
             )
 
-    if input_str == "" or not currentDate:
-        return None
-
     found = False
     daySpecified = False
     dayOffset = False
     monthOffset = 0
     yearOffset = 0
-    dateNow = currentDate
-    today = dateNow.strftime("%w")
-    currentYear = dateNow.strftime("%Y")
     fromFlag = False
     datestr = ""
     hasYear = False
     timeQualifier = ""
 
     words = clean_string(input_str).split(" ")
-    timeQualifiersList = ['manha', 'tarde', 'noite']
-    time_indicators = ["em", "as", "nas", "pelas", "volta", "depois", "estas",
-                       "no", "dia", "hora"]
-    days = ['segunda', 'terca', 'quarta',
-            'quinta', 'sexta', 'sabado', 'domingo']
-    months = ['janeiro', 'febreiro', 'marco', 'abril', 'maio', 'junho',
-              'julho', 'agosto', 'setembro', 'outubro', 'novembro',
-              'dezembro']
-    monthsShort = ['jan', 'feb', 'mar', 'abr', 'mai', 'jun', 'jul', 'ag',
-                   'set', 'out', 'nov', 'dec']
-    nexts = ["proximo", "proxima"]
-    suffix_nexts = ["seguinte", "subsequente", "seguir"]
-    lasts = ["ultimo", "ultima"]
-    suffix_lasts = ["passada", "passado", "anterior", "antes"]
-    nxts = ["depois", "seguir", "seguida", "seguinte", "proxima", "proximo"]
-    prevs = ["antes", "ante", "previa", "previamente", "anterior"]
-    froms = ["partir", "em", "para", "na", "no", "daqui", "seguir",
-             "depois", "por", "proxima", "proximo", "da", "do", "de"]
-    thises = ["este", "esta", "deste", "desta", "neste", "nesta", "nesse",
-              "nessa"]
-    froms += thises
-    lists = nxts + prevs + froms + time_indicators
-    for idx, word in enumerate(words):
+    lexicon = _DATETIME_PT
+    timeQualifiersList = lexicon.time_qualifiers
+    time_indicators = lexicon.time_indicators
+    days = lexicon.days
+    months = lexicon.months
+    monthsShort = lexicon.months_short
+    nexts = lexicon.nexts
+    suffix_nexts = lexicon.suffix_nexts
+    lasts = lexicon.lasts
+    suffix_lasts = lexicon.suffix_lasts
+    nxts = lexicon.nxts
+    prevs = lexicon.prevs
+    froms = lexicon.froms
+    thises = lexicon.thises
+    lists = lexicon.lists
+    validFollowups = lexicon.valid_followups
+    relative_days = lexicon.relative_days
+
+    # without a trigger no word can start a date or a time, the scans
+    # below would only go through the words
+    scanned = words if lexicon.has_datetime(input_str) else []
+    for idx, word in enumerate(scanned):
         if word == "":
             continue
         wordPrevPrev = words[idx - 2] if idx > 1 else ""
@@ -340,11 +453,8 @@ def extract_datetime_pt(input_str, currentDate, default_time):
             timeQualifier = word
 
         # parse today, tomorrow, yesterday
-        elif word == "hoje" and not fromFlag:
-            dayOffset = 0
-            used += 1
-        elif word == "amanha" and not fromFlag:
-            dayOffset = 1
+        elif word in relative_days and not fromFlag:
+            dayOffset = relative_days[word]
             used += 1
         elif word == "ontem" and not fromFlag:
             dayOffset -= 1
@@ -472,8 +582,8 @@ def extract_datetime_pt(input_str, currentDate, default_time):
         # last Tuesday, etc.
         elif word in days and not fromFlag:
 
-            d = days.index(word)
-            dayOffset = (d + 1) - int(today)
+            d = lexicon.day_index[word]
+            dayOffset = (d + 1) - anchor.day_of_week()
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
@@ -501,10 +611,7 @@ def extract_datetime_pt(input_str, currentDate, default_time):
                 used += 1
         # parse 15 of July, June 20th, Feb 18, 19 of February
         elif word in months or word in monthsShort:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+            m = lexicon.month(word)
             used += 1
             datestr = months[m]
             if wordPrev and wordPrev[0].isdigit():
@@ -559,14 +666,6 @@ def extract_datetime_pt(input_str, currentDate, default_time):
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("hoje")
-        validFollowups.append("amanha")
-        validFollowups.append("ontem")
-        validFollowups.append("anteontem")
-        validFollowups.append("agora")
-        validFollowups.append("ja")
-        validFollowups.append("ante")
 
         # TODO debug word "depois" that one is failing for some reason
         if word in froms and wordNext in validFollowups:
@@ -587,8 +686,8 @@ def extract_datetime_pt(input_str, currentDate, default_time):
                   wordNextNextNext == "ontem"):
                 dayOffset -= 3
             elif wordNext in days:
-                d = days.index(wordNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 2
                 if wordNextNext == "feira":
                     used += 1
@@ -603,8 +702,8 @@ def extract_datetime_pt(input_str, currentDate, default_time):
                         used += 1
                 dayOffset += tmpOffset
             elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNextNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 3
                 if wordNextNextNext:
                     if wordNextNextNext in nxts:
@@ -641,7 +740,7 @@ def extract_datetime_pt(input_str, currentDate, default_time):
     minAbs = None
     military = False
 
-    for idx, word in enumerate(words):
+    for idx, word in enumerate(scanned):
         if word == "":
             continue
 
@@ -932,6 +1031,48 @@ def extract_datetime_pt(input_str, currentDate, default_time):
     if dayOffset is False:
         dayOffset = 0
 
+    resultStr = " ".join(words)
+    resultStr = ' '.join(resultStr.split())
+    resultStr = pt_pruning(resultStr)
+
+    return DatetimePlan(
+        resultStr,
+        date_str=datestr,
+        has_year=hasYear,
+        year_offset=yearOffset,
+        month_offset=monthOffset,
+        day_offset=dayOffset,
+        hour=hrAbs,
+        minute=minAbs,
+        hour_offset=hrOffset,
+        minute_offset=minOffset,
+        second_offset=secOffset,
+        day_specified=daySpecified,
+        time_str=timeStr)
+
+
+_DATETIME_PLANS_PT = DatetimePlans(_plan_datetime_pt)
+
+
+def _resolve_datetime_pt(plan, dateNow, default_time):
+    """ extract_datetime_pt result of plan at the anchor dateNow """
+    if plan.now:
+        return [dateNow.replace(microsecond=0), plan.leftover]
+    datestr = plan.date_str
+    hasYear = plan.has_year
+    yearOffset = plan.year_offset
+    monthOffset = plan.month_offset
+    dayOffset = plan.day_offset
+    hrAbs = plan.hour
+    minAbs = plan.minute
+    hrOffset = plan.hour_offset
+    minOffset = plan.minute_offset
+    secOffset = plan.second_offset
+    daySpecified = plan.day_specified
+    timeStr = plan.time_str
+    months = _DATETIME_PT.months
+    currentYear = dateNow.year
+
     # perform date manipulation
 
     extractedDate = dateNow
@@ -940,37 +1081,23 @@ def extract_datetime_pt(input_str, currentDate, default_time):
                                           minute=0,
                                           hour=0)
     if datestr != "":
-        en_months = ['january', 'february', 'march', 'april', 'may', 'june',
-                     'july', 'august', 'september', 'october', 'november',
-                     'december']
-        en_monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july',
-                          'aug',
-                          'sept', 'oct', 'nov', 'dec']
-        for idx, en_month in enumerate(en_months):
-            datestr = datestr.replace(months[idx], en_month)
-        for idx, en_month in enumerate(en_monthsShort):
-            datestr = datestr.replace(monthsShort[idx], en_month)
-
-        temp = datetime.strptime(datestr, "%B %d")
+        temp = parse_month_day(datestr, months)
         if not hasYear:
             temp = temp.replace(year=extractedDate.year)
             if extractedDate < temp:
-                extractedDate = extractedDate.replace(year=int(currentYear),
-                                                      month=int(
-                                                          temp.strftime(
-                                                              "%m")),
-                                                      day=int(temp.strftime(
-                                                          "%d")))
+                extractedDate = extractedDate.replace(year=currentYear,
+                                                      month=temp.month,
+                                                      day=temp.day)
             else:
                 extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")))
+                    year=currentYear + 1,
+                    month=temp.month,
+                    day=temp.day)
         else:
             extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")))
+                year=temp.year,
+                month=temp.month,
+                day=temp.day)
 
     if timeStr != "":
         temp = datetime(timeStr)
@@ -978,32 +1105,20 @@ def extract_datetime_pt(input_str, currentDate, default_time):
                                               minute=temp.strftime("%M"),
                                               second=temp.strftime("%S"))
 
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
+    timeOfDay = None
+    notBefore = None
     if (hrAbs or 0) != -1 and (minAbs or 0) != -1:
         if hrAbs is None and minAbs is None and default_time:
             hrAbs = default_time.hour
             minAbs = default_time.minute
-        extractedDate = extractedDate + relativedelta(hours=hrAbs or 0,
-                                                      minutes=minAbs or 0)
+        timeOfDay = (hrAbs or 0, minAbs or 0)
         if (hrAbs or minAbs) and datestr == "":
-            if not daySpecified and dateNow > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    resultStr = pt_pruning(resultStr)
-    return [extractedDate, resultStr]
+            if not daySpecified:
+                notBefore = dateNow
+    extractedDate = shift_datetime(extractedDate, yearOffset, monthOffset,
+                                   dayOffset, timeOfDay, hrOffset, minOffset,
+                                   secOffset, notBefore)
+    return [extractedDate, plan.leftover]
 
 
 def pt_pruning(text, symbols=True, accents=True, agressive=True):
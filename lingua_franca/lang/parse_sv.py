@@ -14,8 +14,27 @@
 # limitations under the License.
 #
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
-from .parse_common import is_numeric, look_for_fractions
+from .format_sv import NUM_STRING_SV
+from .parse_common import is_numeric, look_for_fractions, fraction_table, \
+    invert_dict, extract_numbers_with_spans_generic, is_compound_number, \
+    DatetimeLexicon, DatetimePlan, DatetimePlans, shift_datetime, \
+    parse_month_day
+
+_FRACTION_SV = fraction_table(
+    {"hel": 1, "halv": 2, "tredjedel": 3, "fjärdedel": 4, "femtedel": 5,
+     "sjättedel": 6, "sjundedel": 7, "åttondel": 8, "niondel": 9,
+     "tiondel": 10, "elftedel": 11, "tolftedel": 12, "kvart": 4},
+    {"trekvart": 3.0 / 4})
+
+# words joining the parts of a number, "två och en halv"
+_NUMBER_MARKERS_SV = ("och",)
+
+_NUMBERS_SV = dict(invert_dict(NUM_STRING_SV), ett=1, tusen=1000,
+                   miljon=1000000, miljoner=1000000)
+del _NUMBERS_SV["noll"]
+
+# words multiplying the number before them, "två hundra"
+_MULTIPLIERS_SV = ("hundra", "tusen", "miljon", "miljoner")
 
 # TODO: short_scale and ordinals don't do anything here.
 # The parameters are present in the function signature for API compatibility
@@ -56,38 +75,38 @@ def extractnumber_sv(text, short_scale=True, ordinals=False):
         elif is_fractional_sv(word):
             val = is_fractional_sv(word)
         else:
-            if word == "en":
-                val = 1
-            if word == "ett":
-                val = 1
-            elif word == "två":
-                val = 2
-            elif word == "tre":
-                val = 3
-            elif word == "fyra":
-                val = 4
-            elif word == "fem":
-                val = 5
-            elif word == "sex":
-                val = 6
-            elif word == "sju":
-                val = 7
-            elif word == "åtta":
-                val = 8
-            elif word == "nio":
-                val = 9
-            elif word == "tio":
-                val = 10
-            if val:
-                if count < (len(aWords) - 1):
-                    wordNext = aWords[count + 1]
+            val = _NUMBERS_SV.get(word, False)
+            # "tjugo två", "två hundra"
+            while val and count + 1 < len(aWords):
+                part = _NUMBERS_SV.get(aWords[count + 1])
+                if not part:
+                    break
+                if aWords[count + 1] in _MULTIPLIERS_SV:
+                    combined = val * part
                 else:
-                    wordNext = ""
-                valNext = is_fractional_sv(wordNext)
+                    combined = val + part
+                if not is_compound_number(val, part, combined):
+                    break
+                val = combined
+                aWords[count] = ""
+                count += 1
+        # "en halv", "3 fjärdedelar"
+        if val and (is_numeric(word) or word in _NUMBERS_SV):
+            if count < (len(aWords) - 1):
+                wordNext = aWords[count + 1]
+            else:
+                wordNext = ""
+            valNext = is_fractional_sv(wordNext)
+
+            if valNext:
+                val = val * valNext
+                aWords[count + 1] = ""
 
-                if valNext:
-                    val = val * valNext
-                    aWords[count + 1] = ""
+        if and_pass and word in _MULTIPLIERS_SV:
+            # a scale multiplies the number right before it only, "fem
+            # katter och tusen kronor"
+            val = valPreAnd
+            break
 
         if not val:
             # look for fractions like "2/3"
@@ -125,7 +144,61 @@ def extractnumber_sv(text, short_scale=True, ordinals=False):
     return val or False
 
 
+def _build_datetime_lexicon_sv():
+    days = ['måndag', 'tisdag', 'onsdag', 'torsdag',
+            'fredag', 'lördag', 'söndag']
+    months = ['januari', 'februari', 'mars', 'april', 'maj', 'juni',
+              'juli', 'augusti', 'september', 'oktober', 'november',
+              'december']
+    monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
+                   'sept', 'oct', 'nov', 'dec']
+    timeQualifiers = {'morgon', 'förmiddag', 'eftermiddag', 'kväll'}
+    markers = ['på', 'i', 'den här', 'kring', 'efter']
+    return DatetimeLexicon(
+        days, months, monthsShort,
+        # word -> day offset
+        relative_days={"idag": 0, "imorgon": 1},
+        time_qualifiers=timeQualifiers,
+        markers=markers,
+        valid_followups=set(days + months + monthsShort +
+                            ["idag", "imorgon", "nästa", "förra", "nu"]),
+        # any word after a marker is read as a relative time
+        triggers=list(timeQualifiers) + markers + ["idag", "middag",
+                                                   "midnatt"],
+        trigger_phrases=[(["nästa", "förra"], ["vecka", "veckor", "månad",
+                                               "år"]),
+                         (["från"], ["nästa", "förra", "nu"])])
+
+
+_DATETIME_SV = _build_datetime_lexicon_sv()
+
+
+def has_datetime_sv(text):
+    """ Check if text may contain a date or a time
+
+    A cheap scan for the words extract_datetime_sv needs, text without any
+    of them has no date or time.
+
+    Args:
+        text (str): the text to check
+    Returns:
+        bool: False if extract_datetime_sv would find nothing in text
+    """
+    return _DATETIME_SV.has_datetime(text)
+
+
 def extract_datetime_sv(string, currentDate, default_time):
+    if string == "" or not currentDate:
+        return None
+
+    plan = _DATETIME_PLANS_SV.get(string, currentDate)
+    if plan is None:
+        return None
+    return _resolve_datetime_sv(plan, currentDate, default_time)
+
+
+def _plan_datetime_sv(string, anchor):
+    """ DatetimePlan of string, None if it has no date or time """
     def clean_string(s):
         """
             cleans the input string of unneeded punctuation and capitalization
@@ -156,35 +229,31 @@ def extract_datetime_sv(string, currentDate, default_time):
                 minAbs or secOffset != 0
             )
 
-    if string == "" or not currentDate:
-        return None
-
     found = False
     daySpecified = False
     dayOffset = False
     monthOffset = 0
     yearOffset = 0
-    dateNow = currentDate
-    today = dateNow.strftime("%w")
-    currentYear = dateNow.strftime("%Y")
     fromFlag = False
     datestr = ""
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersList = ['morgon', 'förmiddag', 'eftermiddag', 'kväll']
-    markers = ['på', 'i', 'den här', 'kring', 'efter']
-    days = ['måndag', 'tisdag', 'onsdag', 'torsdag',
-            'fredag', 'lördag', 'söndag']
-    months = ['januari', 'februari', 'mars', 'april', 'maj', 'juni',
-              'juli', 'augusti', 'september', 'oktober', 'november',
-              'december']
-    monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
-                   'sept', 'oct', 'nov', 'dec']
+    lexicon = _DATETIME_SV
+    timeQualifiersList = lexicon.time_qualifiers
+    markers = lexicon.markers
+    days = lexicon.days
+    months = lexicon.months
+    monthsShort = lexicon.months_short
+    validFollowups = lexicon.valid_followups
+    relative_days = lexicon.relative_days
 
     words = clean_string(string)
+    # without a trigger no word can start a date or a time, the scans
+    # below would only go through the words
+    scanned = words if lexicon.has_datetime(string) else []
 
-    for idx, word in enumerate(words):
+    for idx, word in enumerate(scanned):
         if word == "":
             continue
         wordPrevPrev = words[idx - 2] if idx > 1 else ""
@@ -200,11 +269,8 @@ def extract_datetime_sv(string, currentDate, default_time):
         if word in timeQualifiersList:
             timeQualifier = word
             # parse today, tomorrow, day after tomorrow
-        elif word == "idag" and not fromFlag:
-            dayOffset = 0
-            used += 1
-        elif word == "imorgon" and not fromFlag:
-            dayOffset = 1
+        elif word in relative_days and not fromFlag:
+            dayOffset = relative_days[word]
             used += 1
         elif word == "morgondagen" or word == "morgondagens" and not fromFlag:
             dayOffset = 1
@@ -262,8 +328,8 @@ def extract_datetime_sv(string, currentDate, default_time):
                 # parse Monday, Tuesday, etc., and next Monday,
                 # last Tuesday, etc.
         elif word in days and not fromFlag:
-            d = days.index(word)
-            dayOffset = (d + 1) - int(today)
+            d = lexicon.day_index[word]
+            dayOffset = (d + 1) - anchor.day_of_week()
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
@@ -277,10 +343,7 @@ def extract_datetime_sv(string, currentDate, default_time):
                 start -= 1
         # parse 15 of July, June 20th, Feb 18, 19 of February
         elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+            m = lexicon.month(word)
             used += 1
             datestr = months[m]
             if wordPrev and (wordPrev[0].isdigit() or
@@ -311,27 +374,21 @@ def extract_datetime_sv(string, currentDate, default_time):
                     hasYear = False
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("idag")
-        validFollowups.append("imorgon")
-        validFollowups.append("nästa")
-        validFollowups.append("förra")
-        validFollowups.append("nu")
         if (word == "från" or word == "efter") and wordNext in validFollowups:
             used = 2
             fromFlag = True
             if wordNext == "imorgon":
                 dayOffset += 1
             elif wordNext in days:
-                d = days.index(wordNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
             elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
-                tmpOffset = (d + 1) - int(today)
+                d = lexicon.day_index[wordNextNext]
+                tmpOffset = (d + 1) - anchor.day_of_week()
                 used = 3
                 if wordNext == "nästa":
                     tmpOffset += 7
@@ -363,7 +420,7 @@ def extract_datetime_sv(string, currentDate, default_time):
     hrAbs = None
     minAbs = None
 
-    for idx, word in enumerate(words):
+    for idx, word in enumerate(scanned):
         if word == "":
             continue
 
@@ -659,6 +716,51 @@ def extract_datetime_sv(string, currentDate, default_time):
     if dayOffset is False:
         dayOffset = 0
 
+    for idx, word in enumerate(words):
+        if words[idx] == "and" and words[idx - 1] == "" and words[
+                idx + 1] == "":
+            words[idx] = ""
+
+    resultStr = " ".join(words)
+    resultStr = ' '.join(resultStr.split())
+
+    return DatetimePlan(
+        resultStr,
+        date_str=datestr,
+        has_year=hasYear,
+        year_offset=yearOffset,
+        month_offset=monthOffset,
+        day_offset=dayOffset,
+        hour=hrAbs,
+        minute=minAbs,
+        hour_offset=hrOffset,
+        minute_offset=minOffset,
+        second_offset=secOffset,
+        day_specified=daySpecified,
+        time_str=timeStr)
+
+
+_DATETIME_PLANS_SV = DatetimePlans(_plan_datetime_sv)
+
+
+def _resolve_datetime_sv(plan, dateNow, default_time):
+    """ extract_datetime_sv result of plan at the anchor dateNow """
+    if plan.now:
+        return [dateNow.replace(microsecond=0), plan.leftover]
+    datestr = plan.date_str
+    hasYear = plan.has_year
+    yearOffset = plan.year_offset
+    monthOffset = plan.month_offset
+    dayOffset = plan.day_offset
+    hrAbs = plan.hour
+    minAbs = plan.minute
+    hrOffset = plan.hour_offset
+    minOffset = plan.minute_offset
+    secOffset = plan.second_offset
+    daySpecified = plan.day_specified
+    timeStr = plan.time_str
+    currentYear = dateNow.year
+
     # perform date manipulation
 
     extractedDate = dateNow
@@ -667,26 +769,23 @@ def extract_datetime_sv(string, currentDate, default_time):
                                           minute=0,
                                           hour=0)
     if datestr != "":
-        temp = datetime.strptime(datestr, "%B %d")
+        temp = parse_month_day(datestr, _DATETIME_SV.months)
         if not hasYear:
             temp = temp.replace(year=extractedDate.year)
             if extractedDate < temp:
-                extractedDate = extractedDate.replace(year=int(currentYear),
-                                                      month=int(
-                                                          temp.strftime(
-                                                              "%m")),
-                                                      day=int(temp.strftime(
-                                                          "%d")))
+                extractedDate = extractedDate.replace(year=currentYear,
+                                                      month=temp.month,
+                                                      day=temp.day)
             else:
                 extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")))
+                    year=currentYear + 1,
+                    month=temp.month,
+                    day=temp.day)
         else:
             extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")))
+                year=temp.year,
+                month=temp.month,
+                day=temp.day)
 
     if timeStr != "":
         temp = datetime(timeStr)
@@ -694,36 +793,21 @@ def extract_datetime_sv(string, currentDate, default_time):
                                               minute=temp.strftime("%M"),
                                               second=temp.strftime("%S"))
 
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
 
     if hrAbs is None and minAbs is None and default_time:
         hrAbs = default_time.hour
         minAbs = default_time.minute
+    timeOfDay = None
+    notBefore = None
     if hrAbs != -1 and minAbs != -1:
-        extractedDate = extractedDate + relativedelta(hours=hrAbs or 0,
-                                                      minutes=minAbs or 0)
+        timeOfDay = (hrAbs or 0, minAbs or 0)
         if (hrAbs or minAbs) and datestr == "":
-            if not daySpecified and dateNow > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-    for idx, word in enumerate(words):
-        if words[idx] == "and" and words[idx - 1] == "" and words[
-                idx + 1] == "":
-            words[idx] = ""
-
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    return [extractedDate, resultStr]
+            if not daySpecified:
+                notBefore = dateNow
+    extractedDate = shift_datetime(extractedDate, yearOffset, monthOffset,
+                                   dayOffset, timeOfDay, hrOffset, minOffset,
+                                   secOffset, notBefore)
+    return [extractedDate, plan.leftover]
 
 
 def is_fractional_sv(input_str):
@@ -745,17 +829,47 @@ def is_fractional_sv(input_str):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "halva"
 
-    aFrac = ["hel", "halv", "tredjedel", "fjärdedel", "femtedel", "sjättedel",
-             "sjundedel", "åttondel", "niondel", "tiondel", "elftedel",
-             "tolftedel"]
-    if input_str.lower() in aFrac:
-        return 1.0 / (aFrac.index(input_str) + 1)
-    if input_str == "kvart":
-        return 1.0 / 4
-    if input_str == "trekvart":
-        return 3.0 / 4
-
-    return False
+    return _FRACTION_SV.get(input_str.lower(), False)
+
+
+def extract_numbers_with_spans_sv(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers, with the
+        characters each of them was read from.
+
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: (number, start, end) for each number, with text[start:end]
+              the words it was read from
+    """
+    return extract_numbers_with_spans_generic(
+        text, extractnumber_sv, short_scale, ordinals,
+        connectors=_NUMBER_MARKERS_SV, fraction_handler=is_fractional_sv,
+        compound_handler=is_compound_number)
+
+
+def extract_numbers_sv(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers.
+
+    Args:
+        text (str): the string to extract a number from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: list of extracted numbers as floats
+    """
+    return [number for number, _, _ in
+            extract_numbers_with_spans_sv(text, short_scale, ordinals)]
 
 
 def normalize_sv(text, remove_articles):
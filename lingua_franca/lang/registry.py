@@ -0,0 +1,219 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Registry of the languages supported by lingua_franca.
+
+Each primary language code maps to a LanguageProvider, which knows which
+parse_xx / format_xx module implements each public function.  The modules
+are only imported the first time one of their functions is requested, so a
+process only pays for the languages it actually uses.
+"""
+import sys
+from importlib import import_module
+
+_PACKAGE = "lingua_franca.lang."
+
+# Default implementation of each public function, "{}" being replaced by
+# the primary language code.
+_FUNCTION_NAMES = {
+    "extract_number": ("parse_{}", "extractnumber_{}"),
+    "extract_numbers": ("parse_{}", "extract_numbers_{}"),
+    "extract_numbers_with_spans": ("parse_{}",
+                                   "extract_numbers_with_spans_{}"),
+    "extract_duration": ("parse_{}", "extract_duration_{}"),
+    "extract_datetime": ("parse_{}", "extract_datetime_{}"),
+    "has_datetime": ("parse_{}", "has_datetime_{}"),
+    "normalize": ("parse_{}", "normalize_{}"),
+    "get_gender": ("parse_{}", "get_gender_{}"),
+    "nice_number": ("format_{}", "nice_number_{}"),
+    "nice_time": ("format_{}", "nice_time_{}"),
+    "pronounce_number": ("format_{}", "pronounce_number_{}"),
+}
+
+_PARSE_AND_FORMAT = ("extract_number", "extract_numbers",
+                     "extract_numbers_with_spans", "extract_datetime",
+                     "has_datetime", "normalize", "nice_number", "nice_time",
+                     "pronounce_number")
+
+# Public functions implemented by each language
+_SUPPORTED_FUNCTIONS = {
+    "cs": _PARSE_AND_FORMAT + ("extract_duration",),
+    "da": _PARSE_AND_FORMAT,
+    "de": _PARSE_AND_FORMAT,
+    "en": _PARSE_AND_FORMAT + ("extract_duration",),
+    "es": _PARSE_AND_FORMAT + ("get_gender",),
+    "fr": _PARSE_AND_FORMAT,
+    "hu": ("nice_number", "nice_time", "pronounce_number"),
+    "it": _PARSE_AND_FORMAT + ("get_gender",),
+    "nl": _PARSE_AND_FORMAT,
+    "pt": _PARSE_AND_FORMAT + ("get_gender",),
+    "sv": _PARSE_AND_FORMAT,
+}
+
+# Implementations that don't follow the naming scheme above, the
+# Normalizer subclasses used by the languages that have one, and the
+# internals lingua_franca.document shares between the extractors:
+#   number_markers: words joining the parts of a number
+#   extract_number_tokens, extract_numbers_tokens: the extractors on the
+#       Token list of the text, lowercased for extract_number
+_OVERRIDES = {
+    "cs": {"normalizer": ("parse_cs", "CzechNormalizer"),
+           "number_markers": ("parse_cs", "_NUMBER_MARKERS_CS"),
+           "extract_number_tokens": ("parse_cs",
+                                     "_extract_number_with_text_cs"),
+           "extract_numbers_tokens": ("parse_cs",
+                                      "_extract_numbers_with_text_cs")},
+    "da": {"number_markers": ("parse_da", "_NUMBER_MARKERS_DA")},
+    "de": {"number_markers": ("parse_de", "_NUMBER_MARKERS_DE")},
+    "en": {"normalizer": ("parse_en", "EnglishNormalizer"),
+           "number_markers": ("parse_en", "_NUMBER_MARKERS_EN"),
+           "extract_number_tokens": ("parse_en",
+                                     "_extract_number_with_text_en"),
+           "extract_numbers_tokens": ("parse_en",
+                                      "_extract_numbers_with_text_en")},
+    # spanish follows the portuguese gender rules
+    "es": {"get_gender": ("parse_pt", "get_gender_pt"),
+           "number_markers": ("parse_es", "_NUMBER_MARKERS_ES")},
+    "fr": {"number_markers": ("parse_fr", "_NUMBER_MARKERS_FR")},
+    "it": {"number_markers": ("parse_it", "_NUMBER_MARKERS_IT")},
+    "nl": {"number_markers": ("parse_nl", "_NUMBER_MARKERS_NL")},
+    "pt": {"normalizer": ("parse_pt", "PortugueseNormalizer"),
+           "number_markers": ("parse_pt", "_NUMBER_MARKERS_PT")},
+    "sv": {"number_markers": ("parse_sv", "_NUMBER_MARKERS_SV")},
+}
+
+
+class LanguageProvider:
+    """
+    Lazily loaded implementation of lingua_franca for a single language.
+
+    The parse_xx / format_xx modules are imported on first use, and each
+    resolved function is kept so later lookups are a single dict access.
+
+    Args:
+        code (str): primary language code, e.g. "en"
+        functions (dict): public function name -> (module name, attribute)
+    """
+
+    def __init__(self, code, functions):
+        self.code = code
+        self._specs = functions
+        self._functions = {}
+
+    def supports(self, name):
+        """ Check if the language implements the public function ``name`` """
+        return name in self._specs
+
+    def get(self, name):
+        """
+        Get the language specific implementation of a public function.
+
+        Args:
+            name (str): public function name, e.g. "extract_number"
+
+        Returns:
+            function or None if the language doesn't implement it
+        """
+        func = self._functions.get(name)
+        if func is None and name in self._specs:
+            module_name, attr = self._specs[name]
+            func = getattr(import_module(_PACKAGE + module_name), attr)
+            self._functions[name] = func
+        return func
+
+    @property
+    def modules(self):
+        """ Names of the modules implementing this language """
+        return sorted({_PACKAGE + module for module, _ in
+                       self._specs.values()})
+
+    def load(self):
+        """ Import the language modules and resolve all its functions """
+        for name in self._specs:
+            self.get(name)
+
+    def unload(self):
+        """
+        Forget the resolved functions and remove the language's own modules
+        (parse_xx, format_xx, common_data_xx) from sys.modules, so they
+        can be garbage collected once no one else references them.
+        """
+        self._functions.clear()
+        package = sys.modules[_PACKAGE[:-1]]
+        suffix = "_" + self.code
+        for module in [m for m in sys.modules if m.startswith(_PACKAGE)
+                       and m.endswith(suffix)]:
+            del sys.modules[module]
+            name = module[len(_PACKAGE):]
+            if hasattr(package, name):
+                delattr(package, name)
+
+    def __repr__(self):
+        return "{n}({c})".format(n=self.__class__.__name__, c=self.code)
+
+
+def _build_provider(code):
+    functions = {}
+    for name in _SUPPORTED_FUNCTIONS[code]:
+        module, attr = _FUNCTION_NAMES[name]
+        functions[name] = (module.format(code), attr.format(code))
+    functions.update(_OVERRIDES.get(code, {}))
+    return LanguageProvider(code, functions)
+
+
+_PROVIDERS = {code: _build_provider(code) for code in _SUPPORTED_FUNCTIONS}
+
+
+def get_provider(lang_code):
+    """
+    Get the provider for a primary language code.
+
+    Args:
+        lang_code (str): primary language code, e.g. "en"
+
+    Returns:
+        LanguageProvider or None if the language is not supported
+    """
+    return _PROVIDERS.get(lang_code)
+
+
+def get_function(name, lang_code):
+    """
+    Get the implementation of a public function for a language.
+
+    Args:
+        name (str): public function name, e.g. "extract_number"
+        lang_code (str): primary language code, e.g. "en"
+
+    Returns:
+        function or None if not available for that language
+    """
+    provider = _PROVIDERS.get(lang_code)
+    return provider.get(name) if provider else None
+
+
+def supported_languages(name=None):
+    """
+    List the languages implementing a public function.
+
+    Args:
+        name (str, optional): public function name, None for all languages
+
+    Returns:
+        [str]: sorted primary language codes
+    """
+    return sorted(code for code, provider in _PROVIDERS.items()
+                  if name is None or provider.supports(name))
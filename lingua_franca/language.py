@@ -0,0 +1,335 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import lingua_franca.format
+import lingua_franca.parse
+from lingua_franca.document import Document
+from lingua_franca.format import date_time_format, word_translations, \
+    _PRONOUNCE_NUMBER_OPTIONS
+from lingua_franca.lang import get_full_lang_code
+from lingua_franca.pack import unload_packs
+from lingua_franca.lang.registry import get_provider
+from lingua_franca.time import now_local
+
+
+class Language:
+    """
+    Pre-resolved handle for a single language.
+
+    The lingua_franca.parse and lingua_franca.format functions resolve the
+    language code and look up the implementation on every call.  A Language
+    does that once, when it is created, and keeps the language modules, the
+    date/time formatting config and the normalizer around, so its methods
+    call straight into the language implementation.
+
+    Functions not implemented by the language fall back to the generic
+    lingua_franca.parse / lingua_franca.format behavior.
+
+    Use lingua_franca.get_language() rather than creating these directly.
+
+    Args:
+        lang (str): BCP-47 language code, e.g. "en-us", None for default
+    """
+
+    def __init__(self, lang=None):
+        self.full_code = get_full_lang_code(lang)
+        self.code = self.full_code.split("-")[0]
+        self._provider = get_provider(self.code)
+
+        resolve = self._provider.get if self._provider else lambda name: None
+        self._extract_number = resolve("extract_number")
+        self._extract_numbers = resolve("extract_numbers")
+        self._extract_numbers_with_spans = resolve(
+            "extract_numbers_with_spans")
+        self._extract_duration = resolve("extract_duration")
+        self._extract_datetime = resolve("extract_datetime")
+        self._has_datetime = resolve("has_datetime")
+        self._normalize = resolve("normalize")
+        self._get_gender = resolve("get_gender")
+        self._nice_number = resolve("nice_number")
+        self._nice_time = resolve("nice_time")
+        self._pronounce_number = resolve("pronounce_number")
+        self._pronounce_options = _PRONOUNCE_NUMBER_OPTIONS.get(self.code, ())
+
+        normalizer = resolve("normalizer")
+        self._normalizer = normalizer() if normalizer else None
+
+        # used by lingua_franca.document
+        self._number_markers = resolve("number_markers") or ()
+        self._extract_number_tokens = resolve("extract_number_tokens")
+        self._extract_numbers_tokens = resolve("extract_numbers_tokens")
+
+        date_time_format.cache(self.full_code)
+        self._date_time_config = date_time_format.lang_config[self.full_code]
+
+    def __repr__(self):
+        return "{n}({c})".format(n=self.__class__.__name__, c=self.full_code)
+
+    def translate_word(self, name):
+        """ Get the translation of a .word resource
+
+        Args:
+            name (str): Word name. Returned if not translated.
+
+        Returns:
+            str: translated version of resource name
+        """
+        return word_translations.translate(name, self.full_code)
+
+    # parsing
+
+    def analyze(self, text):
+        """ See lingua_franca.analyze """
+        return Document(text, self)
+
+    def _analyzed(self, document):
+        """ document, or a new analysis of its text in this language """
+        if document.language is self:
+            return document
+        return self.analyze(document.text)
+
+    def extract_number(self, text, short_scale=True, ordinals=False):
+        """ See lingua_franca.parse.extract_number """
+        if isinstance(text, Document):
+            return self._analyzed(text).extract_number(short_scale, ordinals)
+        if not self._extract_number:
+            return lingua_franca.parse.extract_number(
+                text, short_scale, ordinals, lang=self.full_code)
+        return self._extract_number(text, short_scale=short_scale,
+                                    ordinals=ordinals)
+
+    def extract_numbers(self, text, short_scale=True, ordinals=False):
+        """ See lingua_franca.parse.extract_numbers """
+        if isinstance(text, Document):
+            return self._analyzed(text).extract_numbers(short_scale,
+                                                        ordinals)
+        if not self._extract_numbers:
+            return lingua_franca.parse.extract_numbers(
+                text, short_scale, ordinals, lang=self.full_code)
+        return self._extract_numbers(text, short_scale, ordinals)
+
+    def extract_numbers_with_spans(self, text, short_scale=True,
+                                   ordinals=False):
+        """ See lingua_franca.parse.extract_numbers_with_spans """
+        if isinstance(text, Document):
+            document = self._analyzed(text)
+            spans = document.number_spans(short_scale, ordinals)
+            if spans is None:
+                return lingua_franca.parse.extract_numbers_with_spans(
+                    document.text, short_scale, ordinals, self.full_code)
+            return [(number, start, end, document.text[start:end])
+                    for number, start, end in spans]
+        if not self._extract_numbers_with_spans:
+            return lingua_franca.parse.extract_numbers_with_spans(
+                text, short_scale, ordinals, lang=self.full_code)
+        return [(number, start, end, text[start:end]) for number, start, end
+                in self._extract_numbers_with_spans(text, short_scale,
+                                                    ordinals)]
+
+    def extract_duration(self, text):
+        """ See lingua_franca.parse.extract_duration """
+        if isinstance(text, Document):
+            return self._analyzed(text).extract_duration()
+        if not self._extract_duration:
+            return lingua_franca.parse.extract_duration(text,
+                                                        lang=self.full_code)
+        return self._extract_duration(text)
+
+    def extract_datetime(self, text, anchorDate=None, default_time=None):
+        """ See lingua_franca.parse.extract_datetime """
+        if isinstance(text, Document):
+            return self._analyzed(text).extract_datetime(anchorDate,
+                                                         default_time)
+        if not self._extract_datetime:
+            return lingua_franca.parse.extract_datetime(
+                text, anchorDate, lang=self.full_code,
+                default_time=default_time)
+        return self._extract_datetime(text, anchorDate or now_local(),
+                                      default_time)
+
+    def has_datetime(self, text):
+        """ See lingua_franca.parse.has_datetime """
+        if isinstance(text, Document):
+            return self._analyzed(text).has_datetime()
+        if not self._has_datetime:
+            return lingua_franca.parse.has_datetime(text,
+                                                    lang=self.full_code)
+        return self._has_datetime(text)
+
+    def normalize(self, text, remove_articles=True):
+        """ See lingua_franca.parse.normalize """
+        if isinstance(text, Document):
+            return self._analyzed(text).normalize(remove_articles)
+        if self._normalizer:
+            return self._normalizer.normalize(text, remove_articles)
+        if not self._normalize:
+            return lingua_franca.parse.normalize(
+                text, lang=self.full_code, remove_articles=remove_articles)
+        return self._normalize(text, remove_articles)
+
+    def get_gender(self, word, context=""):
+        """ See lingua_franca.parse.get_gender """
+        if not self._get_gender:
+            return lingua_franca.parse.get_gender(word, context,
+                                                  lang=self.full_code)
+        return self._get_gender(word, context)
+
+    # formatting
+
+    def nice_number(self, number, speech=True, denominators=None):
+        """ See lingua_franca.format.nice_number """
+        if not self._nice_number:
+            return lingua_franca.format.nice_number(
+                number, self.full_code, speech, denominators)
+        return self._nice_number(number, speech, denominators)
+
+    def nice_time(self, dt, speech=True, use_24hour=False, use_ampm=False):
+        """ See lingua_franca.format.nice_time """
+        if not self._nice_time:
+            return lingua_franca.format.nice_time(
+                dt, self.full_code, speech, use_24hour, use_ampm)
+        return self._nice_time(dt, speech, use_24hour, use_ampm)
+
+    def pronounce_number(self, number, places=2, short_scale=True,
+                         scientific=False, ordinals=False):
+        """ See lingua_franca.format.pronounce_number """
+        if not self._pronounce_number:
+            return lingua_franca.format.pronounce_number(
+                number, self.full_code, places, short_scale, scientific,
+                ordinals)
+        options = {"short_scale": short_scale, "scientific": scientific,
+                   "ordinals": ordinals}
+        kwargs = {option: options[option]
+                  for option in self._pronounce_options}
+        return self._pronounce_number(number, places=places, **kwargs)
+
+    def nice_date(self, dt, now=None):
+        """ See lingua_franca.format.nice_date """
+        return date_time_format.date_format(dt, self.full_code, now)
+
+    def nice_date_time(self, dt, now=None, use_24hour=False, use_ampm=False):
+        """ See lingua_franca.format.nice_date_time """
+        date_str = date_time_format.date_format(dt, self.full_code, now)
+        time_str = self.nice_time(dt, use_24hour=use_24hour,
+                                  use_ampm=use_ampm)
+        return self._date_time_config['date_time_format']['date_time'].format(
+            formatted_date=date_str, formatted_time=time_str)
+
+    def nice_year(self, dt, bc=False):
+        """ See lingua_franca.format.nice_year """
+        return date_time_format.year_format(dt, self.full_code, bc)
+
+    def nice_duration(self, duration, speech=True):
+        """ See lingua_franca.format.nice_duration """
+        return lingua_franca.format._nice_duration(
+            duration, speech, self.pronounce_number, self.translate_word)
+
+    def join_list(self, items, connector, sep=None):
+        """ See lingua_franca.format.join_list """
+        return lingua_franca.format._join_list(items, connector, sep,
+                                               self.translate_word)
+
+
+_LANGUAGES = {}
+
+
+def get_language(lang=None):
+    """ Get the pre-resolved handle for a language
+
+    Handles are created on first use and shared afterwards.
+
+    Args:
+        lang (str, optional): BCP-47 language code, None for the active one
+
+    Returns:
+        Language: the handle for that language
+    """
+    full_code = get_full_lang_code(lang)
+    language = _LANGUAGES.get(full_code)
+    if language is None:
+        language = Language(full_code)
+        _LANGUAGES[full_code] = language
+    return language
+
+
+def analyze(text, lang=None):
+    """ Analyze a text once for all the extractors
+
+    The returned Document can be given instead of the text to
+    lingua_franca.parse.extract_number, extract_numbers, extract_duration,
+    extract_datetime and normalize, and to the same Language methods.  The
+    text is lowercased and tokenized once, and the results of each extractor
+    are kept, instead of preprocessing the text again for every call.
+
+    Args:
+        text (str): the text to analyze
+        lang (str, optional): BCP-47 language code, None for the active one
+
+    Returns:
+        Document: the analyzed text
+    """
+    return get_language(lang).analyze(text)
+
+
+def load_languages(langs):
+    """ Load everything needed by a list of languages ahead of time
+
+    Imports the language modules and builds the per-language state (date
+    and time formatting config, normalizer, .word translations), so the
+    first request in that language doesn't pay for it.  In pre-fork
+    servers, call this before forking so the workers share that state.
+
+    Args:
+        langs ([str]): BCP-47 language codes, e.g. ["en-us", "de-de"]
+
+    Returns:
+        [Language]: the handles of the languages
+    """
+    languages = []
+    for lang in langs:
+        language = get_language(lang)
+        if language._provider:
+            language._provider.load()
+        word_translations.cache(language.full_code)
+        languages.append(language)
+    return languages
+
+
+def unload_language(lang):
+    """ Free the caches of a language that is no longer used
+
+    The handle, the date and time formatting config, the .word translations,
+    the language pack and the cached resource paths of the language are
+    dropped.  Once no other variant of the language is loaded (e.g. en-au
+    when unloading en-us), its modules are unloaded as well.  Everything is
+    loaded again if the language is used afterwards.
+
+    Args:
+        lang (str): BCP-47 language code, e.g. "en-us"
+    """
+    from lingua_franca import resource_cache
+
+    full_code = get_full_lang_code(lang)
+    language = _LANGUAGES.pop(full_code, None)
+    date_time_format.lang_config.pop(full_code, None)
+    word_translations.reload(full_code)
+    unload_packs(full_code)
+    resource_cache.discard("text/" + full_code + "/")
+
+    code = full_code.split("-")[0]
+    provider = get_provider(code)
+    if provider and not any(other.code == code
+                            for other in _LANGUAGES.values()):
+        provider.unload()
@@ -0,0 +1,255 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Compiled language packs.
+
+The resources of a language are spread over many small files in
+res/text/<lang>/: date_time.json, normalize.json and a dozen .word files.
+Running
+
+    python -m lingua_franca.pack [lang ...]
+
+compiles each of these directories into a single res/packs/<lang>.lfpack
+file, already parsed, which is then loaded with a single mmap instead of
+opening and parsing every file.  Packs only stand in for the packaged
+resources: overrides in ~/.mycroft and /opt/mycroft still take precedence.
+
+Packs are build artifacts.  The header of a pack holds a fingerprint of the
+names, sizes and modification times of the files it was compiled from: a
+pack whose files have changed since, or that was written by another
+PACK_VERSION, is ignored and the files are used until it is rebuilt.
+
+The payload is stored with marshal, which only holds plain data and runs no
+code on load, unlike pickle, and is read straight from the mmap.
+"""
+import argparse
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import struct
+from os.path import join, dirname, normpath
+
+PACK_MAGIC = b"LFPACK"
+PACK_VERSION = 2
+PACK_EXTENSION = ".lfpack"
+# magic, version, sha1 fingerprint of the source files
+_HEADER = struct.Struct("<6sH20s")
+
+RES_DIR = join(dirname(__file__), "res")
+TEXT_DIR = join(RES_DIR, "text")
+PACK_DIR = join(RES_DIR, "packs")
+
+_packs = {}
+
+
+def read_word_file(filename):
+    """ Get the first non-comment line of a .word file
+
+    Args:
+        filename (str): path of the .word file
+    Returns:
+        str: the word, or None if there is none or the file can't be read
+    """
+    try:
+        with open(filename, 'r', encoding='utf8') as f:
+            for line in f:
+                word = line.strip()
+                if word.startswith("#"):
+                    continue  # skip comment lines
+                return word
+    except Exception:
+        pass
+    return None
+
+
+def _source_files(lang):
+    """ Get the names of the packaged resource files of a language """
+    return sorted(filename for filename in os.listdir(join(TEXT_DIR, lang))
+                  if filename.endswith((".json", ".word")) and
+                  not filename.endswith("_test.json"))
+
+
+def source_fingerprint(lang):
+    """ Fingerprint the packaged resource files of a language
+
+    Only the names, sizes and modification times of the files are hashed, so
+    checking a pack costs a stat per file rather than reading them.
+
+    Args:
+        lang (str): full language code, e.g. "en-us"
+    Returns:
+        bytes: the sha1 digest
+    """
+    digest = hashlib.sha1()
+    lang_dir = join(TEXT_DIR, lang)
+    for filename in _source_files(lang):
+        stat = os.stat(join(lang_dir, filename))
+        digest.update("{}\0{}\0{}\n".format(
+            filename, stat.st_size, stat.st_mtime_ns).encode("utf8"))
+    return digest.digest()
+
+
+def compile_language(lang):
+    """ Read and parse the packaged resources of a language
+
+    Args:
+        lang (str): full language code, e.g. "en-us"
+    Returns:
+        dict: the pack payload, {"lang": lang, "files": {filename: data}}
+              with the parsed .json files and the words of the .word files
+    """
+    files = {}
+    lang_dir = join(TEXT_DIR, lang)
+    for filename in _source_files(lang):
+        path = join(lang_dir, filename)
+        if filename.endswith(".json"):
+            with open(path, 'r', encoding='utf8') as f:
+                files[filename] = json.load(f)
+        elif filename.endswith(".word"):
+            files[filename] = read_word_file(path)
+    return {"lang": lang, "files": files}
+
+
+def build_pack(lang, pack_dir=None):
+    """ Compile the packaged resources of a language into a pack file
+
+    Args:
+        lang (str): full language code, e.g. "en-us"
+        pack_dir (str, optional): output directory, default res/packs
+    Returns:
+        str: path of the pack file
+    """
+    pack_dir = pack_dir or PACK_DIR
+    os.makedirs(pack_dir, exist_ok=True)
+    path = join(pack_dir, lang + PACK_EXTENSION)
+    fingerprint = source_fingerprint(lang)
+    payload = marshal.dumps(compile_language(lang))
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, fingerprint))
+        f.write(payload)
+    os.replace(tmp_path, path)
+    _packs.pop(lang, None)
+    return path
+
+
+def build_packs(langs=None, pack_dir=None):
+    """ Build the packs of several languages, all of them by default
+
+    Returns:
+        [str]: paths of the pack files
+    """
+    langs = langs or sorted(os.listdir(TEXT_DIR))
+    return [build_pack(lang, pack_dir) for lang in langs]
+
+
+def _read_pack(lang, path):
+    try:
+        with open(path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            magic, version, fingerprint = _HEADER.unpack_from(data)
+            if magic != PACK_MAGIC or version != PACK_VERSION or \
+                    fingerprint != source_fingerprint(lang):
+                return None
+            with memoryview(data) as view, \
+                    view[_HEADER.size:] as payload:
+                pack = marshal.loads(payload)
+    except (OSError, ValueError, EOFError, TypeError, struct.error):
+        return None
+    if not isinstance(pack, dict) or pack.get("lang") != lang or \
+            not isinstance(pack.get("files"), dict):
+        return None
+    return pack
+
+
+def load_pack(lang):
+    """ Get the compiled pack of a language
+
+    Args:
+        lang (str): full language code, e.g. "en-us"
+    Returns:
+        dict: the pack payload, see compile_language(), None if there is no
+              usable pack for this language or it is stale
+    """
+    try:
+        return _packs[lang]
+    except KeyError:
+        pack = _read_pack(lang, join(PACK_DIR, lang + PACK_EXTENSION))
+        _packs[lang] = pack
+        return pack
+
+
+def unload_packs(lang=None):
+    """ Forget the loaded pack of a language, or of all languages if None """
+    if lang is None:
+        _packs.clear()
+    else:
+        _packs.pop(lang, None)
+
+
+def packed_file(lang, filename):
+    """ Get the content of a packaged resource file from the language pack
+
+    Args:
+        lang (str): full language code, e.g. "en-us"
+        filename (str): file name in res/text/<lang>, e.g. "normalize.json"
+    Returns:
+        the parsed file, or None if not packed
+    """
+    pack = load_pack(lang)
+    if pack is None:
+        return None
+    return pack["files"].get(filename)
+
+
+def read_json_resource(res_name):
+    """ Load a json resource, e.g. "text/en-us/normalize.json"
+
+    The resource is resolved with resolve_resource_file, and served from the
+    language pack when the packaged file is the one to use.
+
+    Returns:
+        the parsed json
+    """
+    from lingua_franca import resolve_resource_file
+
+    filename = resolve_resource_file(res_name)
+    parts = res_name.split("/")
+    if len(parts) == 3 and parts[0] == "text" and filename and \
+            normpath(filename) == normpath(join(RES_DIR, res_name)):
+        data = packed_file(parts[1], parts[2])
+        if data is not None:
+            return data
+    with open(filename, 'r', encoding='utf8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compile the lingua_franca resources into language packs")
+    parser.add_argument("langs", nargs="*",
+                        help="full language codes, e.g. en-us, default all")
+    parser.add_argument("--output", help="output directory, default " +
+                        PACK_DIR)
+    args = parser.parse_args()
+    for path in build_packs(args.langs, args.output):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Parallel processing of large corpora.
+
+The functions of this module spread the texts over a pool of worker
+processes, in chunks, and yield the results in the order of the texts:
+
+    from lingua_franca.parallel import extract_datetime
+
+    for result in extract_datetime(lines, lang="en-us", anchorDate=anchor):
+        ...
+
+The language is resolved in the calling process, active_lang() and
+set_active_lang() included, and every worker loads it once when it starts.
+Each chunk is processed with the lingua_franca.parse _batch functions, so
+texts repeated within a chunk are only parsed once.
+
+The texts are read lazily, at most a few chunks per worker ahead of the
+results consumed, so the corpus never needs to fit in memory.
+"""
+import os
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+
+import lingua_franca.parse
+from lingua_franca.lang import get_full_lang_code
+from lingua_franca.language import load_languages
+from lingua_franca.time import now_local
+
+DEFAULT_CHUNKSIZE = 256
+
+# chunks queued per worker, enough to keep the workers busy while the
+# results of the previous chunks are consumed
+_CHUNKS_PER_WORKER = 2
+
+_FUNCTIONS = {"extract_number", "extract_numbers", "extract_duration",
+              "extract_datetime", "normalize"}
+
+# the job of a worker process, set by _init_worker
+_worker_job = None
+
+
+def _init_worker(name, lang, kwargs):
+    global _worker_job
+    load_languages([lang])
+    batch = getattr(lingua_franca.parse, name + "_batch")
+    _worker_job = (batch, lang, kwargs)
+
+
+def _process_chunk(texts):
+    batch, lang, kwargs = _worker_job
+    return batch(texts, lang=lang, **kwargs)
+
+
+def _chunks(texts, chunksize):
+    texts = iter(texts)
+    chunk = list(islice(texts, chunksize))
+    while chunk:
+        yield chunk
+        chunk = list(islice(texts, chunksize))
+
+
+def imap(name, texts, lang=None, processes=None,
+         chunksize=DEFAULT_CHUNKSIZE, **kwargs):
+    """ Apply a lingua_franca.parse function to texts in worker processes
+
+    Args:
+        name (str): name of the function, one of extract_number,
+                    extract_numbers, extract_duration, extract_datetime
+                    and normalize
+        texts (iterable): the texts to process
+        lang (str): the BCP-47 code for the language to use, None uses default
+        processes (int): number of worker processes, default os.cpu_count()
+        chunksize (int): number of texts sent to a worker at once
+        kwargs: other arguments of the function, e.g. ordinals=True
+
+    Returns:
+        generator: the result of each text, in the order of the texts
+    """
+    if name not in _FUNCTIONS:
+        raise ValueError("{} can't be run in parallel, use one of {}".format(
+            name, ", ".join(sorted(_FUNCTIONS))))
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    lang = get_full_lang_code(lang)
+    # load the language before the workers fork, so they inherit it
+    load_languages([lang])
+    return _imap(name, texts, lang, processes, chunksize, kwargs)
+
+
+def _imap(name, texts, lang, processes, chunksize, kwargs):
+    processes = processes or os.cpu_count() or 1
+    with Pool(processes, _init_worker, (name, lang, kwargs)) as pool:
+        max_pending = processes * _CHUNKS_PER_WORKER
+        pending = deque()
+        for chunk in _chunks(texts, chunksize):
+            pending.append(pool.apply_async(_process_chunk, (chunk,)))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
+
+
+def extract_number(texts, short_scale=True, ordinals=False, lang=None,
+                   processes=None, chunksize=DEFAULT_CHUNKSIZE):
+    """ lingua_franca.parse.extract_number for each text, see imap() """
+    return imap("extract_number", texts, lang, processes, chunksize,
+                short_scale=short_scale, ordinals=ordinals)
+
+
+def extract_numbers(texts, short_scale=True, ordinals=False, lang=None,
+                    processes=None, chunksize=DEFAULT_CHUNKSIZE):
+    """ lingua_franca.parse.extract_numbers for each text, see imap() """
+    return imap("extract_numbers", texts, lang, processes, chunksize,
+                short_scale=short_scale, ordinals=ordinals)
+
+
+def extract_duration(texts, lang=None, processes=None,
+                     chunksize=DEFAULT_CHUNKSIZE):
+    """ lingua_franca.parse.extract_duration for each text, see imap() """
+    return imap("extract_duration", texts, lang, processes, chunksize)
+
+
+def extract_datetime(texts, anchorDate=None, lang=None, default_time=None,
+                     processes=None, chunksize=DEFAULT_CHUNKSIZE):
+    """ lingua_franca.parse.extract_datetime for each text, see imap()
+
+    anchorDate defaults to the current local date/time, taken once in the
+    calling process so that all the texts share it.
+    """
+    return imap("extract_datetime", texts, lang, processes, chunksize,
+                anchorDate=anchorDate or now_local(),
+                default_time=default_time)
+
+
+def normalize(texts, lang=None, remove_articles=True, processes=None,
+              chunksize=DEFAULT_CHUNKSIZE):
+    """ lingua_franca.parse.normalize for each text, see imap() """
+    return imap("normalize", texts, lang, processes, chunksize,
+                remove_articles=remove_articles)
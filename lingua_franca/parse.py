@@ -13,36 +13,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import sys
 from difflib import SequenceMatcher
+from importlib import import_module
+from types import ModuleType
+from lingua_franca import resolve_resource_file
+from lingua_franca.document import Document
 from lingua_franca.time import now_local
 from lingua_franca.lang import get_primary_lang_code
 
-from lingua_franca.lang.parse_en import *
-from lingua_franca.lang.parse_pt import *
-from lingua_franca.lang.parse_es import *
-from lingua_franca.lang.parse_it import *
-from lingua_franca.lang.parse_sv import *
-
-from lingua_franca.lang.parse_de import extractnumber_de
-from lingua_franca.lang.parse_de import extract_numbers_de
-from lingua_franca.lang.parse_de import extract_datetime_de
-from lingua_franca.lang.parse_de import normalize_de
-from lingua_franca.lang.parse_fr import extractnumber_fr
-from lingua_franca.lang.parse_fr import extract_numbers_fr
-from lingua_franca.lang.parse_fr import extract_datetime_fr
-from lingua_franca.lang.parse_fr import normalize_fr
-from lingua_franca.lang.parse_da import extractnumber_da
-from lingua_franca.lang.parse_da import extract_numbers_da
-from lingua_franca.lang.parse_da import extract_datetime_da
-from lingua_franca.lang.parse_da import normalize_da
-from lingua_franca.lang.parse_nl import normalize_nl, extractnumber_nl, extract_datetime_nl
-from lingua_franca.lang.parse_cs import extractnumber_cs
-from lingua_franca.lang.parse_cs import extract_datetime_cs
-from lingua_franca.lang.parse_cs import extract_numbers_cs
-from lingua_franca.lang.parse_cs import normalize_cs
-from lingua_franca.lang.parse_cs import extract_duration_cs
-
+from lingua_franca.lang.registry import get_function, get_provider, \
+    supported_languages
 from lingua_franca import _log_unsupported_language
+# the helpers this module used to get from the star imports of parse_xx
+from lingua_franca.lang.parse_common import Normalizer, ReplaceableNumber, \
+    Token, extract_numbers_generic, invert_dict, is_numeric, \
+    look_for_fractions, partition_list, tokenize
+
+# the language specific names this module used to have that aren't found
+# in parse_xx from their "_xx" suffix
+_LEGACY_NAMES = {"EnglishNormalizer": "parse_en",
+                 "PortugueseNormalizer": "parse_pt",
+                 "es_number_parse": "parse_es", "pt_pruning": "parse_pt",
+                 "STRING_NUM_ITA": "parse_it",
+                 "pronounce_number_es": "format_es",
+                 "pronounce_number_it": "format_it"}
 
 
 def fuzzy_match(x, against):
@@ -83,12 +78,17 @@ def match_one(query, choices):
         return best
 
 
+def _language_of(document, lang):
+    """ The language to read a Document in, its own unless lang is given """
+    return document.language if lang is None else _get_language(lang)
+
+
 def extract_numbers(text, short_scale=True, ordinals=False, lang=None):
     """
         Takes in a string and extracts a list of numbers.
 
     Args:
-        text (str): the string to extract a number from
+        text (str or Document): the string to extract a number from
         short_scale (bool): Use "short scale" or "long scale" for large
             numbers -- over a million.  The default is short scale, which
             is now common in most English speaking countries.
@@ -98,24 +98,51 @@ def extract_numbers(text, short_scale=True, ordinals=False, lang=None):
     Returns:
         list: list of extracted numbers as floats, or empty list if none found
     """
+    if isinstance(text, Document):
+        return _language_of(text, lang).extract_numbers(text, short_scale,
+                                                        ordinals)
     lang_code = get_primary_lang_code(lang)
-    if lang_code == "en":
-        return extract_numbers_en(text, short_scale, ordinals)
-    elif lang_code == "de":
-        return extract_numbers_de(text, short_scale, ordinals)
-    elif lang_code == "fr":
-        return extract_numbers_fr(text, short_scale, ordinals)
-    elif lang_code == "it":
-        return extract_numbers_it(text, short_scale, ordinals)
-    elif lang_code == "da":
-        return extract_numbers_da(text, short_scale, ordinals)
-    elif lang_code == "es":
-        return extract_numbers_es(text, short_scale, ordinals)
-    elif lang_code == "cs":
-        return extract_numbers_cs(text, short_scale, ordinals)
+    extract = get_function("extract_numbers", lang_code)
+    if extract:
+        return extract(text, short_scale, ordinals)
     # TODO: extractnumbers_xx for other languages
     _log_unsupported_language(lang_code,
-                              ['en', 'it', 'fr', 'de', 'da','cs'])
+                              supported_languages("extract_numbers"))
+    return []
+
+
+def extract_numbers_with_spans(text, short_scale=True, ordinals=False,
+                               lang=None):
+    """
+        Takes in a string and extracts a list of numbers, with where each
+        of them was found in the string.
+
+    Each number is located by the words it was read from, so equal numbers
+    are told apart and the string doesn't need to be searched again, e.g.
+    to highlight the numbers.
+
+    Args:
+        text (str or Document): the string to extract numbers from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        lang (str): the BCP-47 code for the language to use, None uses default
+    Returns:
+        list: (number, start, end, matched text) for each number, with
+              text[start:end] == matched text, or empty list if none found
+    """
+    if isinstance(text, Document):
+        return _language_of(text, lang).extract_numbers_with_spans(
+            text, short_scale, ordinals)
+    lang_code = get_primary_lang_code(lang)
+    extract = get_function("extract_numbers_with_spans", lang_code)
+    if extract:
+        return [(number, start, end, text[start:end]) for number, start, end
+                in extract(text, short_scale, ordinals)]
+    _log_unsupported_language(
+        lang_code, supported_languages("extract_numbers_with_spans"))
     return []
 
 
@@ -123,7 +150,7 @@ def extract_number(text, short_scale=True, ordinals=False, lang=None):
     """Takes in a string and extracts a number.
 
     Args:
-        text (str): the string to extract a number from
+        text (str or Document): the string to extract a number from
         short_scale (bool): Use "short scale" or "long scale" for large
             numbers -- over a million.  The default is short scale, which
             is now common in most English speaking countries.
@@ -134,37 +161,16 @@ def extract_number(text, short_scale=True, ordinals=False, lang=None):
         (int, float or False): The number extracted or False if the input
                                text contains no numbers
     """
+    if isinstance(text, Document):
+        return _language_of(text, lang).extract_number(text, short_scale,
+                                                       ordinals)
     lang_code = get_primary_lang_code(lang)
-    if lang_code == "en":
-        return extractnumber_en(text, short_scale=short_scale,
-                                ordinals=ordinals)
-    elif lang_code == "es":
-        return extractnumber_es(text)
-    elif lang_code == "pt":
-        return extractnumber_pt(text)
-    elif lang_code == "it":
-        return extractnumber_it(text, short_scale=short_scale,
-                                ordinals=ordinals)
-    elif lang_code == "fr":
-        return extractnumber_fr(text)
-    elif lang_code == "sv":
-        return extractnumber_sv(text)
-    elif lang_code == "de":
-        return extractnumber_de(text)
-    elif lang_code == "da":
-        return extractnumber_da(text)
-    elif lang_code == "es":
-        return extract_numbers_es(text, short_scale, ordinals)
-    elif lang_code == "nl":
-        return extractnumber_nl(text, short_scale=short_scale,
-                                ordinals=ordinals)
-    elif lang_code == "cs":
-        return extractnumber_cs(text, short_scale=short_scale,
-                                ordinals=ordinals)
+    extract = get_function("extract_number", lang_code)
+    if extract:
+        return extract(text, short_scale=short_scale, ordinals=ordinals)
     # TODO: extractnumber_xx for other languages
     _log_unsupported_language(lang_code,
-                              ['en', 'es', 'pt', 'it', 'fr',
-                               'sv', 'de', 'da', 'nl','cs'])
+                              supported_languages("extract_number"))
     return text
 
 
@@ -184,7 +190,7 @@ def extract_duration(text, lang=None):
     (300, "set a timer for").
 
     Args:
-        text (str): string containing a duration
+        text (str or Document): string containing a duration
         lang (str): the BCP-47 code for the language to use, None uses default
 
     Returns:
@@ -194,15 +200,16 @@ def extract_duration(text, lang=None):
                     be None if no duration is found. The text returned
                     will have whitespace stripped from the ends.
     """
+    if isinstance(text, Document):
+        return _language_of(text, lang).extract_duration(text)
     lang_code = get_primary_lang_code(lang)
-
-    if lang_code == "en":
-        return extract_duration_en(text)
-    if lang_code == "cs":
-        return extract_duration_cs(text)
+    extract = get_function("extract_duration", lang_code)
+    if extract:
+        return extract(text)
 
     # TODO: extract_duration for other languages
-    _log_unsupported_language(lang_code, ['en','cs'])
+    _log_unsupported_language(lang_code,
+                              supported_languages("extract_duration"))
     return None
 
 
@@ -220,7 +227,7 @@ def extract_datetime(text, anchorDate=None, lang=None, default_time=None):
     If a time isn't supplied or implied, the function defaults to 12 AM
 
     Args:
-        text (str): the text to be interpreted
+        text (str or Document): the text to be interpreted
         anchorDate (:obj:`datetime`, optional): the date to be used for
             relative dating (for example, what does "tomorrow" mean?).
             Defaults to the current local date/time.
@@ -257,39 +264,62 @@ def extract_datetime(text, anchorDate=None, lang=None, default_time=None):
         ... )
         None
     """
+    if isinstance(text, Document):
+        return _language_of(text, lang).extract_datetime(text, anchorDate,
+                                                         default_time)
 
     lang_code = get_primary_lang_code(lang)
 
     if not anchorDate:
         anchorDate = now_local()
 
-    if lang_code == "en":
-        return extract_datetime_en(text, anchorDate, default_time)
-    elif lang_code == "es":
-        return extract_datetime_es(text, anchorDate, default_time)
-    elif lang_code == "pt":
-        return extract_datetime_pt(text, anchorDate, default_time)
-    elif lang_code == "it":
-        return extract_datetime_it(text, anchorDate, default_time)
-    elif lang_code == "fr":
-        return extract_datetime_fr(text, anchorDate, default_time)
-    elif lang_code == "sv":
-        return extract_datetime_sv(text, anchorDate, default_time)
-    elif lang_code == "de":
-        return extract_datetime_de(text, anchorDate, default_time)
-    elif lang_code == "da":
-        return extract_datetime_da(text, anchorDate, default_time)
-    elif lang_code == "nl":
-        return extract_datetime_nl(text, anchorDate, default_time)
-    elif lang_code == "cs":
-        return extract_datetime_cs(text, anchorDate, default_time)
+    extract = get_function("extract_datetime", lang_code)
+    if extract:
+        return extract(text, anchorDate, default_time)
 
     # TODO: extract_datetime for other languages
     _log_unsupported_language(lang_code,
-                              ['en', 'es', 'pt', 'it', 'fr', 'sv', 'de', 'da','cs'])
+                              supported_languages("extract_datetime"))
     return text
 
 
+def has_datetime(text, lang=None):
+    """ Check if a sentence may contain a date or a time
+
+    A single scan of the text for the day and month names, the digits and
+    the other words extract_datetime needs, much cheaper than
+    extract_datetime itself.  Text it rejects can be skipped, text it
+    accepts may still contain no date.
+
+    Args:
+        text (str or Document): the text to check
+        lang (str): the BCP-47 code for the language to use, None uses default
+
+    Returns:
+        bool: False if extract_datetime would find nothing in text, True
+              otherwise and for the languages without extract_datetime
+
+    Examples:
+
+        >>> has_datetime("what is the weather like on tuesday")
+        True
+
+        >>> has_datetime("turn off the lights")
+        False
+    """
+    if isinstance(text, Document):
+        return _language_of(text, lang).has_datetime(text)
+
+    lang_code = get_primary_lang_code(lang)
+    check = get_function("has_datetime", lang_code)
+    if check:
+        return check(text)
+
+    _log_unsupported_language(lang_code,
+                              supported_languages("has_datetime"))
+    return True
+
+
 def normalize(text, lang=None, remove_articles=True):
     """Prepare a string for parsing
 
@@ -297,7 +327,7 @@ def normalize(text, lang=None, remove_articles=True):
     numbers consistent, getting rid of contractions, etc.
 
     Args:
-        text (str): the string to normalize
+        text (str or Document): the string to normalize
         lang (str): the BCP-47 code for the language to use, None uses default
         remove_articles (bool): whether to remove articles (like 'a', or
                                 'the'). True by default.
@@ -305,33 +335,16 @@ def normalize(text, lang=None, remove_articles=True):
     Returns:
         (str): The normalized string.
     """
+    if isinstance(text, Document):
+        return _language_of(text, lang).normalize(text, remove_articles)
 
     lang_code = get_primary_lang_code(lang)
+    normalizer = get_function("normalize", lang_code)
+    if normalizer:
+        return normalizer(text, remove_articles)
 
-    if lang_code == "en":
-        return normalize_en(text, remove_articles)
-    elif lang_code == "es":
-        return normalize_es(text, remove_articles)
-    elif lang_code == "pt":
-        return normalize_pt(text, remove_articles)
-    elif lang_code == "it":
-        return normalize_it(text, remove_articles)
-    elif lang_code == "fr":
-        return normalize_fr(text, remove_articles)
-    elif lang_code == "sv":
-        return normalize_sv(text, remove_articles)
-    elif lang_code == "de":
-        return normalize_de(text, remove_articles)
-    elif lang_code == "da":
-        return normalize_da(text, remove_articles)
-    elif lang_code == "nl":
-        return normalize_nl(text, remove_articles)
-    elif lang_code == "cs":
-        return normalize_cs(text, remove_articles)
     # TODO: Normalization for other languages
-    _log_unsupported_language(lang_code,
-                              ['en', 'es', 'pt', 'it', 'fr',
-                               'sv', 'de', 'da', 'nl','cs'])
+    _log_unsupported_language(lang_code, supported_languages("normalize"))
     return text
 
 
@@ -352,13 +365,158 @@ def get_gender(word, context="", lang=None):
     """
 
     lang_code = get_primary_lang_code(lang)
+    gender = get_function("get_gender", lang_code)
+    if gender:
+        return gender(word, context)
 
-    if lang_code in ["pt", "es"]:
-        # spanish follows same rules
-        return get_gender_pt(word, context)
-    elif lang_code == "it":
-        return get_gender_it(word, context)
     # TODO: get_gender_xx for other languages
-    _log_unsupported_language(lang_code,
-                              ['pt', 'it', 'es'])
+    _log_unsupported_language(lang_code, supported_languages("get_gender"))
     return None
+
+
+def _get_language(lang):
+    # lingua_franca.language depends on this module, import it late
+    from lingua_franca.language import get_language
+    return get_language(lang)
+
+
+def _map_batch(func, texts, copy=None):
+    """ Apply func to every text, parsing each distinct text only once
+
+    Transcribed utterances repeat a lot, so the results are shared between
+    the equal texts of a batch.  Mutable results are copied with copy, so
+    callers can't see the sharing.
+    """
+    results = {}
+    batch = []
+    for text in texts:
+        try:
+            result = results[text]
+            if copy:
+                result = copy(result)
+        except KeyError:
+            result = results[text] = func(text)
+        batch.append(result)
+    return batch
+
+
+def extract_numbers_batch(texts, short_scale=True, ordinals=False,
+                          lang=None):
+    """ extract_numbers for a list of texts
+
+    The language is resolved once for the whole batch and texts that occur
+    several times are only parsed once, which is cheaper than calling
+    extract_numbers in a loop.  The same holds for the other _batch
+    functions.
+
+    Args:
+        texts ([str]): the strings to extract numbers from
+        short_scale (bool): see extract_numbers
+        ordinals (bool): see extract_numbers
+        lang (str): the BCP-47 code for the language to use, None uses default
+    Returns:
+        list: the list of numbers of each text, in the order of the texts
+    """
+    language = _get_language(lang)
+    return _map_batch(
+        lambda text: language.extract_numbers(text, short_scale, ordinals),
+        texts, copy=list)
+
+
+def extract_number_batch(texts, short_scale=True, ordinals=False, lang=None):
+    """ extract_number for a list of texts
+
+    Args:
+        texts ([str]): the strings to extract a number from
+        short_scale (bool): see extract_number
+        ordinals (bool): see extract_number
+        lang (str): the BCP-47 code for the language to use, None uses default
+    Returns:
+        list: the number of each text, or False where there is none, in the
+              order of the texts
+    """
+    language = _get_language(lang)
+    return _map_batch(
+        lambda text: language.extract_number(text, short_scale, ordinals),
+        texts)
+
+
+def extract_duration_batch(texts, lang=None):
+    """ extract_duration for a list of texts
+
+    Args:
+        texts ([str]): the strings containing a duration
+        lang (str): the BCP-47 code for the language to use, None uses default
+    Returns:
+        list: the (timedelta, remaining text) tuple of each text, in the
+              order of the texts
+    """
+    language = _get_language(lang)
+    return _map_batch(language.extract_duration, texts)
+
+
+def extract_datetime_batch(texts, anchorDate=None, lang=None,
+                           default_time=None):
+    """ extract_datetime for a list of texts
+
+    Args:
+        texts ([str]): the texts to be interpreted
+        anchorDate (:obj:`datetime`, optional): the date all the texts are
+            relative to.  Defaults to the current local date/time, taken
+            once for the whole batch.
+        lang (str): the BCP-47 code for the language to use, None uses default
+        default_time (datetime.time): time to use if none was found in
+            a text.
+    Returns:
+        list: the [datetime, leftover_string] or None of each text, in the
+              order of the texts
+    """
+    language = _get_language(lang)
+    anchorDate = anchorDate or now_local()
+    return _map_batch(
+        lambda text: language.extract_datetime(text, anchorDate, default_time),
+        texts, copy=lambda result: result and list(result))
+
+
+def normalize_batch(texts, lang=None, remove_articles=True):
+    """ normalize a list of texts
+
+    The normalizer of the language is created once for the whole batch.
+
+    Args:
+        texts ([str]): the strings to normalize
+        lang (str): the BCP-47 code for the language to use, None uses default
+        remove_articles (bool): see normalize
+    Returns:
+        [str]: the normalized strings, in the order of the texts
+    """
+    language = _get_language(lang)
+    return _map_batch(lambda text: language.normalize(text, remove_articles),
+                      texts)
+
+
+def __getattr__(name):
+    """ Backwards compatibility for the language specific functions, which
+    used to be imported into this module, e.g. parse.extractnumber_en
+    """
+    module = _LEGACY_NAMES.get(name)
+    if module is None:
+        provider = get_provider(name.rsplit("_", 1)[-1].lower())
+        module = provider and "parse_" + provider.code
+    if module:
+        try:
+            return getattr(import_module("lingua_franca.lang." + module),
+                           name)
+        except (ImportError, AttributeError):
+            pass
+    raise AttributeError("module {} has no attribute {}".format(__name__,
+                                                                name))
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ (PEP 562) is new in Python 3.7
+    class _Module(ModuleType):
+        def __getattr__(self, name):
+            return __getattr__(name)
+
+    sys.modules[__name__].__class__ = _Module
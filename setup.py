@@ -34,6 +34,7 @@ setup(
     package_data={'': extra_files},
     include_package_data=True,
     install_requires=required('requirements.txt'),
+    python_requires='>=3.5',
     author='Mycroft AI',
     author_email='dev@mycroft.ai',
     description='Mycroft\'s multilingual text parsing and formatting library',
@@ -45,7 +46,6 @@ setup(
         'Topic :: Text Processing :: Linguistic',
         'License :: OSI Approved :: Apache Software License',
 
-        'Programming Language :: Python :: 3.4',
         'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
@@ -0,0 +1,101 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest
+from datetime import datetime
+
+from lingua_franca import analyze, get_language
+from lingua_franca.document import Document, NUMERIC, NUMBER_WORD, \
+    ORDINAL, FRACTION, MARKER
+from lingua_franca.lang.parse_common import Token
+from lingua_franca.parse import extract_number, extract_numbers, \
+    extract_duration, extract_datetime, has_datetime, normalize
+
+
+class TestAnalyze(unittest.TestCase):
+    def test_document(self):
+        doc = analyze("Set a timer for 15% of #1", "en-us")
+        self.assertIsInstance(doc, Document)
+        self.assertIs(doc.language, get_language("en-us"))
+        self.assertEqual(doc.lower, "set a timer for 15% of #1")
+        self.assertEqual(doc.words, ["Set", "a", "timer", "for", "15", "%",
+                                     "of", "#", "1"])
+        self.assertEqual(doc.tokens[:2], [Token("Set", 0), Token("a", 1)])
+        self.assertEqual([doc.text[start:end]
+                          for start, end in doc.token_spans], doc.words)
+
+    def test_classes(self):
+        doc = analyze("one hundred and 2 point five and a third", "en-us")
+        self.assertEqual(doc.classes, [
+            {NUMBER_WORD}, {NUMBER_WORD}, {MARKER}, {NUMERIC}, {MARKER},
+            {NUMBER_WORD}, {MARKER}, set(), {NUMBER_WORD, ORDINAL, FRACTION}])
+
+    def test_number_spans(self):
+        for lang, text, spans in [
+                ("en-us", "I have twenty two cats and 3 dogs",
+                 [(22, "twenty two"), (3, "3")]),
+                ("cs-cz", "mám dva psy a tři kočky",
+                 [(2, "dva"), (3, "tři")]),
+                ("de-de", "zwei und zwanzig Katzen, 7 Hunde",
+                 [(22, "zwei und zwanzig"), (7, "7")])]:
+            doc = analyze(text, lang)
+            self.assertEqual([(number, text[start:end])
+                              for number, start, end in doc.number_spans()],
+                             spans)
+        self.assertIsNone(analyze("kettő", "hu-hu").number_spans())
+
+    def test_extractors(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        for lang, text in [("en-us", "two and a half hours from now"),
+                           ("en-us", "It's the Third of May, 2 PM"),
+                           ("cs-cz", "za dva dny v pět hodin"),
+                           ("de-de", "in zwei tagen um drei uhr"),
+                           ("it-it", "fra tre giorni alle sei"),
+                           ("es-es", "dentro de dos días a las tres")]:
+            doc = analyze(text, lang)
+            for short_scale, ordinals in [(True, False), (False, True)]:
+                self.assertEqual(
+                    extract_number(doc, short_scale, ordinals),
+                    extract_number(text, short_scale, ordinals, lang=lang))
+                self.assertEqual(
+                    extract_numbers(doc, short_scale, ordinals),
+                    extract_numbers(text, short_scale, ordinals, lang=lang))
+            self.assertEqual(extract_duration(doc),
+                             extract_duration(text, lang=lang))
+            self.assertEqual(extract_datetime(doc, anchor),
+                             extract_datetime(text, anchor, lang=lang))
+            self.assertEqual(has_datetime(doc),
+                             has_datetime(text, lang=lang))
+            self.assertEqual(normalize(doc, remove_articles=False),
+                             normalize(text, lang=lang,
+                                       remove_articles=False))
+
+    def test_results_are_kept(self):
+        doc = analyze("three cats and 4 dogs", "en-us")
+        numbers = extract_numbers(doc)
+        numbers.append(5)
+        self.assertEqual(extract_numbers(doc), [3, 4])
+        self.assertEqual(doc.extract_numbers(), [3, 4])
+        self.assertIs(normalize(doc), normalize(doc))
+
+    def test_other_language(self):
+        doc = analyze("drei", "de-de")
+        self.assertEqual(extract_number(doc), 3)
+        self.assertEqual(extract_number(doc, lang="en-us"), False)
+        self.assertEqual(get_language("en-us").extract_number(doc), False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,8 +17,12 @@ import json
 import unittest
 import datetime
 import ast
+import os
 import sys
+import tempfile
+import time
 from pathlib import Path
+from unittest import mock
 
 from lingua_franca.format import nice_number
 from lingua_franca.format import nice_time
@@ -29,6 +33,8 @@ from lingua_franca.format import nice_duration
 from lingua_franca.format import pronounce_number
 from lingua_franca.format import date_time_format
 from lingua_franca.format import join_list
+from lingua_franca.format import WordTranslations
+from lingua_franca import reload_resources
 
 NUMBERS_FIXTURE_EN = {
     1.435634: '1.436',
@@ -604,5 +610,63 @@ class TestNiceDateFormat(unittest.TestCase):
         self.assertEqual(join_list([1, "b", 3, "d"], "or"), "1, b, 3 or d")
 
 
+class TestWordTranslations(unittest.TestCase):
+    def setUp(self):
+        self.home = tempfile.TemporaryDirectory()
+        self.lang_dir = os.path.join(self.home.name, ".mycroft", "text",
+                                     "en-us")
+        self.env = mock.patch.dict(os.environ, {"HOME": self.home.name})
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.home.cleanup()
+        reload_resources()
+
+    def write_word(self, name, content):
+        os.makedirs(self.lang_dir, exist_ok=True)
+        path = os.path.join(self.lang_dir, name + ".word")
+        with open(path, "w", encoding="utf8") as f:
+            f.write(content)
+        return path
+
+    def test_packaged_words(self):
+        translations = WordTranslations()
+        self.assertEqual(translations.translate("minutes", "en-us"),
+                         "minutes")
+        self.assertEqual(translations.translate("minutes", "it-it"),
+                         "minuti")
+        self.assertEqual(translations.translate("unknown", "it-it"),
+                         "unknown")
+        self.assertIn("minuti", translations.lang_words["it-it"].values())
+        self.assertNotIn("de-de", translations.lang_words)
+
+    def test_user_override_and_reload(self):
+        translations = WordTranslations()
+        self.assertEqual(translations.translate("and", "en-us"), "and")
+        self.write_word("and", "# comment\nplus\n")
+        self.assertEqual(translations.translate("and", "en-us"), "and")
+        translations.reload()
+        self.assertEqual(translations.translate("and", "en-us"), "plus")
+
+    def test_check_mtime(self):
+        translations = WordTranslations(check_mtime=True)
+        path = self.write_word("or", "either\n")
+        self.assertEqual(translations.translate("or", "en-us"), "either")
+        with open(path, "w", encoding="utf8") as f:
+            f.write("alternatively\n")
+        os.utime(path, (time.time() + 10, time.time() + 10))
+        self.assertEqual(translations.translate("or", "en-us"),
+                         "alternatively")
+        os.remove(path)
+        self.assertEqual(translations.translate("or", "en-us"), "or")
+
+    def test_reload_resources(self):
+        self.assertEqual(join_list(["a", "b"], "and"), "a and b")
+        self.write_word("and", "plus")
+        reload_resources()
+        self.assertEqual(join_list(["a", "b"], "and"), "a plus b")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,87 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import threading
+import unittest
+
+try:
+    import contextvars
+except ImportError:  # Python < 3.7
+    contextvars = None
+
+from lingua_franca.lang import active_lang, get_active_lang, \
+    set_active_lang, get_primary_lang_code
+from lingua_franca.parse import extract_number
+
+
+class TestActiveLang(unittest.TestCase):
+    def setUp(self):
+        self.old_lang = get_active_lang()
+        set_active_lang("en-us")
+
+    def tearDown(self):
+        set_active_lang(self.old_lang)
+
+    def test_context_manager(self):
+        with active_lang("de-de"):
+            self.assertEqual(get_active_lang(), "de-de")
+            self.assertEqual(get_primary_lang_code(), "de")
+            self.assertEqual(extract_number("zwei"), 2)
+            with active_lang("it-it"):
+                self.assertEqual(get_active_lang(), "it-it")
+            self.assertEqual(get_active_lang(), "de-de")
+        self.assertEqual(get_active_lang(), "en-us")
+
+    def test_set_active_lang_is_default(self):
+        with active_lang("de-de"):
+            set_active_lang("pt-pt")
+            self.assertEqual(get_active_lang(), "de-de")
+        self.assertEqual(get_active_lang(), "pt-pt")
+
+    def test_threads(self):
+        results = {}
+        barrier = threading.Barrier(2)
+
+        def worker(lang):
+            with active_lang(lang):
+                barrier.wait()
+                results[lang] = get_active_lang()
+
+        threads = [threading.Thread(target=worker, args=(lang,))
+                   for lang in ("de-de", "fr-fr")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, {"de-de": "de-de", "fr-fr": "fr-fr"})
+        self.assertEqual(get_active_lang(), "en-us")
+
+    @unittest.skipIf(contextvars is None,
+                     "the tasks of a thread share its language before 3.7")
+    def test_asyncio_tasks(self):
+        async def task(lang):
+            with active_lang(lang):
+                await asyncio.sleep(0)
+                return get_active_lang()
+
+        async def main():
+            return await asyncio.gather(task("de-de"), task("sv-se"))
+
+        self.assertEqual(asyncio.run(main()), ["de-de", "sv-se"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import sys
+import unittest
+from datetime import datetime
+
+from lingua_franca import get_language, Language, load_languages, \
+    unload_language
+from lingua_franca.format import date_time_format, word_translations
+from lingua_franca.format import nice_number, nice_time, pronounce_number, \
+    nice_date, nice_date_time, nice_year, nice_duration, join_list
+from lingua_franca.parse import extract_number, extract_numbers, \
+    extract_numbers_with_spans, \
+    extract_duration, extract_datetime, normalize, get_gender
+
+
+class TestLanguageHandle(unittest.TestCase):
+    def test_shared_handles(self):
+        self.assertIs(get_language("en-us"), get_language("en-us"))
+        self.assertIsInstance(get_language("de-de"), Language)
+        self.assertEqual(get_language("pt-pt").code, "pt")
+        self.assertEqual(get_language("pt-pt").full_code, "pt-pt")
+
+    def test_parse_parity(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        for lang, text in [("en-us", "two and a half hours from now"),
+                           ("de-de", "in zwei tagen um drei uhr"),
+                           ("it-it", "fra tre giorni alle sei"),
+                           ("cs-cz", "za dva dny v pět hodin")]:
+            language = get_language(lang)
+            self.assertEqual(language.extract_number(text),
+                             extract_number(text, lang=lang))
+            self.assertEqual(language.extract_numbers(text),
+                             extract_numbers(text, lang=lang))
+            self.assertEqual(language.extract_numbers_with_spans(text),
+                             extract_numbers_with_spans(text, lang=lang))
+            self.assertEqual(language.extract_duration(text),
+                             extract_duration(text, lang=lang))
+            self.assertEqual(language.extract_datetime(text, anchor),
+                             extract_datetime(text, anchor, lang=lang))
+            self.assertEqual(language.normalize(text),
+                             normalize(text, lang=lang))
+            self.assertEqual(language.normalize(text, False),
+                             normalize(text, lang=lang,
+                                       remove_articles=False))
+        self.assertEqual(get_language("pt-pt").get_gender("vaca"),
+                         get_gender("vaca", lang="pt-pt"))
+
+    def test_format_parity(self):
+        dt = datetime(2017, 1, 31, 13, 22, 3)
+        for lang in ["en-us", "hu-hu", "it-it", "sv-se", "cs-cz"]:
+            language = get_language(lang)
+            self.assertEqual(language.nice_number(4.5),
+                             nice_number(4.5, lang=lang))
+            self.assertEqual(language.nice_time(dt, use_ampm=True),
+                             nice_time(dt, lang=lang, use_ampm=True))
+            self.assertEqual(language.pronounce_number(102.3),
+                             pronounce_number(102.3, lang=lang))
+            self.assertEqual(language.pronounce_number(3, ordinals=True),
+                             pronounce_number(3, lang=lang, ordinals=True))
+            self.assertEqual(language.nice_date(dt, now=dt),
+                             nice_date(dt, lang=lang, now=dt))
+            self.assertEqual(language.nice_date_time(dt),
+                             nice_date_time(dt, lang=lang))
+            self.assertEqual(language.nice_year(dt, bc=True),
+                             nice_year(dt, lang=lang, bc=True))
+            self.assertEqual(language.nice_duration(500000),
+                             nice_duration(500000, lang=lang))
+            self.assertEqual(language.join_list(["a", "b", "c"], "or"),
+                             join_list(["a", "b", "c"], "or", lang=lang))
+
+
+class TestLoadLanguages(unittest.TestCase):
+    def test_load_and_unload(self):
+        sv, = load_languages(["sv-se"])
+        self.assertIs(sv, get_language("sv-se"))
+        self.assertIn("lingua_franca.lang.parse_sv", sys.modules)
+        self.assertIn("lingua_franca.lang.format_sv", sys.modules)
+        self.assertIn("sv-se", date_time_format.lang_config)
+        self.assertIn("sv-se", word_translations.lang_words)
+
+        unload_language("sv-se")
+        self.assertNotIn("lingua_franca.lang.parse_sv", sys.modules)
+        self.assertNotIn("lingua_franca.lang.format_sv", sys.modules)
+        self.assertNotIn("sv-se", date_time_format.lang_config)
+        self.assertNotIn("sv-se", word_translations.lang_words)
+        self.assertIsNot(get_language("sv-se"), sv)
+
+        # everything is loaded again on use
+        self.assertEqual(extract_number("tjugo två", lang="sv-se"), 22)
+        self.assertEqual(pronounce_number(20, lang="sv-se"), "tjugo")
+        self.assertEqual(get_language("sv-se").nice_duration(2),
+                         "två sekunder")
+
+    def test_unload_keeps_other_variants(self):
+        load_languages(["en-us", "en-au"])
+        unload_language("en-au")
+        self.assertIn("lingua_franca.lang.parse_en", sys.modules)
+        self.assertIn("en-us", date_time_format.lang_config)
+
+
+if __name__ == "__main__":
+    unittest.main()
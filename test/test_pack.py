@@ -0,0 +1,117 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import marshal
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import lingua_franca.pack
+from lingua_franca.format import DateTimeFormat, WordTranslations
+from lingua_franca.pack import build_pack, build_packs, compile_language, \
+    load_pack, packed_file, read_json_resource, unload_packs, TEXT_DIR, \
+    PACK_EXTENSION, PACK_VERSION
+
+HEADER_SIZE = lingua_franca.pack._HEADER.size
+
+
+class TestLanguagePacks(unittest.TestCase):
+    def setUp(self):
+        self.pack_dir = tempfile.TemporaryDirectory()
+        self.patch = mock.patch.object(lingua_franca.pack, "PACK_DIR",
+                                       self.pack_dir.name)
+        self.patch.start()
+        unload_packs()
+
+    def tearDown(self):
+        self.patch.stop()
+        self.pack_dir.cleanup()
+        unload_packs()
+
+    def test_no_pack(self):
+        self.assertIsNone(load_pack("en-us"))
+        self.assertIsNone(packed_file("en-us", "and.word"))
+
+    def test_build_and_load(self):
+        path = build_pack("en-us")
+        self.assertEqual(os.path.dirname(path), self.pack_dir.name)
+        pack = load_pack("en-us")
+        self.assertIs(load_pack("en-us"), pack)
+        self.assertEqual(pack["lang"], "en-us")
+        self.assertEqual(pack["files"]["and.word"], "and")
+        self.assertNotIn("date_time_test.json", pack["files"])
+        with open(os.path.join(TEXT_DIR, "en-us", "date_time.json"),
+                  encoding="utf8") as f:
+            self.assertEqual(packed_file("en-us", "date_time.json"),
+                             json.load(f))
+        self.assertIsNone(load_pack("de-de"))
+
+    def test_build_all(self):
+        paths = build_packs()
+        self.assertEqual(len(paths), len(os.listdir(TEXT_DIR)))
+
+    def test_version_mismatch(self):
+        path = build_pack("en-us")
+        with open(path, "r+b") as f:
+            f.seek(len(lingua_franca.pack.PACK_MAGIC))
+            f.write((PACK_VERSION + 1).to_bytes(2, "little"))
+        self.assertIsNone(load_pack("en-us"))
+
+    def test_resources_served_from_pack(self):
+        build_pack("en-us")
+        pack = load_pack("en-us")
+        pack["files"]["and.word"] = "plus"
+        self.assertEqual(WordTranslations().translate("and", "en-us"),
+                         "plus")
+        self.assertIs(read_json_resource("text/en-us/normalize.json"),
+                      pack["files"]["normalize.json"])
+        date_time_format = DateTimeFormat(TEXT_DIR)
+        date_time_format.cache("en-us")
+        config = date_time_format.lang_config["en-us"]
+        packed_config = pack["files"]["date_time.json"]
+        self.assertIs(config["date_format"], packed_config["date_format"])
+        self.assertIn("re", config["year_format"]["1"])
+        self.assertNotIn("re", packed_config["year_format"]["1"])
+
+    def test_stale_pack(self):
+        build_pack("en-us")
+        path = os.path.join(TEXT_DIR, "en-us", "and.word")
+        stat = os.stat(path)
+        try:
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+            self.assertIsNone(load_pack("en-us"))
+        finally:
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        unload_packs()
+        self.assertIsNotNone(load_pack("en-us"))
+
+    def test_pack_of_another_language(self):
+        path = build_pack("en-us")
+        os.replace(path, os.path.join(self.pack_dir.name,
+                                      "de-de" + PACK_EXTENSION))
+        self.assertIsNone(load_pack("de-de"))
+
+    def test_payload_is_marshalled(self):
+        path = build_pack("en-us")
+        with open(path, "rb") as f:
+            data = f.read()
+        self.assertEqual(marshal.loads(data[HEADER_SIZE:]),
+                         compile_language("en-us"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest
+from datetime import datetime
+
+import lingua_franca.parallel as parallel
+from lingua_franca.lang import active_lang
+from lingua_franca.parse import extract_number, extract_numbers, \
+    extract_duration, extract_datetime, normalize
+
+
+class TestParallel(unittest.TestCase):
+    texts = ["I have two hats and three cats",
+             "set a timer for 5 minutes",
+             "wake me up tomorrow at 7 am",
+             "the third of four",
+             "nothing to see here"] * 7
+
+    def test_results_in_order(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        self.assertEqual(
+            list(parallel.extract_datetime(iter(self.texts), anchor,
+                                           processes=2, chunksize=3)),
+            [extract_datetime(t, anchor) for t in self.texts])
+        self.assertEqual(
+            list(parallel.extract_numbers(self.texts, ordinals=True,
+                                          processes=2, chunksize=4)),
+            [extract_numbers(t, ordinals=True) for t in self.texts])
+        self.assertEqual(
+            list(parallel.extract_number(self.texts, processes=2)),
+            [extract_number(t) for t in self.texts])
+        self.assertEqual(
+            list(parallel.extract_duration(self.texts, processes=1,
+                                           chunksize=1)),
+            [extract_duration(t) for t in self.texts])
+        self.assertEqual(
+            list(parallel.normalize(self.texts, remove_articles=False,
+                                    processes=2, chunksize=5)),
+            [normalize(t, remove_articles=False) for t in self.texts])
+
+    def test_active_lang(self):
+        with active_lang("de-de"):
+            numbers = parallel.extract_number(["zwei", "drei"], processes=2,
+                                              chunksize=1)
+        self.assertEqual(list(numbers), [2, 3])
+
+    def test_empty(self):
+        self.assertEqual(list(parallel.normalize([], processes=1)), [])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            parallel.imap("get_gender", self.texts)
+        with self.assertRaises(ValueError):
+            parallel.imap("normalize", self.texts, chunksize=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,13 +16,16 @@
 import unittest
 from datetime import datetime, timedelta
 
-from lingua_franca.parse import extract_datetime
+from lingua_franca.parse import extract_datetime, has_datetime
 from lingua_franca.parse import extract_duration
 from lingua_franca.parse import extract_number, extract_numbers
+from lingua_franca.parse import extract_numbers_with_spans
 from lingua_franca.parse import fuzzy_match
 from lingua_franca.parse import get_gender
 from lingua_franca.parse import match_one
 from lingua_franca.parse import normalize
+from lingua_franca.parse import extract_number_batch, extract_numbers_batch, \
+    extract_duration_batch, extract_datetime_batch, normalize_batch
 
 
 class TestFuzzyMatch(unittest.TestCase):
@@ -736,6 +739,22 @@ class TestNormalize(unittest.TestCase):
                                          " half test"),
                          [7.0, 8.0, 9.5])
 
+    def test_extract_numbers_with_spans(self):
+        text = "two beers for two bears and twenty two 3 cats"
+        self.assertEqual(extract_numbers_with_spans(text),
+                         [(2.0, 0, 3, "two"), (2.0, 14, 17, "two"),
+                          (22.0, 28, 38, "twenty two"), (3.0, 39, 40, "3")])
+        for number, start, end, matched in extract_numbers_with_spans(text):
+            self.assertEqual(text[start:end], matched)
+        self.assertEqual(
+            [number for number, _, _, _ in extract_numbers_with_spans(
+                "six trillion", short_scale=False)],
+            extract_numbers("six trillion", short_scale=False))
+        self.assertEqual(extract_numbers_with_spans("no numbers here"), [])
+        self.assertEqual(extract_numbers_with_spans("dos perros y tres gatos",
+                                                    lang="es"),
+                         [(2, 0, 3, "dos"), (3, 13, 17, "tres")])
+
     def test_contractions(self):
         self.assertEqual(normalize("ain't"), "is not")
         self.assertEqual(normalize("aren't"), "are not")
@@ -894,5 +913,160 @@ class TestNormalize(unittest.TestCase):
                          None)
 
 
+class TestHasDatetime(unittest.TestCase):
+    def test_has_datetime(self):
+        self.assertTrue(has_datetime("what is the weather like on Tuesday"))
+        self.assertTrue(has_datetime("set a timer for 5 minutes"))
+        self.assertTrue(has_datetime("remind me in a couple of hours"))
+        self.assertTrue(has_datetime("what happened 2 weeks from next "
+                                     "friday"))
+        self.assertTrue(has_datetime("wake me up at 7 p.m."))
+        self.assertTrue(has_datetime("see you tonight"))
+        self.assertFalse(has_datetime("turn off the kitchen lights"))
+        self.assertFalse(has_datetime(""))
+        self.assertTrue(has_datetime("wie spät ist es am Montag", lang="de"))
+        self.assertFalse(has_datetime("mach das Licht aus", lang="de"))
+        # no extract_datetime, nothing can be ruled out
+        self.assertTrue(has_datetime("kapcsold le a villanyt", lang="hu"))
+
+    def test_rejected_text_has_no_datetime(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        for text in ["turn off the kitchen lights", "tell me a joke",
+                     "what is the capital of france", "play some music"]:
+            self.assertFalse(has_datetime(text))
+            self.assertIsNone(extract_datetime(text, anchor))
+
+
+class TestDatetimePlans(unittest.TestCase):
+    def test_plans_are_reused_across_anchors(self):
+        from lingua_franca.lang.parse_en import _DATETIME_PLANS_EN
+        texts = ["what is the weather tomorrow", "wake me up at 7 pm",
+                 "set an alarm for monday at 8 am", "remind me at 5",
+                 "what happened on june 5", "in 3 days", "now",
+                 "turn off the lights"]
+        anchors = [datetime(2017, 6, 27, 13, 4), datetime(2017, 7, 2, 4, 30),
+                   datetime(2020, 2, 29, 23, 59), datetime(2017, 6, 28, 6)]
+        fresh = []
+        for anchor in anchors:
+            for text in texts:
+                _DATETIME_PLANS_EN.clear()
+                fresh.append(extract_datetime(text, anchor))
+        _DATETIME_PLANS_EN.clear()
+        self.assertEqual([extract_datetime(text, anchor)
+                          for anchor in anchors for text in texts], fresh)
+        self.assertLess(_DATETIME_PLANS_EN.stats["misses"],
+                        len(anchors) * len(texts) / 2)
+
+
+class TestNumberTables(unittest.TestCase):
+    def test_tables_are_shared(self):
+        from lingua_franca.lang.parse_en import _initialize_number_data
+        self.assertIs(_initialize_number_data(True)[2],
+                      _initialize_number_data(True)[2])
+        multiplies, _, string_num_scale = _initialize_number_data(False)
+        self.assertEqual(string_num_scale["billions"], 1e12)
+        self.assertIn("billions", multiplies)
+        self.assertEqual(_initialize_number_data(True)[2]["billions"], 1e9)
+
+
+class TestExtractNumbersSinglePass(unittest.TestCase):
+    texts = ["five thousand two hundred apples for three thousand pears",
+             "one two three",
+             "I have two and a half apples and three oranges",
+             "two and a half and three point five",
+             "it is thirty two point five degrees and one point two inches",
+             "the 1st one and the second one",
+             "minus twenty five and a quarter or negative 3",
+             "nine million nine hundred seven thousand six hundred fifty "
+             "seven and six hundred sixty six",
+             "twenty fifteen point five",
+             "one point two point three and four",
+             "point five and",
+             "a couple of dogs and three cats"]
+
+    @staticmethod
+    def rescan(tokens, short_scale, ordinals):
+        """ Extract the numbers one at a time from the start of the text """
+        from lingua_franca.lang.parse_common import Token
+        from lingua_franca.lang.parse_en import _extract_number_with_text_en
+        results = []
+        while True:
+            number = _extract_number_with_text_en(tokens, short_scale,
+                                                  ordinals)
+            if not number:
+                break
+            results.append(number)
+            tokens = [Token("<placeholder>", t.index)
+                      if number.start_index <= t.index <= number.end_index
+                      else t for t in tokens]
+        results.sort(key=lambda n: n.start_index)
+        return results
+
+    def test_same_numbers_as_rescanning(self):
+        from lingua_franca.lang.parse_common import tokenize
+        from lingua_franca.lang.parse_en import _extract_numbers_with_text_en
+        # ";" ends the runs of number words, a number of a run carries
+        # into the next one when rescanning, see test_numbers_of_a_run
+        for text in self.texts + [" ; ".join(self.texts * 5)]:
+            for short_scale in (True, False):
+                for ordinals in (False, True):
+                    expected = [(n.value, n.tokens) for n in self.rescan(
+                        tokenize(text), short_scale, ordinals)]
+                    found = [(n.value, n.tokens)
+                             for n in _extract_numbers_with_text_en(
+                                 tokenize(text), short_scale, ordinals)]
+                    self.assertEqual(found, expected, text)
+
+    def test_numbers_of_a_run(self):
+        self.assertEqual(extract_numbers("one two three four"),
+                         [1, 2, 3, 4])
+        self.assertEqual(extract_numbers("two million one two"),
+                         [2000001, 2])
+        self.assertEqual(extract_numbers("six hundred sixty six twenty"),
+                         [666, 20])
+        text = " ".join(["seven", "eight", "nine"] * 700)
+        self.assertTrue(extract_numbers(text) == [7, 8, 9] * 700)
+
+
+class TestBatch(unittest.TestCase):
+    texts = ["I have two hats and three cats",
+             "set a timer for 5 minutes",
+             "wake me up tomorrow at 7 am",
+             "the third of four",
+             "nothing to see here",
+             ""]
+
+    def test_numbers(self):
+        self.assertEqual(extract_numbers_batch(self.texts),
+                         [extract_numbers(t) for t in self.texts])
+        self.assertEqual(extract_numbers_batch(self.texts, ordinals=True),
+                         [extract_numbers(t, ordinals=True)
+                          for t in self.texts])
+        self.assertEqual(extract_number_batch(self.texts),
+                         [extract_number(t) for t in self.texts])
+        self.assertEqual(extract_number_batch(["dos", "tres"], lang="es"),
+                         [2, 3])
+
+    def test_duration(self):
+        self.assertEqual(extract_duration_batch(self.texts),
+                         [extract_duration(t) for t in self.texts])
+
+    def test_datetime(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        self.assertEqual(extract_datetime_batch(self.texts, anchor),
+                         [extract_datetime(t, anchor) for t in self.texts])
+
+    def test_normalize(self):
+        self.assertEqual(normalize_batch(self.texts),
+                         [normalize(t) for t in self.texts])
+        self.assertEqual(normalize_batch(iter(self.texts),
+                                         remove_articles=False),
+                         [normalize(t, remove_articles=False)
+                          for t in self.texts])
+
+    def test_empty(self):
+        self.assertEqual(extract_numbers_batch([]), [])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -14,8 +14,15 @@
 # limitations under the License.
 
 import unittest
+from datetime import datetime
 
-from lingua_franca.lang.parse_common import tokenize, Token
+from dateutil.relativedelta import relativedelta
+from dateutil.tz import gettz
+
+from lingua_franca.lang.parse_common import tokenize, Token, fraction_table, \
+    extract_numbers_with_spans_generic, ReplaceableNumber, NumberLexicon, \
+    grammar_rule, DatetimeLexicon, DatetimePlan, DatetimePlans, shift_datetime, \
+    parse_month_day
 
 
 class TestParseCommon(unittest.TestCase):
@@ -33,3 +40,225 @@ class TestParseCommon(unittest.TestCase):
 
         self.assertEqual(tokenize('hashtag #1world'),
                          [Token('hashtag', 0), Token('#1world', 1)])
+
+    def test_token_offsets(self):
+        text = "  set  15% of #1 "
+        tokens = tokenize(text)
+        self.assertEqual([text[t.start:t.end] for t in tokens],
+                         [t.word for t in tokens])
+        self.assertEqual([(t.start, t.end) for t in tokens],
+                         [(2, 5), (7, 9), (9, 10), (11, 13), (14, 15),
+                          (15, 16)])
+        self.assertEqual(tokens[0], ("set", 0))
+        word, index = tokens[1]
+        self.assertEqual((word, index), ("15", 1))
+
+    def test_replaceable_number(self):
+        text = "I have twenty two cats"
+        tokens = tokenize(text)
+        number = ReplaceableNumber(22, tokens[2:4])
+        self.assertEqual((number.start_index, number.end_index), (2, 3))
+        self.assertEqual(text[number.start:number.end], "twenty two")
+        self.assertEqual(number.text, "twenty two")
+        with self.assertRaises(Exception):
+            number.value = 23
+
+    def test_fraction_table(self):
+        table = fraction_table({"half": 2, "fifth": 5},
+                               {"three quarters": 0.75})
+        self.assertEqual(table, {"half": 0.5, "fifth": 0.2,
+                                 "three quarters": 0.75})
+        with self.assertRaises(TypeError):
+            table["third"] = 1.0 / 3
+
+    def test_extract_numbers_with_spans_generic(self):
+        phrases = {"one": 1, "two": 2, "three": 3, "twenty": 20,
+                   "half": 0.5, "twenty three": 23, "minus two": -2,
+                   "two and half": 2.5}
+
+        def extract(text, short_scale, ordinals):
+            return phrases.get(" ".join(text.split()), False)
+
+        text = "one two and twenty  three and minus two and half"
+        numbers = extract_numbers_with_spans_generic(
+            text, extract, connectors=("and",), prefixes=("minus",),
+            fraction_handler=lambda word: word == "half")
+        self.assertEqual([(value, text[start:end])
+                          for value, start, end in numbers],
+                         [(1, "one"), (2, "two"), (23, "twenty  three"),
+                          (-2, "minus two"), (0.5, "half")])
+
+    def test_number_lexicon(self):
+        lexicon = NumberLexicon({"number": {"two": 2, "couple": 2},
+                                 "ordinal": {"third": 3},
+                                 "fraction": {"third": 1.0 / 3},
+                                 "article": ["a"],
+                                 "marker": ["and"]})
+        self.assertEqual(lexicon.kinds("third"),
+                         {"ordinal": 3, "fraction": 1.0 / 3})
+        self.assertEqual(lexicon.kinds("a"), {"article": True})
+        self.assertEqual(lexicon.kinds("12"), {"numeral": 12})
+        self.assertEqual(lexicon.kinds("1/2"), {"numeral": 0.5})
+        self.assertEqual(lexicon.kinds("cats"), {})
+        self.assertEqual(lexicon.kinds("of"), {})
+        with self.assertRaises(ValueError):
+            lexicon.add(" ", "number", 0)
+        with self.assertRaises(ValueError):
+            lexicon.add("a couple of", "number", 2)
+
+    def test_grammar_rule(self):
+        calls = []
+
+        @grammar_rule
+        def digits(words, i, memo):
+            calls.append(i)
+            if i < len(words) and words[i].isdigit():
+                rest = digits(words, i + 1, memo)
+                return words[i] + (rest[0] if rest else ""), \
+                    rest[1] if rest else i + 1
+            return None
+
+        words = ["1", "2", "3", "cats"]
+        memo = {}
+        self.assertEqual([digits(words, i, memo) for i in range(5)],
+                         [("123", 3), ("23", 3), ("3", 3), None, None])
+        # each start index was parsed once, not once per suffix
+        self.assertEqual(sorted(calls), [0, 1, 2, 3, 4])
+        self.assertEqual(digits(words, 1, {}), ("23", 3))
+        self.assertEqual(len(calls), 8)
+
+    def test_datetime_lexicon(self):
+        lexicon = DatetimeLexicon(
+            ["monday", "tuesday"], ["january", "may", "june"],
+            ["jan", "may", "june"], markers=["at", "on"],
+            time_qualifiers={"morning", "evening"},
+            relative_days={"today": 0, "tomorrow": 1})
+        self.assertEqual(lexicon.days, ("monday", "tuesday"))
+        self.assertEqual(lexicon.day_index["tuesday"], 1)
+        self.assertEqual(lexicon.month("may"), 1)
+        self.assertEqual(lexicon.month("jan"), 0)
+        self.assertEqual(lexicon.month("june"), 2)
+        self.assertIsNone(lexicon.month("monday"))
+        self.assertEqual(lexicon.markers, ("at", "on"))
+        self.assertEqual(lexicon.time_qualifiers,
+                         frozenset({"morning", "evening"}))
+        self.assertEqual(lexicon.relative_days["tomorrow"], 1)
+        with self.assertRaises(TypeError):
+            lexicon.relative_days["yesterday"] = -1
+
+    def test_datetime_lexicon_triggers(self):
+        lexicon = DatetimeLexicon(
+            ["monday"], ["january"], ["jan"], triggers=["tomorrow", "a.m."],
+            trigger_phrases=[(["from", "after"], ["next", "last"])])
+        self.assertTrue(lexicon.has_datetime("Monday"))
+        self.assertTrue(lexicon.has_datetime("at 5"))
+        self.assertTrue(lexicon.has_datetime("TOMORROW!"))
+        self.assertTrue(lexicon.has_datetime("at 5 am"))
+        self.assertTrue(lexicon.has_datetime("3 weeks after the next one"))
+        # a trigger inside a longer word still counts
+        self.assertTrue(lexicon.has_datetime("janitor"))
+        self.assertFalse(lexicon.has_datetime("the next one after"))
+        self.assertFalse(lexicon.has_datetime("turn off the lights"))
+        self.assertFalse(lexicon.has_datetime(""))
+
+    def test_datetime_plans(self):
+        parsed = []
+
+        def plan(text, anchor):
+            parsed.append(text)
+            if text == "tuesday":
+                return DatetimePlan(
+                    "", day_offset=(2 - anchor.day_of_week()) % 7)
+            if text == "at 5":
+                return DatetimePlan("", hour=5 if anchor.is_before(5)
+                                    else 17)
+            if text == "tomorrow":
+                return DatetimePlan("", day_offset=1)
+            return None
+
+        plans = DatetimePlans(plan, size=3)
+        monday, sunday = datetime(2017, 6, 26, 13), datetime(2017, 6, 25, 4)
+        self.assertEqual(plans.get("tomorrow", monday),
+                         DatetimePlan("", day_offset=1))
+        self.assertIs(plans.get("tomorrow", sunday),
+                      plans.get("tomorrow", monday))
+        self.assertEqual(plans.get("tuesday", monday).day_offset, 1)
+        self.assertEqual(plans.get("tuesday", datetime(2017, 7, 3)).day_offset,
+                         1)
+        self.assertEqual(plans.get("tuesday", sunday).day_offset, 2)
+        self.assertEqual(plans.get("at 5", monday).hour, 17)
+        self.assertEqual(plans.get("at 5", sunday).hour, 5)
+        self.assertEqual(plans.get("at 5", datetime(2017, 6, 27, 23)).hour,
+                         17)
+        self.assertEqual(parsed, ["tomorrow", "tuesday", "tuesday", "at 5",
+                                  "at 5"])
+        self.assertEqual(plans.stats,
+                         {"hits": 4, "misses": 5, "entries": 3})
+
+        # texts without a date are kept too, the oldest text is dropped
+        self.assertIsNone(plans.get("lights off", monday))
+        self.assertIsNone(plans.get("lights off", sunday))
+        plans.get("tomorrow", monday)
+        self.assertEqual(parsed[-2:], ["lights off", "tomorrow"])
+
+        plans.clear()
+        self.assertEqual(plans.stats, {"hits": 0, "misses": 0, "entries": 0})
+        uncached = DatetimePlans(plan, size=0)
+        uncached.get("tomorrow", monday)
+        uncached.get("tomorrow", monday)
+        self.assertEqual(uncached.stats,
+                         {"hits": 0, "misses": 2, "entries": 0})
+
+    def test_shift_datetime(self):
+        leap = datetime(2020, 2, 29, 23, 30)
+        # the day is clamped after the years, then after the months
+        self.assertEqual(shift_datetime(leap, years=1, months=1),
+                         datetime(2021, 3, 28, 23, 30))
+        self.assertEqual(shift_datetime(datetime(2017, 1, 31), months=1),
+                         datetime(2017, 2, 28))
+        self.assertEqual(shift_datetime(leap, days=1, time=(8, 15)),
+                         datetime(2020, 3, 2, 7, 45))
+        madrid = datetime(2019, 12, 31, 10, tzinfo=gettz("Europe/Madrid"))
+        moved = shift_datetime(madrid, months=2, hours=-36)
+        self.assertEqual(moved, datetime(2020, 2, 27, 22,
+                                         tzinfo=madrid.tzinfo))
+        self.assertIs(moved.tzinfo, madrid.tzinfo)
+
+        # a time of day already past is the next day's
+        morning = datetime(2017, 6, 27)
+        self.assertEqual(shift_datetime(morning, time=(8, 0), minutes=5,
+                                        not_before=datetime(2017, 6, 27, 9)),
+                         datetime(2017, 6, 28, 8, 5))
+        self.assertEqual(shift_datetime(morning, time=(8, 0),
+                                        not_before=datetime(2017, 6, 27, 7)),
+                         datetime(2017, 6, 27, 8))
+
+        # float offsets round as one relativedelta per step does
+        self.assertEqual(
+            shift_datetime(morning, days=2.25, time=(19.45, 13.7),
+                           hours=3605.98, minutes=-0.1, seconds=59.9),
+            morning + relativedelta(days=2.25)
+            + relativedelta(hours=19.45, minutes=13.7)
+            + relativedelta(hours=3605.98) + relativedelta(minutes=-0.1)
+            + relativedelta(seconds=59.9))
+        with self.assertRaises(ValueError):
+            shift_datetime(morning, years=1.5)
+        with self.assertRaises(OverflowError):
+            shift_datetime(datetime(9999, 12, 31), days=1, hours=-48)
+
+    def test_parse_month_day(self):
+        months = ("januar", "februar", "märz", "april", "mai", "juni", "juli",
+                  "august", "september", "oktober", "november", "dezember")
+        self.assertEqual(parse_month_day("märz 5", months),
+                         datetime(1900, 3, 5))
+        self.assertEqual(parse_month_day("juni 05 2018", months),
+                         datetime(2018, 6, 5))
+        self.assertEqual(parse_month_day("mai  31", months),
+                         datetime(1900, 5, 31))
+        # what datetime.strptime(date_str, "%B %d") rejects too
+        for date_str in ["march 5", "juni", "juni 5th", "juni 32",
+                         "juni 2018", "februar 29", "juni 5 18", "juni 5 "]:
+            with self.assertRaises(ValueError):
+                parse_month_day(date_str, months)
+        self.assertEqual(parse_month_day("februar 29 2020", months),
+                         datetime(2020, 2, 29))
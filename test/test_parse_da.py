@@ -18,6 +18,7 @@ from datetime import datetime, time
 
 from lingua_franca.parse import extract_datetime
 from lingua_franca.parse import extract_number
+from lingua_franca.parse import extract_numbers
 from lingua_franca.parse import normalize
 
 
@@ -71,6 +72,12 @@ class TestNormalize(unittest.TestCase):
 #        self.assertEqual(extract_number("tre fjerdedel kop", lang="da-dk"),
 #                         3.0 / 4.0)
 
+    def test_extract_numbers(self):
+        self.assertEqual(extract_numbers("en to tre", lang="da-dk"),
+                         [1, 2, 3])
+        self.assertEqual(extract_numbers("to og tyve katte og 7 hunde",
+                                         lang="da-dk"), [22, 7])
+
     def test_extractdatetime_de(self):
         def extractWithFormat(text):
             date = datetime(2017, 6, 27, 0, 0)
@@ -88,6 +95,8 @@ class TestNormalize(unittest.TestCase):
                     "2017-06-30 00:00:00", "sæt frisøraftale")
         testExtract("hvordan er vejret i overmorgen?",
                     "2017-06-29 00:00:00", "hvordan er vejret")
+        testExtract("husk mig den 5 juni 2018",
+                    "2018-06-05 00:00:00", "husk mig")
         testExtract("mind mig om det 10:45 i aften",
                     "2017-06-27 22:45:00", "mind mig")
         testExtract("hvordan er vejret fredag om morgenen",
@@ -18,7 +18,9 @@ from datetime import datetime, time
 
 from lingua_franca.parse import extract_datetime
 from lingua_franca.parse import extract_number
+from lingua_franca.parse import extract_numbers
 from lingua_franca.parse import normalize
+from lingua_franca.lang.parse_de import extract_numbers_with_spans_de
 
 
 class TestNormalize(unittest.TestCase):
@@ -72,6 +74,36 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_number("Drei Viertel Tassen", lang="de-de"),
                          3.0 / 4.0)
 
+    def test_extract_numbers(self):
+        self.assertEqual(extract_numbers("eins zwei drei", lang="de-de"),
+                         [1, 2, 3])
+        self.assertEqual(extract_numbers("zwei und zwanzig Katzen, 7 Hunde",
+                                         lang="de-de"), [22, 7])
+        text = "ich habe drei Viertel Tasse und zwei Eier"
+        self.assertEqual(extract_numbers(text, lang="de-de"), [0.75, 2])
+        self.assertEqual([text[start:end] for _, start, end in
+                          extract_numbers_with_spans_de(text)],
+                         ["drei Viertel", "zwei"])
+
+    def test_compound_numbers(self):
+        self.assertEqual(extract_number("einundzwanzig", lang="de-de"), 21)
+        self.assertEqual(extract_number("dreihundertfünfundvierzigtausend",
+                                        lang="de-de"), 345000)
+        self.assertEqual(extract_number("neunzehnhundertneunundneunzig",
+                                        lang="de-de"), 1999)
+        self.assertEqual(extract_number("hundertundeins Tage", lang="de-de"),
+                         101)
+        self.assertEqual(extract_number("zweimillionen", lang="de-de"),
+                         2000000)
+        self.assertEqual(extract_number("der dreiundzwanzigste Tag",
+                                        lang="de-de"), 23)
+        self.assertEqual(extract_number("ein tausendstel", lang="de-de"),
+                         0.001)
+        self.assertEqual(extract_number("ein achtel", lang="de-de"), 0.125)
+        self.assertFalse(extract_number("tausende Menschen", lang="de-de"))
+        self.assertEqual(normalize("zweitausendzwanzig Tage", lang="de-de"),
+                         "2020 Tage")
+
     def test_extractdatetime_de(self):
         def extractWithFormat(text):
             date = datetime(2017, 6, 27, 0, 0)
@@ -89,6 +121,8 @@ class TestNormalize(unittest.TestCase):
                     "2017-07-02 00:00:00", "setze frisörtermin")
         testExtract("wie ist das wetter übermorgen?",
                     "2017-06-29 00:00:00", "wie ist das wetter")
+        testExtract("erinnere mich am 5 juni 2018",
+                    "2018-06-05 00:00:00", "erinnere mich")
         testExtract("erinnere mich um 10:45 abends",
                     "2017-06-27 22:45:00", "erinnere mich")
         testExtract("was ist das Wetter am freitag morgen",
@@ -89,6 +89,19 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_number("seis punto Dos", lang='es'), 6.2)
         self.assertEqual(extract_number("seis coma dos", lang='es'), 6.2)
         self.assertEqual(extract_numbers("un medio", lang='es'), [0.5])
+        # "veintiuno coma medio" is not one number
+        self.assertEqual(extract_numbers(
+            "perros veintiuno coma medio mañana gatos gatos veintiuno",
+            lang='es'), [21, 0.5, 21])
+        self.assertEqual(extract_numbers("dos punto cero dos", lang='es'),
+                         [2.02])
+        self.assertEqual(extract_numbers("dos mil", lang='es'), [2000])
+        self.assertEqual(extract_numbers("dos mil trescientos", lang='es'),
+                         [2300])
+        self.assertEqual(extract_numbers("uno dos tres", lang='es'),
+                         [1, 2, 3])
+        self.assertEqual(extract_number("dos mil trescientos", lang='es'),
+                         2300)
         self.assertEqual(extract_number("cuarto", lang='es'), 0.25)
 
         self.assertEqual(extract_number("2.0", lang='es'), 2.0)
@@ -141,8 +154,6 @@ class TestDatetime_es(unittest.TestCase):
         self.assertEqual(extract_datetime(
             "11 may", lang='es', anchorDate=datetime(1998, 5, 1))[0],
             datetime(1998, 5, 11))
-        # there is an issue with the months of june through september (below)
-        # hay un problema con las meses junio hasta septiembre (lea abajo)
         self.assertEqual(extract_datetime(
             "11 oct", lang='es', anchorDate=datetime(1998, 10, 1))[0],
             datetime(1998, 10, 11))
@@ -155,13 +166,9 @@ class TestDatetime_es(unittest.TestCase):
 
         self.assertEqual(extract_datetime("", lang='es'), None)
 
-    # TODO fix bug causing these tests to fail (MycroftAI/mycroft-core#2348)
-    #         reparar error de traducción preveniendo las funciones abajo de
-    #         retornar correctamente
-    #         (escrito con disculpas por un Inglés hablante)
-    #      further broken tests are below their respective working tests.
-    @unittest.skip("currently processing these months incorrectly")
-    def test_bugged_output_wastebasket(self):
+    # june through september used to be translated to english month names
+    # the wrong way (MycroftAI/mycroft-core#2348)
+    def test_datetime_by_date_summer_es(self):
         self.assertEqual(extract_datetime(
             "11 jun", lang='es', anchorDate=datetime(1998, 6, 1))[0],
             datetime(1998, 6, 11))
@@ -178,9 +185,9 @@ class TestDatetime_es(unittest.TestCase):
             "11 sep", lang='es', anchorDate=datetime(1998, 9, 1))[0],
             datetime(1998, 9, 11))
 
-        # It's also failing on years
         self.assertEqual(extract_datetime(
-            "11 ago 1998", lang='es')[0], datetime(1998, 8, 11))
+            "11 ago 1998", lang='es', anchorDate=datetime(2017, 1, 1))[0],
+            datetime(1998, 8, 11))
 
     def test_extract_datetime_relative(self):
         self.assertEqual(extract_datetime(
@@ -19,6 +19,7 @@ from datetime import datetime, time
 from lingua_franca.parse import get_gender
 from lingua_franca.parse import extract_datetime
 from lingua_franca.parse import extract_number
+from lingua_franca.parse import extract_numbers
 from lingua_franca.parse import normalize
 
 
@@ -84,6 +85,19 @@ class TestNormalize_fr(unittest.TestCase):
         self.assertEqual(extract_number("un 20e",
                                         lang="fr-fr"), 1.0 / 20.0)
 
+    def test_extract_numbers_fr(self):
+        self.assertEqual(extract_numbers("un deux trois", lang="fr-fr"),
+                         [1, 2, 3])
+        self.assertEqual(extract_numbers("vingt-deux chats et 7 chiens",
+                                         lang="fr-fr"), [22, 7])
+        self.assertEqual(extract_numbers("deux virgule cinq litres et "
+                                         "trois quarts", lang="fr-fr"),
+                         [2.5, 0.75])
+        self.assertEqual(extract_numbers("deux virgule zéro deux",
+                                         lang="fr-fr"), [2.02])
+        self.assertEqual(extract_numbers("2 virgule 0 0 5 cm",
+                                         lang="fr-fr"), [2.005])
+
     def test_extractdatetime_fr(self):
         def extractWithFormat_fr(text):
             date = datetime(2017, 6, 27, 0, 0)
@@ -391,6 +405,9 @@ class TestNormalize_fr(unittest.TestCase):
                          "1000e millésime")
         self.assertEqual(normalize("le trentième anniversaire", lang="fr-fr"),
                          "30e anniversaire")
+        self.assertEqual(normalize("ils fêtent le vingt deuxième jour",
+                                   lang="fr-fr"),
+                         "ils fêtent 22e jour")
 
     def test_gender_fr(self):
         self.assertEqual(get_gender("personne", lang="fr-fr"),
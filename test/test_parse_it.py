@@ -203,6 +203,10 @@ class TestNormalize(unittest.TestCase):
                                         lang='it'), 0)
         self.assertEqual(extract_number('Zero gatti',
                                         lang='it'), 0)
+        self.assertEqual(extract_number('duemilacinquecento euro',
+                                        lang='it'), 2500)
+        self.assertEqual(normalize('vado a milano', lang='it'),
+                         'vado a milano')
 
     def test_extractdatetime_it_not_normalized(self):
         """
@@ -731,7 +735,7 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_numbers('questo è  test dieci undici dodici',
                                          lang='it'), [10.0, 11.0, 12.0])
         self.assertEqual(extract_numbers('test dodici gatti ventuno',
-                                         lang='it'), [21.0, 12.0])
+                                         lang='it'), [12.0, 21.0])
         self.assertEqual(extract_numbers('1 cane, sette maiali, macdonald ' +
                                          'aveva la fattoria, 3 volte' +
                                          ' 5 macarena',
@@ -756,7 +760,15 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_numbers('seimilioni', lang='it',
                                          short_scale=False), [6e6])
         self.assertEqual(extract_numbers('dodici maiali accompagnano \
-         seimiliardi di batteri', lang='it', short_scale=True), [6e9, 12])
+         seimiliardi di batteri', lang='it', short_scale=True), [12, 6e9])
+        self.assertEqual(extract_numbers('due virgola zero due',
+                                         lang='it'), [2.02])
+        self.assertEqual(extract_numbers('seicento punto zero zero sei',
+                                         lang='it'), [600.006])
+        self.assertEqual(extract_numbers('tra un paio di mesi',
+                                         lang='it'), [2])
+        self.assertEqual(extract_numbers('una e una mezza tazza',
+                                         lang='it'), [1.5])
 
         # TODO case when pronounced/extracted number don't match
         # fractional numbers often fail
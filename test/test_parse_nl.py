@@ -95,6 +95,10 @@ class TestParsing(unittest.TestCase):
                     "2017-06-28 00:00:00", "hoe is weer")
         testExtract("3 december",
                     "2017-12-03 00:00:00", "")
+        testExtract("wat gebeurt er op 5 januari",
+                    "2018-01-05 00:00:00", "wat gebeurt er")
+        testExtract("plan een afspraak op 3 maart 2018",
+                    "2018-03-03 00:00:00", "plan een afspraak")
         testExtract("hoe is het weer vandaag", "2017-06-27 00:00:00",
                     "hoe is weer")
         testExtract("herinner me over 5 jaar aan mijn contract",
@@ -18,7 +18,7 @@ from datetime import datetime, time
 
 from lingua_franca.parse import get_gender
 from lingua_franca.parse import extract_datetime
-from lingua_franca.parse import extract_number
+from lingua_franca.parse import extract_number, extract_numbers
 from lingua_franca.parse import normalize
 
 
@@ -94,6 +94,27 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_number("seiscentos ponto zero zero zero seis",
                                         lang="pt"), 600.0006)
 
+    def test_extract_numbers_pt(self):
+        self.assertEqual(extract_numbers("um dois três quatro", lang="pt"),
+                         [1, 2, 3, 4])
+        self.assertEqual(extract_numbers("isto 1 2 20 2 teste", lang="pt"),
+                         [1, 2, 20, 2])
+        self.assertEqual(extract_numbers("dois mil e vinte", lang="pt"),
+                         [2020])
+        self.assertEqual(extract_numbers("vinte e dois cães e três gatos",
+                                         lang="pt"), [22, 3])
+        self.assertEqual(extract_numbers("dois e meio", lang="pt"), [2.5])
+        self.assertEqual(extract_numbers("1 e 3 quartos", lang="pt"), [1.75])
+        self.assertEqual(extract_numbers("dois vírgula zero dois",
+                                         lang="pt"), [2.02])
+        # "mil" only multiplies the number word right before it
+        self.assertEqual(extract_numbers("dois gatos custam mil",
+                                         lang="pt"), [2, 1000])
+        self.assertEqual(extract_number("dois gatos custam mil", lang="pt"),
+                         1002)
+        self.assertEqual(extract_number("marca ontem cinco que mil",
+                                        lang="pt"), 1005)
+
     def test_agressive_pruning_pt(self):
         self.assertEqual(normalize("uma palavra", lang="pt"),
                          "1 palavra")
@@ -159,6 +180,10 @@ class TestNormalize(unittest.TestCase):
                     "2017-06-28 00:00:00", "dia")
         testExtract("que dia foi ontem",
                     "2017-06-26 00:00:00", "dia")
+        testExtract("lembra-me a 5 de junho",
+                    "2018-06-05 00:00:00", "lembra")
+        testExtract("lembra-me a 3 de março de 2018",
+                    "2018-03-03 00:00:00", "lembra")
         testExtract("que dia foi antes de ontem",
                     "2017-06-25 00:00:00", "dia")
         testExtract("que dia foi ante ontem",
@@ -17,7 +17,7 @@ import unittest
 from datetime import datetime, time
 
 from lingua_franca.parse import extract_datetime
-from lingua_franca.parse import extract_number
+from lingua_franca.parse import extract_number, extract_numbers
 from lingua_franca.parse import normalize
 
 
@@ -59,6 +59,27 @@ class TestNormalize(unittest.TestCase):
                                         lang='sv-se'), 3.0 / 4.0)
         self.assertEqual(extract_number("trekvarts kopp",
                                         lang='sv-se'), 3.0 / 4.0)
+        self.assertEqual(extract_number("tjugo två katter",
+                                        lang='sv-se'), 22)
+        self.assertEqual(extract_number("två hundra tjugo",
+                                        lang='sv-se'), 220)
+
+    def test_extract_numbers_sv(self):
+        self.assertEqual(extract_numbers("tjugo två katter", lang='sv-se'),
+                         [22])
+        self.assertEqual(extract_numbers("en två tre fyra", lang='sv-se'),
+                         [1, 2, 3, 4])
+        self.assertEqual(extract_numbers("det är 10 11 12 test",
+                                         lang='sv-se'), [10, 11, 12])
+        self.assertEqual(extract_numbers("två tusen och fem", lang='sv-se'),
+                         [2005])
+        self.assertEqual(extract_numbers("5 och en halv", lang='sv-se'),
+                         [5.5])
+        # "tusen" only multiplies the number word right before it
+        self.assertEqual(extract_number("jag har fem katter och tusen kronor",
+                                        lang='sv-se'), 5)
+        self.assertEqual(extract_numbers("fem katter och tusen kronor",
+                                         lang='sv-se'), [5, 1000])
 
     def test_extractdatetime_sv(self):
         def extractWithFormat(text):
@@ -77,6 +98,10 @@ class TestNormalize(unittest.TestCase):
                     "2017-07-02 00:00:00", "planera bakhållet")
         testExtract("Vad blir vädret i övermorgon?",
                     "2017-06-29 00:00:00", "vad blir vädret")
+        testExtract("vad händer den 5 juni",
+                    "2018-06-05 00:00:00", "vad händer")
+        testExtract("påminn mig den 5 januari 2018",
+                    "2018-01-05 00:00:00", "påminn mig")
         testExtract("Påminn mig klockan 10:45",
                     "2017-06-27 10:45:00", "påminn mig klockan")
         testExtract("vad blir vädret på fredag morgon",
@@ -0,0 +1,75 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import subprocess
+import sys
+import unittest
+
+from lingua_franca.lang.registry import get_function, get_provider, \
+    supported_languages
+from lingua_franca.lang.parse_en import extractnumber_en
+from lingua_franca.lang.parse_pt import get_gender_pt
+
+
+class TestLanguageRegistry(unittest.TestCase):
+    def test_get_function(self):
+        self.assertIs(get_function("extract_number", "en"), extractnumber_en)
+        self.assertIs(get_function("get_gender", "es"), get_gender_pt)
+        self.assertIsNone(get_function("extract_duration", "de"))
+        self.assertIsNone(get_function("extract_number", "xx"))
+
+    def test_provider(self):
+        provider = get_provider("en")
+        self.assertEqual(provider.code, "en")
+        self.assertTrue(provider.supports("extract_duration"))
+        self.assertFalse(provider.supports("get_gender"))
+        self.assertIs(provider.get("extract_number"),
+                      provider.get("extract_number"))
+        self.assertIsNone(get_provider("xx"))
+
+    def test_supported_languages(self):
+        self.assertEqual(supported_languages("extract_duration"),
+                         ["cs", "en"])
+        self.assertIn("hu", supported_languages())
+        self.assertNotIn("hu", supported_languages("extract_number"))
+
+    def test_lazy_import(self):
+        code = ("import sys\n"
+                "from lingua_franca.parse import extract_number\n"
+                "from lingua_franca.format import nice_number\n"
+                "assert 'lingua_franca.lang.parse_en' not in sys.modules\n"
+                "extract_number('two', lang='en-us')\n"
+                "assert 'lingua_franca.lang.parse_en' in sys.modules\n"
+                "assert 'lingua_franca.lang.parse_de' not in sys.modules\n"
+                "assert 'lingua_franca.lang.format_de' not in sys.modules\n")
+        subprocess.check_call([sys.executable, "-c", code])
+
+    def test_legacy_module_attributes(self):
+        import lingua_franca.parse
+        import lingua_franca.format
+        self.assertIs(lingua_franca.parse.extractnumber_en, extractnumber_en)
+        self.assertEqual(lingua_franca.format.pronounce_number_de(2), "zwei")
+        with self.assertRaises(AttributeError):
+            lingua_franca.parse.does_not_exist_en
+        from lingua_franca.parse import is_numeric, tokenize, Normalizer, \
+            EnglishNormalizer, SHORT_SCALE_IT
+        from lingua_franca.format import convert_to_mixed_fraction, \
+            NUM_STRING_SV
+        self.assertTrue(is_numeric("2"))
+        self.assertEqual(NUM_STRING_SV[2], "två")
+
+
+if __name__ == "__main__":
+    unittest.main()
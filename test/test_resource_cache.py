@@ -0,0 +1,106 @@
+#
+# Copyright 2019 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from lingua_franca import ResourceCache, resolve_resource_file, \
+    resource_cache
+
+
+class TestResourceCache(unittest.TestCase):
+    def setUp(self):
+        self.home = tempfile.TemporaryDirectory()
+        self.env = mock.patch.dict(os.environ, {"HOME": self.home.name})
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.home.cleanup()
+        resource_cache.configure(ResourceCache.PERMANENT)
+
+    def add_override(self, res_name):
+        path = os.path.join(self.home.name, ".mycroft", res_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, "w").close()
+        return path
+
+    def test_permanent(self):
+        resource_cache.configure(ResourceCache.PERMANENT)
+        packaged = resolve_resource_file("text/en-us/and.word")
+        self.assertTrue(packaged.endswith("res/text/en-us/and.word"))
+        self.assertIsNone(resolve_resource_file("text/en-us/nope.word"))
+        self.assertEqual(resolve_resource_file("text/en-us/and.word"),
+                         packaged)
+        self.assertIsNone(resolve_resource_file("text/en-us/nope.word"))
+        self.assertEqual(resource_cache.stats,
+                         {"hits": 2, "misses": 2, "entries": 2,
+                          "mode": ResourceCache.PERMANENT})
+
+        # overrides are only noticed once the cache is cleared
+        override = self.add_override("text/en-us/and.word")
+        self.assertEqual(resolve_resource_file("text/en-us/and.word"),
+                         packaged)
+        resource_cache.clear()
+        self.assertEqual(resolve_resource_file("text/en-us/and.word"),
+                         override)
+
+    def test_data_dir_is_part_of_key(self):
+        data_dir = os.path.join(self.home.name, "data")
+        os.makedirs(os.path.join(data_dir, "text", "en-us"))
+        path = os.path.join(data_dir, "text", "en-us", "nope.word")
+        open(path, "w").close()
+        self.assertIsNone(resolve_resource_file("text/en-us/nope.word"))
+        self.assertEqual(resolve_resource_file("text/en-us/nope.word",
+                                               data_dir),
+                         path)
+
+    def test_ttl(self):
+        resource_cache.configure(ResourceCache.TTL, ttl=0)
+        resolve_resource_file("text/en-us/and.word")
+        resolve_resource_file("text/en-us/and.word")
+        self.assertEqual(resource_cache.hits, 0)
+        self.assertEqual(resource_cache.misses, 2)
+
+    def test_stat(self):
+        resource_cache.configure(ResourceCache.STAT)
+        packaged = resolve_resource_file("text/en-us/or.word")
+        self.assertEqual(resolve_resource_file("text/en-us/or.word"),
+                         packaged)
+        self.assertEqual(resource_cache.hits, 1)
+        override = self.add_override("text/en-us/or.word")
+        self.assertEqual(resolve_resource_file("text/en-us/or.word"),
+                         override)
+        os.remove(override)
+        self.assertEqual(resolve_resource_file("text/en-us/or.word"),
+                         packaged)
+
+    def test_disabled(self):
+        resource_cache.configure(ResourceCache.DISABLED)
+        resolve_resource_file("text/en-us/and.word")
+        self.assertEqual(resource_cache.stats["entries"], 0)
+        override = self.add_override("text/en-us/and.word")
+        self.assertEqual(resolve_resource_file("text/en-us/and.word"),
+                         override)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            ResourceCache("forever")
+
+
+if __name__ == "__main__":
+    unittest.main()